@@ -0,0 +1,81 @@
+"""
+Compare two results of the benchmark suite.
+
+Usage::
+
+    python -m benchmarks.compare baseline.json current.json --threshold 0.1
+
+Exits with status 1 if any case is slower (median wall time) or uses more
+memory than the baseline by more than the threshold.
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from typing import Dict, Tuple, Any, List, Sequence
+
+
+def index_results(report: Dict[str, Any]) -> Dict[Tuple[str, int], Dict[str, Any]]:
+    return {
+        (result["case"], result["rows"]): result
+        for result in report["results"] if "wall_seconds" in result
+    }
+
+
+def compare(
+        baseline: Dict[str, Any], current: Dict[str, Any], threshold: float = 0.1
+) -> List[Dict[str, Any]]:
+    """
+    Compare the cases present on both results.
+
+    Parameters
+    ----------
+    baseline : Dict[str, Any]
+        Results of reference.
+    current : Dict[str, Any]
+        Results to compare.
+    threshold : float, optional
+        Relative increase considered a regression. Default `0.1` (10%).
+
+    Returns
+    -------
+    List[Dict[str, Any]]
+        Ratio (current / baseline) of median wall time and peak of memory of each case.
+    """
+    before = index_results(baseline)
+    after = index_results(current)
+    comparison = list()
+    for key in sorted(set(before) & set(after)):
+        wall = after[key]["wall_seconds"]["median"] / max(before[key]["wall_seconds"]["median"], 1e-9)
+        memory = None
+        if "peak_memory_bytes" in before[key] and "peak_memory_bytes" in after[key]:
+            memory = after[key]["peak_memory_bytes"] / max(before[key]["peak_memory_bytes"], 1)
+        comparison.append({
+            "case": key[0], "rows": key[1], "wall_ratio": wall, "memory_ratio": memory,
+            "regression": wall > 1 + threshold or (memory is not None and memory > 1 + threshold),
+        })
+    return comparison
+
+
+def main(arguments: Sequence[str] = None) -> int:
+    parser = argparse.ArgumentParser(description="Compare two results of the benchmark suite.")
+    parser.add_argument("baseline", help="JSON results of reference.")
+    parser.add_argument("current", help="JSON results to compare.")
+    parser.add_argument("--threshold", type=float, default=0.1, help="Relative increase considered a regression.")
+    args = parser.parse_args(arguments)
+    with open(args.baseline, "r", encoding="utf-8") as file:
+        baseline = json.load(file)
+    with open(args.current, "r", encoding="utf-8") as file:
+        current = json.load(file)
+    print(f"{baseline.get('version')} -> {current.get('version')}")
+    comparison = compare(baseline, current, args.threshold)
+    for row in comparison:
+        memory = "-" if row["memory_ratio"] is None else f"{row['memory_ratio']:.2f}x"
+        print(f"{row['case']:<24}{row['rows']:>12}  time {row['wall_ratio']:.2f}x  memory {memory}"
+              f"{'  REGRESSION' if row['regression'] else ''}")
+    return 1 if any(row["regression"] for row in comparison) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
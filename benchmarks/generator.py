@@ -0,0 +1,373 @@
+"""
+Deterministic generator of synthetic Darwin Core Archives.
+
+The same parameters (and seed) always produce the same archive, so results are
+comparable between releases. Rows are written in chunks directly into the
+`zip` members, so archives of tens of millions of rows can be generated
+without holding them in memory.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import zipfile
+from typing import List, Tuple, Sequence, BinaryIO
+
+DWC = "http://rs.tdwg.org/dwc/terms/"
+
+KINGDOMS = {
+    "Plantae": ["Asteraceae", "Rosaceae", "Poaceae", "Fabaceae", "Cactaceae", "Orchidaceae"],
+    "Animalia": ["Felidae", "Canidae", "Muridae", "Accipitridae", "Tyrannidae", "Colubridae"],
+    "Fungi": ["Agaricaceae", "Russulaceae", "Boletaceae"],
+}
+"""Dict[str, List[str]]: Kingdoms and families of the synthetic taxa."""
+GENERA_PER_FAMILY = 8
+"""int: Genera generated for each family."""
+SPECIES_PER_GENUS = 12
+"""int: Species generated for each genus on occurrences."""
+COUNTRIES = ["CL", "AR", "PE", "BO", "BR", "EC", "CO", "UY"]
+BASIS_OF_RECORD = ["HumanObservation", "PreservedSpecimen", "MachineObservation", "MaterialSample"]
+MEASUREMENTS = [("body length", "mm"), ("weight", "g"), ("height", "cm"), ("leaf area", "cm2")]
+IDENTIFIERS = ["Ana Pérez", "João Gonçalves", "Zoë Müller", "Ñusta Quispe", "Søren Ødegaard"]
+
+CORES = {
+    "occurrence": (DWC + "Occurrence", "occurrence.txt", [
+        "occurrenceID", "basisOfRecord", "eventDate", "scientificName", "kingdom", "family", "genus",
+        "decimalLatitude", "decimalLongitude", "countryCode", "individualCount",
+    ]),
+    "taxon": (DWC + "Taxon", "taxon.txt", [
+        "taxonID", "parentNameUsageID", "acceptedNameUsageID", "scientificName",
+        "taxonRank", "kingdom", "family", "genus",
+    ]),
+}
+"""Dict[str, Tuple[str, str, List[str]]]: Supported cores, as row type, file name and terms."""
+EXTENSIONS = {
+    "measurement_or_fact": (DWC + "MeasurementOrFact", "measurementorfact.txt", [
+        "measurementID", "measurementType", "measurementValue", "measurementUnit",
+    ]),
+    "identification": (DWC + "Identification", "identification.txt", [
+        "identificationID", "identifiedBy", "dateIdentified",
+    ]),
+    "resource_relationship": (DWC + "ResourceRelationship", "resourcerelationship.txt", [
+        "resourceRelationshipID", "relatedResourceID", "relationshipOfResource",
+    ]),
+}
+"""Dict[str, Tuple[str, str, List[str]]]: Supported extensions, as row type, file name and terms (after core id)."""
+UNWRITABLE = {
+    "measurement_or_fact": "measurementValue has no concrete type, archives with it cannot be written",
+}
+"""Dict[str, str]: Extensions that can be read but not written, with the reason."""
+
+
+def taxa_names() -> List[Tuple[str, str, str]]:
+    """
+    Synthetic higher taxonomy.
+
+    Returns
+    -------
+    List[Tuple[str, str, str]]
+        Kingdom, family and genus of every synthetic genus.
+    """
+    return [
+        (kingdom, family, f"{family[:-4]}us{g}")
+        for kingdom, families in KINGDOMS.items()
+        for family in families
+        for g in range(GENERA_PER_FAMILY)
+    ]
+
+
+def occurrence_rows(start: int, end: int, rng: random.Random) -> List[List[str]]:
+    genera = taxa_names()
+    rows = list()
+    for index in range(start, end):
+        kingdom, family, genus = genera[rng.randrange(len(genera))]
+        rows.append([
+            f"occ-{index}",
+            BASIS_OF_RECORD[index % len(BASIS_OF_RECORD)],
+            f"{rng.randint(1950, 2024):04d}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            f"{genus} species{rng.randrange(SPECIES_PER_GENUS)}", kingdom, family, genus,
+            f"{rng.uniform(-56.0, -17.0):.5f}",
+            f"{rng.uniform(-76.0, -66.0):.5f}",
+            COUNTRIES[rng.randrange(len(COUNTRIES))],
+            str(rng.randint(1, 50)),
+        ])
+    return rows
+
+
+def higher_taxa_rows() -> List[List[str]]:
+    rows = list()
+    ids = dict()
+    for kingdom, family, genus in taxa_names():
+        for name, parent, rank in ((kingdom, None, "kingdom"), (family, kingdom, "family"), (genus, family, "genus")):
+            if name not in ids:
+                ids[name] = str(len(ids) + 1)
+                rows.append([
+                    ids[name], "" if parent is None else ids[parent], ids[name], name, rank, kingdom,
+                    family if rank != "kingdom" else "", genus if rank == "genus" else "",
+                ])
+    return rows
+
+
+def species_rows(start: int, end: int, genera: List[List[str]], rng: random.Random) -> List[List[str]]:
+    rows = list()
+    for index in range(start, end):
+        genus = genera[rng.randrange(len(genera))]
+        taxon_id = str(index + 1)
+        # One out of ten species is a synonym of the previous one
+        synonym = index % 10 == 9
+        rows.append([
+            taxon_id, "" if synonym else genus[0], str(index) if synonym else taxon_id,
+            f"{genus[3]} species{index + 1}", "species", genus[5], genus[6], genus[3],
+        ])
+    return rows
+
+
+def extension_rows(extension: str, start: int, end: int, per_core: int, rng: random.Random) -> List[List[str]]:
+    rows = list()
+    for index in range(start, end):
+        core_id = f"occ-{index}"
+        for i in range(per_core):
+            if extension == "measurement_or_fact":
+                measurement, unit = MEASUREMENTS[(index + i) % len(MEASUREMENTS)]
+                rows.append([core_id, f"{core_id}-m{i}", measurement, f"{rng.uniform(0, 500):.2f}", unit])
+            elif extension == "identification":
+                rows.append([
+                    core_id, f"{core_id}-i{i}", IDENTIFIERS[rng.randrange(len(IDENTIFIERS))],
+                    f"{rng.randint(1990, 2024):04d}-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+                ])
+            else:
+                rows.append([core_id, f"{core_id}-r{i}", f"occ-{rng.randrange(index + 1)}", "sibling of"])
+    return rows
+
+
+def meta_xml(
+        core: str, extensions: Sequence[str], delimiter: str,
+        quote: str, encoding: str, header: bool
+) -> str:
+    """
+    Index file (`meta.xml`) of the archive.
+
+    Parameters
+    ----------
+    core : str
+        Core of the archive.
+    extensions : Sequence[str]
+        Extensions of the archive.
+    delimiter : str
+        Delimiter of the fields.
+    quote : str
+        Character enclosing the fields.
+    encoding : str
+        Encoding of the data files.
+    header : bool
+        Data files have a header line.
+
+    Returns
+    -------
+    str
+        The `meta.xml` content.
+    """
+    delimiter = delimiter.replace("\t", "\\t")
+    quote = quote.replace('"', "&quot;")
+    attributes = (
+        f'encoding="{encoding.upper()}" fieldsTerminatedBy="{delimiter}" linesTerminatedBy="\\n" '
+        f'fieldsEnclosedBy="{quote}" ignoreHeaderLines="{1 if header else 0}"'
+    )
+    row_type, filename, terms = CORES[core]
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<archive xmlns="http://rs.tdwg.org/dwc/text/" metadata="eml.xml">',
+        f'  <core rowType="{row_type}" {attributes}>',
+        f'    <files><location>{filename}</location></files>',
+        '    <id index="0"/>',
+    ]
+    lines.extend(f'    <field index="{i}" term="{DWC}{term}"/>' for i, term in enumerate(terms))
+    lines.append('  </core>')
+    for extension in extensions:
+        row_type, filename, terms = EXTENSIONS[extension]
+        lines.extend([
+            f'  <extension rowType="{row_type}" {attributes}>',
+            f'    <files><location>{filename}</location></files>',
+            '    <coreid index="0"/>',
+        ])
+        lines.extend(f'    <field index="{i + 1}" term="{DWC}{term}"/>' for i, term in enumerate(terms))
+        lines.append('  </extension>')
+    lines.append('</archive>')
+    return "\n".join(lines) + "\n"
+
+
+def eml_xml(package_id: str, sections: int = 10, keywords: int = 50) -> str:
+    """
+    Metadata document (`eml.xml`) of the archive.
+
+    Parameters
+    ----------
+    package_id : str
+        Identifier of the package.
+    sections : int, optional
+        Number of `additionalMetadata` sections. Default `10`.
+    keywords : int, optional
+        Number of keywords of the dataset. Default `50`.
+
+    Returns
+    -------
+    str
+        EML document.
+    """
+    keyword_set = "\n".join(f"      <keyword>keyword {i}</keyword>" for i in range(keywords))
+    additional = "\n".join(
+        f"  <additionalMetadata>\n    <metadata>\n      <additionalInfo>Section {i}.</additionalInfo>\n"
+        f"    </metadata>\n  </additionalMetadata>"
+        for i in range(sections)
+    )
+    return f"""<?xml version="1.0" encoding="UTF-8"?>
+<eml:eml xmlns:eml="https://eml.ecoinformatics.org/eml-2.2.0" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" packageId="{package_id}" system="http://example.org" scope="system" xml:lang="eng">
+  <dataset scope="document">
+    <title>Synthetic dataset {package_id}</title>
+    <creator scope="document">
+      <individualName>
+        <givenName>Jane</givenName>
+        <surName>Doe</surName>
+      </individualName>
+    </creator>
+    <keywordSet>
+{keyword_set}
+    </keywordSet>
+    <contact scope="document">
+      <positionName>Data manager</positionName>
+    </contact>
+  </dataset>
+{additional}
+</eml:eml>
+"""
+
+
+def write_rows(file: BinaryIO, rows: Sequence[List[str]], delimiter: str, quote: str, encoding: str) -> None:
+    if len(rows) == 0:
+        return
+    lines = [delimiter.join(f"{quote}{value}{quote}" for value in row) for row in rows]
+    file.write(("\n".join(lines) + "\n").encode(encoding))
+    return
+
+
+def generate_archive(
+        path: str, rows: int = 10_000,
+        core: str = "occurrence",
+        extensions: Sequence[str] = ("identification",),
+        extension_rows_per_core: int = 2,
+        delimiter: str = "\t",
+        quote: str = "",
+        encoding: str = "utf-8",
+        header: bool = True,
+        eml_sections: int = 10,
+        seed: int = 0,
+        chunk_size: int = 100_000,
+        package_id: str = None,
+) -> str:
+    """
+    Generate a synthetic Darwin Core Archive.
+
+    Parameters
+    ----------
+    path : str
+        Location of the `.zip` file to generate.
+    rows : int, optional
+        Number of rows of the core. Default `10_000`.
+    core : str, optional
+        Core of the archive, `"occurrence"` or `"taxon"` (a checklist). Default `"occurrence"`.
+    extensions : Sequence[str], optional
+        Extensions of an occurrence core: `"measurement_or_fact"`, `"identification"` or
+        `"resource_relationship"`. Default `("identification",)`.
+    extension_rows_per_core : int, optional
+        Rows of each extension per core row. Default `2`.
+    delimiter : str, optional
+        Delimiter of the fields. Default `"\\t"`.
+    quote : str, optional
+        Character enclosing every field, default empty `""` (not quoted).
+    encoding : str, optional
+        Encoding of the data files. Default `"utf-8"`.
+    header : bool, optional
+        Write a header line on the data files. Default `True`.
+    eml_sections : int, optional
+        Number of `additionalMetadata` sections of the EML document. Default `10`.
+    seed : int, optional
+        Seed of the values. Default `0`.
+    chunk_size : int, optional
+        Number of rows written at once. Default `100_000`.
+    package_id : str, optional
+        Identifier of the package, default derived from the parameters.
+
+    Returns
+    -------
+    str
+        Location of the generated archive.
+    """
+    assert core in CORES, f"Core must be one of {', '.join(CORES)}."
+    assert core == "occurrence" or len(extensions) == 0, "Extensions are only generated for an occurrence core."
+    for extension in extensions:
+        assert extension in EXTENSIONS, f"Extension must be one of {', '.join(EXTENSIONS)}."
+    if package_id is None:
+        package_id = f"synthetic-{core}-{rows}-{seed}"
+    with zipfile.ZipFile(path, "w", compression=zipfile.ZIP_DEFLATED, compresslevel=6) as archive:
+        archive.writestr("meta.xml", meta_xml(core, extensions, delimiter, quote, encoding, header))
+        archive.writestr("eml.xml", eml_xml(package_id, sections=eml_sections))
+        _, filename, terms = CORES[core]
+        # Each data file has its own generator, so they are written one after the other
+        rng = random.Random(f"{seed}-{core}")
+        with archive.open(filename, "w", force_zip64=True) as file:
+            if header:
+                write_rows(file, [terms], delimiter, quote, encoding)
+            if core == "taxon":
+                higher = higher_taxa_rows()[:rows]
+                write_rows(file, higher, delimiter, quote, encoding)
+                genera = [row for row in higher if row[4] == "genus"]
+                for start in range(len(higher), rows, chunk_size):
+                    end = min(rows, start + chunk_size)
+                    write_rows(file, species_rows(start, end, genera, rng), delimiter, quote, encoding)
+            else:
+                for start in range(0, rows, chunk_size):
+                    end = min(rows, start + chunk_size)
+                    write_rows(file, occurrence_rows(start, end, rng), delimiter, quote, encoding)
+        for extension in extensions:
+            _, filename, terms = EXTENSIONS[extension]
+            rng = random.Random(f"{seed}-{extension}")
+            with archive.open(filename, "w", force_zip64=True) as file:
+                if header:
+                    write_rows(file, [["coreid"] + terms], delimiter, quote, encoding)
+                step = max(1, chunk_size // max(1, extension_rows_per_core))
+                for start in range(0, rows, step):
+                    end = min(rows, start + step)
+                    write_rows(
+                        file, extension_rows(extension, start, end, extension_rows_per_core, rng),
+                        delimiter, quote, encoding
+                    )
+    return path
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Generate a synthetic Darwin Core Archive.")
+    parser.add_argument("path", help="Location of the archive to generate.")
+    parser.add_argument("--rows", type=int, default=10_000, help="Rows of the core.")
+    parser.add_argument("--core", choices=list(CORES), default="occurrence", help="Core of the archive.")
+    parser.add_argument(
+        "--extensions", nargs="*", choices=list(EXTENSIONS), default=["identification"],
+        help="Extensions of an occurrence core."
+    )
+    parser.add_argument("--per-core", type=int, default=2, help="Rows of each extension per core row.")
+    parser.add_argument("--delimiter", default="\t", help="Delimiter of the fields.")
+    parser.add_argument("--quote", default="", help="Character enclosing the fields.")
+    parser.add_argument("--encoding", default="utf-8", help="Encoding of the data files.")
+    parser.add_argument("--no-header", action="store_true", help="Do not write header lines.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the values.")
+    args = parser.parse_args()
+    generate_archive(
+        args.path, rows=args.rows, core=args.core,
+        extensions=args.extensions if args.core == "occurrence" else [],
+        extension_rows_per_core=args.per_core, delimiter=args.delimiter, quote=args.quote,
+        encoding=args.encoding, header=not args.no_header, seed=args.seed,
+    )
+    return
+
+
+if __name__ == "__main__":
+    main()
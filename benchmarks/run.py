@@ -0,0 +1,315 @@
+"""
+Benchmark suite of the library.
+
+Each case is timed (wall and CPU time) over several repetitions on synthetic
+archives of the requested sizes, and its peak memory is measured on an extra
+run. Results are written as JSON, so they can be compared between releases
+with `benchmarks/compare.py`.
+
+Usage::
+
+    python -m benchmarks.run --rows 10000 100000 --output results.json
+"""
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import gc
+import json
+import os
+import platform
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+import warnings
+from typing import Callable, Dict, List, Any, Sequence, Tuple
+
+# Progress bars are not part of the measurements
+os.environ.setdefault("TQDM_DISABLE", "1")
+
+from benchmarks.generator import generate_archive, eml_xml, EXTENSIONS, UNWRITABLE  # noqa: E402
+from dwca import DarwinCoreArchive  # noqa: E402
+from eml import EML  # noqa: E402
+
+Setup = Callable[[Dict[str, str]], Any]
+Run = Callable[[Any], Any]
+Teardown = Callable[[Any], None]
+
+
+def load(path: str, lazy: bool = False) -> DarwinCoreArchive:
+    return DarwinCoreArchive.from_file(path, lazy=lazy, _no_interaction=True)
+
+
+def close(darwin_core: DarwinCoreArchive) -> None:
+    if darwin_core is None:
+        return
+    for data_file in [darwin_core.core] + list(darwin_core.extensions):
+        if data_file.is_lazy():
+            data_file.close()
+    return
+
+
+def nothing(_: Any) -> None:
+    return
+
+
+def output_path() -> Tuple[str, str]:
+    directory = tempfile.mkdtemp()
+    return directory, os.path.join(directory, "output.zip")
+
+
+def remove_output(state: Tuple[Any, str, str]) -> None:
+    _, directory, path = state
+    if os.path.exists(path):
+        os.remove(path)
+    os.rmdir(directory)
+    return
+
+
+WRITE_CASES = {"write_file", "to_file"}
+"""Set[str]: Cases writing the archive, skipped with the extensions in :data:`benchmarks.generator.UNWRITABLE`."""
+
+CASES: Dict[str, Tuple[Setup, Run, Teardown]] = {
+    "load_eager": (
+        lambda archives: archives["occurrence"],
+        lambda path: load(path),
+        nothing,
+    ),
+    "load_lazy": (
+        lambda archives: [archives["occurrence"], None],
+        lambda state: state.__setitem__(1, load(state[0], lazy=True)),
+        lambda state: close(state[1]),
+    ),
+    "write_file": (
+        lambda archives: load(archives["occurrence"]),
+        lambda darwin_core: [data_file.write_file(_no_interaction=True)
+                             for data_file in [darwin_core.core] + list(darwin_core.extensions)],
+        nothing,
+    ),
+    "to_file": (
+        lambda archives: (load(archives["occurrence"]),) + output_path(),
+        lambda state: state[0].to_file(state[2], _no_interaction=True),
+        remove_output,
+    ),
+    "as_pandas": (
+        lambda archives: load(archives["occurrence"]),
+        lambda darwin_core: darwin_core.core.as_pandas(_no_interaction=True),
+        nothing,
+    ),
+    "as_polars": (
+        lambda archives: load(archives["occurrence"]),
+        lambda darwin_core: darwin_core.core.as_polars(_no_interaction=True),
+        nothing,
+    ),
+    "merge": (
+        lambda archives: (load(archives["occurrence"]), load(archives["other"])),
+        lambda pair: DarwinCoreArchive.merge(pair[0], pair[1]),
+        nothing,
+    ),
+    "insert_sql": (
+        lambda archives: load(archives["occurrence"]),
+        lambda darwin_core: sum(1 for _ in darwin_core.core.insert_sql),
+        nothing,
+    ),
+    "taxon_filter": (
+        lambda archives: load(archives["taxon"]),
+        lambda darwin_core: darwin_core.core.filter(ranks={"kingdom": ["Plantae"], "family": ["Rosaceae", "Poaceae"]}),
+        nothing,
+    ),
+    "taxon_filter_species": (
+        lambda archives: load(archives["taxon"]),
+        lambda darwin_core: darwin_core.core.filter_by_species(
+            [f"Rosaceus{g} species{s}" for g in range(8) for s in range(100, 200)]
+        ),
+        nothing,
+    ),
+    "eml_parse": (
+        lambda archives: archives["eml"],
+        lambda text: EML.from_string(text),
+        nothing,
+    ),
+    "eml_parse_stream": (
+        lambda archives: archives["eml"].encode("utf-8"),
+        lambda content: EML.from_stream(content),
+        nothing,
+    ),
+    "eml_serialize": (
+        lambda archives: EML.from_string(archives["eml"]),
+        lambda eml: eml.to_xml(),
+        nothing,
+    ),
+}
+"""Dict[str, Tuple[Setup, Run, Teardown]]: Benchmark cases, the setup is not measured."""
+
+
+def summary(values: List[float]) -> Dict[str, Any]:
+    return {
+        "min": min(values),
+        "median": statistics.median(values),
+        "max": max(values),
+        "values": values,
+    }
+
+
+def measure(
+        setup: Setup, run: Run, teardown: Teardown,
+        archives: Dict[str, str], repeat: int = 3, memory: bool = True,
+) -> Dict[str, Any]:
+    """
+    Measure a benchmark case.
+
+    Parameters
+    ----------
+    setup : Setup
+        Prepare the state of the case, not measured.
+    run : Run
+        Measured operation.
+    teardown : Teardown
+        Release the state of the case, not measured.
+    archives : Dict[str, str]
+        Archives (and documents) available to the case.
+    repeat : int, optional
+        Number of timed runs. Default `3`.
+    memory : bool, optional
+        Measure the peak of memory on an extra run. Default `True`.
+
+    Returns
+    -------
+    Dict[str, Any]
+        Wall and CPU time (seconds) of each run and peak of memory (bytes).
+    """
+    walls, cpus = list(), list()
+    for _ in range(repeat):
+        state = setup(archives)
+        gc.collect()
+        wall, cpu = time.perf_counter(), time.process_time()
+        run(state)
+        walls.append(time.perf_counter() - wall)
+        cpus.append(time.process_time() - cpu)
+        teardown(state)
+    result = {"wall_seconds": summary(walls), "cpu_seconds": summary(cpus)}
+    if memory:
+        state = setup(archives)
+        gc.collect()
+        tracemalloc.start()
+        run(state)
+        result["peak_memory_bytes"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        teardown(state)
+    return result
+
+
+def prepare_archives(
+        rows: int, data_dir: str, extensions: Sequence[str],
+        quote: str, delimiter: str, encoding: str, eml_sections: int, seed: int,
+) -> Dict[str, str]:
+    """
+    Generate (or reuse) the synthetic archives for a size.
+
+    Returns
+    -------
+    Dict[str, str]
+        Location of the archives by name and the EML document (`"eml"`).
+    """
+    variant = f"{'-'.join(extensions) or 'core'}-{delimiter.encode().hex()}-{quote.encode().hex()}-{encoding}-{seed}"
+    archives = dict()
+    for name, core, file_seed in (("occurrence", "occurrence", seed), ("other", "occurrence", seed + 1),
+                                  ("taxon", "taxon", seed)):
+        path = os.path.join(data_dir, f"{name}-{rows}-{variant}.zip")
+        if not os.path.exists(path):
+            generate_archive(
+                path, rows=rows, core=core,
+                extensions=extensions if core == "occurrence" else [],
+                delimiter=delimiter, quote=quote, encoding=encoding, seed=file_seed,
+                package_id=f"synthetic-{name}-{rows}-{file_seed}",
+            )
+        archives[name] = path
+    # Without the XML declaration, as expected by `from_string`
+    archives["eml"] = eml_xml(f"synthetic-{rows}", sections=eml_sections, keywords=eml_sections).split("\n", 1)[1]
+    return archives
+
+
+def library_version() -> str:
+    try:
+        from importlib.metadata import version
+        return version("pydwca")
+    except Exception:
+        return "unknown"
+
+
+def main(arguments: Sequence[str] = None) -> Dict[str, Any]:
+    parser = argparse.ArgumentParser(description="Run the benchmark suite.")
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000], help="Rows of the core archives.")
+    parser.add_argument("--cases", nargs="+", choices=list(CASES), default=list(CASES), help="Cases to run.")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed runs of each case.")
+    parser.add_argument("--no-memory", action="store_true", help="Do not measure the peak of memory.")
+    parser.add_argument(
+        "--extensions", nargs="*", choices=list(EXTENSIONS), default=["identification"],
+        help="Extensions of the occurrence archives."
+    )
+    parser.add_argument("--quote", default="", help="Character enclosing the fields.")
+    parser.add_argument("--delimiter", default="\t", help="Delimiter of the fields.")
+    parser.add_argument("--encoding", default="utf-8", help="Encoding of the data files.")
+    parser.add_argument("--eml-sections", type=int, default=1_000, help="Sections of the EML document.")
+    parser.add_argument("--seed", type=int, default=0, help="Seed of the synthetic data.")
+    parser.add_argument("--data-dir", default=None, help="Directory to keep the generated archives.")
+    parser.add_argument("--output", default=None, help="JSON file with the results, default standard output.")
+    args = parser.parse_args(arguments)
+    data_dir = args.data_dir or os.path.join(tempfile.gettempdir(), "pydwca-benchmarks")
+    os.makedirs(data_dir, exist_ok=True)
+    report = {
+        "library": "pydwca",
+        "version": library_version(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "created": dt.datetime.now(dt.timezone.utc).isoformat(),
+        "parameters": {
+            "extensions": args.extensions, "quote": args.quote, "delimiter": args.delimiter,
+            "encoding": args.encoding, "eml_sections": args.eml_sections, "seed": args.seed,
+            "repeat": args.repeat,
+        },
+        "results": list(),
+    }
+    for rows in args.rows:
+        archives = prepare_archives(
+            rows, data_dir, args.extensions, args.quote, args.delimiter,
+            args.encoding, args.eml_sections, args.seed,
+        )
+        for case in args.cases:
+            setup, run, teardown = CASES[case]
+            result = {"case": case, "rows": rows}
+            unwritable = [UNWRITABLE[extension] for extension in args.extensions if extension in UNWRITABLE]
+            if case in WRITE_CASES and len(unwritable) > 0:
+                result["skipped"] = "; ".join(unwritable)
+                print(f"{case} [{rows} rows]: skipped ({result['skipped']})", file=sys.stderr)
+                report["results"].append(result)
+                continue
+            try:
+                with warnings.catch_warnings():
+                    warnings.simplefilter("ignore")
+                    result.update(measure(setup, run, teardown, archives, args.repeat, not args.no_memory))
+            except ImportError as e:
+                result["skipped"] = str(e)
+            except Exception as e:
+                # Failures are reported as results, the rest of the cases are still measured
+                result["error"] = f"{type(e).__name__}: {e}"
+            if "wall_seconds" in result:
+                status = f"{result['wall_seconds']['median']:.4f} s"
+            else:
+                status = f"skipped ({result.get('skipped', result.get('error'))})"
+            print(f"{case} [{rows} rows]: {status}", file=sys.stderr)
+            report["results"].append(result)
+    content = json.dumps(report, indent=2)
+    if args.output is None:
+        print(content)
+    else:
+        with open(args.output, "w", encoding="utf-8") as file:
+            file.write(content + "\n")
+    return report
+
+
+if __name__ == "__main__":
+    main()
@@ -3,18 +3,41 @@ from __future__ import annotations
 import io
 import zipfile
 from copy import deepcopy
-from typing import List, Dict, Type
+from itertools import repeat, product, chain
+from typing import List, Dict, Type, BinaryIO, Callable, Iterator, Tuple
 from warnings import warn
 
 from lxml import etree as et
 
 from dwca.base import DarwinCore
+from dwca.base.simple_darwincore import SimpleDarwinCore, SimpleDarwinCoreWriter
+from dwca.terms import Field, DecimalLatitude, DecimalLongitude, MinimumElevationInMeters, \
+    MaximumElevationInMeters, EventDate, DWCYear, DWCMonth, DWCDay, DWCModified
+from dwca.utils import GeographicAggregator, TemporalAggregator, StageProfile, StageRecord, MemoryUsage, deep_sizeof, \
+    Quarantine, QuarantinedRow
 from dwca.classes import DataFile, Occurrence, Organism, MaterialEntity, MaterialSample, Event, Location, \
-    GeologicalContext, Identification, Taxon, ResourceRelationship, MeasurementOrFact, ChronometricAge, OutsideClass
+    GeologicalContext, Identification, Taxon, ResourceRelationship, MeasurementOrFact, ChronometricAge, OutsideClass, \
+    REGISTRY, DataFileType
+from dwca.classes.data_file import READ_CHUNK_SIZE
 from eml import EML
 from eml.resources import EMLResource
+from eml.resources.coverage import GeographicCoverage, TemporalCoverage
 from xml_common import XMLObject
-from xml_common.utils import Language, read_string
+from xml_common.utils import Language, read_string, GPolygon, GRing, LengthUnit, LazyModule, Diagnostics, \
+    UNKNOWN_CLASS
+
+pl = LazyModule("polars")
+
+
+def _parse_eml_(content: BinaryIO | bytes, lazy: bool) -> EML | Exception:
+    try:
+        return EML.from_stream(content, lazy=lazy)
+    except Exception as e:
+        # Errors of lxml cannot be pickled back from a worker process
+        return RuntimeError(f"{type(e).__name__}: {e}")
+    finally:
+        if hasattr(content, "close"):
+            content.close()
 
 
 class DarwinCoreArchive(DarwinCore):
@@ -68,11 +91,15 @@ class DarwinCoreArchive(DarwinCore):
             Type[DataFile]
                 The Python ``class`` representing the class term.
             """
-            for dwc_class in cls.__classes__:
-                if element.get("rowType") == dwc_class.URI:
-                    return dwc_class
-            warn(f"{element.get('rowType')} not in expected namespace. "
-                 f"Some functionalities may not be available.")
+            dwc_class = REGISTRY.get_class(element.get("rowType"))
+            if dwc_class is not None:
+                return dwc_class
+            diagnostics = Diagnostics.active()
+            if diagnostics is None:
+                warn(f"{element.get('rowType')} not in expected namespace. "
+                     f"Some functionalities may not be available.")
+            else:
+                diagnostics.record(UNKNOWN_CLASS, element.get("rowType"))
             return OutsideClass
 
         @classmethod
@@ -128,6 +155,7 @@ class DarwinCoreArchive(DarwinCore):
         self.__id__ = _id
         self.__meta__ = DarwinCoreArchive.Metadata()
         self.__metadata__ = None
+        self.__diagnostics__ = None
         self.__dataset_meta__ = {
             "metadata": self.__metadata__
         }
@@ -146,6 +174,15 @@ class DarwinCoreArchive(DarwinCore):
     @core.setter
     def core(self, core: DataFile) -> None:
         self.__meta__.__core__ = core
+        if core.is_lazy():
+            core_ids = set(core.__column__(core.__fields__[core.id].name))
+            for extension in self.extensions:
+                extension_id = extension.__fields__[extension.id].name
+                if extension.is_lazy():
+                    extension._filter_rows_(pl.col(extension_id).is_in(list(core_ids)))
+                else:
+                    extension._filter_rows_([entry_id in core_ids for entry_id in extension.__column__(extension_id)])
+            return
         try:
             df = self.__meta__.__core__.pandas
             for extension in self.extensions:
@@ -162,6 +199,7 @@ class DarwinCoreArchive(DarwinCore):
                 extension.__entries__ = list(filter(
                     criteria, extension.__entries__
                 ))
+                extension._reset_indexes_()
         return
 
     @property
@@ -192,6 +230,11 @@ class DarwinCoreArchive(DarwinCore):
         """
         return self.__dataset_meta__
 
+    @property
+    def diagnostics(self) -> Diagnostics | None:
+        """Diagnostics | None: Issues found reading the archive, None if it was not read from a file."""
+        return self.__diagnostics__
+
     @property
     def language(self) -> Language:
         """Language: Language of the Darwin Core Archive register on metadata."""
@@ -225,8 +268,153 @@ class DarwinCoreArchive(DarwinCore):
         self.__metadata__ = eml
         return
 
+    def compute_geographic_coverage(
+            self, description: str = "Geographic coverage of the archive records.",
+            hull: bool = False,
+            max_vertices: int = None,
+            batch_size: int = 10_000,
+    ) -> GeographicCoverage:
+        """
+        Compute the geographic coverage of the archive from its coordinates.
+
+        The coordinates of the core and the :class:`dwca.classes.location.Location` and
+        :class:`dwca.classes.event.Event` extensions are read in one pass by batches,
+        without building data frames.
+
+        Parameters
+        ----------
+        description : str, optional
+            Description of the geographic coverage.
+        hull : bool, optional
+            Include the convex hull of the coordinates as a polygon. Default `False`.
+        max_vertices : int, optional
+            Simplify the convex hull to at most this number of vertices.
+        batch_size : int, optional
+            Number of rows read at once. Default `10_000`.
+
+        Returns
+        -------
+        GeographicCoverage
+            Bounding coordinates, elevation limits (if any) and convex hull (if requested).
+        """
+        aggregator = GeographicAggregator(hull=hull)
+        latitude, longitude = DecimalLatitude.name_cls(), DecimalLongitude.name_cls()
+        elevation_fields = [MinimumElevationInMeters, MaximumElevationInMeters]
+        data_files = [self.core] + [ext for ext in self.extensions if isinstance(ext, (Location, Event))]
+        for data_file in data_files:
+            if DecimalLatitude.URI not in data_file.fields or DecimalLongitude.URI not in data_file.fields:
+                continue
+            elevations = [field.name_cls() for field in elevation_fields if field.URI in data_file.fields]
+            for batch in data_file._iter_columns_([latitude, longitude] + elevations, batch_size=batch_size):
+                aggregator.update(batch[0], batch[1], [value for values in batch[2:] for value in values])
+        if aggregator.count == 0:
+            raise ValueError("No valid coordinates found on the archive.")
+        west, east, north, south = aggregator.bounding_box
+        elevation = aggregator.elevation
+        polygons = list()
+        if hull:
+            ring = aggregator.convex_hull(max_vertices=max_vertices)
+            if len(ring) >= 3:
+                polygons.append(GPolygon(GRing(*ring)))
+        return GeographicCoverage(
+            description=description,
+            west_bounding=west,
+            east_bounding=east,
+            north_bounding=north,
+            south_bounding=south,
+            altitude_bounding=None if elevation is None else (elevation[1], elevation[0]),
+            altitude_units=None if elevation is None else LengthUnit.METER,
+            g_polygon=polygons,
+        )
+
+    def compute_temporal_coverage(
+            self, max_single_dates: int = 0,
+            modified: bool = True,
+            batch_size: int = 10_000,
+    ) -> TemporalCoverage:
+        """
+        Compute the temporal coverage of the archive from its dates.
+
+        The event date (including intervals), the year, month and day and, optionally, the modified
+        date of the core and every extension are read in one pass by batches, without building data frames.
+
+        Parameters
+        ----------
+        max_single_dates : int, optional
+            Use single dates instead of a range when there are at most this number of
+            distinct days. Default `0` (always a range).
+        modified : bool, optional
+            Include the date of modification of the records. Default `True`.
+        batch_size : int, optional
+            Number of rows read at once. Default `10_000`.
+
+        Returns
+        -------
+        TemporalCoverage
+            Range of dates (or single dates) covered by the archive.
+        """
+        aggregator = TemporalAggregator(max_single_dates=max_single_dates)
+        date_fields = [EventDate] + ([DWCModified] if modified else [])
+        for data_file in [self.core] + self.extensions:
+            dates = [field.name_cls() for field in date_fields if field.URI in data_file.fields]
+            if len(dates) > 0:
+                for batch in data_file._iter_columns_(dates, batch_size=batch_size):
+                    for values in batch:
+                        aggregator.update(values)
+            if DWCYear.URI in data_file.fields:
+                parts = [field.name_cls() for field in (DWCYear, DWCMonth, DWCDay) if field.URI in data_file.fields]
+                for batch in data_file._iter_columns_(parts, batch_size=batch_size):
+                    values = dict(zip(parts, batch))
+                    aggregator.update_parts(
+                        values[DWCYear.name_cls()],
+                        values.get(DWCMonth.name_cls(), None),
+                        values.get(DWCDay.name_cls(), None),
+                    )
+        if aggregator.count == 0:
+            raise ValueError("No valid dates found on the archive.")
+        single_dates = aggregator.single_dates
+        if single_dates is not None:
+            return TemporalCoverage(single_datetime=single_dates)
+        return TemporalCoverage(range_datetime=aggregator.range)
+
+    def memory_usage(self, deep: bool = True) -> Dict[str, MemoryUsage]:
+        """
+        Bytes used by each member of the archive, see :meth:`DataFile.memory_usage`.
+
+        Parameters
+        ----------
+        deep : bool, optional
+            Measure every value and every index, instead of estimating the entries from a sample. Default `True`.
+
+        Returns
+        -------
+        Dict[str, MemoryUsage]
+            Usage of the core, each extension and the metadata if any (component `metadata`, including the
+            metadata of each dataset), by filename. Use :meth:`MemoryUsage.combine` for the whole archive.
+        """
+        usage = dict()
+        for data_file in [self.core] + self.extensions:
+            if data_file is not None:
+                usage[data_file.filename] = data_file.memory_usage(deep=deep)
+        if self.metadata is not None:
+            seen = set()
+            metadata = deep_sizeof(self.metadata, seen)
+            for eml in self.dataset_metadata.values():
+                metadata += deep_sizeof(eml, seen)
+            usage[self.metadata_filename] = MemoryUsage(self.metadata_filename, components={"metadata": metadata})
+        return usage
+
     @classmethod
-    def from_file(cls, path_to_archive: str, lazy: bool = False, _no_interaction: bool = False) -> DarwinCoreArchive:
+    def from_file(
+            cls, path_to_archive: str,
+            lazy: bool = False,
+            _no_interaction: bool = False,
+            lazy_metadata: bool = False,
+            workers: int = 1,
+            profile: StageProfile | Callable[[StageRecord], None] = None,
+            diagnostics: Diagnostics = None,
+            quarantine: Quarantine | List[QuarantinedRow] | str | DataFile = None,
+    ) -> DarwinCoreArchive:
         """
         Generate a Darwin Core Archive instance from an archive file (`.zip`).
 
@@ -236,64 +424,115 @@ class DarwinCoreArchive(DarwinCore):
             Path of the archive file.
         lazy : bool, optional
             Read the archive lazy. Default `False`.
+        lazy_metadata : bool, optional
+            Read the EML documents in lazy mode, parsing its sections on first access. Default `False`.
+        workers : int, optional
+            Number of processes parsing the EML documents of the datasets (`dataset/` directory). Default `1`.
+        profile : StageProfile | Callable[[StageRecord], None], optional
+            Profile (or callback) recording the resources of each stage (`zip_read`, `decompress`, `decode`,
+            `tokenize`, `convert`, `entries`, `meta_parse` and `eml_parse`) on each member of the archive.
+        diagnostics : Diagnostics, optional
+            Collector of the issues found reading the archive (unknown classes and terms, values that could
+            not be converted). By default, a new collector whose summary is warned at the end, see
+            :attr:`diagnostics`.
+        quarantine : Quarantine | List[QuarantinedRow] | str | DataFile, optional
+            Read the data files in tolerant mode, setting apart the malformed rows of every data file in the
+            quarantine (see :meth:`DataFile.read_file`). Not supported in lazy mode.
         _no_interaction : bool, optional
-            Not to show progress bar if library `tqdm` is installed. Default `False`.
+            Not to report the progress (see :func:`xml_common.utils.configure_progress`). Default `False`.
 
         Returns
         -------
         DarwinCoreArchive
             Instance of the Darwin Core Archive.
         """
-        archive = zipfile.ZipFile(path_to_archive, "r")
-        index_file = archive.read("meta.xml")
-        metadata = DarwinCoreArchive.Metadata.from_string(read_string(index_file))
-        if metadata.__metadata__ is not None:
-            metadata_content = archive.read(metadata.__metadata__)
-            eml = EML.from_string(read_string(metadata_content))
-            darwin_core = DarwinCoreArchive(_id=eml.package_id)
-            darwin_core.__metadata__ = eml
-        else:
-            darwin_core = DarwinCoreArchive()
-        darwin_core.__meta__ = metadata
-        if lazy:
-            core_file = archive.open(darwin_core.core.filename)
-            darwin_core.__meta__.__core__.read_file("", source_file=core_file, lazy=lazy, _no_interaction=_no_interaction)
-            core_file.close()
-        else:
-            core_file = archive.read(darwin_core.core.filename)
-            darwin_core.__meta__.__core__.read_file(core_file.decode(encoding=metadata.__core__.__encoding__), _no_interaction=_no_interaction)
-        darwin_core.__meta__.__core__._register_darwin_core_(0, darwin_core)
-        for i, extension in enumerate(darwin_core.extensions):
-            extension.set_core_field(darwin_core.core.__fields__[darwin_core.core.id])
-            extension.set_primary_key(darwin_core.core.name)
-            if lazy:
-                extension_file = archive.open(extension.filename)
-                darwin_core.__meta__.__extensions__[i].read_file("", source_file=extension_file, lazy=lazy, _no_interaction=_no_interaction)
-                extension_file.close()
+        profile = StageProfile.wrap(profile)
+        assert quarantine is None or not lazy, "Tolerant mode (quarantine) is not supported in lazy mode."
+        sink = Quarantine.wrap(quarantine) if quarantine is not None else None
+        with Diagnostics.collect(diagnostics, name=path_to_archive) as diagnostics:
+            with profile.stage("zip_read"):
+                archive = zipfile.ZipFile(path_to_archive, "r")
+            with profile.stage("zip_read", "meta.xml", n_bytes=archive.getinfo("meta.xml").compress_size):
+                index_file = archive.read("meta.xml")
+            with profile.stage("meta_parse", "meta.xml", n_bytes=len(index_file)):
+                metadata = DarwinCoreArchive.Metadata.from_string(read_string(index_file))
+            if metadata.__metadata__ is not None:
+                with profile.stage("eml_parse", metadata.__metadata__,
+                                   n_bytes=archive.getinfo(metadata.__metadata__).file_size):
+                    with archive.open(metadata.__metadata__) as metadata_file:
+                        eml = EML.from_stream(metadata_file, lazy=lazy_metadata)
+                darwin_core = DarwinCoreArchive(_id=eml.package_id)
+                darwin_core.__metadata__ = eml
             else:
-                extension_file = archive.read(extension.filename)
-                darwin_core.__meta__.__extensions__[i].read_file(extension_file.decode(), _no_interaction=_no_interaction)
-        darwin_core.__dataset_meta__ = {
-            "metadata": darwin_core.__metadata__
-        }
-        for item in archive.namelist():
-            if item.startswith("dataset/"):
-                if item == "dataset/":
-                    continue
-                try:
-                    dataset_meta = EML.from_string(read_string(archive.read(item)))
+                darwin_core = DarwinCoreArchive()
+            darwin_core.__meta__ = metadata
+            cls.__read_data_file__(archive, darwin_core.core, lazy, _no_interaction, profile, sink)
+            darwin_core.__meta__.__core__._register_darwin_core_(0, darwin_core)
+            for extension in darwin_core.extensions:
+                extension.set_core_field(darwin_core.core.__fields__[darwin_core.core.id])
+                extension.set_primary_key(darwin_core.core.name)
+                cls.__read_data_file__(archive, extension, lazy, _no_interaction, profile, sink)
+            darwin_core.__dataset_meta__ = {
+                "metadata": darwin_core.__metadata__
+            }
+            items = [item for item in archive.namelist() if item.startswith("dataset/") and item != "dataset/"]
+            if workers > 1 and len(items) > 1:
+                with profile.stage("zip_read", "dataset/") as record:
+                    contents = [archive.read(item) for item in items]
+                    record.add(n_bytes=sum(len(content) for content in contents), rows=len(contents))
+                from concurrent.futures import ProcessPoolExecutor
+                with profile.stage("eml_parse", "dataset/", n_bytes=sum(len(content) for content in contents)):
+                    with ProcessPoolExecutor(max_workers=workers) as executor:
+                        datasets = list(executor.map(
+                            _parse_eml_, contents, repeat(lazy_metadata),
+                            chunksize=max(1, len(items) // (4 * workers)),
+                        ))
+            else:
+                datasets = list()
+                for item in items:
+                    with profile.stage("eml_parse", item, n_bytes=archive.getinfo(item).file_size):
+                        datasets.append(_parse_eml_(archive.open(item), lazy_metadata))
+            for item, dataset_meta in zip(items, datasets):
+                if isinstance(dataset_meta, Exception):
+                    warn(f"Could not read {item.replace('dataset/', '')}:\n{dataset_meta}", category=RuntimeWarning)
+                else:
                     darwin_core.__dataset_meta__[dataset_meta.package_id] = dataset_meta
-                except Exception as e:
-                    warn(f"Could not read {item.replace('dataset/', '')}:\n{e}", category=RuntimeWarning)
+            darwin_core.__diagnostics__ = diagnostics
+        if sink is not None and sink is not quarantine:
+            sink.close()
         archive.close()
         return darwin_core
 
+    @staticmethod
+    def __read_data_file__(
+            archive: zipfile.ZipFile, data_file: DataFile,
+            lazy: bool, _no_interaction: bool, profile: StageProfile, quarantine: Quarantine = None,
+    ) -> None:
+        member = data_file.filename
+        info = archive.getinfo(member)
+        with profile.stage("zip_read", member, n_bytes=info.compress_size):
+            source = archive.open(member)
+        if lazy:
+            data_file.read_file("", source_file=source, lazy=lazy, _no_interaction=_no_interaction, profile=profile)
+            source.close()
+        else:
+            # Reading a member includes its decompression
+            with profile.stage("decompress", member, n_bytes=info.file_size):
+                raw_content = source.read()
+            source.close()
+            with profile.stage("decode", member, n_bytes=len(raw_content)):
+                content = raw_content.decode(encoding=data_file.__encoding__)
+            del raw_content
+            data_file.read_file(content, _no_interaction=_no_interaction, profile=profile, quarantine=quarantine)
+        return
+
     def to_file(
             self, path_to_archive: str,
             encoding: str = "utf-8",
             compression: int = zipfile.ZIP_DEFLATED,
             compression_level: int = 6,
             _no_interaction: bool = False,
+            profile: StageProfile | Callable[[StageRecord], None] = None,
     ) -> None:
         """
         Generate a Darwin Core Archive file (`.zip` file) using the information of this instance.
@@ -308,26 +547,309 @@ class DarwinCoreArchive(DarwinCore):
             The ZIP compression method to use. Default `zipfile.ZIP_DEFLATED`.
         compression_level : int, optional
             Compression level to use when writing files to the archive. Default `6`.
+        profile : StageProfile | Callable[[StageRecord], None], optional
+            Profile (or callback) recording the resources of each stage (`serialize`, `encode`, `compress`
+            and `zip_write`) on each member of the archive.
         _no_interaction : bool, optional
-            Not to show progress bar if library `tqdm` is installed. Default `False`.
+            Not to report the progress (see :func:`xml_common.utils.configure_progress`). Default `False`.
         """
+        profile = StageProfile.wrap(profile)
+        # Member, serialization, rows and encoding of each file
+        members = [("meta.xml", lambda: self.__meta__.to_xml(), 0, encoding)]
+        if self.metadata is not None:
+            members.append((self.__meta__.__metadata__, lambda: self.__metadata__.to_xml(), 0, encoding))
+        for data_file in ([self.core] if self.core is not None else []) + list(self.extensions):
+            members.append((
+                data_file.filename,
+                lambda data_file=data_file: data_file.write_file(_no_interaction=_no_interaction),
+                len(data_file.__entries__), "utf-8",
+            ))
+        for dataset, metadata in self.dataset_metadata.items():
+            if dataset != "metadata":
+                members.append((f"dataset/{dataset}.xml", lambda metadata=metadata: metadata.to_xml(), 0, encoding))
         zip_buffer = io.BytesIO()
         with zipfile.ZipFile(zip_buffer, 'a', compression=compression, compresslevel=compression_level) as zip_file:
-            zip_file.writestr("meta.xml", self.__meta__.to_xml().encode(encoding))
-            if self.metadata is not None:
-                zip_file.writestr(self.__meta__.__metadata__, self.__metadata__.to_xml().encode(encoding))
-            if self.core is not None:
-                zip_file.writestr(self.core.filename, self.core.write_file(_no_interaction=_no_interaction))
-            for extension in self.extensions:
-                zip_file.writestr(extension.filename, extension.write_file(_no_interaction=_no_interaction))
-            for dataset, metadata in self.dataset_metadata.items():
-                if dataset != "metadata":
-                    zip_file.writestr(f"dataset/{dataset}.xml", metadata.to_xml().encode(encoding))
-        with open(path_to_archive, 'wb') as output_file:
-            output_file.write(zip_buffer.getvalue())
+            for member, serialize, rows, member_encoding in members:
+                with profile.stage("serialize", member, rows=rows):
+                    content = serialize()
+                with profile.stage("encode", member, n_bytes=len(content)):
+                    content = content.encode(member_encoding)
+                with profile.stage("compress", member, n_bytes=len(content)):
+                    zip_file.writestr(member, content)
+                del content
+        with profile.stage("zip_write", n_bytes=zip_buffer.tell()):
+            with open(path_to_archive, 'wb') as output_file:
+                output_file.write(zip_buffer.getvalue())
         zip_buffer.close()
         return
 
+    @staticmethod
+    def _route_terms_(
+            fields: List[Field], core: Type[DataFile], extensions: List[Type[DataFile]]
+    ) -> Dict[str, Type[DataFile]]:
+        """
+        Class receiving each term of a flat table: the core if the term is of the core class (including the
+        record level terms), otherwise the first extension with the term, or the core if none has it.
+
+        Parameters
+        ----------
+        fields : List[Field]
+            Terms of the flat table.
+        core : Type[DataFile]
+            Class of the core.
+        extensions : List[Type[DataFile]]
+            Class of the extensions, in order of preference.
+
+        Returns
+        -------
+        Dict[str, Type[DataFile]]
+            Class of each term by URI.
+        """
+        routes = dict()
+        for field in fields:
+            if REGISTRY.get_term(core, field.uri) is not None:
+                routes[field.uri] = core
+                continue
+            routes[field.uri] = next(
+                (extension for extension in extensions if REGISTRY.get_term(extension, field.uri) is not None), core
+            )
+        return routes
+
+    @classmethod
+    def from_simple(
+            cls, simple: SimpleDarwinCore | str,
+            core: Type[DataFile] = Occurrence,
+            extensions: List[Type[DataFile]] = None,
+            core_id: str = None,
+            _id: str = None,
+            **kwargs,
+    ) -> DarwinCoreArchive:
+        """
+        Split a Simple Darwin Core (a flat table) into a core and its extensions, in a single pass over the rows.
+
+        Each term goes to the class given by :meth:`_route_terms_`. A core record is created for each
+        identifier (the first row with it), and the rows repeated by one-to-many extensions are created once.
+
+        Parameters
+        ----------
+        simple : SimpleDarwinCore | str
+            A Simple Darwin Core, or the path of a file read by chunks (see :meth:`SimpleDarwinCore.from_file`).
+        core : Type[DataFile], optional
+            Class of the core. Default :class:`dwca.classes.Occurrence`.
+        extensions : List[Type[DataFile]], optional
+            Class of the extensions receiving the terms not in the core, in order of preference. Default none.
+        core_id : str, optional
+            Term (name or URI) identifying the core records. Default the identifier of the core class
+            (e.g. `occurrenceID`).
+        _id : str, optional
+            A unique id for the Darwin Core Archive.
+
+        Other Parameters
+        ----------------
+        **kwargs
+            Options of :meth:`SimpleDarwinCore.from_file` reading `simple` from a path.
+
+        Returns
+        -------
+        DarwinCoreArchive
+            Archive with the core and the extensions with any value.
+        """
+        extensions = list() if extensions is None else list(extensions)
+        if isinstance(simple, str):
+            chunks = SimpleDarwinCore.__read__(simple, _no_interaction=kwargs.pop("_no_interaction", True), **kwargs)
+        else:
+            chunks = iter([(simple.data, simple.data.__entries__)])
+        first = next(chunks, None)
+        assert first is not None, "Simple Darwin Core without records."
+        fields = first[0].__fields__
+        routes = cls._route_terms_(fields, core, extensions)
+        core_id = f"{core.URI.split('/')[-1][0].lower()}{core.URI.split('/')[-1][1:]}ID" if core_id is None \
+            else core_id
+        id_field = next((field for field in fields if core_id in (field.uri, field.name)), None)
+        assert id_field is not None, f"{core_id} (identifier of the core) not in the Simple Darwin Core."
+        # Fields of each data file, the core starting with its identifier and the extensions with the core one
+        core_fields = [id_field] + [field for field in fields if routes[field.uri] is core and field is not id_field]
+        data_files = [core(
+            0, f"{core.URI.split('/')[-1].lower()}.txt", cls.__reindex__(core_fields, 0),
+            DataFileType.CORE, fields_terminated_by="\t", ignore_header_lines=1,
+        )]
+        layout = [[field.name for field in core_fields]]
+        for extension in extensions:
+            extension_fields = [field for field in fields if routes[field.uri] is extension]
+            if len(extension_fields) == 0:
+                continue
+            data_file = extension(
+                0, f"{extension.URI.split('/')[-1].lower()}.txt", cls.__reindex__(extension_fields, 1),
+                DataFileType.EXTENSION, fields_terminated_by="\t", ignore_header_lines=1,
+            )
+            data_file.set_core_field(data_files[0].__fields__[data_files[0].id])
+            data_file.set_primary_key(data_files[0].name)
+            data_files.append(data_file)
+            layout.append([field.name for field in extension_fields])
+        names = [[field.name for field in data_file.__fields__] for data_file in data_files]
+        seen = [set() for _ in data_files]
+        no_id = 0
+        for _, entries in chain([first], chunks):
+            for entry in entries:
+                values = entry.__dict__
+                identifier = values.get(id_field.name)
+                for position, data_file in enumerate(data_files):
+                    row = tuple(values.get(name) for name in layout[position])
+                    if position > 0:
+                        if all(value is None or value == "" for value in row):
+                            continue
+                        if identifier is None or identifier == "":
+                            no_id += 1
+                            continue
+                        row = (identifier,) + row
+                        key = row
+                    else:
+                        key = identifier if identifier is not None and identifier != "" else None
+                    if key is not None:
+                        try:
+                            if key in seen[position]:
+                                continue
+                        except TypeError:  # Values without hash (e.g. lists)
+                            key = repr(key)
+                            if key in seen[position]:
+                                continue
+                        seen[position].add(key)
+                    data_file.__entries__.append(DataFile.Entry(**dict(zip(names[position], row))))
+        if no_id > 0:
+            warn(f"{no_id} rows of extensions without {core_id} were not included.", category=RuntimeWarning)
+        darwin_core = DarwinCoreArchive(_id=_id)
+        for data_file in data_files:
+            data_file._reset_indexes_()
+        # Extensions only have rows of the core, there is nothing to filter (see the core setter)
+        darwin_core.__meta__.__core__ = data_files[0]
+        data_files[0]._register_darwin_core_(0, darwin_core)
+        for position, extension in enumerate(data_files[1:]):
+            extension._register_darwin_core_(position, darwin_core)
+            darwin_core.extensions.append(extension)
+        return darwin_core
+
+    @staticmethod
+    def __reindex__(fields: List[Field], start: int) -> List[Field]:
+        # Copy of the fields on consecutive positions
+        copies = [deepcopy(field) for field in fields]
+        for index, field in enumerate(copies):
+            field.index = start + index
+        return copies
+
+    def __denormalize__(
+            self, extensions: List[Type[DataFile] | str] = None, chunk_size: int = READ_CHUNK_SIZE,
+    ) -> Tuple[DataFile, Iterator[List[DataFile.Entry]]]:
+        # Empty data file with the columns of the flat table, and the rows by chunks
+        selected = [
+            extension for extension in self.extensions
+            if extensions is None or type(extension) in extensions or extension.uri in extensions
+        ]
+        for data_file in [self.core] + selected:
+            assert not data_file.is_lazy(), f"{data_file.filename} in lazy mode, collect it with as_polars()."
+        columns = list()
+        uris = set()
+        layout = list()
+        for data_file in [self.core] + selected:
+            names = list()
+            for position, field in enumerate(data_file.__fields__):
+                if (data_file is not self.core and position == data_file.id) or field.uri in uris:
+                    continue
+                uris.add(field.uri)
+                columns.append(field)
+                names.append(field.name)
+            layout.append(names)
+        template = type(self.core)(
+            0, f"{self.core.name.lower()}.txt", self.__reindex__(columns, 0), DataFileType.CORE,
+            fields_terminated_by="\t", ignore_header_lines=1,
+        )
+        # Hash index of the rows of each extension by the identifier of the core
+        indexes = list()
+        for names, extension in zip(layout[1:], selected):
+            index = dict()
+            id_name = extension.__fields__[extension.id].name
+            for entry in extension.__entries__:
+                values = entry.__dict__
+                index.setdefault(values.get(id_name), list()).append(tuple(values.get(name) for name in names))
+            indexes.append(index)
+        empty = [(None,) * len(names) for names in layout[1:]]
+        id_name = self.core.__fields__[self.core.id].name
+        output_names = [column.name for column in columns]
+
+        def rows() -> Iterator[List[DataFile.Entry]]:
+            chunk = list()
+            for entry in self.core.__entries__:
+                values = entry.__dict__
+                base = tuple(values.get(name) for name in layout[0])
+                identifier = values.get(id_name)
+                related = [index.get(identifier, [none]) for index, none in zip(indexes, empty)]
+                for combination in product(*related):
+                    row = base + sum(combination, ())
+                    chunk.append(DataFile.Entry(**dict(zip(output_names, row))))
+                if len(chunk) >= chunk_size:
+                    yield chunk
+                    chunk = list()
+            if len(chunk) > 0:
+                yield chunk
+        return template, rows()
+
+    def to_simple(self, extensions: List[Type[DataFile] | str] = None) -> SimpleDarwinCore:
+        """
+        Denormalize the archive into a Simple Darwin Core (a flat table), joining each core record with the
+        rows of its extensions through a hash index (one row for each combination of related rows).
+
+        Terms on several files are taken from the core (or the first extension with them).
+
+        Parameters
+        ----------
+        extensions : List[Type[DataFile] | str], optional
+            Class or URI of the extensions to include. Default all of them.
+
+        Returns
+        -------
+        SimpleDarwinCore
+            Records of the core class with the terms of the core and the extensions.
+        """
+        template, chunks = self.__denormalize__(extensions)
+        for chunk in chunks:
+            template.__entries__.extend(chunk)
+        template._reset_indexes_()
+        return SimpleDarwinCore(template)
+
+    def write_simple(
+            self, path: str,
+            extensions: List[Type[DataFile] | str] = None,
+            delimiter: str = None,
+            fields_enclosed_by: str = None,
+            encoding: str = "utf-8",
+    ) -> int:
+        """
+        Denormalize the archive into a Simple Darwin Core file (see :meth:`to_simple`), writing the rows by
+        chunks instead of keeping the flat table in memory.
+
+        Parameters
+        ----------
+        path : str
+            Path of the file to generate.
+        extensions : List[Type[DataFile] | str], optional
+            Class or URI of the extensions to include. Default all of them.
+        delimiter : str, optional
+            Delimiter of the cells. Default from the extension of the file, or tab.
+        fields_enclosed_by : str, optional
+            Character enclosing the cells. Default `'"'` on comma separated files, none otherwise.
+        encoding : str, optional
+            Encoding of the file. Default `"utf-8"`.
+
+        Returns
+        -------
+        int
+            Number of rows written.
+        """
+        template, chunks = self.__denormalize__(extensions)
+        with SimpleDarwinCoreWriter(path, template, delimiter, fields_enclosed_by, encoding) as writer:
+            for chunk in chunks:
+                writer.write(chunk)
+        return writer.count
+
     @classmethod
     def merge(
             cls, first_archive: DarwinCoreArchive,
@@ -374,3 +896,7 @@ class DarwinCoreArchive(DarwinCore):
 
     def __str__(self) -> str:
         return f"{self.id} [Core: {self.core.uri}, Entries: {len(self.core)}]"
+
+
+for dwc_class in DarwinCoreArchive.Metadata.__classes__:
+    REGISTRY.register_class(dwc_class)
@@ -1,15 +1,438 @@
 from __future__ import annotations
 
+import csv
+import os
+from itertools import islice
+from typing import List, Type, Callable, Generator, Iterable, Iterator, TextIO, Tuple
+
 from dwca.base import DarwinCore
+from dwca.classes import DataFile, DataFileType, Occurrence, REGISTRY
+from dwca.classes.data_file import READ_CHUNK_SIZE
+from dwca.terms import Field, OutsideTerm
+from dwca.utils import StageProfile, StageRecord, Quarantine, QuarantinedRow
+from xml_common.utils import LazyModule, Progress, Diagnostics, UNKNOWN_TERM
+
+pd = LazyModule("pandas")
+pl = LazyModule("polars")
+
+DELIMITERS = {".csv": ",", ".tsv": "\t", ".tab": "\t"}
+"""Dict[str, str]: Delimiter of the cells by extension of the file, other files are detected from its header."""
 
 
 class SimpleDarwinCore(DarwinCore):
     """
-    Class representing a Simple Darwin Core standard.
+    Class representing a Simple Darwin Core standard: a single text file (e.g. CSV) where each row is a record
+    and each column is named with a term on the header.
+
+    Parameters
+    ----------
+    data_file : DataFile
+        Records of the file, as a data file of its class (e.g. :class:`dwca.classes.Occurrence`).
     """
+    def __init__(self, data_file: DataFile) -> None:
+        super().__init__()
+        self.__data_file__ = data_file
+        return
+
+    @property
+    def data(self) -> DataFile:
+        """DataFile: Records of the file."""
+        return self.__data_file__
+
+    @property
+    def row_class(self) -> Type[DataFile]:
+        """Type[DataFile]: Class of the records."""
+        return type(self.__data_file__)
+
+    @property
+    def fields(self) -> List[str]:
+        """List[str]: Terms of the columns."""
+        return self.__data_file__.fields
+
+    def __len__(self) -> int:
+        return len(self.__data_file__.__entries__)
+
+    @staticmethod
+    def build_fields(header: List[str], diagnostics: Diagnostics = None) -> List[Field]:
+        """
+        Terms of the columns from the header of a file.
+
+        The names are resolved on the registry (see :meth:`dwca.classes.Registry.find_term`), as URI, prefixed
+        name (e.g. `dwc:scientificName`) or name (e.g. `scientificName`).
+
+        Parameters
+        ----------
+        header : List[str]
+            Name of each column.
+        diagnostics : Diagnostics, optional
+            Collector of the names that are not a known term, read as :class:`dwca.terms.OutsideTerm`.
+
+        Returns
+        -------
+        List[Field]
+            Term of each column.
+        """
+        fields = list()
+        for index, name in enumerate(header):
+            term = REGISTRY.find_term(name)
+            if term is None:
+                if diagnostics is not None:
+                    diagnostics.record(UNKNOWN_TERM, name.strip())
+                fields.append(OutsideTerm(index, name.strip()))
+            else:
+                fields.append(term(index))
+        return fields
+
+    @staticmethod
+    def __delimiter__(path: str) -> str:
+        extension = os.path.splitext(path)[1].lower()
+        if extension in DELIMITERS:
+            return DELIMITERS[extension]
+        with open(path, "r", encoding="utf-8", errors="replace") as file:
+            return "\t" if "\t" in file.readline() else ","
+
+    @staticmethod
+    def __chunks__(
+            file: TextIO, delimiter: str, fields_enclosed_by: str, chunk_size: int, blanks: List[int]
+    ) -> Generator[Tuple[List[str] | List[List[str]], int]]:
+        # Rows of the file by chunks (lines, or cells if quoted) with its size, appending the empty lines to blanks
+        quoted = fields_enclosed_by != ""
+        lines: Iterator = csv.reader(file, delimiter=delimiter, quotechar=fields_enclosed_by) if quoted else file
+        position = 0
+        while True:
+            chunk = list(islice(lines, chunk_size))
+            if len(chunk) == 0:
+                return
+            if quoted:
+                n_bytes = 0
+                empty = [index for index, row in enumerate(chunk) if len(row) == 0]
+            else:
+                chunk = [line.rstrip("\r\n") for line in chunk]
+                n_bytes = sum(map(len, chunk))
+                empty = [index for index, line in enumerate(chunk) if line == ""]
+            size = len(chunk)
+            if len(empty) > 0:
+                blanks.extend(position + index for index in empty)
+                empty = set(empty)
+                chunk = [row for index, row in enumerate(chunk) if index not in empty]
+            position += size
+            yield chunk, n_bytes
+
+    @classmethod
+    def __read__(
+            cls, path: str,
+            row_class: Type[DataFile] = Occurrence,
+            delimiter: str = None,
+            fields_enclosed_by: str = None,
+            encoding: str = "utf-8",
+            chunk_size: int = READ_CHUNK_SIZE,
+            _no_interaction: bool = False,
+            profile: StageProfile | Callable[[StageRecord], None] = None,
+            diagnostics: Diagnostics = None,
+            quarantine: Quarantine | List[QuarantinedRow] | str | DataFile = None,
+    ) -> Generator[Tuple[DataFile, List[DataFile.Entry]]]:
+        # Data file with the columns of the header and the entries of each chunk (no entries for only a header)
+        profile = StageProfile.wrap(profile)
+        delimiter = cls.__delimiter__(path) if delimiter is None else delimiter
+        fields_enclosed_by = ('"' if delimiter == "," else "") if fields_enclosed_by is None else fields_enclosed_by
+        filename = os.path.basename(path)
+        # Not activated as context, a generator could be closed on a different context
+        owner = diagnostics is None and Diagnostics.active() is None
+        diagnostics = Diagnostics(filename) if owner else (diagnostics or Diagnostics.active())
+        sink = Quarantine.wrap(quarantine) if quarantine is not None else None
+        progress = Progress(desc=f"Reading file {filename}", unit="entry", enabled=not _no_interaction)
+        blanks = list()
+        start = 0
+        try:
+            with open(path, "r", encoding=encoding, newline="" if fields_enclosed_by != "" else None) as file:
+                chunks = cls.__chunks__(file, delimiter, fields_enclosed_by, chunk_size, blanks)
+                data_file, converters = None, None
+                empty = True
+                for lines, n_bytes in chunks:
+                    with profile.stage("tokenize", filename, n_bytes=n_bytes, rows=len(lines)):
+                        cells = lines if fields_enclosed_by != "" else [line.split(delimiter) for line in lines]
+                    if data_file is None:
+                        if len(cells) == 0:
+                            continue
+                        header, cells = cells[0], cells[1:]
+                        data_file = row_class(
+                            0, filename, cls.build_fields(header, diagnostics), DataFileType.CORE, encoding, "\n",
+                            delimiter, fields_enclosed_by, 1
+                        )
+                        converters = data_file._converters_()
+                    entries = data_file._convert_cells_(cells, start, converters, profile, diagnostics, sink, blanks)
+                    start += len(cells)
+                    if progress.enabled:
+                        progress.update(n=len(cells), n_bytes=n_bytes)
+                    if len(entries) > 0:
+                        empty = False
+                        yield data_file, entries
+                assert data_file is not None, f"{path} has no header."
+                if empty:  # Only the header, the columns are still known
+                    yield data_file, list()
+        finally:
+            progress.close()
+            if sink is not None and not isinstance(quarantine, Quarantine):
+                sink.close()
+            if owner:
+                diagnostics.emit()
+        return
+
+    @classmethod
+    def from_file(
+            cls, path_to_archive: str,
+            row_class: Type[DataFile] = Occurrence,
+            delimiter: str = None,
+            fields_enclosed_by: str = None,
+            encoding: str = "utf-8",
+            chunk_size: int = READ_CHUNK_SIZE,
+            _no_interaction: bool = False,
+            profile: StageProfile | Callable[[StageRecord], None] = None,
+            diagnostics: Diagnostics = None,
+            quarantine: Quarantine | List[QuarantinedRow] | str | DataFile = None,
+    ) -> SimpleDarwinCore:
+        """
+        Generate a Simple Darwin Core instance from a text file (e.g. `.csv`).
+
+        Parameters
+        ----------
+        path_to_archive : str
+            Path of the file.
+        row_class : Type[DataFile], optional
+            Class of the records. Default :class:`dwca.classes.Occurrence`.
+        delimiter : str, optional
+            Delimiter of the cells. Default from the extension (see :data:`DELIMITERS`) or from the header.
+        fields_enclosed_by : str, optional
+            Character enclosing the cells with delimiters or line breaks. Default `'"'` on comma separated
+            files, none otherwise.
+        encoding : str, optional
+            Encoding of the file. Default `"utf-8"`.
+        chunk_size : int, optional
+            Number of lines converted at once. Default :data:`dwca.classes.data_file.READ_CHUNK_SIZE`.
+        _no_interaction : bool, optional
+            Not to report the progress (see :func:`xml_common.utils.configure_progress`). Default `False`.
+        profile : StageProfile | Callable[[StageRecord], None], optional
+            Profile (or callback) recording the stages `tokenize`, `convert` and `entries` (see
+            :meth:`DataFile.read_file`).
+        diagnostics : Diagnostics, optional
+            Collector of the unknown terms on the header and the values that could not be converted. By default,
+            the active collector or a new one, whose summary is warned at the end.
+        quarantine : Quarantine | List[QuarantinedRow] | str | DataFile, optional
+            Read in tolerant mode, setting apart the malformed rows (see :meth:`DataFile.read_file`).
+
+        Returns
+        -------
+        SimpleDarwinCore
+            Instance of the Simple Darwin Core.
+        """
+        data_file = None
+        entries = list()
+        for data_file, chunk in cls.__read__(
+                path_to_archive, row_class, delimiter, fields_enclosed_by, encoding, chunk_size,
+                _no_interaction, profile, diagnostics, quarantine,
+        ):
+            entries.extend(chunk)
+        data_file.__entries__ = entries
+        data_file._reset_indexes_()
+        return SimpleDarwinCore(data_file)
+
+    @classmethod
+    def iter_entries(cls, path_to_archive: str, **kwargs) -> Generator[List[DataFile.Entry]]:
+        """
+        Read a file by chunks, keeping in memory only the entries of one chunk.
+
+        Parameters
+        ----------
+        path_to_archive : str
+            Path of the file.
+
+        Other Parameters
+        ----------------
+        **kwargs
+            Options of :meth:`from_file`, `chunk_size` is the number of lines of each chunk.
+
+        Yields
+        ------
+        List[DataFile.Entry]
+            Entries of each chunk.
+        """
+        for _, entries in cls.__read__(path_to_archive, _no_interaction=kwargs.pop("_no_interaction", True), **kwargs):
+            yield entries
+
+    @classmethod
+    def iter_pandas(cls, path_to_archive: str, **kwargs) -> Generator[pd.DataFrame]:
+        """
+        Read a file by chunks, as pandas DataFrames with a column for each term.
+
+        Parameters
+        ----------
+        path_to_archive : str
+            Path of the file.
+
+        Other Parameters
+        ----------------
+        **kwargs
+            Options of :meth:`from_file`, `chunk_size` is the number of lines of each chunk.
+
+        Yields
+        ------
+        pd.DataFrame
+            Entries of each chunk.
+        """
+        try:
+            import pandas as pd
+        except ImportError:
+            raise ImportError("Install pandas to use this feature.")
+        for data_file, entries in cls.__read__(
+                path_to_archive, _no_interaction=kwargs.pop("_no_interaction", True), **kwargs
+        ):
+            yield pd.DataFrame([entry.to_dict() for entry in entries], columns=[f.name for f in data_file.__fields__])
+
     @classmethod
-    def from_file(cls, path_to_archive: str) -> SimpleDarwinCore:
-        pass
+    def iter_polars(cls, path_to_archive: str, **kwargs) -> Generator[pl.DataFrame]:
+        """
+        Read a file by chunks, as polars DataFrames with a column of the type of each term.
+
+        Parameters
+        ----------
+        path_to_archive : str
+            Path of the file.
+
+        Other Parameters
+        ----------------
+        **kwargs
+            Options of :meth:`from_file`, `chunk_size` is the number of lines of each chunk.
+
+        Yields
+        ------
+        pl.DataFrame
+            Entries of each chunk.
+        """
+        try:
+            import polars as pl
+        except ImportError:
+            raise ImportError("Install polars to use this feature.")
+        from xml_common.utils import type_to_pl
+        for data_file, entries in cls.__read__(
+                path_to_archive, _no_interaction=kwargs.pop("_no_interaction", True), **kwargs
+        ):
+            schema = [(field.name, type_to_pl(field.TYPE)) for field in data_file.__fields__]
+            yield pl.DataFrame([entry.to_dict() for entry in entries], schema=schema)
+
+    def to_file(
+            self, path_to_archive: str,
+            encoding: str = "utf-8",
+            delimiter: str = None,
+            fields_enclosed_by: str = None,
+            _no_interaction: bool = False,
+    ) -> None:
+        """
+        Write the records on a text file, with the name of the terms as header.
+
+        Parameters
+        ----------
+        path_to_archive : str
+            Path of the file to generate.
+        encoding : str, optional
+            Encoding of the file. Default `"utf-8"`.
+        delimiter : str, optional
+            Delimiter of the cells. Default from the extension (see :data:`DELIMITERS`), or tab.
+        fields_enclosed_by : str, optional
+            Character enclosing the cells with delimiters or line breaks. Default `'"'` on comma separated
+            files, none otherwise.
+        _no_interaction : bool, optional
+            Not to report the progress (see :func:`xml_common.utils.configure_progress`). Default `False`.
+        """
+        entries = self.__data_file__.__entries__
+        progress = Progress(
+            total=len(entries), desc=f"Writing file {os.path.basename(path_to_archive)}", unit="line",
+            enabled=not _no_interaction
+        )
+        with SimpleDarwinCoreWriter(
+                path_to_archive, self.__data_file__, delimiter, fields_enclosed_by, encoding
+        ) as writer:
+            for start in range(0, len(entries), READ_CHUNK_SIZE):
+                chunk = entries[start:start + READ_CHUNK_SIZE]
+                writer.write(chunk)
+                progress.update(n=len(chunk))
+        progress.close()
+        return
+
+    def __repr__(self) -> str:
+        return f"<SimpleDarwinCore [{self.row_class.__name__}: {len(self)} records]>"
+
+
+class SimpleDarwinCoreWriter:
+    """
+    Write records on a Simple Darwin Core file as they are produced, one chunk at a time.
+
+    Parameters
+    ----------
+    path : str
+        Path of the file to generate.
+    data_file : DataFile
+        Data file with the terms of the columns, written as header.
+    delimiter : str, optional
+        Delimiter of the cells. Default from the extension (see :data:`DELIMITERS`), or tab.
+    fields_enclosed_by : str, optional
+        Character enclosing the cells with delimiters or line breaks. Default `'"'` on comma separated files,
+        none otherwise.
+    encoding : str, optional
+        Encoding of the file. Default `"utf-8"`.
+    """
+    def __init__(
+            self, path: str, data_file: DataFile, delimiter: str = None,
+            fields_enclosed_by: str = None, encoding: str = "utf-8",
+    ) -> None:
+        self.__data_file__ = data_file
+        self.__delimiter__ = DELIMITERS.get(os.path.splitext(path)[1].lower(), "\t") if delimiter is None else delimiter
+        self.__enclosed__ = ('"' if self.__delimiter__ == "," else "") if fields_enclosed_by is None \
+            else fields_enclosed_by
+        self.__handle__ = open(path, "w", encoding=encoding, newline="")
+        self.__writer__ = csv.writer(
+            self.__handle__, delimiter=self.__delimiter__, quotechar=self.__enclosed__, lineterminator="\n"
+        ) if self.__enclosed__ != "" else None
+        self.__count__ = 0
+        self.__write_rows__([[field.name for field in data_file.__fields__]])
+        return
+
+    @property
+    def count(self) -> int:
+        """int: Number of records written."""
+        return self.__count__
+
+    def __write_rows__(self, rows: Iterable[List[str]]) -> None:
+        if self.__writer__ is not None:
+            self.__writer__.writerows(rows)
+        else:
+            self.__handle__.write("".join(self.__delimiter__.join(row) + "\n" for row in rows))
+        return
+
+    def write(self, entries: Iterable[DataFile.Entry]) -> None:
+        """
+        Append records to the file.
+
+        Parameters
+        ----------
+        entries : Iterable[DataFile.Entry]
+            Entries with the terms of the data file (e.g. a chunk of :meth:`SimpleDarwinCore.iter_entries`).
+        """
+        rows = list(self.__data_file__._unformat_entries_(entries))
+        self.__write_rows__(rows)
+        self.__count__ += len(rows)
+        return
+
+    def close(self) -> None:
+        """
+        Close the file.
+        """
+        if not self.__handle__.closed:
+            self.__handle__.close()
+        return
+
+    def __enter__(self) -> SimpleDarwinCoreWriter:
+        return self
 
-    def to_file(self, path_to_archive: str, encoding: str = "utf-8") -> None:
-        pass
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+        return
@@ -1,3 +1,4 @@
+from dwca.classes.registry import Registry, REGISTRY
 from dwca.classes.data_file import DataFile, DataFileType
 from dwca.classes.occurrence import Occurrence
 from dwca.classes.organism import Organism
@@ -6,9 +6,10 @@ import sys
 import tempfile
 import warnings
 from abc import ABC
+from bisect import bisect_right
 from copy import deepcopy
 from enum import Enum
-from typing import List, Dict, Type, Tuple, BinaryIO, Generator, Any
+from typing import List, Dict, Type, Tuple, BinaryIO, Generator, Any, Callable, Sequence, Iterable
 from warnings import warn
 
 from lxml import etree as et
@@ -16,18 +17,22 @@ from lxml import etree as et
 from dwca.terms import Field, DWCType, DWCModified, DWCLanguage, DWCLicense, DWCRightsHolder, DWCAccessRights, \
     DWCBibliographicCitation, DWCReferences, DWCInstitution, DWCCollection, DWCDataset, DWCInstitutionCode, \
     DWCCollectionCode, DWCDatasetName, DWCOwnerInstitutionCode, DWCBasisOfRecord, DWCInformationWithheld, \
-    DWCDataGeneralizations, DWCDynamicProperties, OutsideTerm, DWCSource
+    DWCDataGeneralizations, DWCDynamicProperties, OutsideTerm, DWCSource, DecimalLatitude, DecimalLongitude
+from dwca.classes.registry import REGISTRY
+from dwca.utils import SpatialIndex, StageProfile, StageRecord, MemoryUsage, deep_sizeof, frame_memory, file_size, \
+    Quarantine, QuarantinedRow, COLUMN_COUNT, CONVERSION
+from eml.resources.coverage import GeographicCoverage
 from xml_common import XMLObject
-from xml_common.utils import iterate_with_bar, type_to_pl, format_to_sql
+from xml_common.utils import type_to_pl, format_to_sql, GPolygon, LazyModule, Progress, Diagnostics, ANY_TYPE, \
+    CONVERSION_FAILURE, UNKNOWN_TERM
 
-try:
-    import pandas as pd
-except Exception:
-    pd = None
-try:
-    import polars as pl
-except Exception:
-    pl = None
+pd = LazyModule("pandas")
+pl = LazyModule("polars")
+
+READ_CHUNK_SIZE = 10_000
+"""int: Number of lines tokenized, converted and turned into entries at once."""
+MEMORY_SAMPLE_SIZE = 1_000
+"""int: Number of entries measured to estimate the memory usage when it is not deep."""
 
 
 class DataFileType(Enum):
@@ -113,6 +118,7 @@ class DataFile(XMLObject, ABC):
         self.__primary_key__ = None
         self.__core_field__ = self.__type__ == DataFileType.CORE
         self.__observers__: List[Tuple[int, DarwinCoreArchive]] = list()
+        self.__indexes__: Dict[str, Any] = dict()
         return
 
     @property
@@ -199,11 +205,8 @@ class DataFile(XMLObject, ABC):
         self.__entries__.clear()
         for _, row in df.iterrows():
             self.__entries__.append(DataFile.Entry(**row.to_dict()))
-        for i, observer in self.__observers__:
-            if self.__type__ == DataFileType.CORE:
-                observer.core = self
-            else:  # self.__type__ == DataFileType.EXTENSION
-                observer.extensions[i] = self
+        self._reset_indexes_()
+        self.__notify_observers__()
         return
 
     @property
@@ -255,6 +258,77 @@ class DataFile(XMLObject, ABC):
         self.__observers__.append((_on, dwca))
         return
 
+    def __notify_observers__(self) -> None:
+        for i, observer in self.__observers__:
+            if self.__type__ == DataFileType.CORE:
+                observer.core = self
+            else:  # self.__type__ == DataFileType.EXTENSION
+                observer.extensions[i] = self
+        return
+
+    def _filter_rows_(self, mask: List[bool] | pl.Expr) -> None:
+        """
+        Keep only the rows where mask is True, in a single pass over the data.
+
+        Parameters
+        ----------
+        mask : List[bool] | pl.Expr
+            A boolean for each row of the data file, or a boolean polars expression
+            (only on lazy evaluation mode, keeping the data lazy).
+        """
+        if self.is_lazy():
+            if not isinstance(mask, pl.Expr):
+                rows = [i for i, keep in enumerate(mask) if keep]
+                mask = pl.int_range(pl.len()).is_in(rows)
+            self.__data__ = self.__data__.filter(mask)
+            self._reset_indexes_()
+            self.__notify_observers__()
+            return
+        self.__entries__ = [entry for entry, keep in zip(self.__entries__, mask) if keep]
+        if self.__data__ is not None:
+            if pd.is_loaded and isinstance(self.__data__, pd.DataFrame):
+                self.__data__ = self.__data__[list(mask)]
+            else:
+                self.__data__ = self.__data__.filter(pl.Series(list(mask), dtype=pl.Boolean))
+        self._reset_indexes_()
+        self.__notify_observers__()
+        return
+
+    def _reset_indexes_(self) -> None:
+        self.__indexes__.clear()
+        return
+
+    def __column__(self, name: str) -> List[Any]:
+        if self.is_lazy():
+            return self.__data__.select(name).collect().to_series().to_list()
+        return [getattr(entry, name, None) for entry in self.__entries__]
+
+    def _iter_columns_(self, names: List[str], batch_size: int = 10_000) -> Generator[Tuple[List[Any], ...]]:
+        """
+        Iterate over the values of some columns by batches, without building data frames.
+
+        Parameters
+        ----------
+        names : List[str]
+            Name of the columns.
+        batch_size : int, optional
+            Number of rows on each batch. Default `10_000`.
+
+        Returns
+        -------
+        Generator[Tuple[List[Any], ...]]
+            For each batch, a list of values of each column in the same order of `names`.
+        """
+        if self.is_lazy():
+            # Only the columns are collected, converted into lists by batches
+            for batch in self.__data__.select(names).collect().iter_slices(n_rows=batch_size):
+                yield tuple(batch[name].to_list() for name in names)
+            return
+        for start in range(0, len(self.__entries__), batch_size):
+            entries = self.__entries__[start:start + batch_size]
+            yield tuple([getattr(entry, name, None) for entry in entries] for name in names)
+        return
+
     def __len__(self) -> int:
         if self.__data__ is not None:
             try:
@@ -279,12 +353,16 @@ class DataFile(XMLObject, ABC):
         Type[Field]
             The Python ``class`` representing the term name.
         """
-        for field_class in cls.__field_class__:
-            if element.get("term") == field_class.URI:
-                return field_class
-        warn(f"{element.get('term')} not in expected namespace for "
-             f"{cls.URI} class. "
-             f"Some functionalities may not be available.")
+        field_class = REGISTRY.get_term(cls, element.get("term"))
+        if field_class is not None:
+            return field_class
+        diagnostics = Diagnostics.active()
+        if diagnostics is None:
+            warn(f"{element.get('term')} not in expected namespace for "
+                 f"{cls.URI} class. "
+                 f"Some functionalities may not be available.")
+        else:
+            diagnostics.record(UNKNOWN_TERM, element.get("term"), cls.URI)
         return OutsideTerm
 
     @classmethod
@@ -444,7 +522,15 @@ class DataFile(XMLObject, ABC):
         self.__fields__ = ordered_fields
         return
 
-    def read_file(self, content: str, source_file: BinaryIO = None, lazy: bool = False, _no_interaction: bool = False) -> None:
+    def read_file(
+            self, content: str,
+            source_file: BinaryIO = None,
+            lazy: bool = False,
+            _no_interaction: bool = False,
+            profile: StageProfile | Callable[[StageRecord], None] = None,
+            diagnostics: Diagnostics = None,
+            quarantine: Quarantine | List[QuarantinedRow] | str | DataFile = None,
+    ) -> None:
         """
         Read the content of the file specified in `files` parameters (:meth:`filename`).
 
@@ -457,13 +543,29 @@ class DataFile(XMLObject, ABC):
         lazy : bool, optional
             Read the file in lazy evaluation mode. Default `False`.
         _no_interaction : bool, optional
-            Not to show progress bar if library `tqdm` is installed. Default `False`.
+            Not to report the progress (see :func:`xml_common.utils.configure_progress`). Default `False`.
+        profile : StageProfile | Callable[[StageRecord], None], optional
+            Profile (or callback) recording the stages `tokenize`, `convert` and `entries`
+            (also `quarantine` in tolerant mode, and `decompress` in lazy mode, copying the source file).
+        diagnostics : Diagnostics, optional
+            Collector of the values that could not be converted and of the values of `Any` fields kept as text.
+            By default, the active collector (e.g. of the archive being read) or a new one, whose summary is
+            warned at the end.
+        quarantine : Quarantine | List[QuarantinedRow] | str | DataFile, optional
+            Read in tolerant mode, setting apart the rows with more or fewer cells than fields and the rows
+            with values that cannot be converted (e.g. in a strict `Union` field) instead of shifting their
+            values or failing. The rows are sent with its line number and reason to the quarantine, or to a
+            list, a file (path) or a separate data file (see :class:`dwca.utils.quarantine.Quarantine`).
+            Not supported in lazy mode.
         """
+        profile = StageProfile.wrap(profile)
+        assert quarantine is None or not lazy, "Tolerant mode (quarantine) is not supported in lazy mode."
         if lazy:
             try:
                 import polars as pl
                 with tempfile.NamedTemporaryFile(delete=False) as file:
-                    shutil.copyfileobj(source_file, file)
+                    with profile.stage("decompress", self.filename):
+                        shutil.copyfileobj(source_file, file)
                     self.__data__ = pl.scan_csv(
                         file.name,
                         has_header=False,
@@ -480,22 +582,159 @@ class DataFile(XMLObject, ABC):
             except ImportError:
                 raise ImportError("Cannot read lazy without polars installed.")
         else:
-            lines = content.split(self.__lines_end__)
-            lines = list(filter(lambda x: x != "", lines))
-            if not _no_interaction:
-                iterator = iterate_with_bar(
-                    lines[self.__ignore_header_lines__:],
-                    desc=f"Reading file {self.filename}", unit="entry"
-                )
-            else:
-                iterator = lines[self.__ignore_header_lines__:]
-            for line in iterator:
-                kwargs = dict()
-                for field, value in zip(self.__fields__, line.split(self.__fields_end__)):
-                    kwargs[field.name] = field.format(value)
-                self.__entries__.append(DataFile.Entry(**kwargs))
+            with profile.stage("tokenize", self.filename, n_bytes=len(content)):
+                lines = content.split(self.__lines_end__)
+                # Position of the empty lines, to know the line number of the rows set apart
+                blanks = list()
+                if quarantine is not None and "" in lines:
+                    blanks = [index for index, line in enumerate(lines) if line == ""]
+                lines = list(filter(lambda x: x != "", lines))[self.__ignore_header_lines__:]
+            converters = self._converters_()
+            progress = Progress(
+                total=len(lines), desc=f"Reading file {self.filename}", unit="entry", enabled=not _no_interaction
+            )
+            tolerant = quarantine is not None
+            sink = Quarantine.wrap(quarantine) if tolerant else None
+            with Diagnostics.collect(diagnostics, name=self.filename) as diagnostics:
+                # Lines are processed in chunks, so each stage can be measured without a cost per row
+                for start in range(0, len(lines), READ_CHUNK_SIZE):
+                    chunk = lines[start:start + READ_CHUNK_SIZE]
+                    with profile.stage("tokenize", self.filename, rows=len(chunk)):
+                        cells = [line.split(self.__fields_end__) for line in chunk]
+                    self.__entries__.extend(self._convert_cells_(
+                        cells, start, converters, profile, diagnostics, sink, blanks
+                    ))
+                    if progress.enabled:
+                        progress.update(n=len(chunk), n_bytes=sum(map(len, chunk)))
+            progress.close()
+            if tolerant and not isinstance(quarantine, Quarantine):
+                sink.close()
+        self._reset_indexes_()
         return
 
+    def _converters_(self) -> Tuple[List[str], List[bool], List[Callable[[str], Any]], List[int]]:
+        """
+        Converters of the cells of each field, computed once for all the rows.
+
+        Returns
+        -------
+        Tuple[List[str], List[bool], List[Callable[[str], Any]], List[int]]
+            Name of the fields, whether the field is kept as text (`Any` fields), function converting the cells
+            of each field, and position of the fields whose conversion can fail.
+        """
+        names = [field.name for field in self.__fields__]
+        # Values of `Any` fields are kept as text, they are counted by field instead of warned by value
+        as_text = [field.TYPE is Any and type(field).format is Field.format for field in self.__fields__]
+        formats = [str if text else field.format for text, field in zip(as_text, self.__fields__)]
+        checked = [index for index, field in enumerate(self.__fields__) if field.TYPE not in (str, Any)]
+        return names, as_text, formats, checked
+
+    def _convert_cells_(
+            self, cells: List[List[str]], start: int,
+            converters: Tuple[List[str], List[bool], List[Callable[[str], Any]], List[int]],
+            profile: StageProfile, diagnostics: Diagnostics,
+            quarantine: Quarantine = None, blanks: List[int] = None,
+    ) -> List[DataFile.Entry]:
+        """
+        Convert a chunk of tokenized rows into entries.
+
+        Parameters
+        ----------
+        cells : List[List[str]]
+            Cells of each row.
+        start : int
+            Position of the first row of the chunk on the file, without header and empty lines.
+        converters : Tuple[List[str], List[bool], List[Callable[[str], Any]], List[int]]
+            See :meth:`_converters_`.
+        profile : StageProfile
+            Profile recording the stages `quarantine`, `convert` and `entries`.
+        diagnostics : Diagnostics
+            Collector of the values that could not be converted.
+        quarantine : Quarantine, optional
+            Quarantine of the malformed rows (tolerant mode), default the rows are not checked.
+        blanks : List[int], optional
+            Position of the empty lines on the file, to compute the line number of the malformed rows.
+
+        Returns
+        -------
+        List[DataFile.Entry]
+            Entries of the rows.
+        """
+        names, as_text, formats, checked = converters
+        blanks = list() if blanks is None else blanks
+        positions = range(start, start + len(cells))
+        if quarantine is not None:
+            with profile.stage("quarantine", self.filename, rows=len(cells)):
+                cells, positions = self.__check_columns__(cells, start, blanks, quarantine)
+        with profile.stage("convert", self.filename, rows=len(cells)):
+            try:
+                rows = [[format_value(value) for format_value, value in zip(formats, row)] for row in cells]
+            except Exception as e:
+                if quarantine is None:
+                    raise e
+                # Only the chunks with errors are converted row by row
+                cells, rows = self.__convert_rows__(cells, positions, formats, blanks, quarantine)
+            self.__diagnose__(diagnostics, names, as_text, checked, cells, rows)
+        with profile.stage("entries", self.filename, rows=len(rows)):
+            return [DataFile.Entry(**dict(zip(names, row))) for row in rows]
+
+    def __line_number__(self, blanks: List[int], row: int) -> int:
+        # Number of the line (from 1) of a row, skipping the header and the empty lines before it
+        position = row + self.__ignore_header_lines__
+        line = position
+        while True:
+            following = position + bisect_right(blanks, line)
+            if following == line:
+                return line + 1
+            line = following
+
+    def __check_columns__(
+            self, cells: List[List[str]], start: int, blanks: List[int], quarantine: Quarantine
+    ) -> Tuple[List[List[str]], Sequence[int]]:
+        expected = len(self.__fields__)
+        lengths = list(map(len, cells))
+        if len(cells) == 0 or min(lengths) == max(lengths) == expected:
+            return cells, range(start, start + len(cells))
+        wrong = [index for index, length in enumerate(lengths) if length != expected]
+        for index in wrong:
+            quarantine.add(QuarantinedRow(
+                self.filename, self.__line_number__(blanks, start + index), COLUMN_COUNT,
+                f"Expected {expected} cells, found {len(cells[index])}", cells[index]
+            ))
+        wrong = set(wrong)
+        kept = [index for index in range(len(cells)) if index not in wrong]
+        return [cells[index] for index in kept], [start + index for index in kept]
+
+    def __convert_rows__(
+            self, cells: List[List[str]], positions: Sequence[int], formats: List[Callable[[str], Any]],
+            blanks: List[int], quarantine: Quarantine,
+    ) -> Tuple[List[List[str]], List[List[Any]]]:
+        kept_cells, rows = list(), list()
+        for position, row in zip(positions, cells):
+            try:
+                rows.append([format_value(value) for format_value, value in zip(formats, row)])
+                kept_cells.append(row)
+            except Exception as e:
+                quarantine.add(QuarantinedRow(
+                    self.filename, self.__line_number__(blanks, position), CONVERSION, str(e), row
+                ))
+        return kept_cells, rows
+
+    @staticmethod
+    def __diagnose__(
+            diagnostics: Diagnostics, names: List[str], as_text: List[bool], checked: List[int],
+            cells: List[List[str]], rows: List[List[Any]],
+    ) -> None:
+        for index, text in enumerate(as_text):
+            if text:
+                diagnostics.add(ANY_TYPE, names[index], sum(1 for row in cells if len(row) > index))
+        for index in checked:
+            failures = [
+                cell[index] for cell, row in zip(cells, rows)
+                if len(row) > index and row[index] is None and cell[index] != ""
+            ]
+            diagnostics.add(CONVERSION_FAILURE, names[index], len(failures), failures)
+        return
 
     def write_file(self, _no_interaction: bool = False) -> str:
         """
@@ -511,11 +750,30 @@ class DataFile(XMLObject, ABC):
             output_file += f"###{self.__lines_end__}" * (self.__ignore_header_lines__ - 1)
             header = [field.name for field in self.__fields__]
             output_file += f"{self.__fields_end__}".join(header) + self.__lines_end__
-        if not _no_interaction:
-            iterator = iterate_with_bar(self.__entries__, desc=f"Writing data {self.uri}", unit="line")
-        else:
-            iterator = self.__entries__
-        for entry in iterator:
+        progress = Progress(
+            total=len(self.__entries__), desc=f"Writing data {self.uri}", unit="line", enabled=not _no_interaction
+        )
+        output_file += "".join(
+            f"{self.__fields_end__}".join(line) + self.__lines_end__
+            for line in self._unformat_entries_(progress.iterate(self.__entries__))
+        )
+        return output_file
+
+    def _unformat_entries_(self, entries: Iterable[DataFile.Entry]) -> Generator[List[str]]:
+        """
+        Cells of the entries as text, one list for each entry.
+
+        Parameters
+        ----------
+        entries : Iterable[DataFile.Entry]
+            Entries with the fields of this data file.
+
+        Yields
+        ------
+        List[str]
+            Text of each field of the entry.
+        """
+        for entry in entries:
             line = list()
             for field in self.__fields__:
                 try:
@@ -526,8 +784,7 @@ class DataFile(XMLObject, ABC):
                 except Exception as e:
                     print(f"Error on {field.name} with value {getattr(entry, field.name)}", file=sys.stderr)
                     raise e
-            output_file += f"{self.__fields_end__}".join(line) + self.__lines_end__
-        return output_file
+            yield line
 
     def as_pandas(self, _no_interaction: bool = False) -> pd.DataFrame:
         """
@@ -545,13 +802,10 @@ class DataFile(XMLObject, ABC):
         fields = list()
         for field in self.__fields__:
             fields.append(field.name)
-        entries = list()
-        if _no_interaction:
-            for entry in self.__entries__:
-                entries.append(entry.to_dict())
-        else:
-            for entry in iterate_with_bar(self.__entries__, desc="Converting to pandas", unit="entry"):
-                entries.append(entry.to_dict())
+        progress = Progress(
+            total=len(self.__entries__), desc="Converting to pandas", unit="entry", enabled=not _no_interaction
+        )
+        entries = [entry.to_dict() for entry in progress.iterate(self.__entries__)]
         self.__data__ = pd.DataFrame(entries, columns=fields)
         return self.__data__
 
@@ -577,13 +831,10 @@ class DataFile(XMLObject, ABC):
             fields = list()
             for field in self.__fields__:
                 fields.append((field.name, type_to_pl(field.TYPE)))
-            entries = list()
-            if _no_interaction:
-                for entry in self.__entries__:
-                    entries.append(entry.to_dict())
-            else:
-                for entry in iterate_with_bar(self.__entries__, desc="Converting to polars", unit="entry"):
-                    entries.append(entry.to_dict())
+            progress = Progress(
+                total=len(self.__entries__), desc="Converting to polars", unit="entry", enabled=not _no_interaction
+            )
+            entries = [entry.to_dict() for entry in progress.iterate(self.__entries__)]
             self.__data__ = pl.DataFrame(entries, schema=fields)
             return self.__data__
 
@@ -658,6 +909,7 @@ class DataFile(XMLObject, ABC):
             self.uri, data_file.uri
         )
         merged = deepcopy(self)
+        merged._reset_indexes_()
         with warnings.catch_warnings():
             warnings.filterwarnings("ignore")
             for field in data_file.__fields__:
@@ -675,8 +927,123 @@ class DataFile(XMLObject, ABC):
                         getattr(entry, field.name)
                     except AttributeError:
                         setattr(merged.__entries__[i], field.name, field.default)
+            merged._reset_indexes_()
         return merged
 
+    def filter_spatial(
+            self, area: GeographicCoverage = None,
+            bbox: Tuple[float, float, float, float] = None,
+            polygon: GPolygon | List[GPolygon] = None,
+            grid_size: int = None,
+    ) -> None:
+        """
+        Keep only the rows with coordinates inside an area.
+
+        Only one of `area`, `bbox` or `polygon` must be given. Rows without coordinates are removed.
+
+        Parameters
+        ----------
+        area : GeographicCoverage, optional
+            Geographic coverage from an EML document, using its polygons if any, otherwise its bounding box.
+        bbox : Tuple[float, float, float, float], optional
+            West, east, north and south limits (in decimal degrees). If west is greater than east,
+            the box crosses the antimeridian.
+        polygon : GPolygon | List[GPolygon], optional
+            Polygon or polygons (with latitude, longitude points), exclusion rings are excluded of the area.
+        grid_size : int, optional
+            Number of rows and columns of the grid index of the polygons, default chosen from its number of edges.
+        """
+        assert sum(arg is not None for arg in (area, bbox, polygon)) == 1, \
+            "Only one of area, bbox or polygon must be given."
+        latitude, longitude = DecimalLatitude.name_cls(), DecimalLongitude.name_cls()
+        assert DecimalLatitude.URI in self.fields and DecimalLongitude.URI in self.fields, \
+            "Decimal Latitude and Decimal Longitude must be in fields of this class to use this feature."
+        if area is not None:
+            if len(area.g_polygon) > 0:
+                polygon = area.g_polygon
+            else:
+                bbox = (area.west_bounding, area.east_bounding, area.north_bounding, area.south_bounding)
+        if bbox is not None:
+            west, east, north, south = bbox
+            assert south <= north, "South limit must be lower than north limit."
+            if self.is_lazy():
+                inside = pl.col(latitude).is_between(south, north)
+                if west <= east:
+                    inside &= pl.col(longitude).is_between(west, east)
+                else:
+                    inside &= (pl.col(longitude) >= west) | (pl.col(longitude) <= east)
+                self._filter_rows_(inside.fill_null(False))
+                return
+
+            def contains(lat: float, lon: float) -> bool:
+                if lat is None or lon is None or not (south <= lat <= north):
+                    return False
+                if west <= east:
+                    return west <= lon <= east
+                return lon >= west or lon <= east
+        else:
+            index = SpatialIndex([polygon] if isinstance(polygon, GPolygon) else polygon, grid_size=grid_size)
+            contains = index.contains
+        self._filter_rows_([
+            contains(lat, lon) for lat, lon in zip(self.__column__(latitude), self.__column__(longitude))
+        ])
+        return
+
+    def memory_usage(self, deep: bool = True) -> MemoryUsage:
+        """
+        Bytes used by this data file, by storage component and by column.
+
+        The components are the `entries` (rows as Python objects), the `data` frame
+        cached by pandas or polars (both can be held at the same time as the entries),
+        and the `indexes` built over the data. The temporal file of the lazy mode is
+        reported on disk.
+
+        Parameters
+        ----------
+        deep : bool, optional
+            Measure every value and every index. If `False`, the entries are estimated from a
+            sample of :data:`MEMORY_SAMPLE_SIZE` entries and only the containers of the indexes
+            are measured, so the cost does not depend on the size of the data. Default `True`.
+
+        Returns
+        -------
+        MemoryUsage
+            Bytes used by each component, each column and the temporal file.
+        """
+        usage = MemoryUsage(self.filename)
+        entries = self.__entries__
+        if deep or len(entries) <= MEMORY_SAMPLE_SIZE:
+            sample = entries
+        else:
+            step = len(entries) / MEMORY_SAMPLE_SIZE
+            sample = [entries[int(i * step)] for i in range(MEMORY_SAMPLE_SIZE)]
+        scale = len(entries) / len(sample) if len(sample) > 0 else 0
+        seen = set()
+        overhead = 0
+        columns: Dict[str, int] = dict()
+        for entry in sample:
+            overhead += sys.getsizeof(entry) + sys.getsizeof(entry.__dict__)
+            for name, value in entry.__dict__.items():
+                columns[name] = columns.get(name, 0) + deep_sizeof(value, seen)
+        columns = {name: round(n_bytes * scale) for name, n_bytes in columns.items()}
+        usage.components["entries"] = sys.getsizeof(entries) + round(overhead * scale) + sum(columns.values())
+        usage.add_columns(columns)
+        data_columns = frame_memory(self.__data__, deep=deep) if self.__data__ is not None else dict()
+        data_columns = dict() if data_columns is None else data_columns
+        usage.components["data"] = sum(data_columns.values())
+        usage.add_columns({name: n_bytes for name, n_bytes in data_columns.items() if name != "Index"})
+        if deep:
+            usage.components["indexes"] = deep_sizeof(self.__indexes__)
+        else:
+            usage.components["indexes"] = sys.getsizeof(self.__indexes__)
+            for index in self.__indexes__.values():
+                index_columns = frame_memory(index, deep=False)
+                usage.components["indexes"] += sys.getsizeof(index) if index_columns is None \
+                    else sum(index_columns.values())
+        if self.is_lazy():
+            usage.files[self.__temp_file__] = file_size(self.__temp_file__)
+        return usage
+
     def close(self) -> None:
         if self.is_lazy():
             os.remove(self.__temp_file__)
@@ -1,9 +1,12 @@
-from typing import List
+from __future__ import annotations
+
+from typing import List, Dict, Any
 
 from dwca.classes import DataFile, DataFileType
 from dwca.terms import EventID, ParentEventID, EventType, FieldNumber, EventDate, EventTime, StartDayOfYear, \
     EndDayOfYear, DWCYear, DWCMonth, DWCDay, VerbatimEventDate, Habitat, SamplingProtocol, SampleSizeValue, \
     SampleSizeUnit, SamplingEffort, FieldNotes, EventRemarks, Field
+from dwca.utils import EventHierarchy
 
 
 class Event(DataFile):
@@ -57,3 +60,50 @@ class Event(DataFile):
             fields_enclosed_by, ignore_header_lines,
         )
         return
+
+    def hierarchy(self) -> EventHierarchy:
+        """
+        Hierarchy index of this data file using :class:`dwca.terms.event.ParentEventID`, built on first use.
+
+        Returns
+        -------
+        EventHierarchy
+            Index with the depth, top-level event and descendants of each event.
+        """
+        if "hierarchy" not in self.__indexes__:
+            assert EventID.URI in self.fields, "Event id is required for the hierarchy."
+            events_id = self.__column__(EventID.name_cls())
+            parents_id = self.__column__(ParentEventID.name_cls()) if ParentEventID.URI in self.fields \
+                else [None] * len(events_id)
+            self.__indexes__["hierarchy"] = EventHierarchy(events_id, parents_id)
+        return self.__indexes__["hierarchy"]
+
+    def rollup(self, data_file: DataFile, values: str = None, level: int | None = 0) -> Dict[str, Any]:
+        """
+        Add the rows of a data file referencing these events to their ancestors, e.g. the number of
+        occurrences of each top-level survey (see :meth:`dwca.utils.EventHierarchy.rollup`).
+
+        Parameters
+        ----------
+        data_file : DataFile
+            An extension of these events (by core id), or a data file with :class:`dwca.terms.event.EventID`.
+        values : str, optional
+            Name of the column of `data_file` to add (e.g. `"individualCount"`). Default to count the rows.
+        level : int | None, optional
+            Depth of the ancestors receiving the rows, `0` for the top-level events. None for the total of
+            each event and its descendants. Default `0`.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Total of each event.
+        """
+        if data_file.__type__ == DataFileType.EXTENSION:
+            id_name = data_file.__fields__[data_file.id].name
+        else:
+            assert EventID.URI in data_file.fields, f"{data_file.filename} does not reference the events."
+            id_name = EventID.name_cls()
+        events_id = data_file.__column__(id_name)
+        return self.hierarchy().rollup(
+            events_id, None if values is None else data_file.__column__(values), level
+        )
@@ -1,8 +1,16 @@
-from typing import List
+from __future__ import annotations
+
+from typing import List, Any, Callable, Dict, Sequence
 
 from dwca.classes import DataFile, DataFileType
+from dwca.classes.data_file import READ_CHUNK_SIZE
 from dwca.terms import MeasurementID, ParentMeasurementID, MeasurementType, MeasurementValue, MeasurementAccuracy, \
     MeasurementUnit, MeasurementDeterminedBy, MeasurementDeterminedDate, MeasurementMethod, MeasurementRemarks, Field
+from dwca.utils import MeasurementPivot
+from xml_common.utils import LazyModule, Diagnostics, CONVERSION_FAILURE
+
+pd = LazyModule("pandas")
+pl = LazyModule("polars")
 
 
 class MeasurementOrFact(DataFile):
@@ -54,3 +62,85 @@ class MeasurementOrFact(DataFile):
             fields_enclosed_by, ignore_header_lines,
         )
         return
+
+    def pivot(
+            self, value_type: Callable[[Any], Any] | Dict[str, Callable[[Any], Any]] = float,
+            agg: str | Callable[[List[Any]], Any] = "first",
+            types: Sequence[str] = None,
+            max_types: int = 1_000,
+            core: DataFile = None,
+            id_column: str = "id",
+            output: str = "pandas",
+            diagnostics: Diagnostics = None,
+    ) -> pd.DataFrame | pl.DataFrame | Dict[str, List[Any]]:
+        """
+        Pivot the measurements to a wide table, with a row for each core record and a column for each
+        :class:`dwca.terms.MeasurementType`.
+
+        The data file is read by batches (also in lazy mode) into a :class:`dwca.utils.MeasurementPivot`,
+        keeping only the aggregated values, instead of building a pandas `pivot_table`.
+
+        Parameters
+        ----------
+        value_type : Callable[[Any], Any] | Dict[str, Callable[[Any], Any]], optional
+            Type of the :class:`dwca.terms.MeasurementValue` (e.g. `float`, `int`, `bool`, `str`), or the type
+            of each measurement type (others kept as text). Values that cannot be converted are ignored.
+            Default `float`.
+        agg : str | Callable[[List[Any]], Any], optional
+            Aggregation of several values of a record and type, `"first"`, `"last"`, `"count"`, `"sum"`,
+            `"min"`, `"max"`, `"mean"`, `"list"` or a function of the list of values. Default `"first"`.
+        types : Sequence[str], optional
+            Measurement types to include, in order. Default all of them, in order of appearance.
+        max_types : int, optional
+            Maximum number of columns, further types are ignored with a warning. Default `1_000`.
+        core : DataFile, optional
+            Core of the archive, to join its columns to the measurements, one row for each core record
+            (in order). Default only the records with measurements.
+        id_column : str, optional
+            Name of the column with the identifier of the core record, without `core`. Default `"id"`.
+        output : str, optional
+            Kind of table, `"pandas"`, `"polars"` or `"dict"` (a list of values by column). Default `"pandas"`.
+        diagnostics : Diagnostics, optional
+            Collector of the values that could not be converted. By default, the active collector or a new one,
+            whose summary is warned at the end.
+
+        Returns
+        -------
+        pd.DataFrame | pl.DataFrame | Dict[str, List[Any]]
+            Wide table of the measurements.
+        """
+        assert output in ("pandas", "polars", "dict"), f"Unknown output {output}, use pandas, polars or dict."
+        assert MeasurementType.URI in self.fields and MeasurementValue.URI in self.fields, \
+            "Measurement type and value are required to pivot."
+        table = MeasurementPivot(value_type, agg, types, max_types)
+        names = [self.__fields__[self.id].name, MeasurementType.name_cls(), MeasurementValue.name_cls()]
+        for ids, measurement_types, values in self._iter_columns_(names, batch_size=READ_CHUNK_SIZE):
+            table.add(ids, measurement_types, values)
+        with Diagnostics.collect(diagnostics, name=self.filename) as diagnostics:
+            for measurement_type, failures in table.failures.items():
+                diagnostics.add(CONVERSION_FAILURE, measurement_type, len(failures), failures)
+        if core is None:
+            columns = {id_column: list(table.ids)}
+            columns.update(table.columns())
+        else:
+            core_names = [field.name for field in core.__fields__]
+            columns = {name: list() for name in core_names}
+            for batch in core._iter_columns_(core_names, batch_size=READ_CHUNK_SIZE):
+                for name, values in zip(core_names, batch):
+                    columns[name].extend(values)
+            for measurement_type, values in table.columns(columns[core.__fields__[core.id].name]).items():
+                name = measurement_type if measurement_type not in columns else f"{measurement_type}_measurement"
+                columns[name] = values
+        if output == "pandas":
+            try:
+                import pandas as pd
+            except ImportError:
+                raise ImportError("Install pandas to use this feature.")
+            return pd.DataFrame(columns)
+        if output == "polars":
+            try:
+                import polars as pl
+            except ImportError:
+                raise ImportError("Install polars to use this feature.")
+            return pl.DataFrame(columns, infer_schema_length=None)
+        return columns
@@ -4,7 +4,7 @@ from typing import List, Dict, Type
 
 from lxml import etree as et
 
-from dwca.classes import DataFile, DataFileType
+from dwca.classes import DataFile, DataFileType, REGISTRY
 from dwca.terms import Field, OutsideTerm
 
 
@@ -95,7 +95,5 @@ class OutsideClass(DataFile):
         Type[Field]
             The Python ``class`` representing the term name.
         """
-        for field_class in cls.__field_class__:
-            if element.get("term") == field_class.URI:
-                return field_class
-        return OutsideTerm
+        field_class = REGISTRY.get_term(cls, element.get("term"))
+        return OutsideTerm if field_class is None else field_class
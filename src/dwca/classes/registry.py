@@ -0,0 +1,229 @@
+from __future__ import annotations
+
+from importlib import import_module
+from typing import Dict, Type, List, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from dwca.classes import DataFile
+    from dwca.terms import Field
+
+
+PREFIXES = {
+    "dwc": "http://rs.tdwg.org/dwc/terms/",
+    "dcterms": "http://purl.org/dc/terms/",
+    "dc": "http://purl.org/dc/elements/1.1/",
+    "chrono": "http://rs.tdwg.org/chrono/terms/",
+}
+"""Dict[str, str]: Namespace of the usual prefixes of the terms (e.g. `dwc:scientificName`)."""
+
+
+def load_object(path: str) -> type:
+    """
+    Import an object given by its path.
+
+    Parameters
+    ----------
+    path : str
+        Location of the object in format `package.module:Name`.
+
+    Returns
+    -------
+    type
+        The object imported.
+    """
+    module, _, name = path.partition(":")
+    assert name != "", f"{path} must be in format `package.module:Name`."
+    return getattr(import_module(module), name)
+
+
+class Registry:
+    """
+    Resolution of URIs into the Python classes representing Darwin Core classes and terms.
+
+    Classes (row types) and terms are looked up in dictionaries by URI. The
+    index of the terms of a class is built on its first resolution, from its
+    `__field_class__` and the terms registered to it (or any of its bases).
+    Third-party classes and terms can be registered as the class itself or as
+    a path `package.module:Name`, imported only the first time it is resolved.
+    """
+    def __init__(self) -> None:
+        self.__classes__: Dict[str, Type[DataFile] | str] = dict()
+        self.__terms__: Dict[type, Dict[str, Type[Field] | str]] = dict()
+        self.__index__: Dict[type, Dict[str, Type[Field] | str]] = dict()
+        self.__names__: Dict[str, Type[Field] | str] | None = None
+        return
+
+    @property
+    def classes(self) -> List[str]:
+        """List[str]: URIs of the registered classes."""
+        return list(self.__classes__.keys())
+
+    def register_class(self, data_class: Type[DataFile] | str, uri: str = None) -> None:
+        """
+        Register a class of data, replacing any class with the same URI.
+
+        Parameters
+        ----------
+        data_class : Type[DataFile] | str
+            Python class representing the Darwin Core class, or its path in format `package.module:Name`.
+        uri : str, optional
+            URI of the row type, default the `URI` of the class. Required if the class is given by its path.
+        """
+        if uri is None:
+            assert not isinstance(data_class, str), "URI must be given for classes registered by path."
+            uri = data_class.URI
+        self.__classes__[uri] = data_class
+        self.__names__ = None
+        return
+
+    def register_term(self, term: Type[Field] | str, data_class: type = None, uri: str = None) -> None:
+        """
+        Register a term for a class of data, and all its subclasses.
+
+        Parameters
+        ----------
+        term : Type[Field] | str
+            Python class representing the term, or its path in format `package.module:Name`.
+        data_class : type, optional
+            Class of data accepting the term, default all of them.
+        uri : str, optional
+            URI of the term, default the `URI` of the term. Required if the term is given by its path.
+        """
+        if uri is None:
+            assert not isinstance(term, str), "URI must be given for terms registered by path."
+            uri = term.URI
+        if data_class is None:
+            from dwca.classes import DataFile
+            data_class = DataFile
+        self.__terms__.setdefault(data_class, dict())[uri] = term
+        self.__index__.clear()
+        self.__names__ = None
+        return
+
+    def unregister_class(self, uri: str) -> None:
+        """
+        Remove a class of data from the registry.
+
+        Parameters
+        ----------
+        uri : str
+            URI of the row type.
+        """
+        self.__classes__.pop(uri, None)
+        self.__names__ = None
+        return
+
+    def unregister_term(self, uri: str, data_class: type = None) -> None:
+        """
+        Remove a term registered for a class of data.
+
+        Parameters
+        ----------
+        uri : str
+            URI of the term.
+        data_class : type, optional
+            Class of data the term was registered to, default all of them.
+        """
+        if data_class is None:
+            from dwca.classes import DataFile
+            data_class = DataFile
+        self.__terms__.get(data_class, dict()).pop(uri, None)
+        self.__index__.clear()
+        self.__names__ = None
+        return
+
+    def get_class(self, uri: str) -> Type[DataFile] | None:
+        """
+        Resolve a row type.
+
+        Parameters
+        ----------
+        uri : str
+            URI of the row type.
+
+        Returns
+        -------
+        Type[DataFile] | None
+            Python class representing the Darwin Core class, None if it is not registered.
+        """
+        data_class = self.__classes__.get(uri)
+        if isinstance(data_class, str):
+            data_class = load_object(data_class)
+            self.__classes__[uri] = data_class
+        return data_class
+
+    def __term_index__(self, data_class: type) -> Dict[str, Type[Field] | str]:
+        index = self.__index__.get(data_class)
+        if index is None:
+            index = {field_class.URI: field_class for field_class in data_class.__field_class__}
+            for base in reversed(data_class.__mro__):
+                index.update(self.__terms__.get(base, dict()))
+            self.__index__[data_class] = index
+        return index
+
+    def get_term(self, data_class: type, uri: str) -> Type[Field] | None:
+        """
+        Resolve a term of a class of data.
+
+        Parameters
+        ----------
+        data_class : type
+            Class of data (subclass of DataFile) with the term.
+        uri : str
+            URI of the term.
+
+        Returns
+        -------
+        Type[Field] | None
+            Python class representing the term, None if it is not a term of the class.
+        """
+        index = self.__term_index__(data_class)
+        term = index.get(uri)
+        if isinstance(term, str):
+            term = load_object(term)
+            index[uri] = term
+        return term
+
+    def __term_names__(self) -> Dict[str, Type[Field] | str]:
+        if self.__names__ is None:
+            from dwca.classes import DataFile
+            names: Dict[str, Type[Field] | str] = dict()
+            for data_class in [DataFile] + [self.get_class(uri) for uri in self.__classes__]:
+                for uri, term in self.__term_index__(data_class).items():
+                    names.setdefault(uri, term)
+                    names.setdefault(uri.rstrip("/").split("/")[-1], term)
+            self.__names__ = names
+        return self.__names__
+
+    def find_term(self, name: str) -> Type[Field] | None:
+        """
+        Resolve a term of any registered class by its URI, prefixed name (e.g. `dwc:scientificName`, see
+        :data:`PREFIXES`) or name (e.g. `scientificName`), as in the header of a Simple Darwin Core file.
+
+        Parameters
+        ----------
+        name : str
+            URI, prefixed name or name of the term.
+
+        Returns
+        -------
+        Type[Field] | None
+            Python class representing the term, None if it is not a term of any registered class.
+        """
+        name = name.strip()
+        prefix, separator, local_name = name.partition(":")
+        if separator != "" and prefix in PREFIXES:
+            name = PREFIXES[prefix] + local_name
+        names = self.__term_names__()
+        term = names.get(name)
+        if isinstance(term, str):
+            term = load_object(term)
+            names[name] = term
+        return term
+
+    def __repr__(self) -> str:
+        return f"<Registry [classes={len(self.__classes__)}]>"
+
+
+REGISTRY = Registry()
+"""Registry: Registry used to resolve the URIs on `meta.xml` files."""
@@ -1,8 +1,11 @@
+from __future__ import annotations
+
 from typing import List
 
 from dwca.classes import DataFile, DataFileType
 from dwca.terms import ResourceRelationshipID, ResourceID, RelationshipOfResourceID, RelatedResourceID, \
     RelationshipOfResource, RelationshipAccordingTo, RelationshipEstablishedDate, RelationshipRemarks, Field
+from dwca.utils import RelationshipGraph
 
 
 class ResourceRelationship(DataFile):
@@ -54,3 +57,17 @@ class ResourceRelationship(DataFile):
             fields_enclosed_by, ignore_header_lines,
         )
         return
+
+    @property
+    def graph(self) -> RelationshipGraph:
+        """RelationshipGraph: Graph index of this data file, from resource to related resource, built on first use."""
+        if "graph" not in self.__indexes__:
+            assert ResourceID.URI in self.fields and RelatedResourceID.URI in self.fields, \
+                "Resource and related resource are required for the graph."
+            self.__indexes__["graph"] = RelationshipGraph(
+                self.__column__(ResourceID.name_cls()),
+                self.__column__(RelatedResourceID.name_cls()),
+                self.__column__(RelationshipOfResource.name_cls()) if RelationshipOfResource.URI in self.fields
+                else None,
+            )
+        return self.__indexes__["graph"]
@@ -1,7 +1,7 @@
 from __future__ import annotations
 
-import re
-from typing import List, Type, Any, Union, Set, Iterable
+import hashlib
+from typing import List, Type, Set, Iterable, Tuple, Dict
 from warnings import warn
 
 from dwca.classes import DataFile, DataFileType
@@ -11,16 +11,10 @@ from dwca.terms import Field, TaxonID, ScientificNameID, AcceptedNameUsageID, Pa
     DWCClass, Order, Superfamily, Family, Subfamily, Tribe, Subtribe, Genus, GenericName, Subgenus, \
     InfragenericEpithet, SpecificEpithet, InfraspecificEpithet, CultivarEpithet, TaxonRank, VerbatimTaxonRank, \
     ScientificNameAuthorship, VernacularName, NomenclaturalCode, TaxonomicStatus, NomenclaturalStatus, TaxonRemarks
-from xml_common.utils import OptionalTqdm
+from dwca.utils import TaxonomicTree, SynonymIndex, FuzzyMatcher, MatchCache, normalize_name
+from xml_common.utils import Progress, LazyModule
 
-try:
-    import pandas as pd
-except ImportError:
-    pd = None
-try:
-    import polars as pl
-except ImportError:
-    pl = None
+pl = LazyModule("polars")
 
 
 class Taxon(DataFile):
@@ -64,6 +58,12 @@ class Taxon(DataFile):
         VernacularName, NomenclaturalCode, TaxonomicStatus,
         NomenclaturalStatus, TaxonRemarks,
     ]
+    __rank_fields__ = {
+        "kingdom": Kingdom, "phylum": Phylum, "class": DWCClass,
+        "order": Order, "superfamily": Superfamily, "family": Family,
+        "subfamily": Subfamily, "tribe": Tribe, "subtribe": Subtribe,
+        "genus": Genus, "subgenus": Subgenus,
+    }
 
     def __init__(
             self, _id: int, files: str,
@@ -89,90 +89,152 @@ class Taxon(DataFile):
             taxa: List[str],
             filter_with_rank: bool = True,
             fuzzy_threshold: float = -1,
+            workers: int = 1,
     ) -> None:
         assert taxa_field.URI in self.fields, f"{taxa_name} must be in fields of this class to use this feature."
-        tqdm = OptionalTqdm(total=100)
-        tqdm.set_descriptor(desc="Getting Taxon ID")
-        if fuzzy_threshold > 0:
-            try:
-                from rapidfuzz import process
-            except ImportError:
-                raise ImportError("Install rapidfuzz to use this feature.")
-        try:
-            df = self.pandas
-            if fuzzy_threshold < 0:
-                mask = df[ScientificName.name_cls()].isin(taxa)
-            else:
-                tqdm.reset(total=len(df))
-                def process_with_bar(x: str) -> float:
-                    tqdm.update()
-                    return process.extractOne(x, taxa)[1]
-                matches = df[ScientificName.name_cls()].apply(process_with_bar)
-                mask = matches >= fuzzy_threshold
-            if filter_with_rank:
-                mask &= df[TaxonRank.name_cls()].str.lower() == taxa_name.lower()
-            taxa_id = df[mask][TaxonID.name_cls()]
-        except ImportError:
-            tqdm.reset(total=len(taxa))
-            taxa_id = list()
+        progress = Progress(total=100, unit="%")
+        postfix = dict()
+        mask = self.__taxa_mask__(
+            taxa_field, taxa_name, taxa, filter_with_rank,
+            fuzzy_threshold, workers, progress, postfix
+        )
+        progress.set_descriptor(desc=f"Filtering {taxa_name}")
+        self._filter_rows_(mask)
+        postfix["Total filtered"] = len(self)
+        progress.set_postfix(ordered_dict=postfix)
+        progress.update(n=10)
+        progress.close()
+        return
+
+    def __taxa_mask__(
+            self,
+            taxa_field: Type[Field],
+            taxa_name: str,
+            taxa: List[str],
+            filter_with_rank: bool,
+            fuzzy_threshold: float,
+            workers: int,
+            progress: Progress,
+            postfix: Dict[str, int],
+    ) -> List[bool] | pl.Expr:
+        progress.set_descriptor(desc=f"Getting {taxa_name} Taxon ID")
+        # Built first, so a missing rapidfuzz fails before reading the names (exact match up to a threshold of 0)
+        matcher = FuzzyMatcher(taxa, workers=workers) if fuzzy_threshold > 0 else None
+        rank = taxa_name.lower()
+        if self.is_lazy() and matcher is None:
+            expression = pl.col(ScientificName.name_cls()).is_in(list(taxa))
             if filter_with_rank:
-                for taxon in taxa:
-                    taxon_found = self.__get_entry__(**{
-                        ScientificName.name_cls(): taxon,
-                        f"{TaxonRank.name_cls()}__case_insensitive": taxa_name
-                    }, fuzzy_threshold=fuzzy_threshold)
-                    if taxon_found is not None:
-                        taxa_id.append(getattr(taxon_found, TaxonID.name_cls()))
-                    tqdm.update()
+                expression &= pl.col(TaxonRank.name_cls()).str.to_lowercase() == rank
+            taxa_id = self.__data__.filter(expression).select(TaxonID.name_cls()).collect().to_series().to_list()
+        else:
+            names = self.__column__(ScientificName.name_cls())
+            if matcher is None:
+                wanted = set(taxa)
+                found = [name in wanted for name in names]
             else:
-                for taxon in taxa:
-                    taxon_found = self.__get_entry__(**{ScientificName.name_cls(): taxon}, fuzzy_threshold=fuzzy_threshold)
-                    if taxon_found is not None:
-                        taxa_id.append(getattr(taxon_found, TaxonID.name_cls()))
-                    tqdm.update()
-            tqdm.reset(total=100)
-        tqdm.update(n=10)
-        postfix = {"Exact match found": len(taxa_id)}
-        tqdm.set_postfix(ordered_dict=postfix)
-        tqdm.set_descriptor(desc="Getting synonyms")
-        complete_taxa = self.all_synonyms(taxa_id, get_names=True)
-        postfix["Synonyms found"] = len(complete_taxa) - len(taxa_id)
-        taxa_id = self.all_synonyms(taxa_id)
-        tqdm.set_postfix(ordered_dict=postfix)
-        tqdm.update(n=40)
-        tqdm.set_descriptor(desc="Getting parents")
-        parents = self.get_parents(taxa_id)
-        parents.update(self.all_synonyms(parents))
-        postfix["Parents found"] = len(parents)
-        tqdm.set_postfix(ordered_dict=postfix)
-        tqdm.update(n=40)
-        tqdm.set_descriptor(desc=f"Filtering {taxa_name}")
-        try:
-            df = self.pandas
-            name = taxa_field.name_cls()
-            mask = df[TaxonID.name_cls()].isin(parents) | df[TaxonID.name_cls()].isin(taxa_id)
+                scores = matcher.scores(names, threshold=fuzzy_threshold)
+                found = [score >= fuzzy_threshold for score in scores]
             if filter_with_rank:
-                mask |= df[name].isin(complete_taxa)
-            df = df[mask]
-            self.pandas = df
-        except ImportError:
+                found = [
+                    is_found and isinstance(taxon_rank, str) and taxon_rank.lower() == rank
+                    for is_found, taxon_rank in zip(found, self.__column__(TaxonRank.name_cls()))
+                ]
+            taxa_id = [
+                taxon_id for taxon_id, is_found in zip(self.__column__(TaxonID.name_cls()), found) if is_found
+            ]
+        progress.update(n=10)
+        postfix["Exact match found"] = postfix.get("Exact match found", 0) + len(taxa_id)
+        progress.set_postfix(ordered_dict=postfix)
+        progress.set_descriptor(desc="Getting synonyms")
+        synonyms = self.synonym_index
+        complete_taxa = set(synonyms.names(taxa_id))
+        matched = len(taxa_id)
+        taxa_id = synonyms.members(taxa_id)
+        postfix["Synonyms found"] = postfix.get("Synonyms found", 0) + len(taxa_id) - matched
+        progress.set_postfix(ordered_dict=postfix)
+        progress.update(n=40)
+        progress.set_descriptor(desc="Getting parents")
+        kept = self.__ancestors__(taxa_id)
+        kept.update(synonyms.members(kept))
+        postfix["Parents found"] = postfix.get("Parents found", 0) + len(kept)
+        kept.update(taxa_id)
+        progress.set_postfix(ordered_dict=postfix)
+        progress.update(n=40)
+        if self.is_lazy():
+            expression = pl.col(TaxonID.name_cls()).is_in(list(kept))
             if filter_with_rank:
-                def filter_taxa(entry: DataFile.Entry) -> bool:
-                    return (getattr(entry, taxa_field.name_cls()) in complete_taxa or
-                            getattr(entry, TaxonID.name_cls()) in parents or
-                            getattr(entry, TaxonID.name_cls()) in taxa_id)
+                expression |= pl.col(taxa_field.name_cls()).is_in(list(complete_taxa))
+            return expression
+        taxa_ids = self.__column__(TaxonID.name_cls())
+        if filter_with_rank:
+            return [
+                taxon_id in kept or taxon in complete_taxa
+                for taxon_id, taxon in zip(taxa_ids, self.__column__(taxa_field.name_cls()))
+            ]
+        return [taxon_id in kept for taxon_id in taxa_ids]
+
+    def filter(
+            self,
+            ranks: Dict[str, List[str]] = None,
+            species: List[str] = None,
+            fuzzy_threshold: float = -1,
+            workers: int = 1,
+    ) -> None:
+        """
+        Filter data by several taxonomic criteria at once.
+
+        Every criterion is resolved against the shared indexes of this data file
+        (:meth:`taxonomic_tree` and :meth:`synonym_index`) and the data is
+        filtered once, keeping the rows that satisfy all of them. Names on the
+        same rank are combined as in the `filter_by_` methods.
+
+        Parameters
+        ----------
+        ranks : Dict[str, List[str]], optional
+            Names to filter by rank, keys are any of `"kingdom"`, `"phylum"`, `"class"`, `"order"`, `"superfamily"`,
+            `"family"`, `"subfamily"`, `"tribe"`, `"subtribe"`, `"genus"` or `"subgenus"`
+            (e.g.: `{"kingdom": ["Plantae"], "family": ["Asteraceae", "Rosaceae"]}`).
+        species : List[str], optional
+            Scientific Name of species (or rank below) to filter data, see :meth:`filter_by_species`.
+        fuzzy_threshold : float, optional
+            If given any value > 0 it will use Levenshtein Distance with that threshold instead of exact match.
+        workers : int, optional
+            Number of cores used for fuzzy matching, `-1` to use all of them. Default `1`.
+        """
+        criteria = list()
+        for rank, taxa in ({} if ranks is None else ranks).items():
+            assert rank.lower() in self.__rank_fields__, f"{rank} is not a supported rank."
+            taxa_field = self.__rank_fields__[rank.lower()]
+            taxa_name = rank.lower().capitalize()
+            assert taxa_field.URI in self.fields, f"{taxa_name} must be in fields of this class to use this feature."
+            criteria.append((taxa_field, taxa_name, taxa, True))
+        if species is not None:
+            criteria.append((ScientificName, "Species", species, False))
+        if len(criteria) == 0:
+            return
+        progress = Progress(total=100 * len(criteria), unit="%")
+        postfix = dict()
+        mask = None
+        for taxa_field, taxa_name, taxa, filter_with_rank in criteria:
+            criterion_mask = self.__taxa_mask__(
+                taxa_field, taxa_name, taxa, filter_with_rank,
+                fuzzy_threshold, workers, progress, postfix
+            )
+            if mask is None:
+                mask = criterion_mask
+            elif self.is_lazy():
+                mask &= criterion_mask
             else:
-                def filter_taxa(entry: DataFile.Entry) -> bool:
-                    return (getattr(entry, TaxonID.name_cls()) in parents or
-                            getattr(entry, TaxonID.name_cls()) in taxa_id)
-            self.__entries__ = list(filter(filter_taxa, self.__entries__))
+                mask = [previous and current for previous, current in zip(mask, criterion_mask)]
+            progress.update(n=10)
+        progress.set_descriptor(desc="Filtering")
+        self._filter_rows_(mask)
         postfix["Total filtered"] = len(self)
-        tqdm.set_postfix(ordered_dict=postfix)
-        tqdm.update(n=10)
-        tqdm.close()
+        progress.set_postfix(ordered_dict=postfix)
+        progress.close()
         return
 
-    def filter_by_kingdom(self, kingdoms: List[str], fuzzy_threshold: float = -1) -> None:
+    def filter_by_kingdom(self, kingdoms: List[str], fuzzy_threshold: float = -1, workers: int = 1) -> None:
         """
         Filter data by a valid kingdoms.
 
@@ -182,10 +244,12 @@ class Taxon(DataFile):
             Kingdom names to filter data.
         fuzzy_threshold : float, optional
             If given any value > 0 it will use Levenshtein Distance with that threshold instead of exact match.
+        workers : int, optional
+            Number of cores used for fuzzy matching, `-1` to use all of them. Default `1`.
         """
-        return self._filter_by_taxa_(Kingdom, "Kingdom", kingdoms, fuzzy_threshold=fuzzy_threshold)
+        return self._filter_by_taxa_(Kingdom, "Kingdom", kingdoms, fuzzy_threshold=fuzzy_threshold, workers=workers)
 
-    def filter_by_phylum(self, phyla: List[str], fuzzy_threshold: float = -1) -> None:
+    def filter_by_phylum(self, phyla: List[str], fuzzy_threshold: float = -1, workers: int = 1) -> None:
         """
         Filter data by a valid phylum.
 
@@ -195,10 +259,12 @@ class Taxon(DataFile):
             Phylum names to filter data.
         fuzzy_threshold : float, optional
             If given any value > 0 it will use Levenshtein Distance with that threshold instead of exact match.
+        workers : int, optional
+            Number of cores used for fuzzy matching, `-1` to use all of them. Default `1`.
         """
-        return self._filter_by_taxa_(Phylum, "Phylum", phyla, fuzzy_threshold=fuzzy_threshold)
+        return self._filter_by_taxa_(Phylum, "Phylum", phyla, fuzzy_threshold=fuzzy_threshold, workers=workers)
 
-    def filter_by_class(self, classes: List[str], fuzzy_threshold: float = -1) -> None:
+    def filter_by_class(self, classes: List[str], fuzzy_threshold: float = -1, workers: int = 1) -> None:
         """
         Filter data by a valid class.
 
@@ -208,10 +274,12 @@ class Taxon(DataFile):
             Class names to filter data.
         fuzzy_threshold : float, optional
             If given any value > 0 it will use Levenshtein Distance with that threshold instead of exact match.
+        workers : int, optional
+            Number of cores used for fuzzy matching, `-1` to use all of them. Default `1`.
         """
-        return self._filter_by_taxa_(DWCClass, "Class", classes, fuzzy_threshold=fuzzy_threshold)
+        return self._filter_by_taxa_(DWCClass, "Class", classes, fuzzy_threshold=fuzzy_threshold, workers=workers)
 
-    def filter_by_order(self, orders: List[str], fuzzy_threshold: float = -1) -> None:
+    def filter_by_order(self, orders: List[str], fuzzy_threshold: float = -1, workers: int = 1) -> None:
         """
         Filter data by a valid order.
 
@@ -221,10 +289,12 @@ class Taxon(DataFile):
             Order names to filter data.
         fuzzy_threshold : float, optional
             If given any value > 0 it will use Levenshtein Distance with that threshold instead of exact match.
+        workers : int, optional
+            Number of cores used for fuzzy matching, `-1` to use all of them. Default `1`.
         """
-        return self._filter_by_taxa_(Order, "Order", orders, fuzzy_threshold=fuzzy_threshold)
+        return self._filter_by_taxa_(Order, "Order", orders, fuzzy_threshold=fuzzy_threshold, workers=workers)
 
-    def filter_by_family(self, families: List[str], fuzzy_threshold: float = -1) -> None:
+    def filter_by_family(self, families: List[str], fuzzy_threshold: float = -1, workers: int = 1) -> None:
         """
         Filter data by a valid family.
 
@@ -234,10 +304,12 @@ class Taxon(DataFile):
             Family names to filter data.
         fuzzy_threshold : float, optional
             If given any value > 0 it will use Levenshtein Distance with that threshold instead of exact match.
+        workers : int, optional
+            Number of cores used for fuzzy matching, `-1` to use all of them. Default `1`.
         """
-        return self._filter_by_taxa_(Family, "Family", families, fuzzy_threshold=fuzzy_threshold)
+        return self._filter_by_taxa_(Family, "Family", families, fuzzy_threshold=fuzzy_threshold, workers=workers)
 
-    def filter_by_genus(self, genera: List[str], fuzzy_threshold: float = -1) -> None:
+    def filter_by_genus(self, genera: List[str], fuzzy_threshold: float = -1, workers: int = 1) -> None:
         """
         Filter data by a valid genus.
 
@@ -247,10 +319,12 @@ class Taxon(DataFile):
             Class names to filter genus.
         fuzzy_threshold : float, optional
             If given any value > 0 it will use Levenshtein Distance with that threshold instead of exact match.
+        workers : int, optional
+            Number of cores used for fuzzy matching, `-1` to use all of them. Default `1`.
         """
-        return self._filter_by_taxa_(Genus, "Genus", genera, fuzzy_threshold=fuzzy_threshold)
+        return self._filter_by_taxa_(Genus, "Genus", genera, fuzzy_threshold=fuzzy_threshold, workers=workers)
 
-    def filter_by_species(self, species: List[str], fuzzy_threshold: float = -1) -> None:
+    def filter_by_species(self, species: List[str], fuzzy_threshold: float = -1, workers: int = 1) -> None:
         """
         Filer data by species or any rank taxonomy below (subspecies, variety, form, etc.).
 
@@ -267,8 +341,113 @@ class Taxon(DataFile):
             Scientific Name of species (or rank below) to filter data.
         fuzzy_threshold : float, optional
             If given any value > 0 it will use Levenshtein Distance with that threshold instead of exact match.
+        workers : int, optional
+            Number of cores used for fuzzy matching, `-1` to use all of them. Default `1`.
+        """
+        return self._filter_by_taxa_(
+            ScientificName, "Species", species, filter_with_rank=False, fuzzy_threshold=fuzzy_threshold, workers=workers
+        )
+
+    @property
+    def fingerprint(self) -> str:
+        """str: Hash of the taxon ids and scientific names of this data file, identifying the checklist version."""
+        if "fingerprint" not in self.__indexes__:
+            digest = hashlib.sha256()
+            for taxon_id, name in zip(self.__column__(TaxonID.name_cls()), self.__column__(ScientificName.name_cls())):
+                digest.update(f"{taxon_id}\t{name}\n".encode("utf-8"))
+            self.__indexes__["fingerprint"] = digest.hexdigest()
+        return self.__indexes__["fingerprint"]
+
+    def match_names(
+            self, names: List[str],
+            fuzzy_threshold: float = -1,
+            block: str = "genus",
+            workers: int = 1,
+            cache: MatchCache = None,
+    ) -> List[Tuple[str | None, float]]:
+        """
+        Match names against the :class:`dwca.terms.taxon.ScientificName` of this data file.
+
+        Names are normalized (collapsing whitespaces) and the ones with an exact
+        match are resolved with a dictionary lookup, the rest are matched with
+        :class:`dwca.utils.fuzzy_matcher.FuzzyMatcher` when a `fuzzy_threshold` is given.
+
+        Parameters
+        ----------
+        names : List[str]
+            Scientific names to be matched.
+        fuzzy_threshold : float, optional
+            If given any value > 0 it will use Levenshtein Distance with that threshold on names without exact match.
+        block : str, optional
+            Block strategy for fuzzy matching, any of `"genus"`, `"trigram"` or None. Default `"genus"`.
+        workers : int, optional
+            Number of cores used for fuzzy matching, `-1` to use all of them. Default `1`.
+        cache : MatchCache, optional
+            Cache to look up previous results and store the new ones, keyed by the :meth:`fingerprint` of this file.
+
+        Returns
+        -------
+        List[Tuple[str | None, float]]
+            For each name, the :class:`dwca.terms.taxon.TaxonID` matched (None if there is not a match) and its score.
         """
-        return self._filter_by_taxa_(ScientificName, "Species", species, filter_with_rank=False, fuzzy_threshold=fuzzy_threshold)
+        queries = [normalize_name(name) for name in names]
+        pending = [query for query in dict.fromkeys(queries) if query != ""]
+        matches: Dict[str, Tuple[str | None, float]] = dict()
+        if cache is not None:
+            mode = "exact" if fuzzy_threshold <= 0 else f"fuzzy_{fuzzy_threshold}_{block}"
+            matches = cache.get(self.fingerprint, mode, pending)
+            pending = [query for query in pending if query not in matches]
+        new_matches = dict(zip(pending, self.__match_names__(pending, fuzzy_threshold, block, workers)))
+        if cache is not None:
+            cache.put(self.fingerprint, mode, new_matches)
+        matches.update(new_matches)
+        return [matches.get(query, (None, 0.0)) for query in queries]
+
+    def __match_names__(
+            self, names: List[str],
+            fuzzy_threshold: float,
+            block: str,
+            workers: int,
+    ) -> List[Tuple[str | None, float]]:
+        if "names" not in self.__indexes__:
+            lookup = dict()
+            for taxon_id, name in zip(self.__column__(TaxonID.name_cls()), self.__column__(ScientificName.name_cls())):
+                name = normalize_name(name)
+                if name != "" and name not in lookup:
+                    lookup[name] = taxon_id
+            self.__indexes__["names"] = lookup
+        lookup = self.__indexes__["names"]
+        results: List[Tuple[str | None, float]] = list()
+        pending = list()
+        for i, name in enumerate(names):
+            taxon_id = lookup.get(name, None)
+            if taxon_id is None:
+                results.append((None, 0.0))
+                pending.append(i)
+            else:
+                results.append((taxon_id, 100.0))
+        if fuzzy_threshold > 0 and len(pending) > 0:
+            key = f"matcher_{block}"
+            if key not in self.__indexes__:
+                self.__indexes__[key] = FuzzyMatcher(self.__column__(ScientificName.name_cls()), block=block)
+            taxa_id = self.__column__(TaxonID.name_cls())
+            matches = self.__indexes__[key].match(
+                [names[i] for i in pending], threshold=fuzzy_threshold, workers=workers
+            )
+            for i, (position, score) in zip(pending, matches):
+                if position is not None:
+                    results[i] = (taxa_id[position], score)
+        return results
+
+    @property
+    def taxonomic_tree(self) -> TaxonomicTree:
+        """TaxonomicTree: Hierarchy index of this data file using :class:`dwca.terms.taxon.ParentNameUsageID`, built on first use."""
+        if "tree" not in self.__indexes__:
+            self.__indexes__["tree"] = TaxonomicTree(
+                self.__column__(TaxonID.name_cls()),
+                self.__column__(ParentNameUsageID.name_cls()),
+            )
+        return self.__indexes__["tree"]
 
     def get_parents(self, taxa_id: List[str]) -> Set[str]:
         """
@@ -284,30 +463,101 @@ class Taxon(DataFile):
         Set[str]
             Set of taxa ids.
         """
-        parent_taxa = set()
-        try:
-            df = self.pandas
-            current_taxa = self.__get_rows__(taxa_id)
-            while len(current_taxa) > 0:
-                new_found_parents = current_taxa[ParentNameUsageID.name_cls()]
-                new_found_parents = new_found_parents[
-                    pd.notna(new_found_parents) &
-                    (new_found_parents != "")
-                ]
-                parent_taxa.update(list(new_found_parents))
-                current_taxa = df[df[TaxonID.name_cls()].isin(new_found_parents)]
-        except ImportError:
-            entries = self.__get_rows__(taxa_id)
-            current_taxa = entries.copy()
-            while len(current_taxa) > 0:
-                new_found_parents = [getattr(current, ParentNameUsageID.name_cls()) for current in current_taxa]
-                new_found_parents = list(filter(
-                    lambda current: current != "" and current is not None,
-                    new_found_parents
-                ))
-                parent_taxa.update(new_found_parents)
-                current_taxa = self.__get_entries__(**{f"{TaxonID.name_cls()}__isin": new_found_parents})
-        return parent_taxa
+        if self.is_lazy():
+            edges = self.__edges__
+            present = edges.filter(pl.col(TaxonID.name_cls()).is_in(list(taxa_id)))[TaxonID.name_cls()].to_list()
+            self.__check_present__(set(present), taxa_id)
+        else:
+            self.__check_present__(self.taxonomic_tree, taxa_id)
+        return self.__ancestors__(taxa_id)
+
+    def get_children(self, taxa_id: List[str], subtree: bool = False) -> Set[str]:
+        """
+        Get a list of taxa ids of the children of the list taxa id provided.
+
+        Parameters
+        ----------
+        taxa_id : List[str]
+            A list of :class:`dwca.terms.taxon.TaxonID` to look for children.
+        subtree : bool, optional
+            Whether to get every descendant instead of only the direct children. Default `False`.
+
+        Returns
+        -------
+        Set[str]
+            Set of taxa ids.
+        """
+        tree = self.taxonomic_tree
+        self.__check_present__(tree, taxa_id)
+        return tree.descendants(taxa_id, subtree=subtree)
+
+    def lowest_common_ancestor(self, taxa_id: List[str]) -> str | None:
+        """
+        Get the lowest taxon in the hierarchy that contains all the taxa ids provided.
+
+        Parameters
+        ----------
+        taxa_id : List[str]
+            A list of :class:`dwca.terms.taxon.TaxonID`.
+
+        Returns
+        -------
+        str | None
+            Taxon id of the common ancestor (it can be one of the given taxa) or None if there is not one.
+        """
+        tree = self.taxonomic_tree
+        self.__check_present__(tree, taxa_id)
+        return tree.lowest_common_ancestor([taxon_id for taxon_id in taxa_id if taxon_id in tree])
+
+    @property
+    def __edges__(self) -> pl.DataFrame:
+        if "edges" not in self.__indexes__:
+            self.__indexes__["edges"] = self.__data__.select(
+                TaxonID.name_cls(), ParentNameUsageID.name_cls()
+            ).filter(
+                pl.col(TaxonID.name_cls()).is_not_null() &
+                pl.col(ParentNameUsageID.name_cls()).is_not_null() &
+                (pl.col(ParentNameUsageID.name_cls()) != "")
+            ).unique(subset=TaxonID.name_cls(), keep="first", maintain_order=True).collect()
+        return self.__indexes__["edges"]
+
+    def __ancestors__(self, taxa_id: Iterable[str]) -> Set[str]:
+        if not self.is_lazy():
+            return self.taxonomic_tree.ancestors(taxa_id)
+        # Walk the hierarchy joining each level with the parent relation, on polars
+        edges = self.__edges__
+        taxon = TaxonID.name_cls()
+        parent = ParentNameUsageID.name_cls()
+        found = set()
+        frontier = pl.DataFrame({taxon: list(taxa_id)}, schema={taxon: edges.schema[taxon]})
+        while frontier.height > 0:
+            parents = frontier.join(edges, on=taxon, how="inner").select(
+                pl.col(parent).alias(taxon)
+            ).unique().filter(~pl.col(taxon).is_in(list(found)))
+            found.update(parents[taxon].to_list())
+            frontier = parents
+        return found
+
+    @staticmethod
+    def __check_present__(index: TaxonomicTree | SynonymIndex | Set[str], taxa_id: Iterable[str]) -> None:
+        if isinstance(index, set):
+            not_present = [taxon_id for taxon_id in taxa_id if taxon_id not in index]
+        else:
+            not_present = [taxon_id for taxon_id in taxa_id if not index.is_present(taxon_id)]
+        if len(not_present) > 0:
+            warn(f"{', '.join(not_present)} not found in data file.", category=RuntimeWarning)
+        return
+
+    @property
+    def synonym_index(self) -> SynonymIndex:
+        """SynonymIndex: Accepted name grouping index of this data file using :class:`dwca.terms.taxon.AcceptedNameUsageID`, built on first use."""
+        if "synonyms" not in self.__indexes__:
+            self.__indexes__["synonyms"] = SynonymIndex(
+                self.__column__(TaxonID.name_cls()),
+                self.__column__(AcceptedNameUsageID.name_cls()),
+                self.__column__(ScientificName.name_cls()),
+            )
+        return self.__indexes__["synonyms"]
 
     def all_synonyms(self, taxa_id: Iterable[str], get_names: bool = False) -> List[str]:
         """
@@ -325,83 +575,6 @@ class Taxon(DataFile):
         List[str]
             A list of :class:`dwca.terms.taxon.TaxonID`.
         """
-        try:
-            df = self.pandas
-            current_taxa = self.__get_rows__(taxa_id)
-            accepted_names = current_taxa[AcceptedNameUsageID.name_cls()]
-            return list(
-                df[df[AcceptedNameUsageID.name_cls()].isin(accepted_names)][
-                    ScientificName.name_cls() if get_names else TaxonID.name_cls()
-                ]
-            )
-        except ImportError:
-            entries = self.__get_rows__(taxa_id)
-            accepted_names = [getattr(entry, AcceptedNameUsageID.name_cls()) for entry in entries]
-            synonyms = self.__get_entries__(**{f"{AcceptedNameUsageID.name_cls()}__isin": accepted_names})
-            field = ScientificName.name_cls() if get_names else TaxonID.name_cls()
-            return [getattr(synonymous, field) for synonymous in synonyms]
-
-    def __get_rows__(self, taxa_id: Iterable[str]) -> Union[pd.DataFrame, List[DataFile.Entry]]:
-        try:
-            df = self.pandas
-            current_taxa = df[df[TaxonID.name_cls()].isin(taxa_id)]
-            if len(current_taxa) != len(taxa_id):
-                candidates = pd.Series(taxa_id)
-                not_present = candidates[~candidates.isin(df[TaxonID.name_cls()])]
-                warn(f"{', '.join(list(not_present))} not found in data file.", category=RuntimeWarning)
-            return current_taxa
-        except ImportError:
-            entries = self.__get_entries__(**{f"{TaxonID.name_cls()}__isin": taxa_id})
-            if len(entries) != len(taxa_id):
-                found_taxa = [getattr(entry, TaxonID.name_cls()) for entry in entries]
-                not_present = list(filter(lambda candid: candid not in found_taxa, taxa_id))
-                warn(f"{', '.join(not_present)} not found in data file.", category=RuntimeWarning)
-            return entries
-
-    def __get_entry__(self, fuzzy_threshold: float =-1, **kwargs) -> DataFile.Entry | None:
-        for candid in self.__entries__:
-            found = True
-            for key, value in kwargs.items():
-                found &= Taxon.__compare__(candid, key, value, fuzzy_threshold=fuzzy_threshold)
-                if not found:
-                    break
-            if found:
-                return candid
-        return None
-
-    def __get_entries__(self, fuzzy_threshold: float =-1, **kwargs) -> List[DataFile.Entry]:
-        results = list()
-        for candid in self.__entries__:
-            found = True
-            for key, value in kwargs.items():
-                found &= Taxon.__compare__(candid, key, value, fuzzy_threshold=fuzzy_threshold)
-                if not found:
-                    break
-            if found:
-                results.append(candid)
-        return results
-
-    @staticmethod
-    def __compare__(candid: DataFile.Entry, key: str, value: Any, fuzzy_threshold: float = -1) -> bool:
-        match = re.match(r"(\w+)__case_insensitive$", key)
-        if match:
-            if fuzzy_threshold > 0:
-                from rapidfuzz import fuzz
-                ratio = fuzz.ratio(getattr(candid, match.group(1)).lower(), value.lower())
-                return ratio >= fuzzy_threshold
-            return getattr(candid, match.group(1)).lower() == value.lower()
-        match = re.match(r"(\w+)__isin$", key)
-        if match:
-            if fuzzy_threshold > 0:
-                from rapidfuzz import process
-                _, ratio = process.extractOne(getattr(candid, match.group(1)), value)
-                return ratio >= fuzzy_threshold
-            return getattr(candid, match.group(1)) in value
-        if fuzzy_threshold > 0:
-            from rapidfuzz import fuzz
-            ratio = fuzz.ratio(getattr(candid, key), value)
-            if getattr(candid, key) == "Rtfkiaicpdng (Abifwvxqn) gurqtwpof f. prczacpvtdtu 'xzhgezqpaorp'":
-                import sys
-                print(candid, key, value, ratio, file=sys.stderr)
-            return ratio >= fuzzy_threshold
-        return getattr(candid, key) == value
+        index = self.synonym_index
+        self.__check_present__(index, taxa_id)
+        return index.names(taxa_id) if get_names else index.members(taxa_id)
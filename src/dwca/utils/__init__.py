@@ -0,0 +1,14 @@
+from dwca.utils.taxonomic_tree import TaxonomicTree, is_missing
+from dwca.utils.synonym_index import SynonymIndex
+from dwca.utils.fuzzy_matcher import FuzzyMatcher
+from dwca.utils.match_cache import MatchCache, normalize_name
+from dwca.utils.spatial_index import SpatialIndex
+from dwca.utils.geo_aggregator import GeographicAggregator, convex_hull, simplify_ring
+from dwca.utils.time_aggregator import TemporalAggregator, date_bounds, key_to_date
+from dwca.utils.stage_profile import StageProfile, StageRecord
+from dwca.utils.memory_usage import MemoryUsage, deep_sizeof, frame_memory, file_size
+from dwca.utils.quarantine import Quarantine, QuarantinedRow, ListQuarantine, FileQuarantine, DataFileQuarantine
+from dwca.utils.quarantine import COLUMN_COUNT, CONVERSION
+from dwca.utils.measurement_pivot import MeasurementPivot, AGGREGATIONS, to_bool, to_int
+from dwca.utils.relationship_graph import RelationshipGraph
+from dwca.utils.event_hierarchy import EventHierarchy
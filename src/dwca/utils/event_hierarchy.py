@@ -0,0 +1,135 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, Sequence, Tuple
+
+from dwca.utils.taxonomic_tree import TaxonomicTree, is_missing
+
+
+class EventHierarchy(TaxonomicTree):
+    """
+    Parent-pointer index of nested events (e.g. survey, site visit, sample).
+
+    The events are flattened in a pre-order traversal as in :class:`dwca.utils.TaxonomicTree`, so the
+    descendants of an event are a contiguous range of that traversal. On top of it, the top-level event of
+    every event is computed in the same order, and rollups add the rows of another data file (e.g. occurrences
+    by `eventID`) to their ancestors in a single pass over the rows and another over the events.
+
+    Parameters
+    ----------
+    events_id : Sequence[str]
+        :class:`dwca.terms.event.EventID` of each row.
+    parents_id : Sequence[str]
+        :class:`dwca.terms.event.ParentEventID` of each row, in the same order of `events_id`.
+    """
+    def __init__(self, events_id: Sequence[str], parents_id: Sequence[str]) -> None:
+        super().__init__(events_id, parents_id)
+        # Top-level ancestor of each node, parents come before their children in pre-order
+        self.__top__ = [-1] * len(self.__parent__)
+        for node in self.__order__:
+            parent = self.__parent__[node]
+            self.__top__[node] = node if parent == -1 else self.__top__[parent]
+        self.__levels__: Dict[int, List[int]] = dict()
+        return
+
+    @property
+    def roots(self) -> List[str]:
+        """List[str]: Top-level events, in order of traversal."""
+        return [self.__ids__[node] for node in self.__order__ if self.__parent__[node] == -1]
+
+    @property
+    def max_depth(self) -> int:
+        """int: Depth of the deepest event, 0 if there are only top-level events."""
+        return max(self.__depth__, default=0)
+
+    def top(self, event_id: str) -> str:
+        """
+        Top-level ancestor of an event.
+
+        Parameters
+        ----------
+        event_id : str
+            A :class:`dwca.terms.event.EventID` value.
+
+        Returns
+        -------
+        str
+            Event id of the top-level event, itself for a top-level event.
+        """
+        return self.__ids__[self.__top__[self.__index__[event_id]]]
+
+    def subtree_range(self, event_id: str) -> Tuple[int, int]:
+        """
+        Range of an event and its descendants in the pre-order traversal.
+
+        Parameters
+        ----------
+        event_id : str
+            A :class:`dwca.terms.event.EventID` value.
+
+        Returns
+        -------
+        Tuple[int, int]
+            Start (the event) and end (exclusive) positions.
+        """
+        node = self.__index__[event_id]
+        return self.__start__[node], self.__end__[node]
+
+    def __ancestor_at__(self, level: int) -> List[int]:
+        # Ancestor at the depth of each node (itself at that depth), -1 for shallower nodes
+        if level not in self.__levels__:
+            ancestor = [-1] * len(self.__parent__)
+            for node in self.__order__:
+                depth = self.__depth__[node]
+                if depth == level:
+                    ancestor[node] = node
+                elif depth > level:
+                    ancestor[node] = ancestor[self.__parent__[node]]
+            self.__levels__[level] = ancestor
+        return self.__levels__[level]
+
+    def rollup(
+            self, events_id: Sequence[str], values: Sequence[Any] = None, level: int | None = 0
+    ) -> Dict[str, Any]:
+        """
+        Add the rows of a data file referencing the events (e.g. occurrences by `eventID`) to their ancestors.
+
+        Parameters
+        ----------
+        events_id : Sequence[str]
+            :class:`dwca.terms.event.EventID` of each row, unknown or missing ones are ignored.
+        values : Sequence[Any], optional
+            Value of each row to add (e.g. :class:`dwca.terms.occurrence.IndividualCount`), missing ones are
+            ignored. Default to count the rows.
+        level : int | None, optional
+            Depth of the ancestors receiving the rows, `0` for the top-level events (rows of shallower events
+            are not included). None to add them to every ancestor (the total of each event and its
+            descendants). Default `0`.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Total of each event at the level (or of every event) with rows, in order of traversal.
+        """
+        totals = [0] * len(self.__parent__)
+        values = [1] * len(events_id) if values is None else values
+        for event_id, value in zip(events_id, values):
+            node = self.__index__.get(event_id) if not is_missing(event_id) else None
+            if node is None or is_missing(value):
+                continue
+            totals[node] += value
+        if level is None:
+            # Totals of the subtrees, adding the children (after its parent in pre-order) in reverse order
+            for node in reversed(self.__order__):
+                parent = self.__parent__[node]
+                if parent != -1:
+                    totals[parent] += totals[node]
+            return {self.__ids__[node]: totals[node] for node in self.__order__ if totals[node] != 0}
+        ancestor = self.__ancestor_at__(level)
+        result = [0] * len(self.__parent__)
+        for node in self.__order__:
+            if ancestor[node] != -1:
+                result[ancestor[node]] += totals[node]
+        return {
+            self.__ids__[node]: result[node] for node in self.__order__
+            if self.__depth__[node] == level and result[node] != 0
+        }
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from typing import List, Dict, Tuple, Sequence, Callable
+
+from dwca.utils.taxonomic_tree import is_missing
+
+BLOCK_KEYS: Dict[str, Callable[[str], str]] = {
+    "genus": lambda name: name.split(maxsplit=1)[0].lower() if name.strip() != "" else "",
+    "trigram": lambda name: name.strip()[:3].lower(),
+}
+"""Dict[str, Callable[[str], str]]: Functions to get the block of a name, candidates are only compared inside a block."""
+
+
+class FuzzyMatcher:
+    """
+    Fuzzy matching engine of names against a fixed list of choices.
+
+    Queries are scored in batches with :func:`rapidfuzz.process.cdist`, which
+    can spread the work across cores. Optionally, queries are only compared
+    with the choices sharing the same block (first word or first trigram),
+    falling back to all choices when the block of the query does not exist.
+
+    Parameters
+    ----------
+    choices : Sequence[str]
+        Names to be matched against.
+    block : str, optional
+        Block strategy, any of `"genus"` or `"trigram"`. Default `None` (no blocking).
+    workers : int, optional
+        Number of cores used by rapidfuzz, `-1` to use all of them. Default `1`.
+    scorer : Callable, optional
+        A rapidfuzz scorer. Default :func:`rapidfuzz.fuzz.WRatio`.
+    max_cells : int, optional
+        Maximum number of scores computed at once, bounding memory usage. Default `10_000_000`.
+    """
+    def __init__(
+            self, choices: Sequence[str],
+            block: str = None,
+            workers: int = 1,
+            scorer: Callable = None,
+            max_cells: int = 10_000_000,
+    ) -> None:
+        try:
+            from rapidfuzz import fuzz
+        except ImportError:
+            raise ImportError("Install rapidfuzz to use this feature.")
+        if block is not None and block not in BLOCK_KEYS:
+            raise ValueError(f"Block must be any of {', '.join(BLOCK_KEYS.keys())}.")
+        self.__block__ = block
+        self.__workers__ = workers
+        self.__scorer__ = fuzz.WRatio if scorer is None else scorer
+        self.__max_cells__ = max_cells
+        self.__choices__: List[str] = list()
+        self.__positions__: List[int] = list()
+        for i, choice in enumerate(choices):
+            if not is_missing(choice):
+                self.__choices__.append(str(choice))
+                self.__positions__.append(i)
+        self.__blocks__: Dict[str, List[int]] = dict()
+        if block is not None:
+            key = BLOCK_KEYS[block]
+            for i, choice in enumerate(self.__choices__):
+                self.__blocks__.setdefault(key(choice), list()).append(i)
+        return
+
+    def match(
+            self, queries: Sequence[str],
+            threshold: float = 0,
+            workers: int = None,
+    ) -> List[Tuple[int | None, float]]:
+        """
+        Best choice for every query.
+
+        Parameters
+        ----------
+        queries : Sequence[str]
+            Names to be matched.
+        threshold : float, optional
+            Minimum score (0 - 100) to be considered a match. Default `0`.
+        workers : int, optional
+            Number of cores used on this call, default the one given on the constructor.
+
+        Returns
+        -------
+        List[Tuple[int | None, float]]
+            For each query, the position of the best choice (in the `choices` given) and its score.
+            Position is None when there is not a choice with score above the threshold.
+        """
+        from rapidfuzz import process
+        results: List[Tuple[int | None, float]] = [(None, 0.0)] * len(queries)
+        groups: Dict[str | None, List[int]] = dict()
+        key = BLOCK_KEYS[self.__block__] if self.__block__ is not None else None
+        for i, query in enumerate(queries):
+            if is_missing(query):
+                continue
+            group = key(str(query)) if key is not None else None
+            if group not in self.__blocks__:
+                group = None
+            groups.setdefault(group, list()).append(i)
+        for group, positions in groups.items():
+            if group is None:
+                candidates = range(len(self.__choices__))
+            else:
+                candidates = self.__blocks__[group]
+            choices = [self.__choices__[i] for i in candidates]
+            if len(choices) == 0:
+                continue
+            batch_size = max(1, self.__max_cells__ // len(choices))
+            for start in range(0, len(positions), batch_size):
+                batch = positions[start:start + batch_size]
+                scores = process.cdist(
+                    [str(queries[i]) for i in batch], choices,
+                    scorer=self.__scorer__,
+                    score_cutoff=threshold,
+                    workers=self.__workers__ if workers is None else workers,
+                )
+                best = scores.argmax(axis=1)
+                for row, position in enumerate(batch):
+                    score = float(scores[row, best[row]])
+                    if score > 0 and score >= threshold:
+                        results[position] = (self.__positions__[candidates[best[row]]], score)
+        return results
+
+    def scores(self, queries: Sequence[str], threshold: float = 0, workers: int = None) -> List[float]:
+        """
+        Score of the best choice for every query.
+
+        Parameters
+        ----------
+        queries : Sequence[str]
+            Names to be matched.
+        threshold : float, optional
+            Scores below it are set to 0. Default `0`.
+        workers : int, optional
+            Number of cores used on this call, default the one given on the constructor.
+
+        Returns
+        -------
+        List[float]
+            Best score for each query.
+        """
+        return [score for _, score in self.match(queries, threshold=threshold, workers=workers)]
+
+    def __len__(self) -> int:
+        return len(self.__choices__)
+
+    def __repr__(self) -> str:
+        return f"<FuzzyMatcher [choices={len(self)}, block={self.__block__}]>"
@@ -0,0 +1,181 @@
+from __future__ import annotations
+
+from typing import List, Tuple, Sequence
+
+from dwca.utils.taxonomic_tree import is_missing
+
+Point = Tuple[float, float]
+
+
+def convex_hull(points: Sequence[Point]) -> List[Point]:
+    """
+    Convex hull of a set of points using the monotone chain algorithm.
+
+    Parameters
+    ----------
+    points : Sequence[Tuple[float, float]]
+        Points as (latitude, longitude).
+
+    Returns
+    -------
+    List[Tuple[float, float]]
+        Vertices of the hull in counter-clockwise order, without repeating the first one.
+    """
+    points = sorted(set(points), key=lambda point: (point[1], point[0]))
+    if len(points) <= 2:
+        return points
+
+    def cross(origin: Point, first: Point, second: Point) -> float:
+        return ((first[1] - origin[1]) * (second[0] - origin[0]) -
+                (first[0] - origin[0]) * (second[1] - origin[1]))
+
+    lower: List[Point] = list()
+    for point in points:
+        while len(lower) >= 2 and cross(lower[-2], lower[-1], point) <= 0:
+            lower.pop()
+        lower.append(point)
+    upper: List[Point] = list()
+    for point in reversed(points):
+        while len(upper) >= 2 and cross(upper[-2], upper[-1], point) <= 0:
+            upper.pop()
+        upper.append(point)
+    return lower[:-1] + upper[:-1]
+
+
+def simplify_ring(ring: List[Point], max_vertices: int) -> List[Point]:
+    """
+    Reduce the vertices of a ring, removing the one enclosing the smallest area each time.
+
+    Parameters
+    ----------
+    ring : List[Tuple[float, float]]
+        Vertices of the ring, without repeating the first one.
+    max_vertices : int
+        Maximum number of vertices, at least 3.
+
+    Returns
+    -------
+    List[Tuple[float, float]]
+        Simplified ring.
+    """
+    assert max_vertices >= 3, "A ring has at least 3 vertices."
+    ring = list(ring)
+
+    def area(i: int) -> float:
+        (lat_1, lon_1), (lat_2, lon_2), (lat_3, lon_3) = ring[i - 1], ring[i], ring[(i + 1) % len(ring)]
+        return abs((lon_2 - lon_1) * (lat_3 - lat_1) - (lon_3 - lon_1) * (lat_2 - lat_1))
+
+    while len(ring) > max_vertices:
+        ring.pop(min(range(len(ring)), key=area))
+    return ring
+
+
+class GeographicAggregator:
+    """
+    Streaming aggregation of coordinates and elevations.
+
+    Values are consumed in batches keeping only the limits found and, if
+    requested, the candidates of the convex hull, so memory does not grow
+    with the number of rows. Missing or out of range coordinates are skipped.
+
+    Parameters
+    ----------
+    hull : bool, optional
+        Keep track of the convex hull of the points. Default `False`.
+    buffer_size : int, optional
+        Number of points buffered before reducing them to the current hull. Default `100_000`.
+    """
+    def __init__(self, hull: bool = False, buffer_size: int = 100_000) -> None:
+        self.__hull__ = hull
+        self.__buffer_size__ = buffer_size
+        self.__points__: List[Point] = list()
+        self.__count__ = 0
+        self.__south__ = self.__north__ = self.__west__ = self.__east__ = None
+        self.__min_elevation__ = self.__max_elevation__ = None
+        return
+
+    @property
+    def count(self) -> int:
+        """int: Number of valid coordinates aggregated."""
+        return self.__count__
+
+    @property
+    def bounding_box(self) -> Tuple[float, float, float, float] | None:
+        """Tuple[float, float, float, float] | None: West, east, north and south limits, None if there are no points."""
+        if self.__count__ == 0:
+            return None
+        return self.__west__, self.__east__, self.__north__, self.__south__
+
+    @property
+    def elevation(self) -> Tuple[float, float] | None:
+        """Tuple[float, float] | None: Minimum and maximum elevation, None if there are no elevations."""
+        if self.__min_elevation__ is None:
+            return None
+        return self.__min_elevation__, self.__max_elevation__
+
+    def update(
+            self, latitudes: Sequence[float],
+            longitudes: Sequence[float],
+            elevations: Sequence[float] = None,
+    ) -> None:
+        """
+        Aggregate a batch of values.
+
+        Parameters
+        ----------
+        latitudes : Sequence[float]
+            Decimal latitudes.
+        longitudes : Sequence[float]
+            Decimal longitudes, in the same order of `latitudes`.
+        elevations : Sequence[float], optional
+            Elevations in meters, not necessarily of the same rows of the coordinates.
+        """
+        valid = [
+            (float(lat), float(lon)) for lat, lon in zip(latitudes, longitudes)
+            if not is_missing(lat) and not is_missing(lon) and -90 <= lat <= 90 and -180 <= lon <= 180
+        ]
+        if len(valid) > 0:
+            lats = [lat for lat, _ in valid]
+            lons = [lon for _, lon in valid]
+            if self.__count__ == 0:
+                self.__south__, self.__north__ = min(lats), max(lats)
+                self.__west__, self.__east__ = min(lons), max(lons)
+            else:
+                self.__south__, self.__north__ = min(self.__south__, min(lats)), max(self.__north__, max(lats))
+                self.__west__, self.__east__ = min(self.__west__, min(lons)), max(self.__east__, max(lons))
+            self.__count__ += len(valid)
+            if self.__hull__:
+                self.__points__.extend(valid)
+                if len(self.__points__) > self.__buffer_size__:
+                    self.__points__ = convex_hull(self.__points__)
+        if elevations is not None:
+            values = [float(value) for value in elevations if not is_missing(value)]
+            if len(values) > 0:
+                low, high = min(values), max(values)
+                if self.__min_elevation__ is not None:
+                    low, high = min(low, self.__min_elevation__), max(high, self.__max_elevation__)
+                self.__min_elevation__, self.__max_elevation__ = low, high
+        return
+
+    def convex_hull(self, max_vertices: int = None) -> List[Point]:
+        """
+        Convex hull of the aggregated points.
+
+        Parameters
+        ----------
+        max_vertices : int, optional
+            Simplify the hull to at most this number of vertices.
+
+        Returns
+        -------
+        List[Tuple[float, float]]
+            Vertices (latitude, longitude) of the hull.
+        """
+        assert self.__hull__, "Aggregator not tracking the convex hull."
+        self.__points__ = convex_hull(self.__points__)
+        if max_vertices is not None and len(self.__points__) > max_vertices:
+            return simplify_ring(self.__points__, max_vertices)
+        return list(self.__points__)
+
+    def __repr__(self) -> str:
+        return f"<GeographicAggregator [points={self.count}]>"
@@ -0,0 +1,197 @@
+from __future__ import annotations
+
+import sqlite3
+from typing import Dict, Tuple, Iterable
+
+from dwca.utils.taxonomic_tree import is_missing
+
+SQLITE_MAX_VARIABLES = 500
+"""int: Maximum number of names looked up in the same query."""
+
+
+def normalize_name(name: str) -> str:
+    """
+    Normalize a scientific name to be used as a key, collapsing whitespaces.
+
+    Parameters
+    ----------
+    name : str
+        A scientific name.
+
+    Returns
+    -------
+    str
+        Normalized name.
+    """
+    if is_missing(name):
+        return ""
+    return " ".join(str(name).split())
+
+
+class MatchCache:
+    """
+    Persistent cache of name matching results.
+
+    Results are stored in a SQLite database keyed by the fingerprint of the
+    checklist, the matching mode (exact or fuzzy with its parameters) and the
+    normalized query name. When the cache exceeds `max_size` entries, the least
+    recently used ones are evicted.
+
+    Parameters
+    ----------
+    path : str, optional
+        Location of the database file. Default `":memory:"` (not persisted).
+    max_size : int, optional
+        Maximum number of entries stored. Default `1_000_000`.
+    """
+    def __init__(self, path: str = ":memory:", max_size: int = 1_000_000) -> None:
+        assert max_size > 0, "Cache size must be positive."
+        self.__path__ = path
+        self.__max_size__ = max_size
+        self.__hits__ = 0
+        self.__misses__ = 0
+        self.__connection__ = sqlite3.connect(path)
+        self.__connection__.execute("""CREATE TABLE IF NOT EXISTS matches (
+            fingerprint TEXT NOT NULL,
+            mode TEXT NOT NULL,
+            name TEXT NOT NULL,
+            taxon_id TEXT,
+            score REAL NOT NULL,
+            last_used INTEGER NOT NULL,
+            PRIMARY KEY (fingerprint, mode, name)
+        )""")
+        self.__connection__.execute("CREATE INDEX IF NOT EXISTS matches_last_used ON matches (last_used)")
+        self.__connection__.commit()
+        self.__clock__ = self.__connection__.execute("SELECT COALESCE(MAX(last_used), 0) FROM matches").fetchone()[0]
+        # Counted once, then kept up to date on each insertion and eviction
+        self.__size__ = self.__connection__.execute("SELECT COUNT(*) FROM matches").fetchone()[0]
+        return
+
+    @property
+    def path(self) -> str:
+        """str: Location of the database file."""
+        return self.__path__
+
+    @property
+    def hits(self) -> int:
+        """int: Number of names found on the cache since it was opened."""
+        return self.__hits__
+
+    @property
+    def misses(self) -> int:
+        """int: Number of names not found on the cache since it was opened."""
+        return self.__misses__
+
+    def get(self, fingerprint: str, mode: str, names: Iterable[str]) -> Dict[str, Tuple[str | None, float]]:
+        """
+        Look up matches stored.
+
+        Parameters
+        ----------
+        fingerprint : str
+            Fingerprint of the checklist.
+        mode : str
+            Matching mode.
+        names : Iterable[str]
+            Normalized names to look up.
+
+        Returns
+        -------
+        Dict[str, Tuple[str | None, float]]
+            Stored matches (taxon id and score) of the names found.
+        """
+        names = list(dict.fromkeys(names))
+        found: Dict[str, Tuple[str | None, float]] = dict()
+        for start in range(0, len(names), SQLITE_MAX_VARIABLES):
+            batch = names[start:start + SQLITE_MAX_VARIABLES]
+            rows = self.__connection__.execute(
+                f"SELECT name, taxon_id, score FROM matches WHERE fingerprint = ? AND mode = ? "
+                f"AND name IN ({', '.join(['?'] * len(batch))})",
+                [fingerprint, mode] + batch
+            )
+            for name, taxon_id, score in rows:
+                found[name] = (taxon_id, score)
+        self.__hits__ += len(found)
+        self.__misses__ += len(names) - len(found)
+        if len(found) > 0:
+            self.__clock__ += 1
+            self.__connection__.executemany(
+                "UPDATE matches SET last_used = ? WHERE fingerprint = ? AND mode = ? AND name = ?",
+                [(self.__clock__, fingerprint, mode, name) for name in found.keys()]
+            )
+            self.__connection__.commit()
+        return found
+
+    def put(self, fingerprint: str, mode: str, matches: Dict[str, Tuple[str | None, float]]) -> None:
+        """
+        Store matches, evicting the least recently used ones if the cache is full.
+
+        Parameters
+        ----------
+        fingerprint : str
+            Fingerprint of the checklist.
+        mode : str
+            Matching mode.
+        matches : Dict[str, Tuple[str | None, float]]
+            Matches (taxon id and score) of normalized names.
+        """
+        if len(matches) == 0:
+            return
+        self.__clock__ += 1
+        added = self.__connection__.executemany(
+            "INSERT OR IGNORE INTO matches (fingerprint, mode, name, taxon_id, score, last_used) "
+            "VALUES (?, ?, ?, ?, ?, ?)",
+            [
+                (fingerprint, mode, name, taxon_id, score, self.__clock__)
+                for name, (taxon_id, score) in matches.items()
+            ]
+        ).rowcount
+        if added < len(matches):
+            self.__connection__.executemany(
+                "UPDATE matches SET taxon_id = ?, score = ?, last_used = ? WHERE fingerprint = ? AND mode = ? "
+                "AND name = ?",
+                [
+                    (taxon_id, score, self.__clock__, fingerprint, mode, name)
+                    for name, (taxon_id, score) in matches.items()
+                ]
+            )
+        self.__size__ += added
+        overflow = self.__size__ - self.__max_size__
+        if overflow > 0:
+            self.__size__ -= self.__connection__.execute(
+                "DELETE FROM matches WHERE rowid IN (SELECT rowid FROM matches ORDER BY last_used LIMIT ?)",
+                (overflow,)
+            ).rowcount
+        self.__connection__.commit()
+        return
+
+    def clear(self) -> None:
+        """
+        Remove every entry of the cache and reset the counters.
+        """
+        self.__connection__.execute("DELETE FROM matches")
+        self.__connection__.commit()
+        self.__size__ = 0
+        self.__hits__ = 0
+        self.__misses__ = 0
+        return
+
+    def close(self) -> None:
+        """
+        Close the connection to the database file.
+        """
+        self.__connection__.close()
+        return
+
+    def __len__(self) -> int:
+        return self.__size__
+
+    def __enter__(self) -> MatchCache:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+        return
+
+    def __repr__(self) -> str:
+        return f"<MatchCache [path={self.path}, hits={self.hits}, misses={self.misses}]>"
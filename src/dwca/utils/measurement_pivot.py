@@ -0,0 +1,245 @@
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, List, Sequence, Tuple
+from warnings import warn
+
+from dwca.utils.taxonomic_tree import is_missing
+
+__true__ = {"true", "t", "yes", "y", "1"}
+__false__ = {"false", "f", "no", "n", "0"}
+
+
+def to_bool(value: Any) -> bool:
+    """
+    Convert a value of a measurement into a boolean (e.g. `"true"`, `"yes"`, `"1"`).
+
+    Parameters
+    ----------
+    value : Any
+        Value as text or number.
+
+    Returns
+    -------
+    bool
+        The value as boolean.
+    """
+    if isinstance(value, bool):
+        return value
+    text = str(value).strip().lower()
+    if text in __true__:
+        return True
+    if text in __false__:
+        return False
+    raise ValueError(f"{value} is not a boolean.")
+
+
+def to_int(value: Any) -> int:
+    """
+    Convert a value of a measurement into an integer, accepting integral decimals (e.g. `"3.0"`).
+
+    Parameters
+    ----------
+    value : Any
+        Value as text or number.
+
+    Returns
+    -------
+    int
+        The value as integer.
+    """
+    try:
+        return int(value)
+    except ValueError:
+        number = float(value)
+        if not number.is_integer():
+            raise ValueError(f"{value} is not an integer.")
+        return int(number)
+
+
+CONVERTERS: Dict[type, Callable[[Any], Any]] = {bool: to_bool, int: to_int}
+"""Dict[type, Callable[[Any], Any]]: Converter of the types that cannot be used as function on text."""
+
+
+def __mean__(accumulated: Tuple[float, int]) -> float:
+    return accumulated[0] / accumulated[1]
+
+
+def __append__(accumulated: List[Any], value: Any) -> List[Any]:
+    accumulated.append(value)
+    return accumulated
+
+
+AGGREGATIONS: Dict[str, Tuple[Callable[[Any], Any], Callable[[Any, Any], Any], Callable[[Any], Any] | None]] = {
+    "first": (lambda value: value, lambda accumulated, value: accumulated, None),
+    "last": (lambda value: value, lambda accumulated, value: value, None),
+    "count": (lambda value: 1, lambda accumulated, value: accumulated + 1, None),
+    "sum": (lambda value: value, lambda accumulated, value: accumulated + value, None),
+    "min": (lambda value: value, lambda accumulated, value: value if value < accumulated else accumulated, None),
+    "max": (lambda value: value, lambda accumulated, value: value if value > accumulated else accumulated, None),
+    "mean": (lambda value: (value, 1), lambda accumulated, value: (accumulated[0] + value, accumulated[1] + 1),
+             __mean__),
+    "list": (lambda value: [value], __append__, None),
+}
+"""Dict[str, Tuple]: Start, step and final functions of each aggregation of the values of a cell."""
+
+
+class MeasurementPivot:
+    """
+    Streaming long to wide pivot of measurements: one row for each identifier and one column for each type of
+    measurement.
+
+    Rows and columns are hash indexes (identifier and type to position), and only the cells with values are
+    kept, aggregated as they arrive, so the memory is proportional to the values and not to the whole table.
+
+    Parameters
+    ----------
+    value_type : Callable[[Any], Any] | Dict[str, Callable[[Any], Any]], optional
+        Type (or function) of the values, or the type of each measurement type (others kept as text).
+        Default `float`.
+    agg : str | Callable[[List[Any]], Any], optional
+        Aggregation of several values of the same identifier and type, one of :data:`AGGREGATIONS` or a
+        function of the list of values. Default `"first"`.
+    types : Sequence[str], optional
+        Measurement types to include, in order. Default all of them, in order of appearance.
+    max_types : int, optional
+        Maximum number of columns, the values of further types are ignored with a warning. Default `1_000`.
+    """
+    def __init__(
+            self, value_type: Callable[[Any], Any] | Dict[str, Callable[[Any], Any]] = float,
+            agg: str | Callable[[List[Any]], Any] = "first",
+            types: Sequence[str] = None,
+            max_types: int = 1_000,
+    ) -> None:
+        if isinstance(agg, str):
+            assert agg in AGGREGATIONS, f"Unknown aggregation {agg}, use one of {', '.join(AGGREGATIONS)}."
+            self.__start__, self.__step__, self.__final__ = AGGREGATIONS[agg]
+        else:
+            self.__start__, self.__step__, _ = AGGREGATIONS["list"]
+            self.__final__ = agg
+        assert max_types > 0, "The maximum number of types must be positive."
+        self.__value_type__ = value_type
+        self.__max_types__ = max_types
+        self.__fixed__ = types is not None
+        self.__rows__: Dict[Any, int] = dict()
+        self.__ids__: List[Any] = list()
+        self.__columns__: Dict[str, int] = dict()
+        self.__types__: List[str] = list()
+        self.__converters__: List[Callable[[Any], Any]] = list()
+        self.__cells__: List[Dict[int, Any]] = list()
+        self.__failures__: Dict[str, List[Any]] = dict()
+        self.__ignored__: Dict[str, int] = dict()
+        for measurement_type in types or list():
+            self.__add_column__(measurement_type)
+        return
+
+    @property
+    def ids(self) -> List[Any]:
+        """List[Any]: Identifier of each row, in order of appearance."""
+        return self.__ids__
+
+    @property
+    def types(self) -> List[str]:
+        """List[str]: Measurement type of each column."""
+        return self.__types__
+
+    @property
+    def failures(self) -> Dict[str, List[Any]]:
+        """Dict[str, List[Any]]: Values that could not be converted, by measurement type."""
+        return self.__failures__
+
+    @property
+    def ignored(self) -> Dict[str, int]:
+        """Dict[str, int]: Number of values of the types over the maximum, by measurement type."""
+        return self.__ignored__
+
+    def __converter__(self, measurement_type: str) -> Callable[[Any], Any]:
+        value_type = self.__value_type__
+        if isinstance(value_type, dict):
+            value_type = value_type.get(measurement_type, str)
+        return CONVERTERS.get(value_type, value_type)
+
+    def __add_column__(self, measurement_type: str) -> int:
+        column = len(self.__types__)
+        self.__columns__[measurement_type] = column
+        self.__types__.append(measurement_type)
+        self.__converters__.append(self.__converter__(measurement_type))
+        self.__cells__.append(dict())
+        return column
+
+    def add(self, ids: Sequence[Any], types: Sequence[str], values: Sequence[Any]) -> None:
+        """
+        Add a batch of measurements.
+
+        Parameters
+        ----------
+        ids : Sequence[Any]
+            Identifier (e.g. of the core record) of each measurement.
+        types : Sequence[str]
+            Type of each measurement.
+        values : Sequence[Any]
+            Value of each measurement.
+        """
+        rows, columns, cells = self.__rows__, self.__columns__, self.__cells__
+        start, step = self.__start__, self.__step__
+        for identifier, measurement_type, value in zip(ids, types, values):
+            if is_missing(identifier) or is_missing(measurement_type) or is_missing(value):
+                continue
+            column = columns.get(measurement_type)
+            if column is None:
+                if self.__fixed__ or len(self.__types__) >= self.__max_types__:
+                    if not self.__fixed__:
+                        self.__ignored__[measurement_type] = self.__ignored__.get(measurement_type, 0) + 1
+                    continue
+                column = self.__add_column__(measurement_type)
+            try:
+                value = self.__converters__[column](value)
+            except (ValueError, TypeError):
+                self.__failures__.setdefault(measurement_type, list()).append(value)
+                continue
+            row = rows.get(identifier)
+            if row is None:
+                row = len(self.__ids__)
+                rows[identifier] = row
+                self.__ids__.append(identifier)
+            column_cells = cells[column]
+            if row in column_cells:
+                column_cells[row] = step(column_cells[row], value)
+            else:
+                column_cells[row] = start(value)
+        return
+
+    def columns(self, ids: Sequence[Any] = None) -> Dict[str, List[Any]]:
+        """
+        Aggregated values of each column.
+
+        Parameters
+        ----------
+        ids : Sequence[Any], optional
+            Identifiers of the rows, in order (e.g. of a core data file). Default the identifiers with values,
+            in order of appearance.
+
+        Returns
+        -------
+        Dict[str, List[Any]]
+            Values of each measurement type, None where there is no value.
+        """
+        if len(self.__ignored__) > 0:
+            warn(f"{len(self.__ignored__)} measurement types over the maximum of {self.__max_types__} columns were "
+                 f"ignored.", category=RuntimeWarning)
+        positions = range(len(self.__ids__)) if ids is None else [self.__rows__.get(i, -1) for i in ids]
+        final = self.__final__
+        result = dict()
+        for measurement_type, cells in zip(self.__types__, self.__cells__):
+            if final is None:
+                result[measurement_type] = [cells.get(position) for position in positions]
+            else:
+                result[measurement_type] = [
+                    final(cells[position]) if position in cells else None for position in positions
+                ]
+        return result
+
+    def __len__(self) -> int:
+        return len(self.__ids__)
+
+    def __repr__(self) -> str:
+        return f"<MeasurementPivot [{len(self.__ids__)} rows, {len(self.__types__)} columns]>"
@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import os
+import sys
+from types import ModuleType, FunctionType, BuiltinFunctionType, MethodType
+from typing import Any, Dict, Iterable, Set
+
+__code_types__ = (type, ModuleType, FunctionType, BuiltinFunctionType, MethodType)
+__atomic_types__ = (str, bytes, bytearray, int, float, complex, bool)
+
+
+def frame_memory(frame: Any, deep: bool = True) -> Dict[str, int] | None:
+    """
+    Bytes used by each column of a pandas or polars data frame.
+
+    Parameters
+    ----------
+    frame : Any
+        A pandas DataFrame or a polars DataFrame or LazyFrame.
+    deep : bool, optional
+        Measure the Python objects of the pandas columns (e.g. strings). Default `True`.
+
+    Returns
+    -------
+    Dict[str, int] | None
+        Bytes of each column (the pandas index as `"Index"`), empty for a LazyFrame (not in memory),
+        None if `frame` is not a data frame.
+    """
+    module = type(frame).__module__.split(".")[0]
+    if module == "pandas" and hasattr(frame, "memory_usage"):
+        usage = frame.memory_usage(deep=deep, index=True)
+        if not hasattr(usage, "items"):  # Series
+            return {"Index": 0, str(frame.name): int(usage)}
+        return {str(column): int(value) for column, value in usage.items()}
+    if module == "polars":
+        if hasattr(frame, "collect"):
+            return dict()
+        if hasattr(frame, "columns"):
+            return {column: frame[column].estimated_size() for column in frame.columns}
+        if hasattr(frame, "estimated_size"):
+            return {frame.name: frame.estimated_size()}
+    return None
+
+
+def deep_sizeof(obj: Any, seen: Set[int] = None) -> int:
+    """
+    Bytes used by an object and every object it references (containers, attributes and data frames).
+
+    Classes, modules and functions are not followed, and each object is counted once.
+
+    Parameters
+    ----------
+    obj : Any
+        Object to measure.
+    seen : Set[int], optional
+        Identifiers of the objects already counted, to share them between several calls.
+
+    Returns
+    -------
+    int
+        Bytes used.
+    """
+    seen = set() if seen is None else seen
+    total = 0
+    pending = [obj]
+    while len(pending) > 0:
+        current = pending.pop()
+        if id(current) in seen:
+            continue
+        seen.add(id(current))
+        if isinstance(current, __code_types__):
+            continue
+        if isinstance(current, __atomic_types__):
+            total += sys.getsizeof(current)
+            continue
+        columns = frame_memory(current)
+        if columns is not None:
+            total += sum(columns.values())
+            continue
+        if hasattr(current, "nbytes") and hasattr(current, "base"):  # numpy arrays, views count their base
+            total += sys.getsizeof(current)
+            if current.base is not None:
+                pending.append(current.base)
+            continue
+        total += sys.getsizeof(current)
+        if isinstance(current, dict):
+            pending.extend(current.keys())
+            pending.extend(current.values())
+        elif isinstance(current, (list, tuple, set, frozenset)):
+            pending.extend(current)
+        if hasattr(current, "__dict__"):
+            pending.append(current.__dict__)
+        for slot in getattr(type(current), "__slots__", ()):
+            if hasattr(current, slot):
+                pending.append(getattr(current, slot))
+    return total
+
+
+def file_size(path: str) -> int:
+    """
+    Size of a file on disk.
+
+    Parameters
+    ----------
+    path : str
+        Location of the file.
+
+    Returns
+    -------
+    int
+        Bytes of the file, 0 if it does not exist.
+    """
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
+
+
+class MemoryUsage:
+    """
+    Bytes used by a data file (or other element of an archive) by storage component and by column.
+
+    Parameters
+    ----------
+    name : str
+        Name of the element measured (e.g. the filename of a data file).
+    components : Dict[str, int], optional
+        Bytes in memory of each storage component (e.g. `"entries"`, `"data"`, `"indexes"`).
+    columns : Dict[str, int], optional
+        Bytes in memory of each column, adding every component storing it.
+    files : Dict[str, int], optional
+        Bytes on disk of each temporal file.
+    """
+    def __init__(
+            self, name: str, components: Dict[str, int] = None,
+            columns: Dict[str, int] = None, files: Dict[str, int] = None,
+    ) -> None:
+        self.__element__ = name
+        self.__components__ = dict() if components is None else dict(components)
+        self.__columns__ = dict() if columns is None else dict(columns)
+        self.__files__ = dict() if files is None else dict(files)
+        return
+
+    @property
+    def name(self) -> str:
+        """str: Name of the element measured."""
+        return self.__element__
+
+    @property
+    def components(self) -> Dict[str, int]:
+        """Dict[str, int]: Bytes in memory of each storage component."""
+        return self.__components__
+
+    @property
+    def columns(self) -> Dict[str, int]:
+        """Dict[str, int]: Bytes in memory of each column, adding every component storing it."""
+        return self.__columns__
+
+    @property
+    def files(self) -> Dict[str, int]:
+        """Dict[str, int]: Bytes on disk of each temporal file."""
+        return self.__files__
+
+    @property
+    def total(self) -> int:
+        """int: Bytes in memory."""
+        return sum(self.__components__.values())
+
+    @property
+    def disk(self) -> int:
+        """int: Bytes on disk."""
+        return sum(self.__files__.values())
+
+    def add_columns(self, columns: Dict[str, int]) -> None:
+        """
+        Add bytes to the columns.
+
+        Parameters
+        ----------
+        columns : Dict[str, int]
+            Bytes of each column.
+        """
+        for column, n_bytes in columns.items():
+            self.__columns__[column] = self.__columns__.get(column, 0) + n_bytes
+        return
+
+    @staticmethod
+    def combine(name: str, usages: Iterable[MemoryUsage]) -> MemoryUsage:
+        """
+        Add the usage of several elements, component by component.
+
+        Parameters
+        ----------
+        name : str
+            Name of the result.
+        usages : Iterable[MemoryUsage]
+            Usage of each element.
+
+        Returns
+        -------
+        MemoryUsage
+            Bytes of each component, column and file of all the elements.
+        """
+        result = MemoryUsage(name)
+        for usage in usages:
+            for component, n_bytes in usage.components.items():
+                result.__components__[component] = result.__components__.get(component, 0) + n_bytes
+            result.add_columns(usage.columns)
+            result.__files__.update(usage.files)
+        return result
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Usage as a dictionary.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Name, components, columns, files and totals.
+        """
+        return {
+            "name": self.name, "components": dict(self.components), "columns": dict(self.columns),
+            "files": dict(self.files), "total": self.total, "disk": self.disk,
+        }
+
+    def __repr__(self) -> str:
+        return f"<MemoryUsage [{self.name}: {self.total} bytes, {self.disk} bytes on disk]>"
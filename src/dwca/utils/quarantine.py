@@ -0,0 +1,261 @@
+from __future__ import annotations
+
+from typing import Any, Dict, List, TextIO
+
+COLUMN_COUNT = "column_count"
+"""str: The row has more or fewer cells than the fields of the data file."""
+CONVERSION = "conversion"
+"""str: A value of the row could not be converted to the type of its field."""
+
+
+class QuarantinedRow:
+    """
+    Row of a data file set apart while reading.
+
+    Parameters
+    ----------
+    filename : str
+        Data file of the row.
+    line_number : int
+        Number of the line on the file, starting on 1 (including the header lines).
+    kind : str
+        Kind of problem, :data:`COLUMN_COUNT` or :data:`CONVERSION`.
+    reason : str
+        Description of the problem.
+    cells : List[str]
+        Values of the row, as text.
+    """
+    def __init__(self, filename: str, line_number: int, kind: str, reason: str, cells: List[str]) -> None:
+        self.__filename__ = filename
+        self.__line_number__ = line_number
+        self.__kind__ = kind
+        self.__reason__ = reason
+        self.__cells__ = cells
+        return
+
+    @property
+    def filename(self) -> str:
+        """str: Data file of the row."""
+        return self.__filename__
+
+    @property
+    def line_number(self) -> int:
+        """int: Number of the line on the file, starting on 1 (including the header lines)."""
+        return self.__line_number__
+
+    @property
+    def kind(self) -> str:
+        """str: Kind of problem."""
+        return self.__kind__
+
+    @property
+    def reason(self) -> str:
+        """str: Description of the problem."""
+        return self.__reason__
+
+    @property
+    def cells(self) -> List[str]:
+        """List[str]: Values of the row, as text."""
+        return self.__cells__
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Row as a dictionary.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Filename, line number, kind, reason and cells.
+        """
+        return {
+            "filename": self.filename, "line_number": self.line_number,
+            "kind": self.kind, "reason": self.reason, "cells": list(self.cells),
+        }
+
+    def __repr__(self) -> str:
+        return f"<QuarantinedRow [{self.filename}:{self.line_number} {self.kind}]>"
+
+
+class Quarantine:
+    """
+    Destination of the rows set apart while reading in tolerant mode.
+    """
+    def __init__(self) -> None:
+        self.__counts__: Dict[str, int] = dict()
+        return
+
+    @property
+    def count(self) -> int:
+        """int: Number of rows set apart."""
+        return sum(self.__counts__.values())
+
+    @property
+    def counts(self) -> Dict[str, int]:
+        """Dict[str, int]: Number of rows set apart by kind of problem."""
+        return self.__counts__
+
+    def add(self, row: QuarantinedRow) -> None:
+        """
+        Set apart a row.
+
+        Parameters
+        ----------
+        row : QuarantinedRow
+            Row with a problem.
+        """
+        self.__counts__[row.kind] = self.__counts__.get(row.kind, 0) + 1
+        self.__store__(row)
+        return
+
+    def __store__(self, row: QuarantinedRow) -> None:
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """
+        Release the resources of the quarantine.
+        """
+        return
+
+    def __enter__(self) -> Quarantine:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+        return
+
+    @staticmethod
+    def wrap(sink: Quarantine | List[QuarantinedRow] | str | Any) -> Quarantine:
+        """
+        Quarantine from the argument of a method.
+
+        Parameters
+        ----------
+        sink : Quarantine | List[QuarantinedRow] | str | DataFile
+            A quarantine, a list, the path of a file or a data file.
+
+        Returns
+        -------
+        Quarantine
+            The quarantine given, or one adding the rows to the list, the file or the data file.
+        """
+        from dwca.classes.data_file import DataFile
+        if isinstance(sink, Quarantine):
+            return sink
+        if isinstance(sink, list):
+            return ListQuarantine(sink)
+        if isinstance(sink, str):
+            return FileQuarantine(sink)
+        if isinstance(sink, DataFile):
+            return DataFileQuarantine(sink)
+        raise TypeError(f"{type(sink).__name__} cannot be used as quarantine.")
+
+    def __repr__(self) -> str:
+        return f"<{type(self).__name__} [{self.count} rows]>"
+
+
+class ListQuarantine(Quarantine):
+    """
+    Keep the rows set apart on a list.
+
+    Parameters
+    ----------
+    rows : List[QuarantinedRow], optional
+        List receiving the rows, default a new one.
+    """
+    def __init__(self, rows: List[QuarantinedRow] = None) -> None:
+        super().__init__()
+        self.__rows__ = list() if rows is None else rows
+        return
+
+    @property
+    def rows(self) -> List[QuarantinedRow]:
+        """List[QuarantinedRow]: Rows set apart."""
+        return self.__rows__
+
+    def __store__(self, row: QuarantinedRow) -> None:
+        self.__rows__.append(row)
+        return
+
+
+class FileQuarantine(Quarantine):
+    """
+    Append the rows set apart to a tab separated file, with the columns filename, line number, kind, reason
+    and the original cells.
+
+    Parameters
+    ----------
+    path : str
+        Location of the file, opened on the first row.
+    delimiter : str, optional
+        Delimiter of the original cells. Default `"\\t"`.
+    """
+    def __init__(self, path: str, delimiter: str = "\t") -> None:
+        super().__init__()
+        self.__path__ = path
+        self.__delimiter__ = delimiter
+        self.__handle__: TextIO | None = None
+        return
+
+    @property
+    def path(self) -> str:
+        """str: Location of the file."""
+        return self.__path__
+
+    def __store__(self, row: QuarantinedRow) -> None:
+        if self.__handle__ is None:
+            self.__handle__ = open(self.__path__, "a", encoding="utf-8")
+        reason = row.reason.replace("\t", " ").replace("\n", " ")
+        self.__handle__.write(
+            f"{row.filename}\t{row.line_number}\t{row.kind}\t{reason}\t{self.__delimiter__.join(row.cells)}\n"
+        )
+        return
+
+    def close(self) -> None:
+        if self.__handle__ is not None:
+            self.__handle__.close()
+            self.__handle__ = None
+        return
+
+
+class DataFileQuarantine(Quarantine):
+    """
+    Add the rows set apart to a separate data file, as text and matching its fields by position.
+
+    Parameters
+    ----------
+    data_file : DataFile
+        Data file receiving the rows.
+    """
+    def __init__(self, data_file: Any) -> None:
+        super().__init__()
+        self.__data_file__ = data_file
+        self.__line_numbers__: List[int] = list()
+        self.__reasons__: List[str] = list()
+        return
+
+    @property
+    def data_file(self) -> Any:
+        """DataFile: Data file receiving the rows."""
+        return self.__data_file__
+
+    @property
+    def line_numbers(self) -> List[int]:
+        """List[int]: Line number of each row added to the data file."""
+        return self.__line_numbers__
+
+    @property
+    def reasons(self) -> List[str]:
+        """List[str]: Problem of each row added to the data file."""
+        return self.__reasons__
+
+    def __store__(self, row: QuarantinedRow) -> None:
+        names = [field.name for field in self.__data_file__.__fields__]
+        values = list(row.cells[:len(names)]) + [None] * (len(names) - len(row.cells))
+        self.__data_file__.__entries__.append(type(self.__data_file__).Entry(**dict(zip(names, values))))
+        self.__line_numbers__.append(row.line_number)
+        self.__reasons__.append(row.reason)
+        return
+
+    def close(self) -> None:
+        self.__data_file__._reset_indexes_()
+        return
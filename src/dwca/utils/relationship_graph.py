@@ -0,0 +1,336 @@
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from typing import List, Dict, Set, Iterable, Sequence, Tuple
+
+from dwca.utils.taxonomic_tree import is_missing
+
+OUT = "out"
+"""str: Follow the relationships from the resource to the related resource."""
+IN = "in"
+"""str: Follow the relationships from the related resource to the resource."""
+BOTH = "both"
+"""str: Follow the relationships in both directions."""
+
+
+class RelationshipGraph:
+    """
+    Directed graph of the relationships between resources.
+
+    Every resource is mapped to an integer node and every kind of relationship to an integer code, and the
+    edges are stored as compressed adjacency arrays (offsets of the edges of each node, target node and
+    relationship of each edge), in both directions. A traversal only reads the edges of the nodes it reaches,
+    so its time is proportional to the part of the graph visited and not to the number of relationships.
+
+    Parameters
+    ----------
+    resources_id : Sequence[str]
+        :class:`dwca.terms.resource_relationship.ResourceID` of each relationship.
+    related_id : Sequence[str]
+        :class:`dwca.terms.resource_relationship.RelatedResourceID` of each relationship, in the same order.
+    relationships : Sequence[str], optional
+        :class:`dwca.terms.resource_relationship.RelationshipOfResource` of each relationship, in the same
+        order. Default without kind.
+    """
+    def __init__(
+            self, resources_id: Sequence[str], related_id: Sequence[str], relationships: Sequence[str] = None
+    ) -> None:
+        self.__index__: Dict[str, int] = dict()
+        self.__ids__: List[str] = list()
+        self.__codes__: Dict[str, int] = dict()
+        self.__kinds__: List[str] = list()
+        sources, targets, kinds = array("l"), array("l"), array("l")
+        relationships = [None] * len(resources_id) if relationships is None else relationships
+        for resource_id, related, relationship in zip(resources_id, related_id, relationships):
+            if is_missing(resource_id) or is_missing(related):
+                continue
+            sources.append(self.__node__(resource_id))
+            targets.append(self.__node__(related))
+            relationship = "" if is_missing(relationship) else relationship
+            code = self.__codes__.get(relationship)
+            if code is None:
+                code = len(self.__kinds__)
+                self.__codes__[relationship] = code
+                self.__kinds__.append(relationship)
+            kinds.append(code)
+        self.__edges__ = len(sources)
+        self.__out__ = self.__compress__(sources, targets, kinds)
+        self.__in__ = self.__compress__(targets, sources, kinds)
+        self.__components__: array | None = None
+        return
+
+    def __node__(self, resource_id: str) -> int:
+        node = self.__index__.get(resource_id)
+        if node is None:
+            node = len(self.__ids__)
+            self.__index__[resource_id] = node
+            self.__ids__.append(resource_id)
+        return node
+
+    def __compress__(self, sources: array, targets: array, kinds: array) -> Tuple[array, array, array]:
+        # Offsets of the edges of each node, and target and kind of each edge, ordered by source
+        size = len(self.__ids__)
+        offset = array("l", [0]) * (size + 1)
+        for source in sources:
+            offset[source + 1] += 1
+        for i in range(size):
+            offset[i + 1] += offset[i]
+        position = offset[:size]
+        adjacent = array("l", [0]) * len(sources)
+        adjacent_kinds = array("l", [0]) * len(sources)
+        for source, target, kind in zip(sources, targets, kinds):
+            adjacent[position[source]] = target
+            adjacent_kinds[position[source]] = kind
+            position[source] += 1
+        return offset, adjacent, adjacent_kinds
+
+    def __len__(self) -> int:
+        return len(self.__ids__)
+
+    def __contains__(self, resource_id: str) -> bool:
+        return resource_id in self.__index__
+
+    @property
+    def edges(self) -> int:
+        """int: Number of relationships."""
+        return self.__edges__
+
+    @property
+    def relationships(self) -> List[str]:
+        """List[str]: Kinds of relationship (empty for the relationships without kind)."""
+        return self.__kinds__
+
+    def __kinds_filter__(self, relationships: Iterable[str] | None) -> Set[int] | None:
+        if relationships is None:
+            return None
+        return {self.__codes__[kind] for kind in relationships if kind in self.__codes__}
+
+    def __adjacency__(self, direction: str) -> List[Tuple[array, array, array]]:
+        assert direction in (OUT, IN, BOTH), f"Unknown direction {direction}, use {OUT}, {IN} or {BOTH}."
+        if direction == OUT:
+            return [self.__out__]
+        if direction == IN:
+            return [self.__in__]
+        return [self.__out__, self.__in__]
+
+    def __neighbours__(
+            self, node: int, adjacency: List[Tuple[array, array, array]], kinds: Set[int] | None
+    ) -> Iterable[int]:
+        for offset, adjacent, adjacent_kinds in adjacency:
+            start, end = offset[node], offset[node + 1]
+            if kinds is None:
+                yield from adjacent[start:end]
+            else:
+                for i in range(start, end):
+                    if adjacent_kinds[i] in kinds:
+                        yield adjacent[i]
+        return
+
+    def __check__(self, resource_id: str) -> int:
+        node = self.__index__.get(resource_id)
+        assert node is not None, f"{resource_id} not in the relationships."
+        return node
+
+    def neighbours(
+            self, resource_id: str, direction: str = OUT, relationships: Iterable[str] = None
+    ) -> List[str]:
+        """
+        Resources directly related to a resource.
+
+        Parameters
+        ----------
+        resource_id : str
+            Identifier of the resource.
+        direction : str, optional
+            Direction of the relationships, :data:`OUT`, :data:`IN` or :data:`BOTH`. Default :data:`OUT`.
+        relationships : Iterable[str], optional
+            Kinds of relationship to follow. Default all of them.
+
+        Returns
+        -------
+        List[str]
+            Identifiers of the related resources, without repetitions.
+        """
+        node = self.__check__(resource_id)
+        found = dict.fromkeys(self.__neighbours__(
+            node, self.__adjacency__(direction), self.__kinds_filter__(relationships)
+        ))
+        return [self.__ids__[neighbour] for neighbour in found]
+
+    def bfs(
+            self, resource_id: str, direction: str = BOTH, relationships: Iterable[str] = None, max_depth: int = None,
+    ) -> Dict[str, int]:
+        """
+        Breadth first traversal from a resource.
+
+        Parameters
+        ----------
+        resource_id : str
+            Identifier of the first resource.
+        direction : str, optional
+            Direction of the relationships, :data:`OUT`, :data:`IN` or :data:`BOTH`. Default :data:`BOTH`.
+        relationships : Iterable[str], optional
+            Kinds of relationship to follow. Default all of them.
+        max_depth : int, optional
+            Maximum number of relationships from the first resource. Default no limit.
+
+        Returns
+        -------
+        Dict[str, int]
+            Number of relationships from the first resource to each resource reached, in order of visit.
+        """
+        node = self.__check__(resource_id)
+        adjacency, kinds = self.__adjacency__(direction), self.__kinds_filter__(relationships)
+        distance = {node: 0}
+        queue = deque([node])
+        while len(queue) > 0:
+            current = queue.popleft()
+            depth = distance[current] + 1
+            if max_depth is not None and depth > max_depth:
+                continue
+            for neighbour in self.__neighbours__(current, adjacency, kinds):
+                if neighbour not in distance:
+                    distance[neighbour] = depth
+                    queue.append(neighbour)
+        return {self.__ids__[visited]: depth for visited, depth in distance.items()}
+
+    def dfs(self, resource_id: str, direction: str = BOTH, relationships: Iterable[str] = None) -> List[str]:
+        """
+        Depth first traversal (pre-order) from a resource.
+
+        Parameters
+        ----------
+        resource_id : str
+            Identifier of the first resource.
+        direction : str, optional
+            Direction of the relationships, :data:`OUT`, :data:`IN` or :data:`BOTH`. Default :data:`BOTH`.
+        relationships : Iterable[str], optional
+            Kinds of relationship to follow. Default all of them.
+
+        Returns
+        -------
+        List[str]
+            Identifiers of the resources reached, in order of visit.
+        """
+        node = self.__check__(resource_id)
+        adjacency, kinds = self.__adjacency__(direction), self.__kinds_filter__(relationships)
+        visited = set()
+        order = list()
+        stack = [node]
+        while len(stack) > 0:
+            current = stack.pop()
+            if current in visited:
+                continue
+            visited.add(current)
+            order.append(current)
+            stack.extend(reversed([
+                neighbour for neighbour in self.__neighbours__(current, adjacency, kinds) if neighbour not in visited
+            ]))
+        return [self.__ids__[current] for current in order]
+
+    def neighbourhood(
+            self, resources_id: Iterable[str], k: int = 1, direction: str = BOTH, relationships: Iterable[str] = None,
+    ) -> Set[str]:
+        """
+        Resources at `k` or fewer relationships from any of the given resources.
+
+        Parameters
+        ----------
+        resources_id : Iterable[str]
+            Identifiers of the resources, unknown ones are ignored.
+        k : int, optional
+            Maximum number of relationships. Default `1`.
+        direction : str, optional
+            Direction of the relationships, :data:`OUT`, :data:`IN` or :data:`BOTH`. Default :data:`BOTH`.
+        relationships : Iterable[str], optional
+            Kinds of relationship to follow. Default all of them.
+
+        Returns
+        -------
+        Set[str]
+            Identifiers of the resources, including the given ones.
+        """
+        adjacency, kinds = self.__adjacency__(direction), self.__kinds_filter__(relationships)
+        frontier = {self.__index__[resource_id] for resource_id in resources_id if resource_id in self.__index__}
+        visited = set(frontier)
+        for _ in range(k):
+            following = set()
+            for current in frontier:
+                for neighbour in self.__neighbours__(current, adjacency, kinds):
+                    if neighbour not in visited:
+                        visited.add(neighbour)
+                        following.add(neighbour)
+            if len(following) == 0:
+                break
+            frontier = following
+        return {self.__ids__[node] for node in visited}
+
+    def __label__(self, kinds: Set[int] | None) -> array:
+        # Component of each node (the smallest node of the component), with a disjoint set forest
+        parent = array("l", range(len(self.__ids__)))
+
+        def find(node: int) -> int:
+            root = node
+            while parent[root] != root:
+                root = parent[root]
+            while parent[node] != root:
+                parent[node], node = root, parent[node]
+            return root
+
+        offset, adjacent, adjacent_kinds = self.__out__
+        for source in range(len(self.__ids__)):
+            for i in range(offset[source], offset[source + 1]):
+                if kinds is not None and adjacent_kinds[i] not in kinds:
+                    continue
+                first, second = find(source), find(adjacent[i])
+                if first != second:
+                    parent[max(first, second)] = min(first, second)
+        for node in range(len(self.__ids__)):
+            parent[node] = find(node)
+        return parent
+
+    def connected_components(self, relationships: Iterable[str] = None) -> List[Set[str]]:
+        """
+        Groups of resources connected by relationships in any direction.
+
+        Parameters
+        ----------
+        relationships : Iterable[str], optional
+            Kinds of relationship connecting the resources. Default all of them.
+
+        Returns
+        -------
+        List[Set[str]]
+            Identifiers of the resources of each component, from the largest to the smallest.
+        """
+        kinds = self.__kinds_filter__(relationships)
+        if kinds is None:
+            if self.__components__ is None:
+                self.__components__ = self.__label__(None)
+            labels = self.__components__
+        else:
+            labels = self.__label__(kinds)
+        components: Dict[int, Set[str]] = dict()
+        for node, label in enumerate(labels):
+            components.setdefault(label, set()).add(self.__ids__[node])
+        return sorted(components.values(), key=len, reverse=True)
+
+    def component(self, resource_id: str) -> Set[str]:
+        """
+        Resources connected to a resource by relationships in any direction.
+
+        Parameters
+        ----------
+        resource_id : str
+            Identifier of the resource.
+
+        Returns
+        -------
+        Set[str]
+            Identifiers of the resources of the component, including the given one.
+        """
+        return set(self.bfs(resource_id, BOTH))
+
+    def __repr__(self) -> str:
+        return f"<RelationshipGraph [{len(self.__ids__)} resources, {self.__edges__} relationships]>"
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+import math
+from typing import List, Tuple, Sequence
+
+from xml_common.utils import GPolygon, GRing
+from dwca.utils.taxonomic_tree import is_missing
+
+Edge = Tuple[float, float, float, float]
+
+
+class SpatialIndex:
+    """
+    Point in polygon index of one or more polygons with holes.
+
+    Points are tested with the even-odd rule over the edges of every ring,
+    so exclusion rings (holes) are honored. The bounding box of the polygons
+    is divided into a uniform grid: cells crossed by no edge are classified
+    once as fully inside or outside, and points on the remaining cells are
+    only tested against the edges of their latitude band.
+
+    Parameters
+    ----------
+    polygons : Sequence[GPolygon]
+        Polygons (with latitude, longitude points) of the area.
+    grid_size : int, optional
+        Number of rows and columns of the grid, default chosen from the number of edges.
+    """
+    def __init__(self, polygons: Sequence[GPolygon], grid_size: int = None) -> None:
+        self.__polygons__: List[List[Edge]] = list()
+        for polygon in polygons:
+            edges = list()
+            for ring in [polygon.outer] + list(polygon.exclusion):
+                edges.extend(self.__ring_edges__(ring))
+            self.__polygons__.append(edges)
+        edges = [edge for polygon in self.__polygons__ for edge in polygon]
+        assert len(edges) > 0, "At least one polygon to build the index."
+        self.__south__ = min(min(lat_1, lat_2) for lat_1, _, lat_2, _ in edges)
+        self.__north__ = max(max(lat_1, lat_2) for lat_1, _, lat_2, _ in edges)
+        self.__west__ = min(min(lon_1, lon_2) for _, lon_1, _, lon_2 in edges)
+        self.__east__ = max(max(lon_1, lon_2) for _, lon_1, _, lon_2 in edges)
+        if grid_size is None:
+            grid_size = min(256, max(1, int(math.sqrt(len(edges)))))
+        assert grid_size > 0, "Grid size must be positive."
+        self.__size__ = grid_size
+        self.__height__ = (self.__north__ - self.__south__) / grid_size or 1.0
+        self.__width__ = (self.__east__ - self.__west__) / grid_size or 1.0
+        # Edges (by polygon) overlapping each latitude band
+        self.__bands__: List[List[List[Edge]]] = [
+            [list() for _ in self.__polygons__] for _ in range(grid_size)
+        ]
+        # Cells crossed by any edge, other are classified by its center
+        self.__boundary__: List[List[bool]] = [[False] * grid_size for _ in range(grid_size)]
+        for p, polygon in enumerate(self.__polygons__):
+            for edge in polygon:
+                lat_1, lon_1, lat_2, lon_2 = edge
+                first_row, last_row = self.__row__(min(lat_1, lat_2)), self.__row__(max(lat_1, lat_2))
+                first_col, last_col = self.__col__(min(lon_1, lon_2)), self.__col__(max(lon_1, lon_2))
+                for row in range(first_row, last_row + 1):
+                    self.__bands__[row][p].append(edge)
+                    for col in range(first_col, last_col + 1):
+                        self.__boundary__[row][col] = True
+        self.__cells__: List[List[bool | None]] = [[None] * grid_size for _ in range(grid_size)]
+        return
+
+    @staticmethod
+    def __ring_edges__(ring: GRing) -> List[Edge]:
+        points = [(float(lat), float(lon)) for lat, lon in ring]
+        if points[0] == points[-1]:
+            points.pop()
+        return [
+            (lat_1, lon_1, lat_2, lon_2)
+            for (lat_1, lon_1), (lat_2, lon_2) in zip(points, points[1:] + points[:1])
+        ]
+
+    @property
+    def bounding_box(self) -> Tuple[float, float, float, float]:
+        """Tuple[float, float, float, float]: West, east, north and south limits of the polygons."""
+        return self.__west__, self.__east__, self.__north__, self.__south__
+
+    def __row__(self, latitude: float) -> int:
+        return min(self.__size__ - 1, max(0, int((latitude - self.__south__) / self.__height__)))
+
+    def __col__(self, longitude: float) -> int:
+        return min(self.__size__ - 1, max(0, int((longitude - self.__west__) / self.__width__)))
+
+    @staticmethod
+    def __crosses__(edges: List[Edge], latitude: float, longitude: float) -> bool:
+        inside = False
+        for lat_1, lon_1, lat_2, lon_2 in edges:
+            if (lat_1 > latitude) != (lat_2 > latitude):
+                if longitude < lon_1 + (latitude - lat_1) * (lon_2 - lon_1) / (lat_2 - lat_1):
+                    inside = not inside
+        return inside
+
+    def __test__(self, edges_by_polygon: List[List[Edge]], latitude: float, longitude: float) -> bool:
+        return any(self.__crosses__(edges, latitude, longitude) for edges in edges_by_polygon)
+
+    def contains(self, latitude: float, longitude: float) -> bool:
+        """
+        Check if a point is inside the area.
+
+        Parameters
+        ----------
+        latitude : float
+            Latitude of the point.
+        longitude : float
+            Longitude of the point.
+
+        Returns
+        -------
+        bool
+            True if the point is inside any polygon (and not in one of its holes), False otherwise.
+        """
+        if is_missing(latitude) or is_missing(longitude):
+            return False
+        if not (self.__south__ <= latitude <= self.__north__ and self.__west__ <= longitude <= self.__east__):
+            return False
+        row, col = self.__row__(latitude), self.__col__(longitude)
+        if self.__boundary__[row][col]:
+            return self.__test__(self.__bands__[row], latitude, longitude)
+        if self.__cells__[row][col] is None:
+            center_lat = self.__south__ + (row + 0.5) * self.__height__
+            center_lon = self.__west__ + (col + 0.5) * self.__width__
+            self.__cells__[row][col] = self.__test__(self.__bands__[row], center_lat, center_lon)
+        return self.__cells__[row][col]
+
+    def contains_all(self, latitudes: Sequence[float], longitudes: Sequence[float]) -> List[bool]:
+        """
+        Check a batch of points.
+
+        Parameters
+        ----------
+        latitudes : Sequence[float]
+            Latitudes of the points.
+        longitudes : Sequence[float]
+            Longitudes of the points, in the same order of `latitudes`.
+
+        Returns
+        -------
+        List[bool]
+            For each point, True if it is inside the area, False otherwise.
+        """
+        contains = self.contains
+        return [contains(latitude, longitude) for latitude, longitude in zip(latitudes, longitudes)]
+
+    def __repr__(self) -> str:
+        return f"<SpatialIndex [polygons={len(self.__polygons__)}, grid={self.__size__}x{self.__size__}]>"
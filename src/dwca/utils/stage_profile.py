@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+import time
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Tuple, Iterator, Any
+
+
+class StageRecord:
+    """
+    Resources used by a stage of a process on a member of an archive.
+
+    Parameters
+    ----------
+    stage : str
+        Name of the stage (e.g. `"decompress"`).
+    member : str, optional
+        Member of the archive processed, None for the whole archive.
+    """
+    def __init__(self, stage: str, member: str = None) -> None:
+        self.__stage__ = stage
+        self.__member__ = member
+        self.__wall_time__ = 0.0
+        self.__cpu_time__ = 0.0
+        self.__bytes__ = 0
+        self.__rows__ = 0
+        self.__calls__ = 0
+        return
+
+    @property
+    def stage(self) -> str:
+        """str: Name of the stage."""
+        return self.__stage__
+
+    @property
+    def member(self) -> str | None:
+        """str | None: Member of the archive processed, None for the whole archive."""
+        return self.__member__
+
+    @property
+    def wall_time(self) -> float:
+        """float: Elapsed time, in seconds."""
+        return self.__wall_time__
+
+    @property
+    def cpu_time(self) -> float:
+        """float: CPU time of the process, in seconds."""
+        return self.__cpu_time__
+
+    @property
+    def bytes(self) -> int:
+        """int: Bytes processed."""
+        return self.__bytes__
+
+    @property
+    def rows(self) -> int:
+        """int: Rows processed."""
+        return self.__rows__
+
+    @property
+    def calls(self) -> int:
+        """int: Times the stage was measured (e.g. number of chunks)."""
+        return self.__calls__
+
+    def add(self, n_bytes: int = 0, rows: int = 0) -> None:
+        """
+        Count bytes and rows processed.
+
+        Parameters
+        ----------
+        n_bytes : int, optional
+            Bytes processed. Default `0`.
+        rows : int, optional
+            Rows processed. Default `0`.
+        """
+        self.__bytes__ += n_bytes
+        self.__rows__ += rows
+        return
+
+    def merge(self, other: StageRecord) -> None:
+        """
+        Accumulate the resources of another measure of the same stage.
+
+        Parameters
+        ----------
+        other : StageRecord
+            Another measure.
+        """
+        self.__wall_time__ += other.wall_time
+        self.__cpu_time__ += other.cpu_time
+        self.__bytes__ += other.bytes
+        self.__rows__ += other.rows
+        self.__calls__ += other.calls
+        return
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Resources of the stage as a dictionary.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Stage, member, wall and CPU time, bytes, rows and calls.
+        """
+        return {
+            "stage": self.stage, "member": self.member,
+            "wall_time": self.wall_time, "cpu_time": self.cpu_time,
+            "bytes": self.bytes, "rows": self.rows, "calls": self.calls,
+        }
+
+    def __repr__(self) -> str:
+        return f"<StageRecord [{self.stage}, member={self.member}, wall={self.wall_time:.4f}s]>"
+
+
+class StageProfile:
+    """
+    Profile of a process (e.g. reading an archive) by stage and member.
+
+    Each measure of a stage is sent to the callback (if given) and
+    accumulated with the previous measures of the same stage and member.
+
+    Parameters
+    ----------
+    callback : Callable[[StageRecord], None], optional
+        Function called with every measure, as soon as it finishes.
+    """
+    def __init__(self, callback: Callable[[StageRecord], None] = None) -> None:
+        self.__callback__ = callback
+        self.__records__: Dict[Tuple[str, str | None], StageRecord] = dict()
+        return
+
+    @staticmethod
+    def wrap(profile: StageProfile | Callable[[StageRecord], None] | None) -> StageProfile:
+        """
+        Profile from the argument of a method.
+
+        Parameters
+        ----------
+        profile : StageProfile | Callable[[StageRecord], None] | None
+            A profile, a callback or nothing.
+
+        Returns
+        -------
+        StageProfile
+            The profile given, a profile calling the callback, or a new profile.
+        """
+        if isinstance(profile, StageProfile):
+            return profile
+        return StageProfile(callback=profile)
+
+    @property
+    def records(self) -> List[StageRecord]:
+        """List[StageRecord]: Accumulated resources by stage and member, in order of appearance."""
+        return list(self.__records__.values())
+
+    @contextmanager
+    def stage(self, stage: str, member: str = None, n_bytes: int = 0, rows: int = 0) -> Iterator[StageRecord]:
+        """
+        Measure a stage.
+
+        Parameters
+        ----------
+        stage : str
+            Name of the stage.
+        member : str, optional
+            Member of the archive processed, None for the whole archive.
+        n_bytes : int, optional
+            Bytes processed, they can also be added to the yielded record. Default `0`.
+        rows : int, optional
+            Rows processed, they can also be added to the yielded record. Default `0`.
+
+        Yields
+        ------
+        StageRecord
+            Record of this measure.
+        """
+        record = StageRecord(stage, member)
+        record.add(n_bytes, rows)
+        wall, cpu = time.perf_counter(), time.process_time()
+        try:
+            yield record
+        finally:
+            record.__wall_time__ = time.perf_counter() - wall
+            record.__cpu_time__ = time.process_time() - cpu
+            record.__calls__ = 1
+            self.add(record)
+        return
+
+    def add(self, record: StageRecord) -> None:
+        """
+        Add a measure of a stage.
+
+        Parameters
+        ----------
+        record : StageRecord
+            Measure of the stage.
+        """
+        if self.__callback__ is not None:
+            self.__callback__(record)
+        key = (record.stage, record.member)
+        if key not in self.__records__:
+            self.__records__[key] = StageRecord(record.stage, record.member)
+        self.__records__[key].merge(record)
+        return
+
+    def totals(self) -> Dict[str, StageRecord]:
+        """
+        Resources by stage, adding all the members.
+
+        Returns
+        -------
+        Dict[str, StageRecord]
+            Total resources of each stage.
+        """
+        totals: Dict[str, StageRecord] = dict()
+        for record in self.__records__.values():
+            if record.stage not in totals:
+                totals[record.stage] = StageRecord(record.stage)
+            totals[record.stage].merge(record)
+        return totals
+
+    def to_dict(self) -> List[Dict[str, Any]]:
+        """
+        Profile as a list of dictionaries, one for each stage and member.
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            See :meth:`StageRecord.to_dict`.
+        """
+        return [record.to_dict() for record in self.__records__.values()]
+
+    def __repr__(self) -> str:
+        return f"<StageProfile [records={len(self.__records__)}]>"
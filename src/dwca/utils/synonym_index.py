@@ -0,0 +1,154 @@
+from __future__ import annotations
+
+from typing import List, Dict, Iterable, Sequence
+
+from dwca.utils.taxonomic_tree import is_missing
+
+
+class SynonymIndex:
+    """
+    Grouping index of taxa sharing the same accepted name.
+
+    Each row is joined with its accepted name using a union-find structure,
+    so chains of synonyms (a synonym pointing to another synonym) resolve
+    transitively into the same group.
+
+    Parameters
+    ----------
+    taxa_id : Sequence[str]
+        :class:`dwca.terms.taxon.TaxonID` of each row.
+    accepted_id : Sequence[str]
+        :class:`dwca.terms.taxon.AcceptedNameUsageID` of each row, in the same order of `taxa_id`.
+    names : Sequence[str]
+        :class:`dwca.terms.taxon.ScientificName` of each row, in the same order of `taxa_id`.
+    """
+    def __init__(self, taxa_id: Sequence[str], accepted_id: Sequence[str], names: Sequence[str]) -> None:
+        self.__ids__ = list(taxa_id)
+        self.__names__ = list(names)
+        self.__node__: Dict[str, int] = dict()
+        parent: List[int] = list()
+
+        def node_of(value: str) -> int:
+            node = self.__node__.get(value, None)
+            if node is None:
+                node = len(parent)
+                self.__node__[value] = node
+                parent.append(node)
+            return node
+
+        def find(node: int) -> int:
+            root = node
+            while parent[root] != root:
+                root = parent[root]
+            while parent[node] != root:
+                parent[node], node = root, parent[node]
+            return root
+
+        for taxon_id, accepted in zip(self.__ids__, accepted_id):
+            if is_missing(taxon_id):
+                continue
+            node = node_of(taxon_id)
+            if not is_missing(accepted):
+                first, second = find(node), find(node_of(accepted))
+                if first != second:
+                    parent[max(first, second)] = min(first, second)
+        self.__group__ = [find(node) for node in range(len(parent))]
+        self.__rows__: Dict[int, List[int]] = dict()
+        self.__present__ = set()
+        for row, taxon_id in enumerate(self.__ids__):
+            if not is_missing(taxon_id):
+                self.__present__.add(taxon_id)
+                self.__rows__.setdefault(self.__group__[self.__node__[taxon_id]], list()).append(row)
+        return
+
+    def __contains__(self, taxon_id: str) -> bool:
+        return taxon_id in self.__node__
+
+    def is_present(self, taxon_id: str) -> bool:
+        """
+        Check if a taxon has a row on the indexed data, in contrast to be only referenced as accepted name.
+
+        Parameters
+        ----------
+        taxon_id : str
+            A :class:`dwca.terms.taxon.TaxonID` value.
+
+        Returns
+        -------
+        bool
+            True if the taxon is on the data, False otherwise.
+        """
+        return taxon_id in self.__present__
+
+    def group(self, taxon_id: str) -> int | None:
+        """
+        Group identifier of a taxon.
+
+        Parameters
+        ----------
+        taxon_id : str
+            A :class:`dwca.terms.taxon.TaxonID` value.
+
+        Returns
+        -------
+        int | None
+            An integer shared by all synonyms of the taxon, None if it is not indexed.
+        """
+        node = self.__node__.get(taxon_id, None)
+        return None if node is None else self.__group__[node]
+
+    def rows(self, taxa_id: Iterable[str]) -> List[int]:
+        """
+        Position of the rows synonyms of a list of taxa.
+
+        Parameters
+        ----------
+        taxa_id : Iterable[str]
+            A list (or iterable) of :class:`dwca.terms.taxon.TaxonID` value.
+
+        Returns
+        -------
+        List[int]
+            Sorted position of the rows in the indexed data.
+        """
+        groups = set()
+        for taxon_id in taxa_id:
+            group = self.group(taxon_id)
+            if group is not None:
+                groups.add(group)
+        rows = list()
+        for group in groups:
+            rows.extend(self.__rows__.get(group, []))
+        return sorted(rows)
+
+    def members(self, taxa_id: Iterable[str]) -> List[str]:
+        """
+        All the synonyms of a list of taxa, including themselves.
+
+        Parameters
+        ----------
+        taxa_id : Iterable[str]
+            A list (or iterable) of :class:`dwca.terms.taxon.TaxonID` value.
+
+        Returns
+        -------
+        List[str]
+            A list of :class:`dwca.terms.taxon.TaxonID`.
+        """
+        return [self.__ids__[row] for row in self.rows(taxa_id)]
+
+    def names(self, taxa_id: Iterable[str]) -> List[str]:
+        """
+        Scientific names of all the synonyms of a list of taxa, including themselves.
+
+        Parameters
+        ----------
+        taxa_id : Iterable[str]
+            A list (or iterable) of :class:`dwca.terms.taxon.TaxonID` value.
+
+        Returns
+        -------
+        List[str]
+            A list of :class:`dwca.terms.taxon.ScientificName`.
+        """
+        return [self.__names__[row] for row in self.rows(taxa_id)]
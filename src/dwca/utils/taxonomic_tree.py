@@ -0,0 +1,291 @@
+from __future__ import annotations
+
+from typing import List, Dict, Set, Iterable, Sequence, Any
+from warnings import warn
+
+
+def is_missing(value: Any) -> bool:
+    """
+    Check if a cell value is empty (``None``, empty string or ``NaN``).
+
+    Parameters
+    ----------
+    value : Any
+        Value of a cell.
+
+    Returns
+    -------
+    bool
+        True if value is considered missing, False otherwise.
+    """
+    if value is None:
+        return True
+    if isinstance(value, str):
+        return value == ""
+    try:
+        return bool(value != value)
+    except TypeError:  # pandas.NA
+        return True
+
+
+class TaxonomicTree:
+    """
+    Parent-pointer index of a taxonomic hierarchy.
+
+    Every taxon is mapped to an integer node, and the tree is flattened in a
+    pre-order traversal (nested sets), so the descendants of a node are a
+    contiguous range of that traversal. Ancestors and lowest common ancestors
+    are found walking the parent pointers, in time proportional to the depth.
+
+    Parameters
+    ----------
+    taxa_id : Sequence[str]
+        :class:`dwca.terms.taxon.TaxonID` of each row.
+    parents_id : Sequence[str]
+        :class:`dwca.terms.taxon.ParentNameUsageID` of each row, in the same order of `taxa_id`.
+    """
+    def __init__(self, taxa_id: Sequence[str], parents_id: Sequence[str]) -> None:
+        self.__index__: Dict[str, int] = dict()
+        self.__ids__: List[str] = list()
+        for taxon_id in taxa_id:
+            if not is_missing(taxon_id) and taxon_id not in self.__index__:
+                self.__index__[taxon_id] = len(self.__ids__)
+                self.__ids__.append(taxon_id)
+        self.__present__ = len(self.__ids__)
+        parent = [-1] * self.__present__
+        for taxon_id, parent_id in zip(taxa_id, parents_id):
+            if is_missing(taxon_id) or is_missing(parent_id):
+                continue
+            node = self.__index__[taxon_id]
+            if parent[node] != -1:
+                continue
+            if parent_id not in self.__index__:
+                self.__index__[parent_id] = len(self.__ids__)
+                self.__ids__.append(parent_id)
+                parent.append(-1)
+            parent[node] = self.__index__[parent_id]
+        self.__parent__ = parent
+        self.__build_children__()
+        self.__build_order__()
+        return
+
+    def __build_children__(self) -> None:
+        size = len(self.__parent__)
+        offset = [0] * (size + 1)
+        for parent in self.__parent__:
+            if parent != -1:
+                offset[parent + 1] += 1
+        for i in range(size):
+            offset[i + 1] += offset[i]
+        children = [0] * offset[size]
+        position = offset[:size]
+        for node, parent in enumerate(self.__parent__):
+            if parent != -1:
+                children[position[parent]] = node
+                position[parent] += 1
+        self.__offset__ = offset
+        self.__children__ = children
+        return
+
+    def __build_order__(self) -> None:
+        size = len(self.__parent__)
+        self.__order__: List[int] = list()
+        self.__start__ = [-1] * size
+        self.__end__ = [0] * size
+        self.__depth__ = [0] * size
+        for root in range(size):
+            if self.__parent__[root] == -1:
+                self.__traverse__(root)
+        for node in range(size):
+            if self.__start__[node] != -1:
+                continue
+            # Node not reachable from any root, so it hangs from a cycle
+            seen = set()
+            current = node
+            while current not in seen:
+                seen.add(current)
+                current = self.__parent__[current]
+            warn(f"Cycle on parent of {self.__ids__[current]}, treating it as root.", category=RuntimeWarning)
+            self.__parent__[current] = -1
+            self.__traverse__(current)
+        return
+
+    def __traverse__(self, root: int) -> None:
+        self.__depth__[root] = 0
+        stack = [root]
+        while len(stack) > 0:
+            node = stack.pop()
+            if node >= 0:
+                self.__start__[node] = len(self.__order__)
+                self.__order__.append(node)
+                stack.append(~node)
+                for i in range(self.__offset__[node + 1] - 1, self.__offset__[node] - 1, -1):
+                    child = self.__children__[i]
+                    if self.__parent__[child] == node:
+                        self.__depth__[child] = self.__depth__[node] + 1
+                        stack.append(child)
+            else:
+                self.__end__[~node] = len(self.__order__)
+        return
+
+    def __len__(self) -> int:
+        return len(self.__ids__)
+
+    def __contains__(self, taxon_id: str) -> bool:
+        return taxon_id in self.__index__
+
+    def is_present(self, taxon_id: str) -> bool:
+        """
+        Check if a taxon has a row on the indexed data, in contrast to be only referenced as parent.
+
+        Parameters
+        ----------
+        taxon_id : str
+            A :class:`dwca.terms.taxon.TaxonID` value.
+
+        Returns
+        -------
+        bool
+            True if the taxon is on the data, False otherwise.
+        """
+        return self.__index__.get(taxon_id, self.__present__) < self.__present__
+
+    def depth(self, taxon_id: str) -> int:
+        """
+        Number of ancestors of a taxon.
+
+        Parameters
+        ----------
+        taxon_id : str
+            A :class:`dwca.terms.taxon.TaxonID` value.
+
+        Returns
+        -------
+        int
+            Depth of the taxon in the tree, 0 for a root.
+        """
+        return self.__depth__[self.__index__[taxon_id]]
+
+    def parent(self, taxon_id: str) -> str | None:
+        """
+        Direct parent of a taxon.
+
+        Parameters
+        ----------
+        taxon_id : str
+            A :class:`dwca.terms.taxon.TaxonID` value.
+
+        Returns
+        -------
+        str | None
+            Taxon id of the parent, None if it is a root.
+        """
+        parent = self.__parent__[self.__index__[taxon_id]]
+        return None if parent == -1 else self.__ids__[parent]
+
+    def ancestors(self, taxa_id: Iterable[str]) -> Set[str]:
+        """
+        All the ancestors of a list of taxa.
+
+        Parameters
+        ----------
+        taxa_id : Iterable[str]
+            A list (or iterable) of :class:`dwca.terms.taxon.TaxonID` value.
+
+        Returns
+        -------
+        Set[str]
+            Set of taxa ids, unknown taxa are ignored.
+        """
+        visited = set()
+        for taxon_id in taxa_id:
+            node = self.__index__.get(taxon_id, None)
+            if node is None:
+                continue
+            node = self.__parent__[node]
+            while node != -1 and node not in visited:
+                visited.add(node)
+                node = self.__parent__[node]
+        return {self.__ids__[node] for node in visited}
+
+    def descendants(self, taxa_id: Iterable[str], subtree: bool = True) -> Set[str]:
+        """
+        All the descendants of a list of taxa.
+
+        Parameters
+        ----------
+        taxa_id : Iterable[str]
+            A list (or iterable) of :class:`dwca.terms.taxon.TaxonID` value.
+        subtree : bool, optional
+            Whether to get the whole subtree or only the direct children. Default `True`.
+
+        Returns
+        -------
+        Set[str]
+            Set of taxa ids, unknown taxa are ignored.
+        """
+        found = set()
+        for taxon_id in taxa_id:
+            node = self.__index__.get(taxon_id, None)
+            if node is None:
+                continue
+            if subtree:
+                found.update(self.__order__[self.__start__[node] + 1:self.__end__[node]])
+            else:
+                for i in range(self.__offset__[node], self.__offset__[node + 1]):
+                    child = self.__children__[i]
+                    if self.__parent__[child] == node:
+                        found.add(child)
+        return {self.__ids__[node] for node in found}
+
+    def is_ancestor(self, ancestor_id: str, taxon_id: str) -> bool:
+        """
+        Check if a taxon is ancestor of another one.
+
+        Parameters
+        ----------
+        ancestor_id : str
+            Candidate ancestor :class:`dwca.terms.taxon.TaxonID`.
+        taxon_id : str
+            Candidate descendant :class:`dwca.terms.taxon.TaxonID`.
+
+        Returns
+        -------
+        bool
+            True if `ancestor_id` is a proper ancestor of `taxon_id`.
+        """
+        ancestor = self.__index__[ancestor_id]
+        node = self.__index__[taxon_id]
+        return self.__start__[ancestor] < self.__start__[node] < self.__end__[ancestor]
+
+    def lowest_common_ancestor(self, taxa_id: Iterable[str]) -> str | None:
+        """
+        Lowest common ancestor of a list of taxa.
+
+        Parameters
+        ----------
+        taxa_id : Iterable[str]
+            A list (or iterable) of :class:`dwca.terms.taxon.TaxonID` value.
+
+        Returns
+        -------
+        str | None
+            Taxon id of the deepest taxon containing all the given ones (it can be one of them),
+            None if they do not share a tree.
+        """
+        common = None
+        for taxon_id in taxa_id:
+            node = self.__index__[taxon_id]
+            if common is None:
+                common = node
+                continue
+            while self.__depth__[node] > self.__depth__[common]:
+                node = self.__parent__[node]
+            while self.__depth__[common] > self.__depth__[node]:
+                common = self.__parent__[common]
+            while common != node:
+                common = self.__parent__[common]
+                node = self.__parent__[node]
+            if common == -1:
+                return None
+        return None if common is None else self.__ids__[common]
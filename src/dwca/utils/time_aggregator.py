@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import calendar
+import datetime as dt
+from typing import List, Tuple, Sequence, Any, Set
+
+from datetime_interval import Interval
+
+from dwca.utils.taxonomic_tree import is_missing
+
+
+def date_bounds(value: str) -> Tuple[str, str] | None:
+    """
+    First and last day covered by an ISO 8601 date (or a start/end interval), as sortable keys.
+
+    Values are only sliced, never parsed, so the keys can be compared as strings.
+    The last day of a month is kept as `YYYY-MM-31` until it is converted into a date.
+
+    Parameters
+    ----------
+    value : str
+        A date in format `YYYY`, `YYYY-MM`, `YYYY-MM-DD` (optionally followed by a time),
+        or an interval of two of them separated by `/`.
+
+    Returns
+    -------
+    Tuple[str, str] | None
+        First and last day in format `YYYY-MM-DD`, None if value is not a valid date.
+    """
+    start, _, end = value.strip().partition("/")
+    if end == "":
+        end = start
+    if not (start[:4].isdigit() and end[:4].isdigit()):
+        return None
+    first = start[:10] if len(start) >= 10 else (start[:7] + "-01" if len(start) >= 7 else start[:4] + "-01-01")
+    last = end[:10] if len(end) >= 10 else (end[:7] + "-31" if len(end) >= 7 else end[:4] + "-12-31")
+    for key in (first, last):
+        month, day = key[5:7], key[8:10]
+        if not (month.isdigit() and day.isdigit() and "01" <= month <= "12" and "01" <= day <= "31"):
+            return None
+    return first, last
+
+
+def key_to_date(key: str) -> dt.date:
+    """
+    Convert a key of :func:`date_bounds` into a date, fixing the last day of the month.
+
+    Parameters
+    ----------
+    key : str
+        A date in format `YYYY-MM-DD`.
+
+    Returns
+    -------
+    datetime.date
+        The date of the key.
+    """
+    year, month, day = int(key[:4]), int(key[5:7]), int(key[8:10])
+    return dt.date(year, month, min(day, calendar.monthrange(year, month)[1]))
+
+
+class TemporalAggregator:
+    """
+    Streaming aggregation of dates.
+
+    Values are consumed in batches keeping only the first and last day found
+    and, if requested, the distinct days while they do not exceed a limit.
+    Text values are reduced to sortable `YYYY-MM-DD` keys by slicing, without
+    creating a date object per row; only the limits are converted at the end.
+
+    Parameters
+    ----------
+    max_single_dates : int, optional
+        Report single dates instead of a range when every value is a day and
+        there are at most this number of distinct days. Default `0` (always a range).
+    """
+    def __init__(self, max_single_dates: int = 0) -> None:
+        self.__max_single__ = max_single_dates
+        self.__singles__: Set[str] | None = set() if max_single_dates > 0 else None
+        self.__first__: str | None = None
+        self.__last__: str | None = None
+        self.__count__ = 0
+        return
+
+    @property
+    def count(self) -> int:
+        """int: Number of valid values aggregated."""
+        return self.__count__
+
+    @property
+    def range(self) -> Tuple[dt.date, dt.date] | None:
+        """Tuple[datetime.date, datetime.date] | None: First and last day covered, None if there are no dates."""
+        if self.__count__ == 0:
+            return None
+        return key_to_date(self.__first__), key_to_date(self.__last__)
+
+    @property
+    def single_dates(self) -> List[dt.date] | None:
+        """List[datetime.date] | None: Distinct days, None if they are not tracked or exceed the limit."""
+        if self.__singles__ is None or self.__count__ == 0:
+            return None
+        return [key_to_date(key) for key in sorted(self.__singles__)]
+
+    @staticmethod
+    def __bounds__(value: Any) -> Tuple[str, str] | None:
+        if isinstance(value, str):
+            return date_bounds(value)
+        if isinstance(value, Interval):
+            start = value.start.isoformat()[:10] if value.start is not None else None
+            end = value.end.isoformat()[:10] if value.end is not None else None
+            if start is None and end is None:
+                return None
+            return start or end, end or start
+        if isinstance(value, (dt.date, dt.datetime)):
+            key = value.isoformat()[:10]
+            return key, key
+        return None
+
+    def __add_bounds__(self, bounds: List[Tuple[str, str]]) -> None:
+        if len(bounds) == 0:
+            return
+        first = min(start for start, _ in bounds)
+        last = max(end for _, end in bounds)
+        self.__first__ = first if self.__first__ is None else min(first, self.__first__)
+        self.__last__ = last if self.__last__ is None else max(last, self.__last__)
+        self.__count__ += len(bounds)
+        if self.__singles__ is not None:
+            if any(start != end for start, end in bounds):
+                self.__singles__ = None
+            else:
+                self.__singles__.update(start for start, _ in bounds)
+                if len(self.__singles__) > self.__max_single__:
+                    self.__singles__ = None
+        return
+
+    def update(self, values: Sequence[Any]) -> None:
+        """
+        Aggregate a batch of dates.
+
+        Parameters
+        ----------
+        values : Sequence[Any]
+            Dates as ISO 8601 text (including `start/end` intervals), `date`, `datetime` or `Interval`.
+            Missing or invalid values are skipped.
+        """
+        bounds = list()
+        for value in values:
+            if is_missing(value):
+                continue
+            bound = self.__bounds__(value)
+            if bound is not None:
+                bounds.append(bound)
+        self.__add_bounds__(bounds)
+        return
+
+    def update_parts(self, years: Sequence[int], months: Sequence[int] = None, days: Sequence[int] = None) -> None:
+        """
+        Aggregate a batch of dates given by its parts.
+
+        Parameters
+        ----------
+        years : Sequence[int]
+            Years of the dates.
+        months : Sequence[int], optional
+            Months of the dates, in the same order of `years`.
+        days : Sequence[int], optional
+            Days of the dates, in the same order of `years`.
+        """
+        months = [None] * len(years) if months is None else months
+        days = [None] * len(years) if days is None else days
+        bounds = list()
+        for year, month, day in zip(years, months, days):
+            if is_missing(year):
+                continue
+            value = f"{int(year):04d}"
+            if not is_missing(month) and 1 <= int(month) <= 12:
+                value += f"-{int(month):02d}"
+                if not is_missing(day) and 1 <= int(day) <= 31:
+                    value += f"-{int(day):02d}"
+            bounds.append(date_bounds(value))
+        self.__add_bounds__(bounds)
+        return
+
+    def __repr__(self) -> str:
+        return f"<TemporalAggregator [dates={self.count}]>"
@@ -1,6 +1,9 @@
 from __future__ import annotations
 
-from typing import Dict, List, Tuple, Any
+import io
+from copy import deepcopy
+from typing import Dict, List, Tuple, Any, BinaryIO
+from warnings import warn
 
 import datetime as dt
 from lxml import etree as et
@@ -10,7 +13,7 @@ from eml.base import EMLAdditionalMetadata, EMLVersion
 from eml.resources import EMLResource, EMLDataset, EMLCitation, EMLProtocol, EMLSoftware, Resource, EMLKeywordSet, \
     EMLLicense, EMLDistribution, EMLCoverage
 from eml.types import Scope, SemanticAnnotation, AccessType, EMLObject, I18nString, ResponsibleParty, ExtensionString, \
-    Role, EMLTextType
+    Role, EMLTextType, Methods
 
 
 class EML(EMLObject):
@@ -114,6 +117,7 @@ class EML(EMLObject):
         self.__annotation__ = list()
         if annotation is not None:
             self.__annotation__.extend([EML.Annotation(a[0], a[1]) for a in annotation])
+        self.__raw__: Dict[str, et.Element | List[et.Element]] = dict()
         return
 
     @property
@@ -141,9 +145,49 @@ class EML(EMLObject):
         """EMLResource: The type of the resource."""
         return self.__resource_type__
 
+    def is_lazy(self) -> bool:
+        """
+        Check if any section of the EML has not been parsed yet.
+
+        Returns
+        -------
+        bool
+            True if a section is kept as the original XML until accessed, False otherwise.
+        """
+        return len(self.__raw__) > 0
+
+    def __parse_section__(self, section: str) -> None:
+        raw = self.__raw__.pop(section, None)
+        if raw is None:
+            return
+        nmap = self.__namespace__
+        if section == "resource":
+            self.__resource__ = self.__resource_class__.parse(raw, nmap)
+        elif section == "access":
+            self.__access__ = AccessType.parse(raw, nmap)
+        elif section == "additional":
+            self.__additional__[0:0] = [EMLAdditionalMetadata.parse(element, nmap) for element in raw]
+        elif section == "annotations":
+            self.__annotation__[0:0] = [
+                EML.Annotation(annotation, references)
+                for annotation, references in self.__parse_annotations__(raw, nmap)
+            ]
+        return
+
+    @property
+    def title(self) -> I18nString:
+        """I18nString: Title of the resource, read without parsing the whole resource on lazy mode."""
+        raw = self.__raw__.get("resource", None)
+        if raw is not None:
+            title = raw.find("title", self.__namespace__)
+            if title is not None:
+                return I18nString.parse(title, self.__namespace__)
+        return self.resource.title
+
     @property
     def resource(self) -> Resource:
         """Resource: The resource instance."""
+        self.__parse_section__("resource")
         if self.__resource__ is None:
             try:
                 self.__resource__ = self.__resource_class__(**self.__kwargs__)
@@ -155,16 +199,19 @@ class EML(EMLObject):
     @property
     def access(self) -> AccessType:
         """None: Access control rules for the entire resource."""
+        self.__parse_section__("access")
         return self.__access__
 
     @property
     def additional_metadata(self) -> List[EMLAdditionalMetadata]:
         """List[EMLAdditionalMetadata]: A flexible field for including any other relevant metadata."""
+        self.__parse_section__("additional")
         return self.__additional__
 
     @property
     def annotations(self) -> List[EML.Annotation]:
         """Annotation: A list of precisely-defined semantic statements about this resource."""
+        self.__parse_section__("annotations")
         return self.__annotation__
 
     def initialize_resource(
@@ -193,6 +240,8 @@ class EML(EMLObject):
                 proper_titles.append(I18nString(title))
         else:
             proper_titles.append(I18nString(titles))
+        # Replaces the section read on lazy mode, otherwise written and parsed over the new one
+        self.__raw__.pop("resource", None)
         self.__resource__ = self.__resource_class__(
             titles=proper_titles,
             creators=creators if isinstance(creators, list) else [creators],
@@ -418,7 +467,7 @@ class EML(EMLObject):
         additional_metadata : EMLAdditionalMetadata
             A flexible field for including any other relevant metadata.
         """
-        self.__additional__.append(additional_metadata)
+        self.additional_metadata.append(additional_metadata)
         return
 
 
@@ -458,7 +507,6 @@ class EML(EMLObject):
         EML
             EML instance.
         """
-        assert element.get("packageId", None) is not None, "`packageId` attribute is not present in document"
         access = None
         access_elem = element.find("access", nmap)
         if access_elem is not None:
@@ -469,11 +517,28 @@ class EML(EMLObject):
         annotation = list()
         annotations_elem = element.find("annotations", nmap)
         if annotations_elem is not None:
-            for annotation_elem in annotations_elem.findall("annotation", nmap):
-                annotation.append((
-                    SemanticAnnotation.parse(annotation_elem, nmap),
-                    annotation_elem.get("references", None)
-                ))
+            annotation.extend(cls.__parse_annotations__(annotations_elem, nmap))
+        eml = cls.__from_root__(element, nmap, access, additional_metadata, annotation)
+        eml.__resource__ = eml.__resource_class__.parse(
+            element.find(eml.__resource_type__.name.lower()), nmap
+        )
+        return eml
+
+    @staticmethod
+    def __parse_annotations__(element: et.Element, nmap: Dict) -> List[Tuple[SemanticAnnotation, str]]:
+        return [
+            (SemanticAnnotation.parse(annotation_elem, nmap), annotation_elem.get("references", None))
+            for annotation_elem in element.findall("annotation", nmap)
+        ]
+
+    @classmethod
+    def __from_root__(
+            cls, element: et.Element, nmap: Dict,
+            access: AccessType,
+            additional_metadata: List[EMLAdditionalMetadata],
+            annotation: List[Tuple[SemanticAnnotation, str]],
+    ) -> EML:
+        assert element.get("packageId", None) is not None, "`packageId` attribute is not present in document"
         eml = EML(
             package_id=element.get("packageId"),
             system=element.get("system"),
@@ -484,12 +549,150 @@ class EML(EMLObject):
             additional_metadata=additional_metadata,
             annotation=annotation
         )
-        eml.__resource__ = eml.__resource_class__.parse(
-            element.find(eml.__resource_type__.name.lower()), nmap
-        )
         eml.__namespace__ = nmap
         return eml
 
+    @classmethod
+    def from_file(cls, path: str, lazy: bool = False) -> EML:
+        """
+        Generate an EML instance from an XML file, parsing it incrementally.
+
+        Parameters
+        ----------
+        path : str
+            Path to the EML file.
+        lazy : bool, optional
+            Keep the sections as XML and parse them on first access. Default `False`.
+
+        Returns
+        -------
+        EML
+            EML instance.
+        """
+        with open(path, "rb") as file:
+            return cls.from_stream(file, lazy=lazy)
+
+    @classmethod
+    def from_stream(cls, stream: BinaryIO | bytes, lazy: bool = False) -> EML:
+        """
+        Generate an EML instance from a binary stream (or bytes), parsing it incrementally.
+
+        Each section of the document (access, additional metadata and annotations), and the
+        largest sections of the resource (coverage and methods), is parsed as soon as it is read
+        and then removed from the tree, so they are not held in memory as XML at the same time.
+        The rest of the resource is parsed at its end. The encoding is taken from the XML declaration.
+
+        On lazy mode, sections are kept as XML and only parsed when accessed (e.g. :attr:`resource`),
+        so reading the package id, the language or the :attr:`title` is cheap. Sections never
+        accessed are written back as the original XML, so the resource is kept whole.
+
+        Parameters
+        ----------
+        stream : BinaryIO | bytes
+            A binary file-like object or the content of the EML file.
+        lazy : bool, optional
+            Keep the sections as XML and parse them on first access. Default `False`.
+
+        Returns
+        -------
+        EML
+            EML instance.
+        """
+        if isinstance(stream, (bytes, bytearray)):
+            stream = io.BytesIO(stream)
+        root = None
+        nmap = dict()
+        depth = 0
+        access = None
+        additional_metadata = list()
+        annotation = list()
+        resource_elem = None
+        resource_tags = [resource.name.lower() for resource in EMLResource]
+        # Sections of the resource parsed on their own, before the rest of the resource
+        resource_sections: Dict[str, Any] = dict()
+        raw: Dict[str, et.Element | List[et.Element]] = dict()
+        for event, element in et.iterparse(stream, events=("start", "end"), remove_comments=True):
+            if event == "start":
+                depth += 1
+                if root is None:
+                    root = element
+                    for prefix, uri in cls.NAMESPACES.items():
+                        nmap[prefix] = uri
+                    for prefix, uri in root.nsmap.items():
+                        nmap[prefix] = uri
+                    cls.check_principal_tag(root.tag, nmap)
+                continue
+            depth -= 1
+            if depth == 2 and not lazy and resource_elem is None:
+                cls.__parse_resource_section__(element, resource_tags, resource_sections, nmap)
+                continue
+            if depth != 1:
+                continue
+            tag = et.QName(element).localname
+            if lazy:
+                if tag == "additionalMetadata":
+                    raw.setdefault("additional", list()).append(element)
+                elif tag in ("access", "annotations"):
+                    raw[tag] = element
+                elif "resource" not in raw and tag in resource_tags:
+                    resource_elem = raw["resource"] = element
+                if element is not resource_elem:
+                    root.remove(element)
+                continue
+            if tag == "access":
+                access = AccessType.parse(element, nmap)
+            elif tag == "additionalMetadata":
+                additional_metadata.append(EMLAdditionalMetadata.parse(element, nmap))
+            elif tag == "annotations":
+                annotation.extend(cls.__parse_annotations__(element, nmap))
+            elif resource_elem is None and tag in resource_tags:
+                resource_elem = element
+            if element is not resource_elem:
+                # Processed section, release its memory
+                element.clear()
+                root.remove(element)
+        assert root is not None, "Empty EML document"
+        eml = cls.__from_root__(root, nmap, access, additional_metadata, annotation)
+        if lazy:
+            if resource_elem is not None:
+                root.remove(resource_elem)
+            eml.__raw__ = raw
+            return eml
+        if resource_elem is not None:
+            eml.__resource__ = eml.__resource_class__.parse(resource_elem, nmap)
+            resource_elem.clear()
+            if not eml.__resource__.referencing:
+                if "coverage" in resource_sections:
+                    eml.__resource__.__cover__ = resource_sections["coverage"]
+                if "methods" in resource_sections:
+                    eml.__resource__.__methods__ = resource_sections["methods"]
+        return eml
+
+    @staticmethod
+    def __parse_resource_section__(
+            element: et.Element, resource_tags: List[str], sections: Dict[str, Any], nmap: Dict
+    ) -> None:
+        # Parse the first coverage (and methods of a dataset) of the resource and release its memory
+        parent = element.getparent()
+        if parent is None or et.QName(parent).localname not in resource_tags:
+            return
+        tag = et.QName(element).localname
+        if tag in sections:
+            return
+        if tag == "coverage":
+            try:
+                sections[tag] = EMLCoverage.parse(element, nmap)
+            except TypeError as e:
+                warn(str(e), category=SyntaxWarning)
+                sections[tag] = None
+        elif tag == "methods" and et.QName(parent).localname == EMLResource.DATASET.name.lower():
+            sections[tag] = Methods.parse(element, nmap)
+        else:
+            return
+        element.clear()
+        parent.remove(element)
+        return
+
     def to_element(self) -> et.Element:
         """
         Generate an XML element instance using the EML information.
@@ -510,12 +713,23 @@ class EML(EMLObject):
         root.set("system", self.system)
         root.set("scope", self.scope.name.lower())
         root.set(f"{{{self.__namespace__['xml']}}}lang", self.language.name.lower())
-        root.append(self.resource.to_element())
-        if self.access is not None:
+        # Sections not accessed on lazy mode are written as they were read
+        if "resource" in self.__raw__:
+            root.append(self.__raw_copy__(self.__raw__["resource"]))
+        else:
+            root.append(self.resource.to_element())
+        if "access" in self.__raw__:
+            root.append(self.__raw_copy__(self.__raw__["access"]))
+        elif self.access is not None:
             root.append(self.access.to_element())
-        for add_meta in self.additional_metadata:
-            root.append(add_meta.to_element())
-        if len(self.annotations) > 0:
+        if "additional" in self.__raw__:
+            root.extend([self.__raw_copy__(element) for element in self.__raw__["additional"]])
+        else:
+            for add_meta in self.additional_metadata:
+                root.append(add_meta.to_element())
+        if "annotations" in self.__raw__:
+            root.append(self.__raw_copy__(self.__raw__["annotations"]))
+        elif len(self.annotations) > 0:
             annotations_elem = self.object_to_element("annotations")
             for annotation in self.annotations:
                 annotation.annotation.set_tag("annotation")
@@ -525,6 +739,29 @@ class EML(EMLObject):
             root.append(annotations_elem)
         return root
 
+    def __getstate__(self) -> Dict:
+        state = self.__dict__.copy()
+        state["__raw__"] = {
+            section: [et.tostring(element, with_tail=False) for element in raw] if isinstance(raw, list)
+            else et.tostring(raw, with_tail=False)
+            for section, raw in self.__raw__.items()
+        }
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        state["__raw__"] = {
+            section: [et.fromstring(element) for element in raw] if isinstance(raw, list) else et.fromstring(raw)
+            for section, raw in state["__raw__"].items()
+        }
+        self.__dict__.update(state)
+        return
+
+    @staticmethod
+    def __raw_copy__(element: et.Element) -> et.Element:
+        copy = deepcopy(element)
+        copy.tail = None
+        return copy
+
     def __str__(self) -> str:
         return f"EML:\n\tResource Type: {self.resource_type.name}\n{self.resource}"
 
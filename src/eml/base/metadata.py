@@ -64,6 +64,16 @@ class EMLMetadata(XMLObject):
         """
         return self.__content__
 
+    def __getstate__(self) -> Dict:
+        state = self.__dict__.copy()
+        state["__content__"] = et.tostring(self.__content__, with_tail=False)
+        return state
+
+    def __setstate__(self, state: Dict) -> None:
+        state["__content__"] = et.fromstring(state["__content__"])
+        self.__dict__.update(state)
+        return
+
 
 class EMLAdditionalMetadata(XMLObject):
     """
@@ -1,11 +1,15 @@
 from __future__ import annotations
-from typing import Dict, List, Tuple, Any
+from typing import Dict, List, Tuple, Any, Set, TYPE_CHECKING
+from warnings import warn
 
 from lxml import etree as et
 
 from xml_common import XMLObject
 from eml.types import EMLObject, Scope, ResponsibleParty
 
+if TYPE_CHECKING:
+    from dwca.classes import DataFile
+
 
 class TaxonomicCoverage(EMLObject):
     """
@@ -518,6 +522,122 @@ class TaxonomicCoverage(EMLObject):
         """TaxonomicClassification: Information about the range of taxa addressed in the data set or collection."""
         return self.__classification__
 
+    @classmethod
+    def from_data(
+            cls, data_file: DataFile,
+            ranks: List[str] = None,
+            max_nodes: int = None,
+            max_depth: int = None,
+            max_width: int = None,
+            general_coverage: str = None,
+            batch_size: int = 10_000,
+    ) -> TaxonomicCoverage:
+        """
+        Generate a Taxonomic Coverage from the rank columns of a data file.
+
+        Rows are read by batches and their rank paths (from kingdom down to species) are
+        merged into a trie, so each taxon appears once. Missing ranks are skipped, attaching
+        the taxon to its closest higher rank.
+
+        Parameters
+        ----------
+        data_file : DataFile
+            A data file with rank columns, as :class:`dwca.classes.taxon.Taxon` or
+            :class:`dwca.classes.occurrence.Occurrence`.
+        ranks : List[str], optional
+            Ranks to include, any of `"kingdom"`, `"phylum"`, `"class"`, `"order"`, `"family"`,
+            `"genus"` and `"species"` (from scientific name). Default all of them present on the data file.
+        max_nodes : int, optional
+            Maximum number of classifications on the coverage.
+        max_depth : int, optional
+            Maximum number of nested levels.
+        max_width : int, optional
+            Maximum number of classifications nested in another one (or at the top level).
+        general_coverage : str, optional
+            A description of the range of taxa addressed in the data set or collection.
+        batch_size : int, optional
+            Number of rows read at once. Default `10_000`.
+
+        Returns
+        -------
+        TaxonomicCoverage
+            Coverage with the nested classification of the taxa on the data.
+
+        Raises
+        ------
+        ValueError
+            If a rank is not supported or there are no taxa on the data.
+        """
+        from dwca.terms import Kingdom, Phylum, DWCClass, Order, Family, Genus, ScientificName
+        rank_fields = {
+            "kingdom": Kingdom, "phylum": Phylum, "class": DWCClass, "order": Order,
+            "family": Family, "genus": Genus, "species": ScientificName,
+        }
+        if ranks is None:
+            ranks = list(rank_fields.keys())
+        for rank in ranks:
+            if rank.lower() not in rank_fields:
+                raise ValueError(f"{rank} is not a supported rank.")
+        ranks = [rank.lower() for rank in rank_fields.keys() if rank in [r.lower() for r in ranks]]
+        ranks = [rank for rank in ranks if rank_fields[rank].URI in data_file.fields]
+        columns = [rank_fields[rank].name_cls() for rank in ranks]
+        # Trie of nested dictionaries: {(rank, value): children}
+        root: Dict[Tuple[str, str], Dict] = dict()
+        nodes = 0
+        # Path of each taxon left out of the coverage, counted once even if it is on several rows
+        ignored: Set[Tuple[Tuple[str, str], ...]] = set()
+        for batch in data_file._iter_columns_(columns, batch_size=batch_size):
+            paths = dict()
+            for values in zip(*batch):
+                path = list()
+                for rank, value in zip(ranks, values):
+                    if not isinstance(value, str) or value.strip() == "":
+                        continue
+                    # Higher taxa rows repeat its name on the scientific name
+                    if len(path) > 0 and path[-1][1] == value.strip():
+                        continue
+                    path.append((rank, value.strip()))
+                path = tuple(path)
+                if max_depth is not None:
+                    path = path[:max_depth]
+                paths[path] = None
+            for path in paths:
+                children = root
+                for position, key in enumerate(path):
+                    child = children.get(key, None)
+                    if child is None:
+                        if (
+                            (max_nodes is not None and nodes >= max_nodes) or
+                            (max_width is not None and len(children) >= max_width)
+                        ):
+                            # The taxon and its descendants on the path
+                            ignored.update(path[:end] for end in range(position + 1, len(path) + 1))
+                            break
+                        child = dict()
+                        children[key] = child
+                        nodes += 1
+                    children = child
+        if len(ignored) > 0:
+            warn(f"Taxonomic coverage truncated, {len(ignored)} taxa ignored.", RuntimeWarning)
+        if nodes == 0:
+            raise ValueError("No taxa found on the data file.")
+
+        def to_classification(
+                children: Dict[Tuple[str, str], Dict]
+        ) -> List[TaxonomicCoverage.TaxonomicClassification]:
+            return [
+                TaxonomicCoverage.TaxonomicClassification(
+                    rank_name=rank.capitalize(),
+                    rank_value=value,
+                    classification=to_classification(child),
+                ) for (rank, value), child in children.items()
+            ]
+
+        return TaxonomicCoverage(
+            general_coverage=general_coverage,
+            classification=to_classification(root),
+        )
+
     @classmethod
     def get_referrer(cls, element: et.Element, nmap: Dict) -> EMLObject:
         """
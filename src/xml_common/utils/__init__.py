@@ -1,4 +1,5 @@
 from xml_common.utils.iteratate import iterate_with_bar, OptionalTqdm
+from xml_common.utils.diagnostics import Diagnostics, ANY_TYPE, CONVERSION_FAILURE, UNKNOWN_TERM, UNKNOWN_CLASS
 from xml_common.utils.enum import CamelCaseEnum
 from xml_common.utils.language import Language
 from xml_common.utils.read_file import read_string
@@ -9,3 +10,6 @@ from xml_common.utils.type_functions import unformat_type
 from xml_common.utils.type_functions import type_to_pl
 from xml_common.utils.type_functions import type_to_sql, format_to_sql
 from xml_common.utils.establishment_means import EstablishmentMeans
+from xml_common.utils.lazy_module import LazyModule
+from xml_common.utils.progress import Progress, ProgressEvent, ProgressSink, configure_progress, get_progress_sink
+from xml_common.utils.progress import CallbackSink, LoggingSink, PrometheusTextfileSink, TqdmSink
@@ -0,0 +1,233 @@
+from __future__ import annotations
+
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Dict, Iterable, Iterator, List
+from warnings import warn
+
+ANY_TYPE = "any_type"
+"""str: Values kept as text because the type of the field is `Any`."""
+CONVERSION_FAILURE = "conversion_failure"
+"""str: Values that could not be converted to the type of the field and were set to None."""
+UNKNOWN_TERM = "unknown_term"
+"""str: Terms not in the expected namespace of the class, read as an outside term."""
+UNKNOWN_CLASS = "unknown_class"
+"""str: Classes not in the expected namespace, read as an outside class."""
+
+__active__: ContextVar[Diagnostics | None] = ContextVar("diagnostics", default=None)
+
+
+class Diagnostics:
+    """
+    Collector of the issues found while reading (e.g. values that could not be converted), aggregated by
+    kind and field, to be reported in a single summary instead of a warning on each occurrence.
+
+    Parameters
+    ----------
+    name : str, optional
+        Name of what is read (e.g. the archive path), used on the summary.
+    sample_size : int, optional
+        Maximum number of values kept as sample of each kind and field. Default `5`.
+    """
+    MESSAGES = {
+        ANY_TYPE: "values kept as text (type <Any> is not recommended as Type of field)",
+        CONVERSION_FAILURE: "values could not be converted and were set to None",
+        UNKNOWN_TERM: "terms not in expected namespace, some functionalities may not be available",
+        UNKNOWN_CLASS: "classes not in expected namespace, some functionalities may not be available",
+    }
+    """Dict[str, str]: Description of each kind of issue on the summary."""
+
+    def __init__(self, name: str = "", sample_size: int = 5) -> None:
+        self.__source__ = name
+        self.__sample_size__ = sample_size
+        self.__counts__: Dict[str, Dict[str, int]] = dict()
+        self.__samples__: Dict[str, Dict[str, List[Any]]] = dict()
+        return
+
+    @property
+    def name(self) -> str:
+        """str: Name of what is read."""
+        return self.__source__
+
+    @property
+    def counts(self) -> Dict[str, Dict[str, int]]:
+        """Dict[str, Dict[str, int]]: Number of issues by kind and field."""
+        return self.__counts__
+
+    @property
+    def samples(self) -> Dict[str, Dict[str, List[Any]]]:
+        """Dict[str, Dict[str, List[Any]]]: Sample of the values with issues by kind and field."""
+        return self.__samples__
+
+    def count(self, kind: str = None) -> int:
+        """
+        Number of issues.
+
+        Parameters
+        ----------
+        kind : str, optional
+            Kind of the issues, default all of them.
+
+        Returns
+        -------
+        int
+            Number of issues of the kind.
+        """
+        kinds = self.__counts__.keys() if kind is None else [kind]
+        return sum(sum(self.__counts__.get(this_kind, dict()).values()) for this_kind in kinds)
+
+    def add(self, kind: str, field: str, count: int = 1, samples: Iterable[Any] = ()) -> None:
+        """
+        Count issues of a field.
+
+        Parameters
+        ----------
+        kind : str
+            Kind of issue (e.g. :data:`CONVERSION_FAILURE`).
+        field : str
+            Field (or term) with the issues.
+        count : int, optional
+            Number of issues. Default `1`.
+        samples : Iterable[Any], optional
+            Values with the issues, only the first ones are kept.
+        """
+        if count <= 0:
+            return
+        counts = self.__counts__.setdefault(kind, dict())
+        counts[field] = counts.get(field, 0) + count
+        kept = self.__samples__.setdefault(kind, dict()).setdefault(field, list())
+        for value in samples:
+            if len(kept) >= self.__sample_size__:
+                break
+            kept.append(value)
+        return
+
+    def record(self, kind: str, field: str, value: Any = None) -> None:
+        """
+        Count one issue of a field.
+
+        Parameters
+        ----------
+        kind : str
+            Kind of issue (e.g. :data:`CONVERSION_FAILURE`).
+        field : str
+            Field (or term) with the issue.
+        value : Any, optional
+            Value with the issue, kept as sample.
+        """
+        self.add(kind, field, 1, () if value is None else (value,))
+        return
+
+    def merge(self, other: Diagnostics) -> None:
+        """
+        Add the issues of another collector.
+
+        Parameters
+        ----------
+        other : Diagnostics
+            Another collector.
+        """
+        for kind, counts in other.counts.items():
+            for field, count in counts.items():
+                self.add(kind, field, count, other.samples.get(kind, dict()).get(field, list()))
+        return
+
+    def summary(self) -> str:
+        """
+        Text summary of the issues.
+
+        Returns
+        -------
+        str
+            Number of issues by kind and field, with sample values.
+        """
+        name = f" on {self.name}" if self.name != "" else ""
+        lines = [f"{self.count()} issues found{name}:"]
+        for kind, counts in self.__counts__.items():
+            lines.append(f"  {self.count(kind)} {self.MESSAGES.get(kind, kind)}:")
+            for field, count in counts.items():
+                samples = self.__samples__.get(kind, dict()).get(field, list())
+                sample = f" (e.g. {', '.join(repr(value) for value in samples)})" if len(samples) > 0 else ""
+                lines.append(f"    {field}: {count}{sample}")
+        return "\n".join(lines)
+
+    def emit(self, category: type[Warning] = UserWarning) -> None:
+        """
+        Warn the summary of the issues, if any.
+
+        Parameters
+        ----------
+        category : type[Warning], optional
+            Category of the warning. Default `UserWarning`.
+        """
+        if self.count() > 0:
+            warn(self.summary(), category=category, stacklevel=2)
+        return
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Issues as a dictionary.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Name, counts and samples by kind and field.
+        """
+        return {
+            "name": self.name,
+            "counts": {kind: dict(counts) for kind, counts in self.__counts__.items()},
+            "samples": {kind: {field: list(values) for field, values in samples.items()}
+                        for kind, samples in self.__samples__.items()},
+        }
+
+    @staticmethod
+    def active() -> Diagnostics | None:
+        """
+        Collector of the current reading, see :meth:`collect`.
+
+        Returns
+        -------
+        Diagnostics | None
+            The active collector, None if there is no one.
+        """
+        return __active__.get()
+
+    @classmethod
+    @contextmanager
+    def collect(cls, diagnostics: Diagnostics = None, name: str = "") -> Iterator[Diagnostics]:
+        """
+        Activate a collector while reading.
+
+        If no collector is given and there is one active (e.g. reading a data file while reading an archive),
+        the issues are collected on it. Otherwise, a new collector is created, and its summary is emitted at
+        the end. A given collector is not emitted, so the caller can inspect it.
+
+        Parameters
+        ----------
+        diagnostics : Diagnostics, optional
+            Collector of the issues.
+        name : str, optional
+            Name of a new collector.
+
+        Yields
+        ------
+        Diagnostics
+            The active collector.
+        """
+        active = __active__.get()
+        if diagnostics is None and active is not None:
+            yield active
+            return
+        owner = diagnostics is None
+        diagnostics = cls(name) if owner else diagnostics
+        token = __active__.set(diagnostics)
+        try:
+            yield diagnostics
+        finally:
+            __active__.reset(token)
+        if owner:
+            diagnostics.emit()
+        return
+
+    def __repr__(self) -> str:
+        return f"<Diagnostics [{self.name}: {self.count()} issues]>"
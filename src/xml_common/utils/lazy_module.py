@@ -0,0 +1,43 @@
+import sys
+from types import ModuleType
+from typing import Any
+
+
+class LazyModule:
+    """
+    Optional module imported on the first access to one of its attributes.
+
+    Heavy optional libraries (`pandas`, `polars`) are not needed to parse an
+    archive, so they are not imported until they are actually used.
+
+    Parameters
+    ----------
+    name : str
+        Name of the module.
+    """
+    def __init__(self, name: str) -> None:
+        self.__module_name__ = name
+        self.__loaded__ = None
+        return
+
+    @property
+    def is_loaded(self) -> bool:
+        """bool: The module has already been imported (by this or any other code)."""
+        return self.__loaded__ is not None or self.__module_name__ in sys.modules
+
+    def __load__(self) -> ModuleType:
+        if self.__loaded__ is None:
+            module = sys.modules.get(self.__module_name__)
+            if module is None:
+                try:
+                    module = __import__(self.__module_name__)
+                except ImportError:
+                    raise ImportError(f"Install {self.__module_name__} to use this feature.")
+            self.__loaded__ = module
+        return self.__loaded__
+
+    def __getattr__(self, item: str) -> Any:
+        return getattr(self.__load__(), item)
+
+    def __repr__(self) -> str:
+        return f"<LazyModule [name={self.__module_name__}, loaded={self.is_loaded}]>"
@@ -0,0 +1,532 @@
+from __future__ import annotations
+
+import logging
+import os
+import tempfile
+import time
+from itertools import count
+from typing import Any, Callable, Dict, Iterable, Iterator, TypeVar
+
+from xml_common.utils.iteratate import get_optional_iterator
+
+T = TypeVar('T')
+
+
+class ProgressEvent:
+    """
+    State of a task at a moment.
+
+    Parameters
+    ----------
+    task : int
+        Identifier of the task, unique while the process runs.
+    desc : str
+        Description of the task.
+    unit : str
+        Unit of the items processed.
+    done : int
+        Items processed.
+    total : int, optional
+        Total items to process, None if unknown.
+    n_bytes : int, optional
+        Bytes processed. Default `0`.
+    elapsed : float, optional
+        Seconds since the task started. Default `0.0`.
+    postfix : Dict[str, Any], optional
+        Additional information of the task.
+    finished : bool, optional
+        The task is finished. Default `False`.
+    """
+    def __init__(
+            self, task: int, desc: str, unit: str, done: int,
+            total: int = None, n_bytes: int = 0, elapsed: float = 0.0,
+            postfix: Dict[str, Any] = None, finished: bool = False,
+    ) -> None:
+        self.__task__ = task
+        self.__desc__ = desc
+        self.__unit__ = unit
+        self.__done__ = done
+        self.__total__ = total
+        self.__bytes__ = n_bytes
+        self.__elapsed__ = elapsed
+        self.__postfix__ = dict() if postfix is None else dict(postfix)
+        self.__finished__ = finished
+        return
+
+    @property
+    def task(self) -> int:
+        """int: Identifier of the task."""
+        return self.__task__
+
+    @property
+    def desc(self) -> str:
+        """str: Description of the task."""
+        return self.__desc__
+
+    @property
+    def unit(self) -> str:
+        """str: Unit of the items processed."""
+        return self.__unit__
+
+    @property
+    def done(self) -> int:
+        """int: Items processed."""
+        return self.__done__
+
+    @property
+    def total(self) -> int | None:
+        """int | None: Total items to process, None if unknown."""
+        return self.__total__
+
+    @property
+    def bytes(self) -> int:
+        """int: Bytes processed."""
+        return self.__bytes__
+
+    @property
+    def elapsed(self) -> float:
+        """float: Seconds since the task started."""
+        return self.__elapsed__
+
+    @property
+    def postfix(self) -> Dict[str, Any]:
+        """Dict[str, Any]: Additional information of the task."""
+        return self.__postfix__
+
+    @property
+    def finished(self) -> bool:
+        """bool: The task is finished."""
+        return self.__finished__
+
+    @property
+    def rate(self) -> float | None:
+        """float | None: Items processed per second, None if no time has elapsed."""
+        return self.done / self.elapsed if self.elapsed > 0 else None
+
+    @property
+    def byte_rate(self) -> float | None:
+        """float | None: Bytes processed per second, None if no time has elapsed."""
+        return self.bytes / self.elapsed if self.elapsed > 0 else None
+
+    @property
+    def eta(self) -> float | None:
+        """float | None: Estimated seconds to finish, None if the total or the rate are unknown."""
+        if self.total is None or not self.rate:
+            return None
+        return max(0.0, (self.total - self.done) / self.rate)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """
+        Event as a dictionary.
+
+        Returns
+        -------
+        Dict[str, Any]
+            Every property of the event.
+        """
+        return {
+            "task": self.task, "desc": self.desc, "unit": self.unit, "done": self.done, "total": self.total,
+            "bytes": self.bytes, "elapsed": self.elapsed, "rate": self.rate, "byte_rate": self.byte_rate,
+            "eta": self.eta, "postfix": self.postfix, "finished": self.finished,
+        }
+
+    def __repr__(self) -> str:
+        return f"<ProgressEvent [{self.desc}: {self.done}/{self.total} {self.unit}]>"
+
+
+class ProgressSink:
+    """
+    Destination of the progress events.
+    """
+    def emit(self, event: ProgressEvent) -> None:
+        """
+        Receive an event.
+
+        Parameters
+        ----------
+        event : ProgressEvent
+            State of a task.
+        """
+        raise NotImplementedError
+
+    def close(self) -> None:
+        """
+        Release the resources of the sink.
+        """
+        return
+
+
+class CallbackSink(ProgressSink):
+    """
+    Send the events to a function.
+
+    Parameters
+    ----------
+    callback : Callable[[ProgressEvent], None]
+        Function called with each event.
+    """
+    def __init__(self, callback: Callable[[ProgressEvent], None]) -> None:
+        self.__callback__ = callback
+        return
+
+    def emit(self, event: ProgressEvent) -> None:
+        self.__callback__(event)
+        return
+
+
+class LoggingSink(ProgressSink):
+    """
+    Log the events.
+
+    Parameters
+    ----------
+    logger : logging.Logger, optional
+        Logger of the events, default `"pydwca.progress"`.
+    level : int, optional
+        Level of the records. Default `logging.INFO`.
+    """
+    def __init__(self, logger: logging.Logger = None, level: int = logging.INFO) -> None:
+        self.__logger__ = logging.getLogger("pydwca.progress") if logger is None else logger
+        self.__level__ = level
+        return
+
+    def emit(self, event: ProgressEvent) -> None:
+        if not self.__logger__.isEnabledFor(self.__level__):
+            return
+        total = "?" if event.total is None else event.total
+        rate = "?" if event.rate is None else f"{event.rate:.1f}"
+        eta = "?" if event.eta is None else f"{event.eta:.1f}s"
+        message = f"{event.desc}: {event.done}/{total} {event.unit} ({rate} {event.unit}/s, ETA {eta})"
+        if event.bytes > 0:
+            message += f", {event.bytes} bytes"
+        if len(event.postfix) > 0:
+            message += ", " + ", ".join(f"{key}={value}" for key, value in event.postfix.items())
+        if event.finished:
+            message += ", finished"
+        self.__logger__.log(self.__level__, message, extra={"progress": event.to_dict()})
+        return
+
+
+class PrometheusTextfileSink(ProgressSink):
+    """
+    Write the state of the tasks in the Prometheus text format, to be collected by the textfile collector.
+
+    The file is replaced atomically on each event with the last state of every task.
+
+    Parameters
+    ----------
+    path : str
+        Location of the file (usually ending in `.prom`).
+    prefix : str, optional
+        Prefix of the metrics. Default `"pydwca_progress"`.
+    """
+    METRICS = {
+        "done": "Items processed by the task.",
+        "total": "Total items to process by the task.",
+        "bytes": "Bytes processed by the task.",
+        "rate": "Items processed per second.",
+        "eta_seconds": "Estimated seconds to finish the task.",
+        "finished": "The task is finished.",
+    }
+    """Dict[str, str]: Metrics written and its help text."""
+
+    def __init__(self, path: str, prefix: str = "pydwca_progress") -> None:
+        self.__path__ = path
+        self.__prefix__ = prefix
+        self.__tasks__: Dict[int, ProgressEvent] = dict()
+        return
+
+    @staticmethod
+    def __label__(value: str) -> str:
+        return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+    def emit(self, event: ProgressEvent) -> None:
+        self.__tasks__[event.task] = event
+        lines = list()
+        for metric, description in self.METRICS.items():
+            name = f"{self.__prefix__}_{metric}"
+            lines.append(f"# HELP {name} {description}")
+            lines.append(f"# TYPE {name} gauge")
+            for task in self.__tasks__.values():
+                value = {
+                    "done": task.done, "total": task.total, "bytes": task.bytes, "rate": task.rate,
+                    "eta_seconds": task.eta, "finished": int(task.finished),
+                }[metric]
+                if value is not None:
+                    lines.append(f'{name}{{task="{task.task}",desc="{self.__label__(task.desc)}"}} {value}')
+        directory = os.path.dirname(os.path.abspath(self.__path__))
+        with tempfile.NamedTemporaryFile("w", dir=directory, delete=False, suffix=".tmp") as file:
+            file.write("\n".join(lines) + "\n")
+        os.replace(file.name, self.__path__)
+        return
+
+
+class TqdmSink(ProgressSink):
+    """
+    Show a `tqdm <https://tqdm.github.io/>`_ progress bar by task, if it is installed.
+    """
+    def __init__(self) -> None:
+        self.__bars__: Dict[int, Any] = dict()
+        self.__descriptions__: Dict[int, str] = dict()
+        return
+
+    def emit(self, event: ProgressEvent) -> None:
+        bar = self.__bars__.get(event.task)
+        if bar is None:
+            bar = get_optional_iterator(total=event.total, desc=event.desc, unit=event.unit)
+            if bar is None:
+                return
+            self.__bars__[event.task] = bar
+            self.__descriptions__[event.task] = event.desc
+        if self.__descriptions__[event.task] != event.desc:
+            bar.set_description(event.desc, refresh=False)
+            self.__descriptions__[event.task] = event.desc
+        if bar.total != event.total:
+            bar.total = event.total
+        if len(event.postfix) > 0:
+            bar.set_postfix(ordered_dict=event.postfix, refresh=False)
+        bar.update(event.done - bar.n)
+        if event.finished:
+            bar.close()
+            self.__bars__.pop(event.task)
+            self.__descriptions__.pop(event.task)
+        return
+
+    def close(self) -> None:
+        for bar in self.__bars__.values():
+            bar.close()
+        self.__bars__.clear()
+        self.__descriptions__.clear()
+        return
+
+
+__settings__: Dict[str, Any] = {
+    "sink": None,
+    "min_interval": 0.1,
+    "min_items": 0,
+}
+
+
+def configure_progress(
+        sink: ProgressSink | Callable[[ProgressEvent], None] | None = None,
+        min_interval: float = 0.1,
+        min_items: int = 0,
+) -> None:
+    """
+    Set where and how often the progress of long tasks is reported.
+
+    Parameters
+    ----------
+    sink : ProgressSink | Callable[[ProgressEvent], None] | None, optional
+        Destination of the events, a function receiving them, or None to use a :class:`TqdmSink` (default).
+    min_interval : float, optional
+        Minimum seconds between two events of the same task. Default `0.1`.
+    min_items : int, optional
+        Minimum items processed between two events of the same task. Default `0`.
+    """
+    if sink is not None and not isinstance(sink, ProgressSink):
+        sink = CallbackSink(sink)
+    __settings__["sink"] = sink
+    __settings__["min_interval"] = min_interval
+    __settings__["min_items"] = min_items
+    return
+
+
+def get_progress_sink() -> ProgressSink:
+    """
+    Sink of the progress events, see :func:`configure_progress`.
+
+    Returns
+    -------
+    ProgressSink
+        The configured sink.
+    """
+    if __settings__["sink"] is None:
+        __settings__["sink"] = TqdmSink()
+    return __settings__["sink"]
+
+
+class Progress:
+    """
+    Progress of a task, reported in batched events to the configured sink (see :func:`configure_progress`).
+
+    Parameters
+    ----------
+    total : int, optional
+        Total items to process, None if unknown.
+    desc : str, optional
+        Description of the task.
+    unit : str, optional
+        Unit of the items. Default `"it"`.
+    enabled : bool, optional
+        Report the progress, if `False` no event is generated. Default `True`.
+    sink : ProgressSink | Callable[[ProgressEvent], None], optional
+        Destination of the events, default the configured one.
+    """
+    __tasks__ = count()
+
+    def __init__(
+            self, total: int = None, desc: str = "", unit: str = "it",
+            enabled: bool = True, sink: ProgressSink | Callable[[ProgressEvent], None] = None,
+    ) -> None:
+        if not enabled:
+            sink = None
+        elif sink is None:
+            sink = get_progress_sink()
+        elif not isinstance(sink, ProgressSink):
+            sink = CallbackSink(sink)
+        self.__sink__ = sink
+        self.__task__ = next(Progress.__tasks__)
+        self.__total__ = total
+        self.__desc__ = desc
+        self.__unit__ = unit
+        self.__done__ = 0
+        self.__bytes__ = 0
+        self.__postfix__: Dict[str, Any] = dict()
+        self.__start__ = time.perf_counter()
+        self.__last_time__ = self.__start__
+        self.__last_done__ = 0
+        self.__closed__ = False
+        self.__min_interval__ = __settings__["min_interval"]
+        self.__min_items__ = __settings__["min_items"]
+        self.__emit__(finished=False)
+        return
+
+    @property
+    def enabled(self) -> bool:
+        """bool: The progress is reported."""
+        return self.__sink__ is not None
+
+    @property
+    def done(self) -> int:
+        """int: Items processed."""
+        return self.__done__
+
+    def __emit__(self, finished: bool) -> None:
+        if self.__sink__ is None:
+            return
+        now = time.perf_counter()
+        self.__last_time__ = now
+        self.__last_done__ = self.__done__
+        self.__sink__.emit(ProgressEvent(
+            self.__task__, self.__desc__, self.__unit__, self.__done__, self.__total__,
+            self.__bytes__, now - self.__start__, self.__postfix__, finished,
+        ))
+        return
+
+    def update(self, n: int = 1, n_bytes: int = 0) -> None:
+        """
+        Count items processed, reporting them if the granularity is reached.
+
+        Parameters
+        ----------
+        n : int, optional
+            Items processed. Default `1`.
+        n_bytes : int, optional
+            Bytes processed. Default `0`.
+        """
+        self.__done__ += n
+        self.__bytes__ += n_bytes
+        if self.__sink__ is None:
+            return
+        if (self.__done__ - self.__last_done__ >= self.__min_items__ and
+                time.perf_counter() - self.__last_time__ >= self.__min_interval__):
+            self.__emit__(finished=False)
+        return
+
+    def set_descriptor(self, desc: str) -> None:
+        """
+        Change the description of the task.
+
+        Parameters
+        ----------
+        desc : str
+            New description.
+        """
+        self.__desc__ = desc
+        return
+
+    def set_postfix(self, ordered_dict: Dict[str, Any] = None, **kwargs) -> None:
+        """
+        Set additional information of the task.
+
+        Parameters
+        ----------
+        ordered_dict : Dict[str, Any], optional
+            Information of the task.
+
+        Other Parameters
+        ----------------
+        Information of the task as keyword arguments.
+        """
+        self.__postfix__ = dict() if ordered_dict is None else dict(ordered_dict)
+        self.__postfix__.update(kwargs)
+        return
+
+    def reset(self, total: int = None) -> None:
+        """
+        Restart the count of the task.
+
+        Parameters
+        ----------
+        total : int, optional
+            New total items to process, default keeps the current one.
+        """
+        self.__done__ = 0
+        self.__bytes__ = 0
+        self.__last_done__ = 0
+        self.__start__ = time.perf_counter()
+        if total is not None:
+            self.__total__ = total
+        return
+
+    def close(self) -> None:
+        """
+        Finish the task, reporting its final state.
+        """
+        if not self.__closed__:
+            self.__closed__ = True
+            self.__emit__(finished=True)
+        return
+
+    def iterate(self, iterable: Iterable[T], batch_size: int = 1_000) -> Iterable[T]:
+        """
+        Iterate counting the items in batches and finishing the task at the end.
+
+        Parameters
+        ----------
+        iterable : Iterable[T]
+            Items to process.
+        batch_size : int, optional
+            Number of items counted at once. Default `1_000`.
+
+        Returns
+        -------
+        Iterable[T]
+            The same items, `iterable` itself if the progress is not reported.
+        """
+        if self.__sink__ is None:
+            return iterable
+        return self.__iterate__(iterable, batch_size)
+
+    def __iterate__(self, iterable: Iterable[T], batch_size: int) -> Iterator[T]:
+        pending = 0
+        for item in iterable:
+            yield item
+            pending += 1
+            if pending == batch_size:
+                self.update(pending)
+                pending = 0
+        self.update(pending)
+        self.close()
+        return
+
+    def __enter__(self) -> Progress:
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
+        return
+
+    def __repr__(self) -> str:
+        return f"<Progress [{self.__desc__}: {self.__done__}/{self.__total__} {self.__unit__}]>"
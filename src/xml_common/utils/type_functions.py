@@ -5,6 +5,8 @@ from warnings import warn
 
 from datetime_interval import Interval
 
+from xml_common.utils.diagnostics import Diagnostics, ANY_TYPE
+
 POSSIBLE_DATETIME_FORMATS = [
     "%Y-%m-%dT%H:%M:%S%z",
     "%Y-%m-%dT%H:%M%z",
@@ -66,7 +68,11 @@ def format_to_type(value: str, a_type: TypeAlias, address_value: bool = True) ->
                 )
             ])
         elif a_type == Any:
-            warn("<Any> type is not recommended as Type of field.")
+            diagnostics = Diagnostics.active()
+            if diagnostics is None:
+                warn("<Any> type is not recommended as Type of field.")
+            else:
+                diagnostics.record(ANY_TYPE, "<Any>")
             return value
         elif a_type == Interval:
             start_value, end_value = value.split("/")
@@ -0,0 +1,150 @@
+import datetime as dt
+import io
+import unittest
+import warnings
+
+from dwca import DarwinCoreArchive
+from dwca.classes import Occurrence, Location, Event, DataFileType
+from dwca.terms import OccurrenceID, DecimalLatitude, DecimalLongitude, LocationID, MinimumElevationInMeters, \
+    MaximumElevationInMeters, EventID, EventDate, DWCYear, DWCMonth, DWCDay, DWCModified
+from xml_common.utils import LengthUnit
+
+OCCURRENCES = """occurrenceID\tdecimalLatitude\tdecimalLongitude
+o1\t-33.4\t-70.6
+o2\t-18.5\t-69.3
+o3\t\t
+o4\t-53.1\t-70.9
+"""
+
+LOCATIONS = """id\tlocationID\tdecimalLatitude\tdecimalLongitude\tminimumElevationInMeters\tmaximumElevationInMeters
+o1\tl1\t-33.4\t-70.6\t500\t650
+o2\tl2\t-27.1\t-109.3\t\t
+o4\tl3\t-53.1\t-70.9\t0\t12
+"""
+
+EVENTS = """eventID\teventDate\tyear\tmonth\tday\tmodified
+e1\t2019-03-02\t2019\t3\t2\t2023-01-10
+e2\t2018-11/2019-01\t\t\t\t
+e3\t\t2015\t\t\t
+"""
+
+
+def build_events(lazy: bool = False) -> DarwinCoreArchive:
+    event = Event(
+        0, "event.txt", [
+            EventID(0), EventDate(1), DWCYear(2), DWCMonth(3), DWCDay(4), DWCModified(5)
+        ],
+        data_file_type=DataFileType.CORE, fields_terminated_by="\t", ignore_header_lines=1,
+    )
+    if lazy:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            event.read_file("", io.BytesIO(EVENTS.encode("utf-8")), lazy=True, _no_interaction=True)
+    else:
+        event.read_file(EVENTS, _no_interaction=True)
+    archive = DarwinCoreArchive("coverage")
+    archive.core = event
+    return archive
+
+
+def build_archive(lazy: bool = False) -> DarwinCoreArchive:
+    occurrence = Occurrence(
+        0, "occurrence.txt", [OccurrenceID(0), DecimalLatitude(1), DecimalLongitude(2)],
+        data_file_type=DataFileType.CORE, fields_terminated_by="\t", ignore_header_lines=1,
+    )
+    location = Location(
+        0, "location.txt", [
+            LocationID(1), DecimalLatitude(2), DecimalLongitude(3),
+            MinimumElevationInMeters(4), MaximumElevationInMeters(5),
+        ],
+        data_file_type=DataFileType.EXTENSION, fields_terminated_by="\t", ignore_header_lines=1,
+    )
+    if lazy:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            occurrence.read_file("", io.BytesIO(OCCURRENCES.encode("utf-8")), lazy=True, _no_interaction=True)
+            location.read_file("", io.BytesIO(LOCATIONS.encode("utf-8")), lazy=True, _no_interaction=True)
+    else:
+        occurrence.read_file(OCCURRENCES, _no_interaction=True)
+        location.read_file(LOCATIONS, _no_interaction=True)
+    archive = DarwinCoreArchive("coverage")
+    archive.extensions.append(location)
+    archive.core = occurrence
+    return archive
+
+
+class TestGeographicCoverage(unittest.TestCase):
+    def test_bounding_box(self):
+        coverage = build_archive().compute_geographic_coverage()
+        self.assertEqual(-109.3, coverage.west_bounding, "Incorrect west bounding")
+        self.assertEqual(-69.3, coverage.east_bounding, "Incorrect east bounding")
+        self.assertEqual(-18.5, coverage.north_bounding, "Incorrect north bounding")
+        self.assertEqual(-53.1, coverage.south_bounding, "Incorrect south bounding")
+        self.assertEqual(0, coverage.min_altitude_bounding, "Incorrect minimum elevation")
+        self.assertEqual(650, coverage.max_altitude_bounding, "Incorrect maximum elevation")
+        self.assertEqual(LengthUnit.METER, coverage.altitude_units_bounding, "Incorrect elevation units")
+        self.assertEqual(0, len(coverage.g_polygon), "Polygon not requested")
+
+    def test_hull(self):
+        coverage = build_archive().compute_geographic_coverage(hull=True)
+        self.assertEqual(1, len(coverage.g_polygon), "Polygon not generated")
+        self.assertEqual(
+            [(-53.1, -70.9), (-18.5, -69.3), (-27.1, -109.3)],
+            coverage.g_polygon[0].outer,
+            "Incorrect convex hull"
+        )
+        coverage = build_archive().compute_geographic_coverage(hull=True, max_vertices=3)
+        self.assertEqual(3, len(list(coverage.g_polygon[0].outer)), "Hull not simplified")
+
+    def test_lazy(self):
+        archive = build_archive(lazy=True)
+        coverage = archive.compute_geographic_coverage()
+        self.assertEqual(
+            (-109.3, -69.3, -18.5, -53.1),
+            (coverage.west_bounding, coverage.east_bounding, coverage.north_bounding, coverage.south_bounding),
+            "Incorrect bounding box on lazy mode"
+        )
+        batches = list(archive.core._iter_columns_(["occurrenceID"], batch_size=3))
+        self.assertEqual([(["o1", "o2", "o3"],), (["o4"],)], batches, "Incorrect batches on lazy mode")
+        self.assertTrue(archive.core.is_lazy(), "Data materialized")
+        archive.core.close()
+        archive.extensions[0].close()
+
+    def test_no_coordinates(self):
+        archive = DarwinCoreArchive("empty")
+        archive.core = Occurrence(0, "occurrence.txt", [OccurrenceID(0)])
+        self.assertRaisesRegex(ValueError, "No valid coordinates", archive.compute_geographic_coverage)
+
+
+class TestTemporalCoverage(unittest.TestCase):
+    def test_range(self):
+        coverage = build_events().compute_temporal_coverage()
+        self.assertEqual((dt.date(2015, 1, 1), dt.date(2023, 1, 10)), coverage.range_datetime, "Incorrect range")
+        coverage = build_events().compute_temporal_coverage(modified=False)
+        self.assertEqual((dt.date(2015, 1, 1), dt.date(2019, 3, 2)), coverage.range_datetime, "Incorrect range")
+
+    def test_lazy(self):
+        archive = build_events(lazy=True)
+        coverage = archive.compute_temporal_coverage(modified=False)
+        self.assertEqual(
+            (dt.date(2015, 1, 1), dt.date(2019, 3, 2)), coverage.range_datetime, "Incorrect range on lazy mode"
+        )
+        archive.core.close()
+
+    def test_single_dates(self):
+        archive = DarwinCoreArchive("single")
+        event = Event(0, "event.txt", [EventID(0), EventDate(1)], fields_terminated_by="\t")
+        event.read_file("e1\t2020-01-05\ne2\t2020-01-07\ne3\t2020-01-05", _no_interaction=True)
+        archive.core = event
+        coverage = archive.compute_temporal_coverage(max_single_dates=5)
+        self.assertEqual([dt.date(2020, 1, 5), dt.date(2020, 1, 7)], coverage.single_datetime, "Incorrect dates")
+        self.assertIsNone(coverage.range_datetime, "Range on single dates")
+
+    def test_no_dates(self):
+        archive = DarwinCoreArchive("empty")
+        archive.core = Occurrence(0, "occurrence.txt", [OccurrenceID(0)])
+        self.assertRaisesRegex(ValueError, "No valid dates", archive.compute_temporal_coverage)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -4,6 +4,8 @@ import unittest
 import zipfile
 
 from dwca import DarwinCoreArchive
+from dwca.classes import Occurrence, DataFileType
+from dwca.terms import OccurrenceID
 from eml import EML
 from eml.resources import EMLResource
 from eml.types import ResponsibleParty, IndividualName
@@ -98,5 +100,53 @@ class TestMultipleDataset(TestXML):
                 self.assertEqualTree(dwc.dataset_metadata["dataset_2"].to_element(), dataset2.to_element(), "Wrong parsed dataset 2")
 
 
+    def test_read_parallel_dataset(self):
+        occurrence = Occurrence(
+            0, "occurrence.txt", [OccurrenceID(0)],
+            data_file_type=DataFileType.CORE, fields_terminated_by="\t", ignore_header_lines=1,
+        )
+        occurrence.read_file("occurrenceID\no1\no2\n", _no_interaction=True)
+        dwc = DarwinCoreArchive("parallel")
+        dwc.core = occurrence
+        dwc.generate_eml("eml.xml")
+        dwc.metadata.initialize_resource(
+            "A Parallel Dataset Test",
+            ResponsibleParty(individual_name=IndividualName("Doe", "Example")),
+            contact=[ResponsibleParty(individual_name=IndividualName("Doe", "Jane"))]
+        )
+        for i in range(4):
+            dwc.dataset_metadata[f"dataset_{i}"] = EML(f"dataset_{i}", "http://gbif.org", EMLResource.DATASET)
+            dwc.dataset_metadata[f"dataset_{i}"].initialize_resource(
+                f"Extra dataset {i}",
+                ResponsibleParty(individual_name=IndividualName("Doe", "Example")),
+                contact=[ResponsibleParty(individual_name=IndividualName("Doe", "Jane"))]
+            )
+        with tempfile.NamedTemporaryFile("wb", suffix=".zip", delete=False) as file:
+            dwc.to_file(file.name)
+        try:
+            with zipfile.ZipFile(file.name, "a") as zipped_file:
+                zipped_file.writestr("dataset/broken.xml", "<eml:eml")
+                zipped_file.writestr("dataset/bad.xml", "<not eml")
+            with self.assertWarnsRegex(RuntimeWarning, "broken.xml"):
+                parallel = DarwinCoreArchive.from_file(file.name, workers=2, _no_interaction=True)
+            with self.assertWarnsRegex(RuntimeWarning, "bad.xml:\nXMLSyntaxError"):
+                DarwinCoreArchive.from_file(file.name, workers=2, _no_interaction=True)
+            with self.assertWarnsRegex(RuntimeWarning, "broken.xml"):
+                deferred = DarwinCoreArchive.from_file(file.name, lazy_metadata=True, _no_interaction=True)
+        finally:
+            os.remove(file.name)
+        self.assertEqual(5, len(parallel.dataset_metadata), "Incorrect number of metadata.")
+        self.assertTrue(deferred.dataset_metadata["dataset_2"].is_lazy(), "Metadata not deferred")
+        for i in range(4):
+            self.assertEqualTree(
+                dwc.dataset_metadata[f"dataset_{i}"].to_element(),
+                parallel.dataset_metadata[f"dataset_{i}"].to_element(),
+                f"Wrong parsed dataset {i} on parallel"
+            )
+            self.assertEqual(
+                f"Extra dataset {i}", str(deferred.dataset_metadata[f"dataset_{i}"].title), "Wrong deferred title"
+            )
+
+
 if __name__ == '__main__':
     unittest.main()
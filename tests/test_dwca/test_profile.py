@@ -0,0 +1,90 @@
+import os
+import tempfile
+import unittest
+
+from dwca import DarwinCoreArchive
+from dwca.classes import Occurrence, Location, DataFileType
+from dwca.terms import OccurrenceID, DecimalLatitude, DecimalLongitude, LocationID
+from dwca.utils import StageProfile
+from eml.types import ResponsibleParty, IndividualName
+
+OCCURRENCES = """occurrenceID\tdecimalLatitude\tdecimalLongitude
+o1\t-33.4\t-70.6
+o2\t-18.5\t-69.3
+o3\t\t
+o4\t-53.1\t-70.9
+"""
+
+LOCATIONS = """id\tlocationID\tdecimalLatitude\tdecimalLongitude
+o1\tl1\t-33.4\t-70.6
+o2\tl2\t-27.1\t-109.3
+o4\tl3\t-53.1\t-70.9
+"""
+
+
+def build_archive() -> DarwinCoreArchive:
+    occurrence = Occurrence(
+        0, "occurrence.txt", [OccurrenceID(0), DecimalLatitude(1), DecimalLongitude(2)],
+        data_file_type=DataFileType.CORE, fields_terminated_by="\t", ignore_header_lines=1,
+    )
+    occurrence.read_file(OCCURRENCES, _no_interaction=True)
+    location = Location(
+        0, "location.txt", [LocationID(1), DecimalLatitude(2), DecimalLongitude(3)],
+        data_file_type=DataFileType.EXTENSION, fields_terminated_by="\t", ignore_header_lines=1,
+    )
+    location.read_file(LOCATIONS, _no_interaction=True)
+    archive = DarwinCoreArchive("profile")
+    archive.extensions.append(location)
+    archive.core = occurrence
+    return archive
+
+
+class TestProfile(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "archive.zip")
+        archive = build_archive()
+        archive.generate_eml()
+        archive.metadata.initialize_resource(
+            "Profile test",
+            ResponsibleParty(individual_name=IndividualName("Doe", "Example")),
+            contact=[ResponsibleParty(individual_name=IndividualName("Doe", "Jane"))]
+        )
+        self.archive = archive
+        return
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+        return
+
+    def test_to_file(self):
+        profile = StageProfile()
+        self.archive.to_file(self.path, _no_interaction=True, profile=profile)
+        stages = {(record.stage, record.member) for record in profile.records}
+        for member in ("meta.xml", "eml.xml", "occurrence.txt", "location.txt"):
+            for stage in ("serialize", "encode", "compress"):
+                self.assertIn((stage, member), stages, f"Missing {stage} of {member}")
+        self.assertIn(("zip_write", None), stages, "Missing write of the archive")
+        rows = {record.member: record.rows for record in profile.records if record.stage == "serialize"}
+        self.assertEqual(4, rows["occurrence.txt"], "Incorrect rows serialized")
+
+    def test_from_file(self):
+        self.archive.to_file(self.path, _no_interaction=True)
+        measures = list()
+        darwin_core = DarwinCoreArchive.from_file(self.path, _no_interaction=True, profile=measures.append)
+        self.assertEqual(4, len(darwin_core.core), "Archive not read")
+        profile = StageProfile()
+        DarwinCoreArchive.from_file(self.path, _no_interaction=True, profile=profile)
+        stages = {(record.stage, record.member): record for record in profile.records}
+        for stage in ("zip_read", "decompress", "decode", "tokenize", "convert", "entries"):
+            self.assertIn((stage, "occurrence.txt"), stages, f"Missing {stage} of the core")
+        self.assertIn(("eml_parse", "eml.xml"), stages, "Missing EML parse")
+        self.assertEqual(4, stages[("entries", "occurrence.txt")].rows, "Incorrect rows of the core")
+        self.assertEqual(3, stages[("convert", "location.txt")].rows, "Incorrect rows of the extension")
+        self.assertEqual(
+            len(measures), sum(record.calls for record in profile.records), "Callback not called on every measure"
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,235 @@
+import os
+import tempfile
+import unittest
+import zipfile
+
+from dwca import SimpleDarwinCore, DarwinCoreArchive
+from dwca.base.simple_darwincore import SimpleDarwinCoreWriter
+from dwca.classes import Occurrence, Taxon, Event, Location
+from dwca.terms import OccurrenceID, ScientificName, IndividualCount, OutsideTerm
+from dwca.utils import StageProfile, COLUMN_COUNT
+from eml.types import ResponsibleParty, IndividualName
+from xml_common.utils import Diagnostics, UNKNOWN_TERM, CONVERSION_FAILURE
+
+CONTENT = (
+    "occurrenceID,dwc:scientificName,http://rs.tdwg.org/dwc/terms/individualCount,projectCode\n"
+    "\n"
+    'occ-1,"Puma concolor (Linnaeus, 1771)",2,P1\n'
+    "occ-2,Felis catus,x,P1\n"
+    'occ-3,Panthera onca,1,"two\n'
+    'lines"\n'
+)
+
+
+class TestSimpleDarwinCore(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "occurrence.csv")
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write(CONTENT)
+        return
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+        return
+
+    def read(self, path: str = None, **kwargs) -> SimpleDarwinCore:
+        diagnostics = Diagnostics()
+        simple = SimpleDarwinCore.from_file(
+            self.path if path is None else path, _no_interaction=True, diagnostics=diagnostics, **kwargs
+        )
+        self.diagnostics = diagnostics
+        return simple
+
+    def test_from_file(self):
+        simple = self.read()
+        self.assertEqual(3, len(simple), "Incorrect number of records")
+        self.assertIs(Occurrence, simple.row_class, "Incorrect class of the records")
+        fields = simple.data.__fields__
+        self.assertEqual(
+            [OccurrenceID, ScientificName, IndividualCount, OutsideTerm], [type(field) for field in fields],
+            "Header not resolved to terms"
+        )
+        entries = simple.data.__entries__
+        self.assertEqual("Puma concolor (Linnaeus, 1771)", entries[0].scientificName, "Quoted cell not read")
+        self.assertEqual(2, entries[0].individualCount, "Value not converted")
+        self.assertIsNone(entries[1].individualCount, "Invalid value not set to None")
+        self.assertEqual("two\nlines", entries[2].projectCode, "Multi-line cell not read")
+        self.assertEqual({"projectCode": 1}, self.diagnostics.counts[UNKNOWN_TERM], "Unknown term not collected")
+        self.assertEqual(
+            {"individualCount": 1}, self.diagnostics.counts[CONVERSION_FAILURE], "Conversion failure not collected"
+        )
+
+    def test_row_class(self):
+        path = os.path.join(self.directory.name, "taxon.txt")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("taxonID\tscientificName\n1\tPuma concolor\n2\tPuma\n")
+        simple = self.read(path, row_class=Taxon)
+        self.assertIs(Taxon, simple.row_class, "Incorrect class of the records")
+        self.assertEqual(["1", "2"], [entry.taxonID for entry in simple.data.__entries__], "Tabs not detected")
+
+    def test_only_header(self):
+        path = os.path.join(self.directory.name, "empty.csv")
+        with open(path, "w", encoding="utf-8") as file:
+            file.write("occurrenceID,scientificName\n")
+        simple = self.read(path)
+        self.assertEqual(0, len(simple), "Records on an empty file")
+        self.assertEqual(["occurrenceID", "scientificName"], [field.name for field in simple.data.__fields__],
+                         "Header not read")
+        frames = list(SimpleDarwinCore.iter_pandas(path, diagnostics=Diagnostics()))
+        self.assertEqual([0], [len(frame) for frame in frames], "Incorrect chunks of an empty file")
+        self.assertEqual(["occurrenceID", "scientificName"], list(frames[0].columns), "Incorrect empty columns")
+
+    def test_iter(self):
+        chunks = list(SimpleDarwinCore.iter_entries(self.path, chunk_size=2, diagnostics=Diagnostics()))
+        self.assertEqual([2, 1], [len(chunk) for chunk in chunks], "Incorrect chunks")
+        frames = list(SimpleDarwinCore.iter_pandas(self.path, chunk_size=3, diagnostics=Diagnostics()))
+        self.assertEqual([1, 2], [len(frame) for frame in frames], "Incorrect pandas chunks")
+        self.assertEqual("occurrenceID", frames[0].columns[0], "Incorrect pandas columns")
+        frames = list(SimpleDarwinCore.iter_polars(self.path, chunk_size=3, diagnostics=Diagnostics()))
+        self.assertEqual([1, 2], [len(frame) for frame in frames], "Incorrect polars chunks")
+        self.assertEqual([None, 1], frames[1]["individualCount"].to_list(), "Incorrect polars values")
+
+    def test_quarantine(self):
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write("occ-4,Puma\n")
+        rows = list()
+        profile = StageProfile()
+        simple = self.read(quarantine=rows, profile=profile)
+        self.assertEqual(3, len(simple), "Incorrect number of records")
+        self.assertEqual(1, len(rows), "Malformed row not set apart")
+        self.assertEqual(COLUMN_COUNT, rows[0].kind, "Incorrect kind")
+        self.assertEqual(6, rows[0].line_number, "Incorrect line number")
+        stages = {record.stage for record in profile.records}
+        self.assertTrue({"tokenize", "quarantine", "convert", "entries"} <= stages, "Missing stages")
+
+    def test_to_file(self):
+        simple = self.read()
+        path = os.path.join(self.directory.name, "copy.csv")
+        simple.to_file(path, _no_interaction=True)
+        copy = self.read(path)
+        self.assertEqual(simple.fields, copy.fields, "Incorrect header")
+        self.assertEqual(
+            [entry.to_dict() for entry in simple.data.__entries__],
+            [entry.to_dict() for entry in copy.data.__entries__],
+            "Incorrect records"
+        )
+        path = os.path.join(self.directory.name, "copy.tsv")
+        simple.to_file(path, _no_interaction=True)
+        with open(path, encoding="utf-8") as file:
+            self.assertEqual(
+                "occurrenceID\tscientificName\tindividualCount\tprojectCode", file.readline().rstrip("\n"),
+                "Incorrect header"
+            )
+
+    def test_writer(self):
+        path = os.path.join(self.directory.name, "stream.csv")
+        chunks = SimpleDarwinCore.iter_entries(self.path, chunk_size=2, diagnostics=Diagnostics())
+        first = next(chunks)
+        template = self.read().data
+        with SimpleDarwinCoreWriter(path, template) as writer:
+            writer.write(first)
+            for chunk in chunks:
+                writer.write(chunk)
+        self.assertEqual(3, writer.count, "Incorrect number of records written")
+        self.assertEqual(3, len(self.read(path)), "Records not written")
+
+
+FLAT = (
+    "occurrenceID\tscientificName\teventID\teventDate\tlocationID\tdecimalLatitude\tbasisOfRecord\n"
+    "o1\tPuma concolor\te1\t2020-01-02\tl1\t-33.4\tHumanObservation\n"
+    "o1\tPuma concolor\te1\t2020-01-02\tl2\t-33.5\tHumanObservation\n"
+    "o2\tFelis catus\te2\t2021-05-01\tl1\t-33.4\tPreservedSpecimen\n"
+    "o3\tFelis catus\t\t\t\t\tPreservedSpecimen\n"
+)
+
+
+class TestSimpleArchive(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, "flat.tsv")
+        with open(self.path, "w", encoding="utf-8") as file:
+            file.write(FLAT)
+        return
+
+    def tearDown(self) -> None:
+        self.directory.cleanup()
+        return
+
+    def split(self) -> DarwinCoreArchive:
+        return DarwinCoreArchive.from_simple(
+            self.path, extensions=[Event, Location], _id="simple", diagnostics=Diagnostics()
+        )
+
+    def test_from_simple(self):
+        archive = self.split()
+        self.assertIsInstance(archive.core, Occurrence, "Incorrect core")
+        self.assertEqual(
+            ["occurrenceID", "scientificName", "basisOfRecord"], [field.name for field in archive.core.__fields__],
+            "Incorrect terms of the core"
+        )
+        self.assertEqual(["o1", "o2", "o3"], [entry.occurrenceID for entry in archive.core.__entries__],
+                         "Core records not unique")
+        event, location = archive.extensions
+        self.assertEqual(["e1", "e2"], [entry.eventID for entry in event.__entries__], "Repeated rows not removed")
+        self.assertEqual(["l1", "l2", "l1"], [entry.locationID for entry in location.__entries__],
+                         "One-to-many rows not kept")
+        self.assertEqual(["o1", "o1", "o2"], [entry.occurrenceID for entry in location.__entries__],
+                         "Incorrect core identifier")
+        self.assertIn('FOREIGN KEY ("occurrenceID") REFERENCES "Occurrence"', location.generate_sql_table(),
+                      "Incorrect SQL table of the extension")
+        simple = SimpleDarwinCore.from_file(self.path, _no_interaction=True, diagnostics=Diagnostics())
+        only_core = DarwinCoreArchive.from_simple(simple)
+        self.assertEqual(0, len(only_core.extensions), "Extensions without classes")
+        self.assertIn("eventDate", [field.name for field in only_core.core.__fields__], "Terms not kept on the core")
+        self.assertRaisesRegex(AssertionError, "taxonID", DarwinCoreArchive.from_simple, simple, Taxon)
+
+    def test_to_file(self):
+        archive = self.split()
+        archive.generate_eml()
+        archive.metadata.initialize_resource(
+            "Simple test",
+            ResponsibleParty(individual_name=IndividualName("Doe", "Example")),
+            contact=[ResponsibleParty(individual_name=IndividualName("Doe", "Jane"))]
+        )
+        path = os.path.join(self.directory.name, "archive.zip")
+        archive.to_file(path, _no_interaction=True)
+        read = DarwinCoreArchive.from_file(path, _no_interaction=True, diagnostics=Diagnostics())
+        self.assertEqual(3, len(read.core.__entries__), "Core not written")
+        self.assertEqual([2, 3], [len(extension.__entries__) for extension in read.extensions],
+                         "Extensions not written")
+        with zipfile.ZipFile(path) as zip_file:
+            for filename in ["event.txt", "location.txt"]:
+                header = zip_file.read(filename).decode("utf-8").split("\n")[0]
+                self.assertEqual("occurrenceID", header.split("\t")[0], f"Core identifier not written on {filename}")
+        for extension in read.extensions:
+            self.assertEqual("occurrenceID", extension.__fields__[extension.id].name, "Core identifier not read")
+            self.assertIn('REFERENCES "Occurrence"', extension.generate_sql_table(), "Incorrect SQL table")
+
+    def test_to_simple(self):
+        archive = self.split()
+        simple = archive.to_simple()
+        self.assertEqual(4, len(simple), "Incorrect number of rows")
+        self.assertEqual(
+            ["occurrenceID", "scientificName", "basisOfRecord", "eventID", "eventDate", "locationID",
+             "decimalLatitude"], [field.name for field in simple.data.__fields__], "Incorrect columns"
+        )
+        self.assertEqual(
+            [("o1", "l1"), ("o1", "l2"), ("o2", "l1"), ("o3", None)],
+            [(entry.occurrenceID, entry.locationID) for entry in simple.data.__entries__], "Incorrect rows"
+        )
+        self.assertEqual(
+            3, len(archive.to_simple(extensions=[Event]).data.__entries__), "Extensions not selected"
+        )
+        path = os.path.join(self.directory.name, "flat.csv")
+        self.assertEqual(4, archive.write_simple(path), "Incorrect number of rows written")
+        again = DarwinCoreArchive.from_simple(path, extensions=[Event, Location], diagnostics=Diagnostics())
+        self.assertEqual(
+            [len(data_file.__entries__) for data_file in [archive.core] + archive.extensions],
+            [len(data_file.__entries__) for data_file in [again.core] + again.extensions],
+            "Incorrect round trip"
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
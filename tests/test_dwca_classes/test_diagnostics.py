@@ -0,0 +1,105 @@
+import os
+import tempfile
+import unittest
+import warnings
+
+from lxml import etree as et
+
+from dwca import DarwinCoreArchive
+from dwca.classes import Occurrence, DataFileType, OutsideClass
+from dwca.terms import OccurrenceID, DecimalLatitude, DWCDataGeneralizations, OutsideTerm
+from eml.types import ResponsibleParty, IndividualName
+from xml_common.utils import Diagnostics, ANY_TYPE, CONVERSION_FAILURE, UNKNOWN_TERM, UNKNOWN_CLASS
+
+OCCURRENCES = """occurrenceID\tdecimalLatitude\tdataGeneralizations
+o1\t-33.4\tnone
+o2\tnorth\t
+o3\t\tcoarse
+o4\t12,5\tnone
+"""
+
+VALID_OCCURRENCES = """occurrenceID\tdecimalLatitude
+o1\t-33.4
+o2\t-18.5
+o3\t
+o4\t-53.1
+"""
+
+
+def build_occurrence() -> Occurrence:
+    return Occurrence(
+        0, "occurrence.txt", [OccurrenceID(0), DecimalLatitude(1), DWCDataGeneralizations(2)],
+        data_file_type=DataFileType.CORE, fields_terminated_by="\t", ignore_header_lines=1,
+    )
+
+
+class TestDiagnostics(unittest.TestCase):
+    def test_read_file(self):
+        occurrence = build_occurrence()
+        diagnostics = Diagnostics()
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            occurrence.read_file(OCCURRENCES, _no_interaction=True, diagnostics=diagnostics)
+        self.assertEqual(4, len(occurrence), "Rows not read")
+        self.assertEqual({"decimalLatitude": 2}, diagnostics.counts[CONVERSION_FAILURE], "Incorrect failures")
+        self.assertEqual(["north", "12,5"], diagnostics.samples[CONVERSION_FAILURE]["decimalLatitude"],
+                         "Incorrect samples")
+        self.assertEqual({"dataGeneralizations": 4}, diagnostics.counts[ANY_TYPE], "Incorrect values as text")
+        self.assertEqual(["none", "", "coarse", "none"], occurrence.__column__("dataGeneralizations"),
+                         "Values not kept")
+
+    def test_read_file_summary(self):
+        occurrence = build_occurrence()
+        with self.assertWarnsRegex(UserWarning, "6 issues found on occurrence.txt") as context:
+            occurrence.read_file(OCCURRENCES, _no_interaction=True)
+        self.assertEqual(1, len(context.warnings), "Warning by value")
+
+    def test_unknown(self):
+        element = et.Element("field")
+        element.set("index", "1")
+        element.set("term", "http://example.org/terms/unknown")
+        with Diagnostics.collect(Diagnostics()) as diagnostics:
+            self.assertIs(OutsideTerm, Occurrence.get_term_class(element), "Unknown term resolved")
+            element.set("rowType", "http://example.org/terms/Unknown")
+            self.assertIs(OutsideClass, DarwinCoreArchive.Metadata.get_dwc_class(element), "Unknown class resolved")
+        self.assertEqual(
+            {"http://example.org/terms/unknown": 1}, diagnostics.counts[UNKNOWN_TERM], "Unknown term not counted"
+        )
+        self.assertEqual(
+            {"http://example.org/terms/Unknown": 1}, diagnostics.counts[UNKNOWN_CLASS], "Unknown class not counted"
+        )
+
+    def test_from_file(self):
+        occurrence = Occurrence(
+            0, "occurrence.txt", [OccurrenceID(0), DecimalLatitude(1)],
+            data_file_type=DataFileType.CORE, fields_terminated_by="\t", ignore_header_lines=1,
+        )
+        occurrence.read_file(VALID_OCCURRENCES, _no_interaction=True)
+        archive = DarwinCoreArchive("diagnostics")
+        archive.core = occurrence
+        archive.generate_eml()
+        archive.metadata.initialize_resource(
+            "Diagnostics test",
+            ResponsibleParty(individual_name=IndividualName("Doe", "Example")),
+            contact=[ResponsibleParty(individual_name=IndividualName("Doe", "Jane"))]
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "archive.zip")
+            archive.to_file(path, _no_interaction=True)
+            diagnostics = Diagnostics()
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                darwin_core = DarwinCoreArchive.from_file(path, _no_interaction=True, diagnostics=diagnostics)
+            self.assertIs(diagnostics, darwin_core.diagnostics, "Collector not kept")
+            self.assertEqual(0, diagnostics.count(CONVERSION_FAILURE), "Conversion failures on a valid archive")
+            # Occurrence does not declare the coordinates, they are read as outside terms
+            self.assertIn(DecimalLatitude.URI, diagnostics.counts[UNKNOWN_TERM], "Unknown term not collected")
+            with self.assertWarnsRegex(UserWarning, "issues found"):
+                self.assertIsNotNone(
+                    DarwinCoreArchive.from_file(path, _no_interaction=True).diagnostics, "No collector"
+                )
+        self.assertIsNone(archive.diagnostics, "Collector on a new archive")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,51 @@
+import unittest
+
+from dwca.classes import Event, Occurrence, DataFileType
+from dwca.terms import EventID, ParentEventID, OccurrenceID, IndividualCount
+
+EVENTS = """eventID\tparentEventID
+s1\t
+v1\ts1
+v2\ts1
+p1\tv1
+"""
+
+OCCURRENCES = """id\toccurrenceID\tindividualCount
+p1\to1\t2
+p1\to2\t3
+v2\to3\t
+s1\to4\t1
+"""
+
+
+class TestEvent(unittest.TestCase):
+    def setUp(self) -> None:
+        self.events = Event(
+            0, "event.txt", [EventID(0), ParentEventID(1)],
+            data_file_type=DataFileType.CORE, fields_terminated_by="\t", ignore_header_lines=1,
+        )
+        self.events.read_file(EVENTS, _no_interaction=True)
+        return
+
+    def test_hierarchy(self):
+        hierarchy = self.events.hierarchy()
+        self.assertIs(hierarchy, self.events.hierarchy(), "Hierarchy not kept")
+        self.assertEqual(2, hierarchy.depth("p1"), "Incorrect depth")
+        self.events._filter_rows_([True, True, False, True])
+        self.assertNotIn("v2", self.events.hierarchy(), "Hierarchy not rebuilt after filtering")
+
+    def test_rollup(self):
+        occurrences = Occurrence(
+            0, "occurrence.txt", [OccurrenceID(1), IndividualCount(2)],
+            data_file_type=DataFileType.EXTENSION, fields_terminated_by="\t", ignore_header_lines=1,
+        )
+        occurrences.read_file(OCCURRENCES, _no_interaction=True)
+        self.assertEqual({"s1": 4}, self.events.rollup(occurrences), "Incorrect occurrences per survey")
+        self.assertEqual(
+            {"s1": 6, "v1": 5, "p1": 5}, self.events.rollup(occurrences, values="individualCount", level=None),
+            "Incorrect individuals per event"
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
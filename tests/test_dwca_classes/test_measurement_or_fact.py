@@ -0,0 +1,66 @@
+import unittest
+
+from dwca.classes import MeasurementOrFact, Occurrence, DataFileType
+from dwca.terms import OccurrenceID, ScientificName, MeasurementID, MeasurementType, MeasurementValue
+from xml_common.utils import Diagnostics, CONVERSION_FAILURE
+
+MEASUREMENTS = """id\tmeasurementID\tmeasurementType\tmeasurementValue
+o1\tm1\tlength\t3.5
+o1\tm2\tweight\t10
+o2\tm3\tlength\t4
+o2\tm4\tlength\t6
+o3\tm5\tweight\tabc
+o9\tm6\tlength\t1
+"""
+
+OCCURRENCES = """occurrenceID\tscientificName
+o1\tPuma concolor
+o2\tFelis catus
+o3\tPanthera onca
+o4\tLynx rufus
+"""
+
+
+def build_measurements() -> MeasurementOrFact:
+    measurements = MeasurementOrFact(
+        0, "measurementorfact.txt", [MeasurementID(1), MeasurementType(2), MeasurementValue(3)],
+        data_file_type=DataFileType.EXTENSION, fields_terminated_by="\t", ignore_header_lines=1,
+    )
+    measurements.read_file(MEASUREMENTS, _no_interaction=True, diagnostics=Diagnostics())
+    return measurements
+
+
+class TestMeasurementOrFact(unittest.TestCase):
+    def setUp(self) -> None:
+        self.measurements = build_measurements()
+        self.diagnostics = Diagnostics()
+        return
+
+    def test_pivot(self):
+        frame = self.measurements.pivot(agg="mean", diagnostics=self.diagnostics)
+        self.assertEqual(["id", "length", "weight"], list(frame.columns), "Incorrect columns")
+        self.assertEqual(["o1", "o2", "o9"], frame["id"].to_list(), "Incorrect rows")
+        self.assertEqual([3.5, 5.0, 1.0], frame["length"].to_list(), "Incorrect mean")
+        self.assertEqual("float64", str(frame["weight"].dtype), "Values not typed")
+        self.assertEqual({"weight": 1}, self.diagnostics.counts[CONVERSION_FAILURE], "Failure not collected")
+        frame = self.measurements.pivot(agg="count", output="polars", diagnostics=self.diagnostics)
+        self.assertEqual([1, 2, 1], frame["length"].to_list(), "Incorrect count")
+        table = self.measurements.pivot(value_type=str, types=["weight"], output="dict")
+        self.assertEqual({"id": ["o1", "o3"], "weight": ["10", "abc"]}, table, "Incorrect types")
+
+    def test_pivot_core(self):
+        core = Occurrence(
+            0, "occurrence.txt", [OccurrenceID(0), ScientificName(1)],
+            data_file_type=DataFileType.CORE, fields_terminated_by="\t", ignore_header_lines=1,
+        )
+        core.read_file(OCCURRENCES, _no_interaction=True)
+        table = self.measurements.pivot(core=core, output="dict", diagnostics=self.diagnostics)
+        self.assertEqual(
+            ["occurrenceID", "scientificName", "length", "weight"], list(table.keys()), "Core not joined"
+        )
+        self.assertEqual(["o1", "o2", "o3", "o4"], table["occurrenceID"], "Rows not of the core")
+        self.assertEqual([3.5, 4.0, None, None], table["length"], "Incorrect values")
+
+
+if __name__ == '__main__':
+    unittest.main()
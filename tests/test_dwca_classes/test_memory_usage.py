@@ -0,0 +1,125 @@
+import importlib.util
+import io
+import unittest
+import warnings
+
+from dwca import DarwinCoreArchive
+from dwca.classes import data_file, Occurrence, Location, DataFileType
+from dwca.terms import OccurrenceID, DecimalLatitude, DecimalLongitude, LocationID
+
+OCCURRENCES = """occurrenceID\tdecimalLatitude\tdecimalLongitude
+o1\t-33.4\t-70.6
+o2\t-18.5\t-69.3
+o3\t\t
+o4\t-53.1\t-70.9
+"""
+
+LOCATIONS = """id\tlocationID\tdecimalLatitude\tdecimalLongitude
+o1\tl1\t-33.4\t-70.6
+o2\tl2\t-27.1\t-109.3
+o4\tl3\t-53.1\t-70.9
+"""
+
+
+def build_occurrence() -> Occurrence:
+    occurrence = Occurrence(
+        0, "occurrence.txt", [OccurrenceID(0), DecimalLatitude(1), DecimalLongitude(2)],
+        data_file_type=DataFileType.CORE, fields_terminated_by="\t", ignore_header_lines=1,
+    )
+    occurrence.read_file(OCCURRENCES, _no_interaction=True)
+    return occurrence
+
+
+def build_archive(lazy: bool = False) -> DarwinCoreArchive:
+    location = Location(
+        0, "location.txt", [LocationID(1), DecimalLatitude(2), DecimalLongitude(3)],
+        data_file_type=DataFileType.EXTENSION, fields_terminated_by="\t", ignore_header_lines=1,
+    )
+    if lazy:
+        occurrence = Occurrence(
+            0, "occurrence.txt", [OccurrenceID(0), DecimalLatitude(1), DecimalLongitude(2)],
+            data_file_type=DataFileType.CORE, fields_terminated_by="\t", ignore_header_lines=1,
+        )
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            occurrence.read_file("", io.BytesIO(OCCURRENCES.encode("utf-8")), lazy=True, _no_interaction=True)
+            location.read_file("", io.BytesIO(LOCATIONS.encode("utf-8")), lazy=True, _no_interaction=True)
+    else:
+        occurrence = build_occurrence()
+        location.read_file(LOCATIONS, _no_interaction=True)
+    archive = DarwinCoreArchive("memory")
+    archive.extensions.append(location)
+    archive.core = occurrence
+    return archive
+
+
+class TestMemoryUsage(unittest.TestCase):
+    def test_entries(self):
+        usage = build_occurrence().memory_usage()
+        self.assertEqual("occurrence.txt", usage.name, "Incorrect name")
+        self.assertEqual({"entries", "data", "indexes"}, set(usage.components.keys()), "Incorrect components")
+        self.assertGreater(usage.components["entries"], 0, "Entries not measured")
+        self.assertEqual(0, usage.components["data"], "Data frame not cached")
+        self.assertEqual(
+            {"occurrenceID", "decimalLatitude", "decimalLongitude"}, set(usage.columns.keys()), "Incorrect columns"
+        )
+        self.assertEqual(0, usage.disk, "Files on disk")
+
+    def test_sample(self):
+        archive = build_archive()
+        original = data_file.MEMORY_SAMPLE_SIZE
+        data_file.MEMORY_SAMPLE_SIZE = 2
+        try:
+            estimated = archive.core.memory_usage(deep=False)
+        finally:
+            data_file.MEMORY_SAMPLE_SIZE = original
+        exact = archive.core.memory_usage(deep=True)
+        self.assertAlmostEqual(exact.total, estimated.total, delta=exact.total * 0.5, msg="Bad estimation")
+
+    def test_data_frames(self):
+        occurrence = build_occurrence()
+        before = occurrence.memory_usage()
+        try:
+            occurrence.as_pandas(_no_interaction=True)
+        except ImportError:
+            return
+        after = occurrence.memory_usage()
+        self.assertGreater(after.components["data"], 0, "Data frame not measured")
+        self.assertEqual(before.components["entries"], after.components["entries"], "Entries changed")
+        self.assertGreater(after.columns["occurrenceID"], before.columns["occurrenceID"], "Column not added")
+
+    def test_indexes(self):
+        archive = build_archive()
+        before = archive.core.memory_usage().components["indexes"]
+        archive.core.__indexes__["test"] = ["x" * 1000]
+        self.assertGreater(archive.core.memory_usage().components["indexes"], before + 1000, "Index not measured")
+
+    def test_lazy(self):
+        if importlib.util.find_spec("polars") is None:
+            self.skipTest("polars not installed")
+        archive = build_archive(lazy=True)
+        usage = archive.core.memory_usage()
+        self.assertEqual(1, len(usage.files), "Temporal file not reported")
+        self.assertGreater(usage.disk, 0, "Temporal file size")
+        for data_file_ in [archive.core] + archive.extensions:
+            data_file_.close()
+
+    def test_archive(self):
+        archive = build_archive()
+        self.assertEqual(["occurrence.txt", "location.txt"], list(archive.memory_usage().keys()),
+                         "Metadata reported without metadata")
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            archive.generate_eml()
+        usage = archive.memory_usage()
+        self.assertEqual(["occurrence.txt", "location.txt", "eml.xml"], list(usage.keys()), "Incorrect members")
+        self.assertGreater(usage["eml.xml"].components["metadata"], 0, "Metadata not measured")
+        estimated = archive.memory_usage(deep=False)
+        self.assertEqual(
+            usage["location.txt"].components["entries"], estimated["location.txt"].components["entries"],
+            "Small files not exact"
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
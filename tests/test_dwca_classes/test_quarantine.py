@@ -0,0 +1,125 @@
+import os
+import tempfile
+import unittest
+import warnings
+
+from dwca import DarwinCoreArchive
+from dwca.classes import Event, DataFileType
+from dwca.terms import EventID, EventDate, DWCYear
+from dwca.utils import ListQuarantine, FileQuarantine, COLUMN_COUNT, CONVERSION
+from eml.types import ResponsibleParty, IndividualName
+
+EVENTS = """eventID\teventDate\tyear
+e1\t2019-03-02\t2019
+
+e2\t2018-11/2019-01
+e3\tnot a date\t2015
+e4\t\t2015\textra
+e5\t2020-01-01\t2020
+"""
+
+VALID_EVENTS = """eventID\teventDate\tyear
+e1\t2019-03-02\t2019
+e2\t2018-11/2019-01\t
+e3\t\t2015
+e4\t2020-01-01\t2020
+"""
+
+
+def build_event() -> Event:
+    return Event(
+        0, "event.txt", [EventID(0), EventDate(1), DWCYear(2)],
+        data_file_type=DataFileType.CORE, fields_terminated_by="\t", ignore_header_lines=1,
+    )
+
+
+class TestQuarantine(unittest.TestCase):
+    def test_strict(self):
+        self.assertRaisesRegex(
+            TypeError, "not a date", build_event().read_file, EVENTS, _no_interaction=True
+        )
+
+    def test_list(self):
+        event = build_event()
+        rows = list()
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            event.read_file(EVENTS, _no_interaction=True, quarantine=rows)
+        self.assertEqual(["e1", "e5"], event.__column__("eventID"), "Incorrect rows kept")
+        self.assertEqual(
+            [(4, COLUMN_COUNT), (5, CONVERSION), (6, COLUMN_COUNT)],
+            sorted((row.line_number, row.kind) for row in rows),
+            "Incorrect rows set apart"
+        )
+        by_line = {row.line_number: row for row in rows}
+        self.assertEqual("Expected 3 cells, found 2", by_line[4].reason, "Incorrect reason")
+        self.assertIn("not a date", by_line[5].reason, "Incorrect conversion reason")
+        self.assertEqual(["e3", "not a date", "2015"], by_line[5].cells, "Incorrect cells")
+        self.assertEqual("event.txt", by_line[6].filename, "Incorrect filename")
+
+    def test_counts(self):
+        quarantine = ListQuarantine()
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            build_event().read_file(EVENTS, _no_interaction=True, quarantine=quarantine)
+        self.assertEqual(3, quarantine.count, "Incorrect count")
+        self.assertEqual({COLUMN_COUNT: 2, CONVERSION: 1}, quarantine.counts, "Incorrect counts")
+
+    def test_file(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "quarantine.tsv")
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                build_event().read_file(EVENTS, _no_interaction=True, quarantine=path)
+            with open(path, encoding="utf-8") as file:
+                lines = file.read().splitlines()
+            self.assertEqual(3, len(lines), "Incorrect number of lines")
+            self.assertEqual(
+                "event.txt\t4\tcolumn_count\tExpected 3 cells, found 2\te2\t2018-11/2019-01", lines[0],
+                "Incorrect line"
+            )
+            quarantine = FileQuarantine(path)
+            quarantine.close()
+            self.assertEqual(0, quarantine.count, "Rows on a new quarantine")
+
+    def test_data_file(self):
+        rejected = Event(0, "rejected.txt", [EventID(0), EventDate(1), DWCYear(2)])
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            build_event().read_file(EVENTS, _no_interaction=True, quarantine=rejected)
+        self.assertEqual(3, len(rejected), "Rows not added")
+        self.assertEqual(["e2", "e3", "e4"], sorted(rejected.__column__("eventID")), "Incorrect rows")
+        self.assertEqual([None, "2015", "2015"], rejected.__column__("year"), "Values not kept as text")
+
+    def test_archive(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "archive.zip")
+            event = build_event()
+            event.read_file(VALID_EVENTS, _no_interaction=True)
+            archive = DarwinCoreArchive("quarantine")
+            archive.core = event
+            archive.generate_eml()
+            archive.metadata.initialize_resource(
+                "Quarantine test",
+                ResponsibleParty(individual_name=IndividualName("Doe", "Example")),
+                contact=[ResponsibleParty(individual_name=IndividualName("Doe", "Jane"))]
+            )
+            archive.to_file(path, _no_interaction=True)
+            rows = list()
+            with warnings.catch_warnings():
+                warnings.simplefilter("ignore")
+                darwin_core = DarwinCoreArchive.from_file(path, _no_interaction=True, quarantine=rows)
+            self.assertEqual(4, len(darwin_core.core), "Rows not read")
+            self.assertEqual(0, len(rows), "Rows set apart on a valid archive")
+            self.assertRaisesRegex(
+                AssertionError, "lazy", DarwinCoreArchive.from_file, path, lazy=True, quarantine=rows
+            )
+
+    def test_invalid(self):
+        self.assertRaisesRegex(
+            TypeError, "quarantine", build_event().read_file, EVENTS, _no_interaction=True, quarantine=1
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
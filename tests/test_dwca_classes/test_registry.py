@@ -0,0 +1,102 @@
+import unittest
+import warnings
+
+from lxml import etree as et
+
+from dwca.base import DarwinCoreArchive
+from dwca.classes import Registry, REGISTRY, DataFile, Occurrence, Taxon, OutsideClass
+from dwca.terms import Field, OccurrenceID, ScientificName, OutsideTerm, DWCModified
+
+
+class ProjectCode(Field):
+    URI = "http://example.org/terms/projectCode"
+    TYPE = str
+
+    def __init__(self, index: int | str, default: TYPE = None, vocabulary: str = None) -> None:
+        super().__init__(index, default, vocabulary)
+        return
+
+
+class Sample(DataFile):
+    URI = "http://example.org/terms/Sample"
+    __field_class__ = DataFile.__field_class__ + [ProjectCode]
+
+
+def field_element(uri: str) -> et.Element:
+    element = et.Element("field")
+    element.set("index", "0")
+    element.set("term", uri)
+    return element
+
+
+class TestRegistry(unittest.TestCase):
+    def test_get_class(self):
+        registry = Registry()
+        registry.register_class(Occurrence)
+        self.assertIs(Occurrence, registry.get_class(Occurrence.URI), "Incorrect class")
+        self.assertIsNone(registry.get_class(Taxon.URI), "Class not registered resolved")
+        registry.register_class("test_dwca_classes.test_registry:Sample", uri=Sample.URI)
+        self.assertIs(Sample, registry.get_class(Sample.URI), "Class registered by path not resolved")
+        self.assertEqual([Occurrence.URI, Sample.URI], registry.classes, "Incorrect classes registered")
+        registry.unregister_class(Sample.URI)
+        self.assertIsNone(registry.get_class(Sample.URI), "Class not removed")
+
+    def test_get_term(self):
+        registry = Registry()
+        self.assertIs(OccurrenceID, registry.get_term(Occurrence, OccurrenceID.URI), "Incorrect term")
+        self.assertIsNone(registry.get_term(Occurrence, ScientificName.URI), "Term of another class resolved")
+        registry.register_term(ProjectCode, Occurrence)
+        self.assertIs(ProjectCode, registry.get_term(Occurrence, ProjectCode.URI), "Registered term not resolved")
+        self.assertIsNone(registry.get_term(Taxon, ProjectCode.URI), "Term resolved on other class")
+        registry.register_term("test_dwca_classes.test_registry:ProjectCode", uri=ProjectCode.URI)
+        self.assertIs(ProjectCode, registry.get_term(Taxon, ProjectCode.URI), "Term of every class not resolved")
+        registry.unregister_term(ProjectCode.URI)
+        self.assertIsNone(registry.get_term(Taxon, ProjectCode.URI), "Term not removed")
+
+    def test_find_term(self):
+        registry = Registry()
+        registry.register_class(Occurrence)
+        registry.register_class(Taxon)
+        self.assertIs(OccurrenceID, registry.find_term(OccurrenceID.URI), "Term not resolved by URI")
+        self.assertIs(ScientificName, registry.find_term("dwc:scientificName"), "Term not resolved by prefix")
+        self.assertIs(ScientificName, registry.find_term(" scientificName "), "Term not resolved by name")
+        self.assertIs(DWCModified, registry.find_term("dcterms:modified"), "Record level term not resolved")
+        self.assertIsNone(registry.find_term("projectCode"), "Unknown term resolved")
+        registry.register_class(Sample)
+        self.assertIs(ProjectCode, registry.find_term("projectCode"), "Term of a registered class not resolved")
+        registry.unregister_class(Sample.URI)
+        self.assertIsNone(registry.find_term("projectCode"), "Term of a removed class resolved")
+
+    def test_register_exception(self):
+        registry = Registry()
+        self.assertRaisesRegex(AssertionError, "URI", registry.register_class, "package.module:Class")
+        self.assertRaisesRegex(AssertionError, "URI", registry.register_term, "package.module:Term")
+        registry.register_class("package", uri="http://example.org/terms/Invalid")
+        self.assertRaisesRegex(
+            AssertionError, "format", registry.get_class, "http://example.org/terms/Invalid"
+        )
+
+    def test_third_party(self):
+        element = et.Element("extension")
+        element.set("rowType", Sample.URI)
+        with self.assertWarns(UserWarning):
+            self.assertIs(OutsideClass, DarwinCoreArchive.Metadata.get_dwc_class(element), "Unknown class resolved")
+        REGISTRY.register_class(Sample)
+        REGISTRY.register_term(ProjectCode, Occurrence)
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                self.assertIs(Sample, DarwinCoreArchive.Metadata.get_dwc_class(element), "Class not resolved")
+                self.assertIs(
+                    ProjectCode, Occurrence.get_term_class(field_element(ProjectCode.URI)), "Term not resolved"
+                )
+        finally:
+            REGISTRY.unregister_class(Sample.URI)
+            REGISTRY.unregister_term(ProjectCode.URI, Occurrence)
+        with self.assertWarns(UserWarning):
+            self.assertIs(OutsideTerm, Occurrence.get_term_class(field_element(ProjectCode.URI)), "Term not removed")
+        self.assertIs(OutsideTerm, OutsideClass.get_term_class(field_element(ProjectCode.URI)), "Term not removed")
+
+
+if __name__ == '__main__':
+    unittest.main()
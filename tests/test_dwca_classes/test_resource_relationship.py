@@ -0,0 +1,30 @@
+import unittest
+
+from dwca.classes import ResourceRelationship, DataFileType
+from dwca.terms import ResourceRelationshipID, ResourceID, RelatedResourceID, RelationshipOfResource
+
+RELATIONSHIPS = """resourceRelationshipID\tresourceID\trelatedResourceID\trelationshipOfResource
+r1\ts1\th1\tparasite of
+r2\ts2\th1\tparasite of
+r3\ts1\ts3\tderived from
+"""
+
+
+class TestResourceRelationship(unittest.TestCase):
+    def test_graph(self):
+        relationships = ResourceRelationship(
+            0, "resourcerelationship.txt",
+            [ResourceRelationshipID(0), ResourceID(1), RelatedResourceID(2), RelationshipOfResource(3)],
+            data_file_type=DataFileType.CORE, fields_terminated_by="\t", ignore_header_lines=1,
+        )
+        relationships.read_file(RELATIONSHIPS, _no_interaction=True)
+        graph = relationships.graph
+        self.assertIs(graph, relationships.graph, "Graph not kept")
+        self.assertEqual(3, graph.edges, "Incorrect number of relationships")
+        self.assertEqual({"s1", "s2", "h1"}, graph.neighbourhood(["s2"], k=2), "Incorrect neighbourhood")
+        relationships._filter_rows_([True, False, True])
+        self.assertEqual(2, relationships.graph.edges, "Graph not rebuilt after filtering")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,109 @@
+import io
+import unittest
+import warnings
+from unittest.mock import patch
+
+from dwca.classes import Occurrence, DataFileType
+from dwca.terms import OccurrenceID, DecimalLatitude, DecimalLongitude, ScientificName
+from eml.resources.coverage import GeographicCoverage
+from xml_common.utils import GPolygon, GRing
+
+orig_import = __import__
+
+
+def import_mock(name, globals=None, locals=None, fromlist=(), level=0):
+    if name == 'pandas':
+        raise ImportError(f"No module named '{name}'")
+    return orig_import(name, globals, locals, fromlist, level)
+
+
+OCCURRENCES = """occurrenceID\tdecimalLatitude\tdecimalLongitude\tscientificName
+o1\t1.0\t1.0\tAster alpinus
+o2\t5.0\t5.0\tAster alpinus
+o3\t8.0\t2.0\tRosa canina
+o4\t-33.4\t-70.6\tRosa canina
+o5\t\t\tFelis catus
+o6\t2.0\t179.5\tFelis catus
+"""
+
+
+def build_occurrence(lazy: bool = False) -> Occurrence:
+    occurrence = Occurrence(
+        0, "occurrence.txt", [
+            OccurrenceID(0), DecimalLatitude(1), DecimalLongitude(2), ScientificName(3),
+        ],
+        data_file_type=DataFileType.CORE,
+        fields_terminated_by="\t",
+        ignore_header_lines=1,
+    )
+    if lazy:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            occurrence.read_file(
+                "", source_file=io.BytesIO(OCCURRENCES.encode("utf-8")), lazy=True, _no_interaction=True
+            )
+    else:
+        occurrence.read_file(OCCURRENCES, _no_interaction=True)
+    return occurrence
+
+
+class TestSpatialFilter(unittest.TestCase):
+    def setUp(self) -> None:
+        self.occurrence = build_occurrence()
+        self.polygon = GPolygon(
+            GRing((0, 0), (0, 10), (10, 10), (10, 0)),
+            exclusion=[GRing((4, 4), (4, 6), (6, 6), (6, 4))]
+        )
+        return
+
+    def ids(self):
+        return [entry.occurrenceID for entry in self.occurrence.__entries__]
+
+    def test_bbox(self):
+        self.occurrence.filter_spatial(bbox=(0, 10, 10, 0))
+        self.assertEqual(["o1", "o2", "o3"], self.ids(), "Incorrect bounding box filter")
+
+    def test_bbox_antimeridian(self):
+        self.occurrence.filter_spatial(bbox=(179, -170, 5, 0))
+        self.assertEqual(["o6"], self.ids(), "Incorrect bounding box crossing antimeridian")
+
+    def test_polygon(self):
+        self.occurrence.filter_spatial(polygon=self.polygon)
+        self.assertEqual(["o1", "o3"], self.ids(), "Incorrect polygon filter with hole")
+
+    def test_geographic_coverage(self):
+        coverage = GeographicCoverage("Area", -80, -60, -20, -40)
+        self.occurrence.filter_spatial(coverage)
+        self.assertEqual(["o4"], self.ids(), "Incorrect filter by bounding coordinates")
+        other = build_occurrence()
+        other.filter_spatial(GeographicCoverage("Area", 0, 10, 10, 0, g_polygon=[self.polygon]))
+        self.assertEqual(
+            ["o1", "o3"], [entry.occurrenceID for entry in other.__entries__], "Incorrect filter by polygon"
+        )
+
+    def test_data_frame(self):
+        self.assertEqual(6, len(self.occurrence.pandas), "Incorrect pandas data")
+        self.occurrence.filter_spatial(polygon=self.polygon)
+        self.assertEqual(["o1", "o3"], list(self.occurrence.pandas["occurrenceID"]), "Pandas data not filtered")
+
+    def test_lazy(self):
+        occurrence = build_occurrence(lazy=True)
+        occurrence.filter_spatial(bbox=(0, 10, 10, 0))
+        self.assertTrue(occurrence.is_lazy(), "Data materialized on filter")
+        occurrence.filter_spatial(polygon=self.polygon)
+        self.assertEqual(["o1", "o3"], occurrence.polars["occurrenceID"].to_list(), "Incorrect lazy filter")
+
+    def test_exception(self):
+        self.assertRaisesRegex(AssertionError, "Only one", self.occurrence.filter_spatial)
+        self.assertRaisesRegex(
+            AssertionError, "Only one", self.occurrence.filter_spatial, bbox=(0, 1, 1, 0), polygon=self.polygon
+        )
+
+    @patch('builtins.__import__', side_effect=import_mock)
+    def test_polygon_no_pandas(self, mock_import):
+        self.occurrence.filter_spatial(polygon=[self.polygon])
+        self.assertEqual(["o1", "o3"], self.ids(), "Incorrect polygon filter")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,261 @@
+import io
+import unittest
+import warnings
+from unittest.mock import patch
+
+from dwca.classes import Taxon, DataFileType
+from dwca.terms import TaxonID, ParentNameUsageID, AcceptedNameUsageID, ScientificName, TaxonRank, Kingdom, \
+    Family, Genus
+from dwca.utils import MatchCache
+
+orig_import = __import__
+
+
+def import_mock(name, globals=None, locals=None, fromlist=(), level=0):
+    if name == 'pandas':
+        raise ImportError(f"No module named '{name}'")
+    return orig_import(name, globals, locals, fromlist, level)
+
+
+CHECKLIST = """taxonID\tparentNameUsageID\tacceptedNameUsageID\tscientificName\ttaxonRank\tkingdom\tfamily\tgenus
+1\t\t1\tPlantae\tkingdom\tPlantae\t\t
+2\t1\t2\tAsteraceae\tfamily\tPlantae\tAsteraceae\t
+3\t2\t3\tAster\tgenus\tPlantae\tAsteraceae\tAster
+4\t3\t4\tAster alpinus\tspecies\tPlantae\tAsteraceae\tAster
+5\t\t4\tAster alpina\tspecies\tPlantae\tAsteraceae\tAster
+6\t1\t6\tRosaceae\tfamily\tPlantae\tRosaceae\t
+7\t6\t7\tRosa\tgenus\tPlantae\tRosaceae\tRosa
+8\t7\t8\tRosa canina\tspecies\tPlantae\tRosaceae\tRosa
+9\t\t9\tAnimalia\tkingdom\tAnimalia\t\t
+10\t9\t10\tFelidae\tfamily\tAnimalia\tFelidae\t
+11\t10\t11\tFelis\tgenus\tAnimalia\tFelidae\tFelis
+12\t11\t12\tFelis catus\tspecies\tAnimalia\tFelidae\tFelis
+13\t\t12\tFelis domesticus\tspecies\tAnimalia\tFelidae\tFelis
+14\t\t13\tFelis silvestris catus\tspecies\tAnimalia\tFelidae\tFelis
+"""
+
+
+def build_checklist(lazy: bool = False) -> Taxon:
+    taxon = Taxon(
+        0, "taxon.txt", [
+            TaxonID(0), ParentNameUsageID(1), AcceptedNameUsageID(2), ScientificName(3),
+            TaxonRank(4), Kingdom(5), Family(6), Genus(7),
+        ],
+        data_file_type=DataFileType.CORE,
+        fields_terminated_by="\t",
+        ignore_header_lines=1,
+    )
+    if lazy:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            taxon.read_file("", source_file=io.BytesIO(CHECKLIST.encode("utf-8")), lazy=True, _no_interaction=True)
+    else:
+        taxon.read_file(CHECKLIST, _no_interaction=True)
+    return taxon
+
+
+class TestTaxonIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.taxon = build_checklist()
+        return
+
+    def test_get_parents(self):
+        self.assertEqual({"1", "2", "3"}, self.taxon.get_parents(["4"]), "Incorrect parents")
+        self.assertEqual({"1", "2", "3", "6", "7"}, self.taxon.get_parents(["4", "8"]), "Incorrect parents")
+        with self.assertWarnsRegex(RuntimeWarning, "300"):
+            self.assertEqual(set(), self.taxon.get_parents(["300"]), "Parents of unknown taxon")
+
+    def test_get_children(self):
+        self.assertEqual({"3"}, self.taxon.get_children(["2"]), "Incorrect children")
+        self.assertEqual({"3", "4"}, self.taxon.get_children(["2"], subtree=True), "Incorrect subtree")
+        self.assertEqual({"2", "6"}, self.taxon.get_children(["1"]), "Incorrect children")
+
+    def test_lowest_common_ancestor(self):
+        self.assertEqual("1", self.taxon.lowest_common_ancestor(["4", "8"]), "Incorrect common ancestor")
+        self.assertEqual("11", self.taxon.lowest_common_ancestor(["11", "12"]), "Incorrect common ancestor")
+        self.assertIsNone(self.taxon.lowest_common_ancestor(["4", "12"]), "Common ancestor between kingdoms")
+
+    def test_all_synonyms(self):
+        self.assertCountEqual(["4", "5"], self.taxon.all_synonyms(["5"]), "Incorrect synonyms")
+        self.assertCountEqual(
+            ["Aster alpinus", "Aster alpina"],
+            self.taxon.all_synonyms(["4"], get_names=True),
+            "Incorrect synonyms names"
+        )
+        self.assertCountEqual(["12", "13", "14"], self.taxon.all_synonyms(["14"]), "Chain of synonyms not resolved")
+        with self.assertWarnsRegex(RuntimeWarning, "300"):
+            self.assertEqual([], self.taxon.all_synonyms(["300"]), "Synonyms of unknown taxon")
+
+    def test_filter_species_synonyms(self):
+        self.taxon.filter_by_species(["Felis catus"])
+        self.assertCountEqual(
+            ["9", "10", "11", "12", "13", "14"],
+            [entry.taxonID for entry in self.taxon.__entries__],
+            "Incorrect filter with synonyms"
+        )
+
+    def test_filter_fuzzy(self):
+        self.taxon.filter_by_family(["Rosacaea"], fuzzy_threshold=80)
+        self.assertCountEqual(
+            ["1", "6", "7", "8"],
+            [entry.taxonID for entry in self.taxon.__entries__],
+            "Incorrect fuzzy filter"
+        )
+
+    def test_filter_fuzzy_workers(self):
+        self.taxon.filter_by_species(["Felis catu"], fuzzy_threshold=90, workers=2)
+        self.assertCountEqual(
+            ["9", "10", "11", "12", "13", "14"],
+            [entry.taxonID for entry in self.taxon.__entries__],
+            "Incorrect fuzzy filter with several workers"
+        )
+
+    def test_filter_threshold_zero(self):
+        self.taxon.filter(ranks={"family": ["Rosaceae", "Rosacaea"]}, fuzzy_threshold=0)
+        self.assertCountEqual(
+            ["1", "6", "7", "8"],
+            [entry.taxonID for entry in self.taxon.__entries__],
+            "Threshold of 0 not matched exactly"
+        )
+
+    def test_match_names(self):
+        self.assertEqual(
+            [("8", 100.0), (None, 0.0), (None, 0.0)],
+            self.taxon.match_names(["Rosa canina", "Rosa caninna", None]),
+            "Incorrect exact match"
+        )
+        matches = self.taxon.match_names(["Rosa canina", "Rosa caninna", "Quercus robur"], fuzzy_threshold=90)
+        self.assertEqual(("8", 100.0), matches[0], "Incorrect exact match")
+        self.assertEqual("8", matches[1][0], "Incorrect fuzzy match")
+        self.assertEqual((None, 0.0), matches[2], "Match under threshold")
+
+    def test_match_names_cache(self):
+        cache = MatchCache()
+        names = ["Rosa  canina", "Rosa caninna", "Quercus robur"]
+        first = self.taxon.match_names(names, fuzzy_threshold=90, cache=cache)
+        self.assertEqual((0, 3), (cache.hits, cache.misses), "Incorrect counters on first match")
+        second = self.taxon.match_names(names, fuzzy_threshold=90, cache=cache)
+        self.assertEqual((3, 3), (cache.hits, cache.misses), "Incorrect counters on second match")
+        self.assertEqual(first, second, "Different results from cache")
+        fingerprint = self.taxon.fingerprint
+        self.taxon.filter_by_family(["Rosaceae"])
+        self.assertNotEqual(fingerprint, self.taxon.fingerprint, "Same fingerprint on different checklist")
+        cache.close()
+
+    def test_filter(self):
+        self.taxon.filter(ranks={"kingdom": ["Plantae"], "Family": ["Rosaceae", "Felidae"]})
+        self.assertCountEqual(
+            ["1", "6", "7", "8"],
+            [entry.taxonID for entry in self.taxon.__entries__],
+            "Incorrect compound filter"
+        )
+
+    def test_filter_species(self):
+        self.taxon.filter(ranks={"genus": ["Aster", "Felis"]}, species=["Felis domesticus"])
+        self.assertCountEqual(
+            ["9", "10", "11", "12", "13", "14"],
+            [entry.taxonID for entry in self.taxon.__entries__],
+            "Incorrect compound filter with species"
+        )
+
+    def test_filter_sequential(self):
+        other = build_checklist()
+        self.taxon.filter(ranks={"kingdom": ["Plantae"], "genus": ["Aster"]})
+        other.filter_by_kingdom(["Plantae"])
+        other.filter_by_genus(["Aster"])
+        self.assertCountEqual(
+            [entry.taxonID for entry in other.__entries__],
+            [entry.taxonID for entry in self.taxon.__entries__],
+            "Compound filter differs from sequential filters"
+        )
+
+    def test_filter_data_frame(self):
+        self.assertEqual(14, len(self.taxon.pandas), "Incorrect pandas data")
+        self.taxon.filter(ranks={"family": ["Rosaceae"]})
+        self.assertCountEqual(["1", "6", "7", "8"], list(self.taxon.pandas["taxonID"]), "Pandas data not filtered")
+        other = build_checklist()
+        other.as_polars(_no_interaction=True)
+        other.filter(ranks={"family": ["Rosaceae"]})
+        self.assertCountEqual(["1", "6", "7", "8"], other.polars["taxonID"].to_list(), "Polars data not filtered")
+
+    def test_filter_exception(self):
+        self.assertRaisesRegex(AssertionError, "variety", self.taxon.filter, ranks={"variety": ["A"]})
+        self.assertRaisesRegex(AssertionError, "Order must be in fields", self.taxon.filter, ranks={"order": ["A"]})
+        self.taxon.filter()
+        self.assertEqual(14, len(self.taxon), "Filtered without criteria")
+
+    def test_tree_reset(self):
+        self.assertEqual(14, len(self.taxon.taxonomic_tree), "Incorrect tree size")
+        self.taxon.filter_by_family(["Rosaceae"])
+        self.assertEqual(4, len(self.taxon), "Incorrect filter")
+        self.assertEqual(4, len(self.taxon.taxonomic_tree), "Tree not rebuilt after filter")
+
+    @patch('builtins.__import__', side_effect=import_mock)
+    def test_filter_family_no_pandas(self, mock_import):
+        self.taxon.filter_by_family(["Asteraceae"])
+        self.assertCountEqual(
+            ["1", "2", "3", "4", "5"],
+            [entry.taxonID for entry in self.taxon.__entries__],
+            "Incorrect filter"
+        )
+        self.assertEqual({"1", "2"}, self.taxon.get_parents(["3"]), "Incorrect parents after filter")
+
+    @patch('builtins.__import__', side_effect=import_mock)
+    def test_filter_no_pandas(self, mock_import):
+        self.taxon.filter(ranks={"kingdom": ["Plantae"], "family": ["Asteraceae"]})
+        self.assertCountEqual(
+            ["1", "2", "3", "4", "5"],
+            [entry.taxonID for entry in self.taxon.__entries__],
+            "Incorrect compound filter"
+        )
+
+    @patch('builtins.__import__', side_effect=import_mock)
+    def test_filter_fuzzy_no_pandas(self, mock_import):
+        self.taxon.filter_by_kingdom(["Animalai"], fuzzy_threshold=80)
+        self.assertCountEqual(
+            ["9", "10", "11", "12", "13", "14"],
+            [entry.taxonID for entry in self.taxon.__entries__],
+            "Incorrect fuzzy filter"
+        )
+
+
+class TestTaxonIndexLazy(unittest.TestCase):
+    def setUp(self) -> None:
+        self.taxon = build_checklist(lazy=True)
+        return
+
+    def tearDown(self) -> None:
+        self.taxon.close()
+        return
+
+    def test_get_parents(self):
+        self.assertEqual({"1", "2", "3"}, self.taxon.get_parents(["4"]), "Incorrect parents")
+        self.assertEqual({"1", "2", "3", "6", "7"}, self.taxon.get_parents(["4", "8"]), "Incorrect parents")
+        with self.assertWarnsRegex(RuntimeWarning, "300"):
+            self.assertEqual(set(), self.taxon.get_parents(["300"]), "Parents of unknown taxon")
+
+    def test_filter_family(self):
+        self.taxon.filter_by_family(["Rosaceae"])
+        self.assertTrue(self.taxon.is_lazy(), "Data materialized on filter")
+        self.assertCountEqual(["1", "6", "7", "8"], self.taxon.polars["taxonID"].to_list(), "Incorrect filter")
+
+    def test_filter_species_synonyms(self):
+        self.taxon.filter_by_species(["Felis catus"])
+        self.assertCountEqual(
+            ["9", "10", "11", "12", "13", "14"],
+            self.taxon.polars["taxonID"].to_list(),
+            "Incorrect filter with synonyms"
+        )
+
+    def test_filter(self):
+        self.taxon.filter(ranks={"kingdom": ["Plantae"], "Family": ["Rosaceae", "Felidae"]})
+        self.assertTrue(self.taxon.is_lazy(), "Data materialized on filter")
+        self.assertCountEqual(["1", "6", "7", "8"], self.taxon.polars["taxonID"].to_list(), "Incorrect compound filter")
+
+    def test_filter_fuzzy(self):
+        self.taxon.filter_by_family(["Rosacaea"], fuzzy_threshold=80)
+        self.assertCountEqual(["1", "6", "7", "8"], self.taxon.polars["taxonID"].to_list(), "Incorrect fuzzy filter")
+
+
+if __name__ == '__main__':
+    unittest.main()
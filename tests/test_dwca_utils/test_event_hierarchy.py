@@ -0,0 +1,43 @@
+import unittest
+
+from dwca.utils import EventHierarchy
+
+
+class TestEventHierarchy(unittest.TestCase):
+    def setUp(self) -> None:
+        #         s1            s2
+        #       /    \          |
+        #      v1     v2        v3
+        #     /  \
+        #   p1    p2
+        self.hierarchy = EventHierarchy(
+            ["s1", "v1", "v2", "p1", "p2", "s2", "v3"],
+            ["", "s1", "s1", "v1", "v1", None, "s2"],
+        )
+        return
+
+    def test_structure(self):
+        self.assertEqual(["s1", "s2"], self.hierarchy.roots, "Incorrect top-level events")
+        self.assertEqual(2, self.hierarchy.max_depth, "Incorrect maximum depth")
+        self.assertEqual("s1", self.hierarchy.top("p2"), "Incorrect top-level event")
+        self.assertEqual("s2", self.hierarchy.top("s2"), "Top-level event not itself")
+        start, end = self.hierarchy.subtree_range("v1")
+        self.assertEqual(3, end - start, "Incorrect subtree range")
+        self.assertEqual({"v1", "v2", "p1", "p2"}, self.hierarchy.descendants(["s1"]), "Incorrect descendants")
+
+    def test_rollup(self):
+        occurrences = ["p1", "p1", "p2", "v2", "s1", "v3", "unknown", None]
+        self.assertEqual({"s1": 5, "s2": 1}, self.hierarchy.rollup(occurrences), "Incorrect top-level rollup")
+        self.assertEqual(
+            {"v1": 3, "v2": 1, "v3": 1}, self.hierarchy.rollup(occurrences, level=1), "Incorrect level rollup"
+        )
+        self.assertEqual(
+            {"s1": 5, "v1": 3, "p1": 2, "p2": 1, "v2": 1, "s2": 1, "v3": 1},
+            self.hierarchy.rollup(occurrences, level=None), "Incorrect subtree totals"
+        )
+        counts = [2, 3, None, 1, 1, 4, 1, 1]
+        self.assertEqual({"s1": 7, "s2": 4}, self.hierarchy.rollup(occurrences, counts), "Incorrect values")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+import unittest
+from unittest.mock import patch
+
+from dwca.utils import FuzzyMatcher
+
+orig_import = __import__
+
+
+def import_mock(name, globals=None, locals=None, fromlist=(), level=0):
+    if name == 'rapidfuzz':
+        raise ImportError(f"No module named '{name}'")
+    return orig_import(name, globals, locals, fromlist, level)
+
+
+class TestFuzzyMatcher(unittest.TestCase):
+    CHOICES = ["Aster alpinus", "Aster amellus", None, "Rosa canina", "Rosa rubiginosa", "Felis catus"]
+
+    def test_match(self):
+        matcher = FuzzyMatcher(self.CHOICES)
+        self.assertEqual(5, len(matcher), "Missing choices not ignored")
+        matches = matcher.match(["Aster alpinus", "Rosa caninna", "Quercus robur", None], threshold=90)
+        self.assertEqual((0, 100.0), matches[0], "Incorrect exact match")
+        self.assertEqual(3, matches[1][0], "Incorrect fuzzy match")
+        self.assertGreaterEqual(matches[1][1], 90, "Incorrect fuzzy score")
+        self.assertEqual((None, 0.0), matches[2], "Match under threshold")
+        self.assertEqual((None, 0.0), matches[3], "Match of missing name")
+
+    def test_batches(self):
+        matcher = FuzzyMatcher(self.CHOICES, max_cells=1, workers=-1)
+        self.assertEqual(
+            [100.0, 100.0, 100.0],
+            matcher.scores(["Felis catus", "Rosa canina", "Aster amellus"], threshold=50),
+            "Incorrect scores on small batches"
+        )
+
+    def test_block(self):
+        for block in ["genus", "trigram"]:
+            matcher = FuzzyMatcher(self.CHOICES, block=block)
+            matches = matcher.match(["Rosa rubiginosaa", "Fellis catus"], threshold=80)
+            self.assertEqual(4, matches[0][0], f"Incorrect match inside {block} block")
+            self.assertEqual(5, matches[1][0], f"Incorrect match outside {block} block")
+
+    def test_invalid_block(self):
+        self.assertRaisesRegex(ValueError, "genus", FuzzyMatcher, self.CHOICES, block="family")
+
+    @patch('builtins.__import__', side_effect=import_mock)
+    def test_no_rapidfuzz(self, mock_import):
+        self.assertRaisesRegex(ImportError, "Install rapidfuzz", FuzzyMatcher, self.CHOICES)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,30 @@
+import unittest
+
+from dwca.utils import GeographicAggregator, convex_hull, simplify_ring
+
+
+class TestGeographicAggregator(unittest.TestCase):
+    def test_convex_hull(self):
+        points = [(0, 0), (0, 10), (10, 10), (10, 0), (5, 5), (2, 8)]
+        self.assertCountEqual([(0, 0), (0, 10), (10, 10), (10, 0)], convex_hull(points), "Incorrect hull")
+        self.assertEqual([(1, 1)], convex_hull([(1, 1), (1, 1)]), "Incorrect hull of one point")
+
+    def test_simplify_ring(self):
+        ring = [(0, 0), (0, 5), (0.1, 10), (10, 10), (10, 0)]
+        self.assertCountEqual(
+            [(0, 0), (0.1, 10), (10, 10), (10, 0)], simplify_ring(ring, 4), "Incorrect simplification"
+        )
+
+    def test_update(self):
+        aggregator = GeographicAggregator(hull=True, buffer_size=3)
+        self.assertIsNone(aggregator.bounding_box, "Bounding box without points")
+        aggregator.update([1, 5, None, 95], [1, 5, 3, 3], [100, None])
+        aggregator.update([8, -3, float("nan")], [2, 4, 1], [2500, 10])
+        self.assertEqual(3 + 1, aggregator.count, "Incorrect number of valid points")
+        self.assertEqual((1, 5, 8, -3), aggregator.bounding_box, "Incorrect bounding box")
+        self.assertEqual((10, 2500), aggregator.elevation, "Incorrect elevation")
+        self.assertCountEqual([(1, 1), (5, 5), (8, 2), (-3, 4)], aggregator.convex_hull(), "Incorrect hull")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import os
+import tempfile
+import unittest
+
+from dwca.utils import MatchCache, normalize_name
+
+
+class TestMatchCache(unittest.TestCase):
+    def test_normalize_name(self):
+        self.assertEqual("Rosa canina L.", normalize_name("  Rosa   canina\tL. "), "Incorrect normalization")
+        self.assertEqual("", normalize_name(None), "Incorrect normalization of missing")
+
+    def test_get_put(self):
+        cache = MatchCache()
+        self.assertEqual({}, cache.get("abc", "exact", ["Rosa canina"]), "Empty cache with values")
+        cache.put("abc", "exact", {"Rosa canina": ("8", 100.0), "Quercus robur": (None, 0.0)})
+        self.assertEqual(2, len(cache), "Incorrect size")
+        cache.put("abc", "exact", {"Rosa canina": ("8", 100.0), "Quercus robur": (None, 0.0)})
+        self.assertEqual(2, len(cache), "Stored values counted again")
+        self.assertEqual(
+            {"Rosa canina": ("8", 100.0), "Quercus robur": (None, 0.0)},
+            cache.get("abc", "exact", ["Rosa canina", "Quercus robur", "Felis catus"]),
+            "Incorrect values"
+        )
+        self.assertEqual({}, cache.get("def", "exact", ["Rosa canina"]), "Values of other checklist")
+        self.assertEqual({}, cache.get("abc", "fuzzy_90_genus", ["Rosa canina"]), "Values of other mode")
+        self.assertEqual(2, cache.hits, "Incorrect hits")
+        self.assertEqual(4, cache.misses, "Incorrect misses")
+        cache.clear()
+        self.assertEqual(0, len(cache), "Cache not cleared")
+        self.assertEqual(0, cache.hits, "Counters not reset")
+        cache.close()
+
+    def test_eviction(self):
+        cache = MatchCache(max_size=2)
+        cache.put("abc", "exact", {"a": ("1", 100.0)})
+        cache.put("abc", "exact", {"b": ("2", 100.0)})
+        cache.get("abc", "exact", ["a"])
+        cache.put("abc", "exact", {"c": ("3", 100.0), "a": ("4", 90.0)})
+        self.assertEqual(2, len(cache), "Cache not bounded")
+        self.assertEqual(
+            {"a": ("4", 90.0), "c": ("3", 100.0)}, cache.get("abc", "exact", ["a", "b", "c"]), "Incorrect eviction"
+        )
+        cache.close()
+
+    def test_persistent(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "matches.db")
+            with MatchCache(path) as cache:
+                cache.put("abc", "exact", {"Rosa canina": ("8", 100.0)})
+            with MatchCache(path) as cache:
+                self.assertEqual(1, len(cache), "Size not counted on opening")
+                self.assertEqual(
+                    {"Rosa canina": ("8", 100.0)},
+                    cache.get("abc", "exact", ["Rosa canina"]),
+                    "Values not persisted"
+                )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+import unittest
+import warnings
+
+from dwca.utils import MeasurementPivot, to_bool, to_int
+
+IDS = ["o1", "o1", "o2", "o2", "o2", "o3", ""]
+TYPES = ["length", "weight", "length", "length", "adult", "weight", "length"]
+VALUES = ["3.5", "10", "4", "6", "yes", "abc", "1"]
+
+
+class TestMeasurementPivot(unittest.TestCase):
+    def test_converters(self):
+        self.assertTrue(to_bool("Yes"), "Incorrect boolean")
+        self.assertFalse(to_bool("0"), "Incorrect boolean")
+        self.assertRaises(ValueError, to_bool, "maybe")
+        self.assertEqual(3, to_int("3.0"), "Integral decimal not converted")
+        self.assertRaises(ValueError, to_int, "3.5")
+
+    def test_first(self):
+        table = MeasurementPivot(value_type={"length": float, "weight": int, "adult": bool})
+        table.add(IDS, TYPES, VALUES)
+        self.assertEqual(["o1", "o2"], table.ids, "Incorrect rows")
+        self.assertEqual(["length", "weight", "adult"], table.types, "Incorrect columns")
+        self.assertEqual(
+            {"length": [3.5, 4.0], "weight": [10, None], "adult": [None, True]}, table.columns(),
+            "Incorrect values"
+        )
+        self.assertEqual({"weight": ["abc"]}, table.failures, "Conversion failures not kept")
+        self.assertEqual(
+            {"length": [None, 4.0, 3.5]}, {"length": table.columns(["o4", "o2", "o1"])["length"]},
+            "Incorrect rows by identifier"
+        )
+
+    def test_aggregations(self):
+        expected = {"mean": 5.0, "sum": 10.0, "min": 4.0, "max": 6.0, "last": 6.0, "count": 2, "list": [4.0, 6.0]}
+        for agg, value in expected.items():
+            table = MeasurementPivot(agg=agg, types=["length"])
+            table.add(IDS, TYPES, VALUES)
+            first = {"count": 1, "list": [3.5]}.get(agg, 3.5)
+            self.assertEqual([first, value], table.columns()["length"][:2], f"Incorrect {agg}")
+        table = MeasurementPivot(agg=lambda values: len(values), types=["length"])
+        table.add(IDS[:4], TYPES[:4], VALUES[:4])
+        self.assertEqual([1, 2], table.columns()["length"], "Incorrect custom aggregation")
+        self.assertRaisesRegex(AssertionError, "aggregation", MeasurementPivot, agg="median")
+
+    def test_max_types(self):
+        table = MeasurementPivot(value_type=str, max_types=2)
+        table.add(IDS, TYPES, VALUES)
+        self.assertEqual(["length", "weight"], table.types, "Cap not applied")
+        self.assertEqual({"adult": 1}, table.ignored, "Ignored values not counted")
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            table.columns()
+        self.assertEqual(1, len(caught), "Cap not warned")
+
+
+if __name__ == '__main__':
+    unittest.main()
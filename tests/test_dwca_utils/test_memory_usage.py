@@ -0,0 +1,65 @@
+import os
+import sys
+import tempfile
+import unittest
+
+from dwca.utils import MemoryUsage, deep_sizeof, frame_memory, file_size
+
+
+class Node:
+    def __init__(self, value, child=None):
+        self.value = value
+        self.child = child
+
+
+class TestMemoryUsage(unittest.TestCase):
+    def test_deep_sizeof(self):
+        text = "a" * 1000
+        self.assertGreater(deep_sizeof([text]), 1000, "Content not counted")
+        self.assertLess(deep_sizeof([text, text]), 2000, "Shared object counted twice")
+        self.assertGreater(deep_sizeof(Node(1, Node(text))), 1000, "Attributes not followed")
+        self.assertEqual(sys.getsizeof([Node, os]), deep_sizeof([Node, os]), "Classes or modules counted")
+        seen = set()
+        deep_sizeof(text, seen)
+        self.assertEqual(sys.getsizeof([text]), deep_sizeof([text], seen), "Seen objects counted")
+
+    def test_frame_memory(self):
+        self.assertIsNone(frame_memory([1, 2]), "Not a data frame")
+        try:
+            import pandas as pd
+            columns = frame_memory(pd.DataFrame({"a": ["x" * 100] * 10, "b": [1] * 10}))
+            self.assertEqual({"Index", "a", "b"}, set(columns.keys()), "Incorrect pandas columns")
+            self.assertGreater(columns["a"], 1000, "Strings not measured")
+            self.assertLess(
+                frame_memory(pd.DataFrame({"a": ["x" * 100] * 10}), deep=False)["a"], 1000, "Deep measure"
+            )
+        except ImportError:
+            pass
+        try:
+            import polars as pl
+            self.assertEqual(80, frame_memory(pl.DataFrame({"a": list(range(10))}))["a"], "Incorrect polars size")
+            self.assertEqual(dict(), frame_memory(pl.LazyFrame({"a": [1]})), "LazyFrame in memory")
+        except ImportError:
+            pass
+
+    def test_usage(self):
+        first = MemoryUsage("first.txt", components={"entries": 100, "data": 50}, columns={"a": 60, "b": 40})
+        second = MemoryUsage("second.txt", components={"entries": 10}, columns={"a": 10}, files={"/tmp/x": 500})
+        self.assertEqual(150, first.total, "Incorrect total")
+        self.assertEqual(0, first.disk, "Incorrect disk")
+        total = MemoryUsage.combine("archive", [first, second])
+        self.assertEqual({"entries": 110, "data": 50}, total.components, "Incorrect components")
+        self.assertEqual({"a": 70, "b": 40}, total.columns, "Incorrect columns")
+        self.assertEqual(500, total.disk, "Incorrect disk")
+        self.assertEqual(160, total.to_dict()["total"], "Incorrect dictionary")
+
+    def test_file_size(self):
+        with tempfile.NamedTemporaryFile(delete=False) as file:
+            file.write(b"12345")
+        self.assertEqual(5, file_size(file.name), "Incorrect size")
+        os.remove(file.name)
+        self.assertEqual(0, file_size(file.name), "Missing file size")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+
+from dwca.utils import RelationshipGraph
+from dwca.utils.relationship_graph import OUT, IN
+
+
+class TestRelationshipGraph(unittest.TestCase):
+    def setUp(self) -> None:
+        #  s1 -parasite of-> h1 <-parasite of- s2     s4 -derived from-> s5
+        #  s1 -derived from-> s3 -derived from-> s6
+        self.graph = RelationshipGraph(
+            ["s1", "s2", "s1", "s3", "s4", "", "s7"],
+            ["h1", "h1", "s3", "s6", "s5", "s9", ""],
+            ["parasite of", "parasite of", "derived from", "derived from", "derived from", "x", "x"],
+        )
+        return
+
+    def test_build(self):
+        self.assertEqual(7, len(self.graph), "Incorrect number of resources")
+        self.assertEqual(5, self.graph.edges, "Incorrect number of relationships")
+        self.assertEqual(["parasite of", "derived from"], self.graph.relationships, "Incorrect kinds")
+        self.assertIn("h1", self.graph, "Related resource not indexed")
+        self.assertNotIn("s9", self.graph, "Relationship without resource indexed")
+
+    def test_neighbours(self):
+        self.assertEqual(["h1", "s3"], self.graph.neighbours("s1"), "Incorrect outgoing")
+        self.assertEqual(["s1", "s2"], self.graph.neighbours("h1", direction=IN), "Incorrect incoming")
+        self.assertEqual(["s3"], self.graph.neighbours("s1", relationships=["derived from"]), "Kind not filtered")
+        self.assertRaisesRegex(AssertionError, "s9", self.graph.neighbours, "s9")
+        self.assertRaisesRegex(AssertionError, "direction", self.graph.neighbours, "s1", "up")
+
+    def test_traversal(self):
+        self.assertEqual(
+            {"s1": 0, "h1": 1, "s3": 1, "s2": 2, "s6": 2}, self.graph.bfs("s1"), "Incorrect breadth first"
+        )
+        self.assertEqual({"s1": 0, "h1": 1, "s3": 1}, self.graph.bfs("s1", max_depth=1), "Depth not limited")
+        self.assertEqual(["s1", "h1", "s3", "s6"], self.graph.dfs("s1", direction=OUT), "Incorrect depth first")
+        self.assertEqual(["s1", "h1", "s2", "s3", "s6"], self.graph.dfs("s1"), "Incorrect depth first")
+        self.assertEqual(
+            {"s1", "s3", "s6"}, set(self.graph.bfs("s1", relationships=["derived from"])), "Kind not filtered"
+        )
+
+    def test_neighbourhood(self):
+        self.assertEqual({"s1", "h1", "s3"}, self.graph.neighbourhood(["s1"]), "Incorrect 1-hop")
+        self.assertEqual({"s1", "h1", "s3", "s2", "s6"}, self.graph.neighbourhood(["s1"], k=2), "Incorrect 2-hop")
+        self.assertEqual({"s2", "h1", "s4", "s5"}, self.graph.neighbourhood(["s2", "s4", "s9"]), "Incorrect hop")
+
+    def test_components(self):
+        components = self.graph.connected_components()
+        self.assertEqual([{"s1", "s2", "h1", "s3", "s6"}, {"s4", "s5"}], components, "Incorrect components")
+        self.assertEqual(
+            [{"s1", "s3", "s6"}, {"s4", "s5"}, {"h1"}, {"s2"}],
+            self.graph.connected_components(relationships=["derived from"]), "Kind not filtered"
+        )
+        self.assertEqual({"s4", "s5"}, self.graph.component("s5"), "Incorrect component")
+
+
+if __name__ == '__main__':
+    unittest.main()
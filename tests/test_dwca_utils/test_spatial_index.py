@@ -0,0 +1,47 @@
+import unittest
+
+from dwca.utils import SpatialIndex
+from xml_common.utils import GPolygon, GRing
+
+
+class TestSpatialIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        # Square from (0, 0) to (10, 10) with a hole from (4, 4) to (6, 6)
+        self.polygon = GPolygon(
+            GRing((0, 0), (0, 10), (10, 10), (10, 0)),
+            exclusion=[GRing((4, 4), (4, 6), (6, 6), (6, 4))]
+        )
+        return
+
+    def test_contains(self):
+        for grid_size in (1, 4, 16):
+            index = SpatialIndex([self.polygon], grid_size=grid_size)
+            self.assertTrue(index.contains(1, 1), f"Point not inside [grid={grid_size}]")
+            self.assertTrue(index.contains(5, 8), f"Point not inside [grid={grid_size}]")
+            self.assertFalse(index.contains(5, 5), f"Point inside hole [grid={grid_size}]")
+            self.assertFalse(index.contains(-1, 5), f"Point outside inside [grid={grid_size}]")
+            self.assertFalse(index.contains(None, 5), f"Missing point inside [grid={grid_size}]")
+        self.assertEqual((0, 10, 10, 0), index.bounding_box, "Incorrect bounding box")
+
+    def test_concave(self):
+        # U shape, open to the north
+        polygon = GPolygon(GRing((0, 0), (10, 0), (10, 3), (2, 3), (2, 7), (10, 7), (10, 10), (0, 10)))
+        index = SpatialIndex([polygon], grid_size=8)
+        self.assertEqual(
+            [True, False, True, True],
+            index.contains_all([5, 5, 5, 1], [1, 5, 9, 5]),
+            "Incorrect concave polygon"
+        )
+
+    def test_many_polygons(self):
+        other = GPolygon(GRing((20, 20), (20, 30), (30, 30), (30, 20)))
+        index = SpatialIndex([self.polygon, other])
+        self.assertEqual(
+            [True, True, False],
+            index.contains_all([1, 25, 15], [1, 25, 15]),
+            "Incorrect union of polygons"
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,44 @@
+import unittest
+
+from dwca.utils import StageProfile, StageRecord
+
+
+class TestStageProfile(unittest.TestCase):
+    def test_stage(self):
+        profile = StageProfile()
+        for _ in range(3):
+            with profile.stage("convert", "occurrence.txt", rows=10) as record:
+                record.add(n_bytes=100)
+        with profile.stage("convert", "taxon.txt", rows=5):
+            pass
+        self.assertEqual(2, len(profile.records), "Incorrect number of records")
+        occurrence = profile.records[0]
+        self.assertEqual(("convert", "occurrence.txt"), (occurrence.stage, occurrence.member), "Incorrect record")
+        self.assertEqual((30, 300, 3), (occurrence.rows, occurrence.bytes, occurrence.calls), "Not accumulated")
+        self.assertGreaterEqual(occurrence.wall_time, 0, "Invalid wall time")
+        total = profile.totals()["convert"]
+        self.assertIsNone(total.member, "Total of a member")
+        self.assertEqual((35, 4), (total.rows, total.calls), "Incorrect totals")
+        self.assertEqual(
+            {"stage", "member", "wall_time", "cpu_time", "bytes", "rows", "calls"},
+            set(profile.to_dict()[0].keys()),
+            "Incorrect dictionary"
+        )
+
+    def test_callback(self):
+        measures = list()
+        profile = StageProfile.wrap(measures.append)
+        with profile.stage("decode", "occurrence.txt", n_bytes=10):
+            pass
+        with self.assertRaises(ValueError):
+            with profile.stage("decode", "occurrence.txt", n_bytes=5):
+                raise ValueError("Failed stage")
+        self.assertEqual([10, 5], [measure.bytes for measure in measures], "Measures not sent to callback")
+        self.assertEqual(15, profile.records[0].bytes, "Failed stage not recorded")
+        self.assertIs(profile, StageProfile.wrap(profile), "Profile wrapped again")
+        self.assertIsInstance(StageProfile.wrap(None), StageProfile, "Profile not created")
+        self.assertIsInstance(measures[0], StageRecord, "Incorrect measure")
+
+
+if __name__ == '__main__':
+    unittest.main()
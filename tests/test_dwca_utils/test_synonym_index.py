@@ -0,0 +1,36 @@
+import unittest
+
+from dwca.utils import SynonymIndex
+
+
+class TestSynonymIndex(unittest.TestCase):
+    def setUp(self) -> None:
+        self.index = SynonymIndex(
+            ["a", "b", "c", "d", "e", ""],
+            ["a", "a", "b", "d", "", "a"],
+            ["A", "B", "C", "D", "E", "Unknown"],
+        )
+        return
+
+    def test_group(self):
+        self.assertEqual(self.index.group("a"), self.index.group("c"), "Chain of synonyms not resolved")
+        self.assertNotEqual(self.index.group("a"), self.index.group("d"), "Different accepted names grouped")
+        self.assertIsNone(self.index.group("z"), "Unknown taxon grouped")
+
+    def test_members(self):
+        self.assertEqual(["a", "b", "c"], self.index.members(["c"]), "Incorrect synonyms")
+        self.assertEqual(["a", "b", "c", "d"], self.index.members(["b", "d"]), "Incorrect synonyms")
+        self.assertEqual(["e"], self.index.members(["e"]), "Taxon without accepted name")
+        self.assertEqual([], self.index.members(["z"]), "Synonyms of unknown taxon")
+
+    def test_names(self):
+        self.assertEqual(["A", "B", "C"], self.index.names(["a"]), "Incorrect synonyms names")
+
+    def test_present(self):
+        self.assertTrue(self.index.is_present("a"), "Taxon not present")
+        self.assertFalse(self.index.is_present("z"), "Unknown taxon present")
+        self.assertFalse(self.index.is_present(""), "Empty taxon present")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,73 @@
+import unittest
+
+from dwca.utils import TaxonomicTree, is_missing
+
+
+class TestTaxonomicTree(unittest.TestCase):
+    def setUp(self) -> None:
+        #         k
+        #       /   \
+        #      p1    p2
+        #     /  \     \
+        #    f1   f2    f3
+        #    |
+        #    g1
+        self.tree = TaxonomicTree(
+            ["k", "p1", "p2", "f1", "f2", "f3", "g1"],
+            ["", "k", "k", "p1", "p1", "p2", "f1"],
+        )
+        return
+
+    def test_is_missing(self):
+        self.assertTrue(is_missing(None), "None not missing")
+        self.assertTrue(is_missing(""), "Empty string not missing")
+        self.assertTrue(is_missing(float("nan")), "NaN not missing")
+        self.assertFalse(is_missing("k"), "Value missing")
+        self.assertFalse(is_missing(0), "Zero missing")
+
+    def test_depth(self):
+        self.assertEqual(7, len(self.tree), "Incorrect number of nodes")
+        self.assertEqual(0, self.tree.depth("k"), "Incorrect root depth")
+        self.assertEqual(3, self.tree.depth("g1"), "Incorrect leaf depth")
+        self.assertEqual("f1", self.tree.parent("g1"), "Incorrect parent")
+        self.assertIsNone(self.tree.parent("k"), "Root with parent")
+
+    def test_ancestors(self):
+        self.assertEqual({"f1", "p1", "k"}, self.tree.ancestors(["g1"]), "Incorrect ancestors")
+        self.assertEqual({"f1", "p1", "p2", "k"}, self.tree.ancestors(["g1", "f3"]), "Incorrect shared ancestors")
+        self.assertEqual(set(), self.tree.ancestors(["k", "unknown"]), "Ancestors of root")
+
+    def test_descendants(self):
+        self.assertEqual({"f1", "f2", "g1"}, self.tree.descendants(["p1"]), "Incorrect subtree")
+        self.assertEqual({"f1", "f2"}, self.tree.descendants(["p1"], subtree=False), "Incorrect children")
+        self.assertEqual(6, len(self.tree.descendants(["k"])), "Incorrect whole tree")
+        self.assertEqual(set(), self.tree.descendants(["g1"]), "Leaf with descendants")
+        self.assertTrue(self.tree.is_ancestor("p1", "g1"), "Ancestor not found")
+        self.assertFalse(self.tree.is_ancestor("p2", "g1"), "Wrong ancestor")
+        self.assertFalse(self.tree.is_ancestor("g1", "g1"), "Self as ancestor")
+
+    def test_lowest_common_ancestor(self):
+        self.assertEqual("p1", self.tree.lowest_common_ancestor(["g1", "f2"]), "Incorrect LCA")
+        self.assertEqual("k", self.tree.lowest_common_ancestor(["g1", "f3"]), "Incorrect LCA")
+        self.assertEqual("f1", self.tree.lowest_common_ancestor(["g1", "f1"]), "Incorrect LCA with ancestor")
+        self.assertEqual("g1", self.tree.lowest_common_ancestor(["g1"]), "Incorrect LCA of one")
+        self.assertIsNone(self.tree.lowest_common_ancestor([]), "LCA of nothing")
+
+    def test_forest(self):
+        tree = TaxonomicTree(["a", "b", "c"], ["", "a", "x"])
+        self.assertEqual(4, len(tree), "Dangling parent not indexed")
+        self.assertTrue(tree.is_present("c"), "Taxon not present")
+        self.assertFalse(tree.is_present("x"), "Referenced parent present")
+        self.assertEqual({"x"}, tree.ancestors(["c"]), "Dangling parent not an ancestor")
+        self.assertIsNone(tree.lowest_common_ancestor(["b", "c"]), "LCA on different trees")
+
+    def test_cycle(self):
+        with self.assertWarnsRegex(RuntimeWarning, "Cycle"):
+            tree = TaxonomicTree(["a", "b", "c"], ["c", "a", "b"])
+        self.assertIsNone(tree.parent("a"), "Cycle not broken")
+        self.assertEqual({"b", "c"}, tree.descendants(["a"]), "Incorrect subtree after break cycle")
+        self.assertEqual(2, tree.depth("c"), "Incorrect depth after break cycle")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,47 @@
+import datetime as dt
+import unittest
+
+from datetime_interval import Interval
+
+from dwca.utils import TemporalAggregator, date_bounds, key_to_date
+
+
+class TestTemporalAggregator(unittest.TestCase):
+    def test_date_bounds(self):
+        self.assertEqual(("2020-01-01", "2020-12-31"), date_bounds("2020"), "Incorrect year bounds")
+        self.assertEqual(("2020-02-01", "2020-02-31"), date_bounds("2020-02"), "Incorrect month bounds")
+        self.assertEqual(("2020-02-03", "2020-02-03"), date_bounds("2020-02-03T10:00Z"), "Incorrect day bounds")
+        self.assertEqual(("2019-05-01", "2020-12-31"), date_bounds("2019-05/2020"), "Incorrect interval bounds")
+        self.assertIsNone(date_bounds("unknown"), "Invalid date with bounds")
+        self.assertIsNone(date_bounds("2020-13-01"), "Invalid month with bounds")
+        self.assertEqual(dt.date(2020, 2, 29), key_to_date("2020-02-31"), "Incorrect last day of month")
+
+    def test_update(self):
+        aggregator = TemporalAggregator()
+        self.assertIsNone(aggregator.range, "Range without dates")
+        aggregator.update(["2020-05-03", None, "", "not a date", "2019-03/2019-04"])
+        aggregator.update([dt.datetime(2021, 1, 2, 10), Interval(dt.datetime(2018, 6, 1), dt.datetime(2018, 7, 1))])
+        self.assertEqual(4, aggregator.count, "Incorrect number of dates")
+        self.assertEqual((dt.date(2018, 6, 1), dt.date(2021, 1, 2)), aggregator.range, "Incorrect range")
+        self.assertIsNone(aggregator.single_dates, "Single dates not requested")
+
+    def test_update_parts(self):
+        aggregator = TemporalAggregator()
+        aggregator.update_parts([2001, 1999, None], [2, None, 5], [None, None, 1])
+        self.assertEqual((dt.date(1999, 1, 1), dt.date(2001, 2, 28)), aggregator.range, "Incorrect range")
+
+    def test_single_dates(self):
+        aggregator = TemporalAggregator(max_single_dates=2)
+        aggregator.update(["2020-05-03", "2020-05-03", "2020-01-31"])
+        self.assertEqual(
+            [dt.date(2020, 1, 31), dt.date(2020, 5, 3)], aggregator.single_dates, "Incorrect single dates"
+        )
+        aggregator.update(["2020-06-01"])
+        self.assertIsNone(aggregator.single_dates, "Single dates over the limit")
+        aggregator = TemporalAggregator(max_single_dates=2)
+        aggregator.update(["2020-05"])
+        self.assertIsNone(aggregator.single_dates, "Month as single date")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,158 @@
+import io
+import os
+import tempfile
+import unittest
+
+from lxml import etree as et
+
+from eml import EML
+from eml.types import ResponsibleParty, IndividualName
+from xml_common.utils import Language
+from test_xml.test_xml import TestXML
+
+EML_TEXT = """<?xml version="1.0" encoding="UTF-8"?>
+<eml:eml xmlns:eml="https://eml.ecoinformatics.org/eml-2.2.0" xmlns:stmml="http://www.xml-cml.org/schema/stmml-1.1" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" packageId="Example package" xsi:schemaLocation="https://eml.ecoinformatics.org/eml-2.2.0 xsd/eml.xsd" system="http://my.system" scope="system" xml:lang="spa">
+  <dataset id="1" scope="document">
+    <title xml:lang="spa">Título de ejemplo</title>
+    <creator scope="document">
+      <individualName>
+        <givenName xml:lang="spa">Joe</givenName>
+        <surName xml:lang="spa">Doe</surName>
+      </individualName>
+    </creator>
+    <contact scope="document">
+      <positionName xml:lang="spa">Contacto</positionName>
+    </contact>
+  </dataset>
+  <!-- Large sections follow -->
+  <additionalMetadata>
+    <metadata>
+      <additionalInfo>First information.</additionalInfo>
+    </metadata>
+  </additionalMetadata>
+  <additionalMetadata>
+    <metadata>
+      <additionalInfo>Second information.</additionalInfo>
+    </metadata>
+  </additionalMetadata>
+</eml:eml>
+"""
+
+EML_SECTIONS = """<?xml version="1.0" encoding="UTF-8"?>
+<eml:eml xmlns:eml="https://eml.ecoinformatics.org/eml-2.2.0" xmlns:xsi="http://www.w3.org/2001/XMLSchema-instance" packageId="Sections package" xsi:schemaLocation="https://eml.ecoinformatics.org/eml-2.2.0 xsd/eml.xsd" system="http://my.system" scope="system" xml:lang="spa">
+  <dataset>
+    <title>Título</title>
+    <creator>
+      <organizationName>Creador</organizationName>
+    </creator>
+    <coverage>
+      <geographicCoverage>
+        <geographicDescription>Chile</geographicDescription>
+        <boundingCoordinates>
+          <westBoundingCoordinate>-109.3</westBoundingCoordinate>
+          <eastBoundingCoordinate>-66.4</eastBoundingCoordinate>
+          <northBoundingCoordinate>-17.5</northBoundingCoordinate>
+          <southBoundingCoordinate>-55.9</southBoundingCoordinate>
+        </boundingCoordinates>
+      </geographicCoverage>
+    </coverage>
+    <contact>
+      <organizationName>Contacto</organizationName>
+    </contact>
+    <methods>
+      <methodStep>
+        <description>
+          <para>Primer paso.</para>
+        </description>
+      </methodStep>
+    </methods>
+  </dataset>
+</eml:eml>
+"""
+
+
+class TestEMLStream(TestXML):
+    DEFAULT_TAGS = {
+        "scope": "document",
+        "{http://www.w3.org/XML/1998/namespace}lang": "spa",
+    }
+
+    def test_from_stream(self):
+        eml = EML.from_stream(io.BytesIO(EML_TEXT.encode("utf-8")))
+        self.assertEqual("Example package", eml.package_id, "Incorrect package id")
+        self.assertEqual(Language.SPA, eml.language, "Incorrect language")
+        self.assertEqual(2, len(eml.additional_metadata), "Incorrect additional metadata")
+        self.assertEqual("Título de ejemplo", str(eml.resource.title), "Incorrect title")
+        expected = EML.from_string(EML_TEXT.split("\n", 1)[1])
+        self.assertEqualTree(expected.to_element(), eml.to_element(), "Different from parsing the whole tree")
+
+    def test_resource_sections(self):
+        eml = EML.from_stream(EML_SECTIONS.encode("utf-8"))
+        self.assertEqual("Chile", eml.resource.coverage.geographic.description, "Coverage not parsed")
+        self.assertEqual(
+            "Primer paso.", eml.resource.methods.method_steps[0].description.paragraphs[0], "Methods not parsed"
+        )
+        expected = EML.from_string(EML_SECTIONS.split("\n", 1)[1])
+        self.assertEqualTree(expected.to_element(), eml.to_element(), "Different from parsing the whole tree")
+
+    def test_from_bytes(self):
+        eml = EML.from_stream(EML_TEXT.encode("utf-8"))
+        self.assertEqual("Example package", eml.package_id, "Incorrect package id from bytes")
+
+    def test_from_file(self):
+        with tempfile.NamedTemporaryFile("wb", suffix=".xml", delete=False) as file:
+            file.write(EML_TEXT.encode("utf-8"))
+        try:
+            eml = EML.from_file(file.name)
+            self.assertEqual("Example package", eml.package_id, "Incorrect package id from file")
+        finally:
+            os.remove(file.name)
+
+    def test_wrong_document(self):
+        self.assertRaises(
+            AssertionError, EML.from_stream, b'<eml:dataset xmlns:eml="https://eml.ecoinformatics.org/eml-2.2.0"/>'
+        )
+        self.assertRaises(
+            et.XMLSyntaxError, EML.from_stream, b'<eml:eml xmlns:eml="https://eml.ecoinformatics.org/eml-2.2.0">'
+        )
+
+
+    def test_lazy(self):
+        eml = EML.from_stream(EML_TEXT.encode("utf-8"), lazy=True)
+        self.assertTrue(eml.is_lazy(), "EML not lazy")
+        self.assertEqual("Example package", eml.package_id, "Incorrect package id")
+        self.assertEqual("Título de ejemplo", str(eml.title), "Incorrect title")
+        self.assertIsNone(eml.__resource__, "Resource parsed to read the title")
+        self.assertEqual(2, len(eml.additional_metadata), "Incorrect additional metadata")
+        self.assertEqual("Joe", str(eml.resource.creator.individual_name.first_name[0]), "Incorrect creator")
+        self.assertFalse(eml.is_lazy(), "Sections not parsed")
+        expected = EML.from_stream(EML_TEXT.encode("utf-8"))
+        self.assertEqualTree(expected.to_element(), eml.to_element(), "Different from parsing eagerly")
+
+    def test_lazy_write(self):
+        eml = EML.from_stream(EML_TEXT.encode("utf-8"), lazy=True)
+        original = et.fromstring(EML_TEXT.encode("utf-8"))
+        self.assertEqual(
+            et.tostring(original.find("dataset"), with_tail=False),
+            et.tostring(eml.to_element().find("dataset")),
+            "Resource not written as read"
+        )
+        self.assertTrue(eml.is_lazy(), "Sections parsed on writing")
+        eml.set_short_name("short")
+        self.assertIsNotNone(eml.to_element().find("dataset/shortName"), "Modified resource written as read")
+
+    def test_lazy_initialize(self):
+        eml = EML.from_stream(EML_TEXT.encode("utf-8"), lazy=True)
+        eml.initialize_resource(
+            "Changed",
+            ResponsibleParty(individual_name=IndividualName("Doe", "Example")),
+            contact=[ResponsibleParty(individual_name=IndividualName("Doe", "Jane"))]
+        )
+        self.assertEqual("Changed", str(eml.title), "Replaced resource parsed from the original")
+        written = EML.from_string(et.tostring(eml.to_element()).decode("utf-8"))
+        self.assertEqual("Changed", str(written.title), "Replaced resource written as read")
+        self.assertEqual(2, len(written.additional_metadata), "Other sections not written")
+
+
+if __name__ == '__main__':
+    unittest.main()
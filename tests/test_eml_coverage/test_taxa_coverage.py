@@ -2,9 +2,33 @@ import unittest
 
 from lxml import etree as et
 
+from dwca.classes import Taxon, DataFileType
+from dwca.terms import TaxonID, ScientificName, Kingdom, Family, Genus
 from eml.resources.coverage import TaxonomicCoverage
 from test_xml.test_xml import TestXML
 
+CHECKLIST = """taxonID\tscientificName\tkingdom\tfamily\tgenus
+1\tPlantae\tPlantae\t\t
+2\tAsteraceae\tPlantae\tAsteraceae\t
+3\tAster\tPlantae\tAsteraceae\tAster
+4\tAster alpinus\tPlantae\tAsteraceae\tAster
+5\tAster alpina\tPlantae\tAsteraceae\tAster
+6\tRosa canina\tPlantae\tRosaceae\tRosa
+7\tFelis catus\tAnimalia\tFelidae\tFelis
+8\tFelis catus\tAnimalia\tFelidae\tFelis
+"""
+
+
+def build_checklist() -> Taxon:
+    taxon = Taxon(
+        0, "taxon.txt", [TaxonID(0), ScientificName(1), Kingdom(2), Family(3), Genus(4)],
+        data_file_type=DataFileType.CORE,
+        fields_terminated_by="\t",
+        ignore_header_lines=1,
+    )
+    taxon.read_file(CHECKLIST, _no_interaction=True)
+    return taxon
+
 
 class TestTaxaCoverage(TestXML):
     DEFAULT_TAGS = {
@@ -392,5 +416,47 @@ class TestTaxaCoverage(TestXML):
         self.assertEqualTree(et.fromstring(text_xml), coverage.to_element(), "Error on to element")
 
 
+    def test_from_data(self):
+        coverage = TaxonomicCoverage.from_data(build_checklist(), general_coverage="Checklist")
+        self.assertEqual("Checklist", coverage.general_coverage, "Incorrect general coverage")
+        self.assertEqual(
+            ["Plantae", "Animalia"], [c.rank_value for c in coverage.classification], "Incorrect kingdoms"
+        )
+        plantae = coverage.classification[0]
+        self.assertEqual("Kingdom", plantae.rank_name, "Incorrect rank name")
+        self.assertEqual(
+            ["Asteraceae", "Rosaceae"], [c.rank_value for c in plantae.classification], "Incorrect families"
+        )
+        aster = plantae.classification[0].classification[0]
+        self.assertEqual(("Genus", "Aster"), (aster.rank_name, aster.rank_value), "Incorrect genus")
+        self.assertEqual(
+            ["Aster alpinus", "Aster alpina"],
+            [c.rank_value for c in aster.classification],
+            "Incorrect species"
+        )
+        self.assertEqual("Species", aster.classification[0].rank_name, "Incorrect species rank")
+
+    def test_from_data_ranks(self):
+        coverage = TaxonomicCoverage.from_data(build_checklist(), ranks=["Kingdom", "family"])
+        families = [c.rank_value for kingdom in coverage.classification for c in kingdom.classification]
+        self.assertEqual(["Asteraceae", "Rosaceae", "Felidae"], families, "Incorrect families")
+        self.assertTrue(
+            all(len(family.classification) == 0 for kingdom in coverage.classification
+                for family in kingdom.classification),
+            "Rank not requested included"
+        )
+        self.assertRaisesRegex(ValueError, "variety", TaxonomicCoverage.from_data, build_checklist(), ["variety"])
+
+    def test_from_data_caps(self):
+        with self.assertWarnsRegex(RuntimeWarning, "truncated"):
+            coverage = TaxonomicCoverage.from_data(build_checklist(), max_depth=2, max_width=1)
+        self.assertEqual(["Plantae"], [c.rank_value for c in coverage.classification], "Width not capped")
+        self.assertEqual(1, len(coverage.classification[0].classification), "Width not capped")
+        self.assertEqual(0, len(coverage.classification[0].classification[0].classification), "Depth not capped")
+        with self.assertWarnsRegex(RuntimeWarning, "truncated, 9 taxa ignored"):
+            coverage = TaxonomicCoverage.from_data(build_checklist(), max_nodes=3)
+        self.assertEqual(1, len(coverage.classification), "Nodes not capped")
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,65 @@
+import unittest
+import warnings
+from typing import Any
+
+from xml_common.utils import Diagnostics, format_to_type, ANY_TYPE, CONVERSION_FAILURE, UNKNOWN_TERM
+
+
+class TestDiagnostics(unittest.TestCase):
+    def test_add(self):
+        diagnostics = Diagnostics("test", sample_size=2)
+        diagnostics.add(CONVERSION_FAILURE, "decimalLatitude", 3, ["a", "b", "c"])
+        diagnostics.record(CONVERSION_FAILURE, "decimalLatitude", "d")
+        diagnostics.record(UNKNOWN_TERM, "http://example.org/term")
+        diagnostics.add(ANY_TYPE, "measurementValue", 0)
+        self.assertEqual(5, diagnostics.count(), "Incorrect total")
+        self.assertEqual(4, diagnostics.count(CONVERSION_FAILURE), "Incorrect count of kind")
+        self.assertEqual(0, diagnostics.count(ANY_TYPE), "Empty count added")
+        self.assertEqual(["a", "b"], diagnostics.samples[CONVERSION_FAILURE]["decimalLatitude"], "Sample not bounded")
+        self.assertEqual({"http://example.org/term": 1}, diagnostics.counts[UNKNOWN_TERM], "Incorrect counts")
+        summary = diagnostics.summary()
+        self.assertIn("5 issues found on test", summary, "Incorrect header")
+        self.assertIn("decimalLatitude: 4 (e.g. 'a', 'b')", summary, "Incorrect field line")
+        self.assertEqual("test", diagnostics.to_dict()["name"], "Incorrect dictionary")
+
+    def test_merge(self):
+        first, second = Diagnostics(), Diagnostics()
+        first.record(CONVERSION_FAILURE, "year", "x")
+        second.record(CONVERSION_FAILURE, "year", "y")
+        second.record(ANY_TYPE, "measurementValue")
+        first.merge(second)
+        self.assertEqual(3, first.count(), "Incorrect merge")
+        self.assertEqual(["x", "y"], first.samples[CONVERSION_FAILURE]["year"], "Samples not merged")
+
+    def test_emit(self):
+        diagnostics = Diagnostics()
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            diagnostics.emit()
+        diagnostics.record(ANY_TYPE, "measurementValue")
+        with self.assertWarnsRegex(RuntimeWarning, "1 issues found"):
+            diagnostics.emit(category=RuntimeWarning)
+
+    def test_collect(self):
+        self.assertIsNone(Diagnostics.active(), "Active collector")
+        with self.assertWarnsRegex(UserWarning, "3 values kept as text") as context:
+            with Diagnostics.collect(name="outer") as outer:
+                for _ in range(3):
+                    self.assertEqual("1", format_to_type("1", Any), "Incorrect value")
+                with Diagnostics.collect() as inner:
+                    self.assertIs(outer, inner, "Nested collector not shared")
+        self.assertEqual(1, len(context.warnings), "More than one warning")
+        self.assertIsNone(Diagnostics.active(), "Collector not deactivated")
+
+    def test_collect_given(self):
+        diagnostics = Diagnostics()
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            with Diagnostics.collect(diagnostics) as active:
+                self.assertIs(diagnostics, active, "Given collector not used")
+                format_to_type("1", Any)
+        self.assertEqual(1, diagnostics.count(ANY_TYPE), "Issue not collected")
+
+
+if __name__ == '__main__':
+    unittest.main()
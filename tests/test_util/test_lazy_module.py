@@ -0,0 +1,29 @@
+import unittest
+from unittest.mock import patch
+
+from xml_common.utils import LazyModule
+
+orig_import = __import__
+
+
+def import_mock(name, globals=None, locals=None, fromlist=(), level=0):
+    if name == 'not_installed_module':
+        raise ImportError(f"No module named '{name}'")
+    return orig_import(name, globals, locals, fromlist, level)
+
+
+class TestLazyModule(unittest.TestCase):
+    def test_load(self):
+        module = LazyModule("colorsys")
+        self.assertEqual((1.0, 1.0, 1.0), module.hsv_to_rgb(0.0, 0.0, 1.0), "Incorrect attribute")
+        self.assertTrue(module.is_loaded, "Module not loaded")
+
+    @patch('builtins.__import__', side_effect=import_mock)
+    def test_not_installed(self, mock_import):
+        module = LazyModule("not_installed_module")
+        self.assertFalse(module.is_loaded, "Module loaded")
+        self.assertRaisesRegex(ImportError, "Install not_installed_module", getattr, module, "DataFrame")
+
+
+if __name__ == '__main__':
+    unittest.main()
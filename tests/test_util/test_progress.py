@@ -0,0 +1,136 @@
+import logging
+import os
+import tempfile
+import unittest
+
+from xml_common.utils import (
+    Progress, ProgressEvent, ProgressSink, configure_progress, get_progress_sink,
+    CallbackSink, LoggingSink, PrometheusTextfileSink, TqdmSink,
+)
+
+
+class ListSink(ProgressSink):
+    def __init__(self):
+        self.events = list()
+        self.closed = False
+
+    def emit(self, event):
+        self.events.append(event)
+
+    def close(self):
+        self.closed = True
+
+
+class TestProgress(unittest.TestCase):
+    def tearDown(self):
+        configure_progress()
+
+    def test_event(self):
+        event = ProgressEvent(0, "Reading", "entry", 50, total=100, n_bytes=500, elapsed=2.0)
+        self.assertEqual(25.0, event.rate, "Incorrect rate")
+        self.assertEqual(250.0, event.byte_rate, "Incorrect byte rate")
+        self.assertEqual(2.0, event.eta, "Incorrect ETA")
+        self.assertEqual("Reading", event.to_dict()["desc"], "Incorrect dictionary")
+        event = ProgressEvent(0, "Reading", "entry", 50)
+        self.assertIsNone(event.rate, "Rate without time")
+        self.assertIsNone(event.eta, "ETA without total")
+
+    def test_batched(self):
+        sink = ListSink()
+        configure_progress(sink, min_interval=0.0, min_items=100)
+        progress = Progress(total=1000, desc="Test", unit="entry")
+        for _ in range(1000):
+            progress.update(n_bytes=10)
+        progress.close()
+        progress.close()
+        self.assertEqual(12, len(sink.events), "Incorrect number of events")
+        self.assertEqual([0, 100, 200], [event.done for event in sink.events[:3]], "Incorrect batches")
+        last = sink.events[-1]
+        self.assertTrue(last.finished, "Last event not finished")
+        self.assertEqual(1000, last.done, "Incorrect done")
+        self.assertEqual(10_000, last.bytes, "Incorrect bytes")
+        self.assertFalse(any(event.finished for event in sink.events[:-1]), "Finished before close")
+
+    def test_interval(self):
+        sink = ListSink()
+        configure_progress(sink, min_interval=3600)
+        progress = Progress(total=10)
+        for _ in range(10):
+            progress.update()
+        progress.close()
+        self.assertEqual([0, 10], [event.done for event in sink.events], "Events not batched by time")
+
+    def test_iterate(self):
+        events = list()
+        configure_progress(events.append, min_interval=0.0)
+        self.assertIsInstance(get_progress_sink(), CallbackSink, "Function not wrapped")
+        progress = Progress(total=25, desc="Iterating")
+        self.assertEqual(list(range(25)), list(progress.iterate(range(25), batch_size=10)), "Incorrect items")
+        self.assertEqual([0, 10, 20, 25, 25], [event.done for event in events], "Incorrect batches")
+        self.assertTrue(events[-1].finished, "Not finished")
+
+    def test_disabled(self):
+        sink = ListSink()
+        progress = Progress(total=10, enabled=False, sink=sink)
+        self.assertFalse(progress.enabled, "Progress enabled")
+        items = [1, 2, 3]
+        self.assertIs(items, progress.iterate(items), "Iterable wrapped")
+        progress.update(5)
+        progress.close()
+        self.assertEqual(5, progress.done, "Incorrect count")
+        self.assertEqual(0, len(sink.events), "Events emitted")
+
+    def test_descriptor_postfix(self):
+        sink = ListSink()
+        with Progress(total=2, desc="First", sink=sink) as progress:
+            progress.set_descriptor(desc="Second")
+            progress.set_postfix(ordered_dict={"Found": 1}, total=2)
+        self.assertEqual("Second", sink.events[-1].desc, "Incorrect description")
+        self.assertEqual({"Found": 1, "total": 2}, sink.events[-1].postfix, "Incorrect postfix")
+
+    def test_reset(self):
+        sink = ListSink()
+        progress = Progress(total=2, sink=sink)
+        progress.update(2)
+        progress.reset(total=5)
+        progress.close()
+        self.assertEqual(0, sink.events[-1].done, "Not reset")
+        self.assertEqual(5, sink.events[-1].total, "Total not changed")
+
+    def test_logging(self):
+        logger = logging.getLogger("test_progress")
+        with self.assertLogs(logger, level=logging.INFO) as logs:
+            with Progress(total=4, desc="Logged", unit="entry", sink=LoggingSink(logger)) as progress:
+                progress.set_postfix(Found=4)
+                progress.update(4, n_bytes=40)
+        self.assertIn("Logged: 0/4 entry", logs.output[0], "Incorrect first record")
+        self.assertIn("Logged: 4/4 entry", logs.output[-1], "Incorrect last record")
+        self.assertIn("40 bytes", logs.output[-1], "Bytes not logged")
+        self.assertIn("Found=4", logs.output[-1], "Postfix not logged")
+        self.assertIn("finished", logs.output[-1], "Finish not logged")
+
+    def test_prometheus(self):
+        directory = tempfile.mkdtemp()
+        path = os.path.join(directory, "progress.prom")
+        sink = PrometheusTextfileSink(path, prefix="test")
+        with Progress(total=10, desc='Reading "file"', sink=sink) as progress:
+            progress.update(10)
+        with open(path) as file:
+            content = file.read()
+        self.assertIn("# TYPE test_done gauge", content, "Missing type")
+        self.assertRegex(content, r'test_done\{task="\d+",desc="Reading \\"file\\""} 10', "Incorrect done")
+        self.assertRegex(content, r'test_finished\{task="\d+",desc=".*"} 1', "Incorrect finished")
+        self.assertEqual(["progress.prom"], os.listdir(directory), "Temporal file left")
+        os.remove(path)
+        os.rmdir(directory)
+
+    def test_tqdm(self):
+        sink = TqdmSink()
+        with Progress(total=3, desc="Bar", sink=sink) as progress:
+            progress.update(3)
+        sink.close()
+        self.assertIsInstance(get_progress_sink(), TqdmSink, "Incorrect default sink")
+
+
+if __name__ == '__main__':
+    unittest.main()